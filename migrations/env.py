@@ -12,14 +12,25 @@ from sqlalchemy.ext.asyncio import async_engine_from_config
 sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "src"))
 
 from app.config import settings
+from app.modules.data_engineering.infrastructure.models.concept_model import ConceptModel  # noqa: F401
+from app.modules.data_engineering.infrastructure.models.concept_shadow_model import ConceptShadowModel  # noqa: F401
+from app.modules.data_engineering.infrastructure.models.concept_stock_model import ConceptStockModel  # noqa: F401
+from app.modules.data_engineering.infrastructure.models.concept_stock_shadow_model import (  # noqa: F401
+    ConceptStockShadowModel,
+)
 
 # Import all models so Alembic can detect them
 from app.modules.data_engineering.infrastructure.models.stock_basic_model import StockBasicModel  # noqa: F401
-from app.modules.data_engineering.infrastructure.models.stock_daily_model import StockDailyModel
-from app.modules.data_engineering.infrastructure.models.stock_daily_sync_failure_model import StockDailySyncFailureModel
 from app.modules.data_engineering.infrastructure.models.stock_financial_model import StockFinancialModel  # noqa: F401
-from app.modules.data_engineering.infrastructure.models.concept_model import ConceptModel  # noqa: F401
-from app.modules.data_engineering.infrastructure.models.concept_stock_model import ConceptStockModel  # noqa: F401
+from app.modules.data_engineering.infrastructure.models.sync_run_model import (  # noqa: F401
+    SyncRunItemModel,
+    SyncRunModel,
+)
+from app.modules.data_engineering.infrastructure.models.trade_calendar_model import TradeCalendarModel  # noqa: F401
+from app.modules.foundation.infrastructure.background_job_model import BackgroundJobModel  # noqa: F401
+from app.modules.foundation.infrastructure.scheduled_job_state_model import ScheduledJobStateModel  # noqa: F401
+from app.modules.foundation.infrastructure.scheduled_task_run_model import ScheduledTaskRunModel  # noqa: F401
+from app.modules.foundation.infrastructure.scheduler_leader_model import SchedulerLeaderModel  # noqa: F401
 from app.shared_kernel.infrastructure.database import Base
 
 config = context.config
@@ -0,0 +1,48 @@
+"""add concept shadow tables for snapshot sync
+
+Revision ID: 20260222_0900
+Revises: 20260221_0022, 20260221_2310
+Create Date: 2026-02-22 09:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20260222_0900"
+down_revision = ("20260221_0022", "20260221_2310")
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "concept_shadow",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("source", sa.String(length=32), nullable=False),
+        sa.Column("third_code", sa.String(length=32), nullable=False),
+        sa.Column("name", sa.String(length=100), nullable=False),
+        sa.Column("content_hash", sa.String(length=16), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("source", "third_code", name="uq_concept_shadow_source_third_code"),
+    )
+
+    op.create_table(
+        "concept_stock_shadow",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("source", sa.String(length=32), nullable=False),
+        sa.Column("concept_third_code", sa.String(length=32), nullable=False),
+        sa.Column("stock_third_code", sa.String(length=32), nullable=False),
+        sa.Column("stock_symbol", sa.String(length=32), nullable=True),
+        sa.Column("content_hash", sa.String(length=16), nullable=False),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("source", "concept_third_code", "stock_third_code", name="uq_concept_stock_shadow_key"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("concept_stock_shadow")
+    op.drop_table("concept_shadow")
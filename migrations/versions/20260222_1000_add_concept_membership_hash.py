@@ -0,0 +1,26 @@
+"""add membership_hash to concept and concept_shadow
+
+Revision ID: 20260222_1000
+Revises: 20260222_0900
+Create Date: 2026-02-22 10:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20260222_1000"
+down_revision = "20260222_0900"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("concept", sa.Column("membership_hash", sa.String(length=16), nullable=True))
+    op.add_column("concept_shadow", sa.Column("membership_hash", sa.String(length=16), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("concept_shadow", "membership_hash")
+    op.drop_column("concept", "membership_hash")
@@ -0,0 +1,39 @@
+"""add background_job table
+
+Revision ID: 20260222_1100
+Revises: 20260222_1000
+Create Date: 2026-02-22 11:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20260222_1100"
+down_revision = "20260222_1000"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "background_job",
+        sa.Column("id", sa.String(length=32), nullable=False),
+        sa.Column("job_type", sa.String(length=64), nullable=False),
+        sa.Column("params", sa.JSON(), nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("progress", sa.JSON(), nullable=False),
+        sa.Column("result", sa.JSON(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_background_job_status", "background_job", ["status"], unique=False)
+
+
+def downgrade() -> None:
+    op.drop_index("ix_background_job_status", table_name="background_job")
+    op.drop_table("background_job")
@@ -0,0 +1,36 @@
+"""add trade_calendar table
+
+Revision ID: 20260222_1300
+Revises: 20260222_1200
+Create Date: 2026-02-22 13:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20260222_1300"
+down_revision = "20260222_1200"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "trade_calendar",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("exchange", sa.String(length=16), nullable=False),
+        sa.Column("cal_date", sa.Date(), nullable=False),
+        sa.Column("is_open", sa.Boolean(), nullable=False),
+        sa.Column("pretrade_date", sa.Date(), nullable=True),
+        sa.Column("created_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("updated_at", sa.DateTime(timezone=True), server_default=sa.text("now()"), nullable=False),
+        sa.Column("version", sa.Integer(), nullable=False),
+        sa.PrimaryKeyConstraint("id"),
+        sa.UniqueConstraint("exchange", "cal_date", name="uq_trade_calendar_exchange_cal_date"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("trade_calendar")
@@ -0,0 +1,31 @@
+"""add scheduler_leader table
+
+Revision ID: 20260222_1400
+Revises: 20260222_1300
+Create Date: 2026-02-22 14:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20260222_1400"
+down_revision = "20260222_1300"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "scheduler_leader",
+        sa.Column("name", sa.String(length=64), nullable=False),
+        sa.Column("instance_id", sa.String(length=128), nullable=False),
+        sa.Column("acquired_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("expires_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("name"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("scheduler_leader")
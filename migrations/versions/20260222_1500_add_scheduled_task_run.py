@@ -0,0 +1,54 @@
+"""add scheduled_task_run and scheduled_job_state tables
+
+Revision ID: 20260222_1500
+Revises: 20260222_1400
+Create Date: 2026-02-22 15:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20260222_1500"
+down_revision = "20260222_1400"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "scheduled_task_run",
+        sa.Column("id", sa.Integer(), autoincrement=True, nullable=False),
+        sa.Column("run_id", sa.String(length=32), nullable=False),
+        sa.Column("task_id", sa.String(length=128), nullable=False),
+        sa.Column("root_id", sa.String(length=128), nullable=False),
+        sa.Column("status", sa.String(length=16), nullable=False),
+        sa.Column("started_at", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("finished_at", sa.DateTime(timezone=True), nullable=False),
+        sa.Column("duration_ms", sa.Integer(), nullable=False),
+        sa.Column("wait_ms", sa.Integer(), nullable=False),
+        sa.Column("rows", sa.Integer(), nullable=True),
+        sa.Column("error", sa.Text(), nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_scheduled_task_run_run_id", "scheduled_task_run", ["run_id"], unique=False)
+    op.create_index("ix_scheduled_task_run_finished_at", "scheduled_task_run", ["finished_at"], unique=False)
+    op.create_index(
+        "ix_scheduled_task_run_task_finished", "scheduled_task_run", ["task_id", "finished_at"], unique=False
+    )
+    op.create_table(
+        "scheduled_job_state",
+        sa.Column("task_id", sa.String(length=128), nullable=False),
+        sa.Column("next_run_time", sa.DateTime(timezone=True), nullable=True),
+        sa.Column("updated_at", sa.DateTime(timezone=True), nullable=False),
+        sa.PrimaryKeyConstraint("task_id"),
+    )
+
+
+def downgrade() -> None:
+    op.drop_table("scheduled_job_state")
+    op.drop_index("ix_scheduled_task_run_task_finished", table_name="scheduled_task_run")
+    op.drop_index("ix_scheduled_task_run_finished_at", table_name="scheduled_task_run")
+    op.drop_index("ix_scheduled_task_run_run_id", table_name="scheduled_task_run")
+    op.drop_table("scheduled_task_run")
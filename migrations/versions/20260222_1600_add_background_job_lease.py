@@ -0,0 +1,26 @@
+"""add owner and lease_expires_at to background_job
+
+Revision ID: 20260222_1600
+Revises: 20260222_1500
+Create Date: 2026-02-22 16:00:00.000000
+
+"""
+
+import sqlalchemy as sa
+from alembic import op
+
+# revision identifiers, used by Alembic.
+revision = "20260222_1600"
+down_revision = "20260222_1500"
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column("background_job", sa.Column("owner", sa.String(length=128), nullable=True))
+    op.add_column("background_job", sa.Column("lease_expires_at", sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column("background_job", "lease_expires_at")
+    op.drop_column("background_job", "owner")
@@ -18,8 +18,41 @@ class Settings(BaseSettings):
 
     # 数据工程配置
     CONCEPT_SYNC_BATCH_SIZE: int = 50  # 概念同步批次大小
-    CONCEPT_SYNC_TIMEOUT_SECONDS: int = 300  # 概念同步超时时间（秒）
+    CONCEPT_SYNC_TIMEOUT_SECONDS: int = 0  # 概念同步超时时间（秒），0 表示不限；全量拉取约需 概念数 / 每分钟限速 分钟
     CONCEPT_SYNC_MEMORY_THRESHOLD_MB: int = 1024  # 内存使用阈值（MB）
+    CONCEPT_SYNC_FETCH_CONCURRENCY: int = 4  # 概念成分股预取并发数
+    AKSHARE_RATE_LIMIT_PER_MINUTE: int = 120  # AKShare 每分钟最大请求数
+    STOCK_DAILY_FETCH_CONCURRENCY: int = 3  # 日线增量按日期拉取的并发数
+    STOCK_DAILY_CATCH_UP_MAX_DAYS: int = 31  # 日线增量补齐模式最多回溯的自然日数
+    SYNC_TIMEOUT_SECONDS: int = 0  # 股票基础信息、日线、财务指标同步超时时间（秒），0 表示不限
+    SYNC_MEMORY_THRESHOLD_MB: int = 1536  # 股票基础信息、日线、财务指标同步内存阈值（MB）
+    TRADE_CALENDAR_EXCHANGE: str = "SSE"  # 交易日历所用交易所
+    TRADE_CALENDAR_REFRESH_SECONDS: int = 3600  # 进程内交易日历缓存的重新加载间隔（秒）
+    SECURITY_MASTER_REFRESH_SECONDS: int = 3600  # 进程内证券主数据的重新加载间隔（秒）
+
+    # 缓存配置
+    CACHE_BACKEND: str = "memory"  # memory：进程内缓存；redis：Redis + 进程内近端缓存，多副本共享
+    CACHE_MAX_ENTRIES: int = 10000  # 进程内（近端）缓存条目上限，超出按 LRU 淘汰
+    CACHE_REDIS_URL: str = "redis://localhost:6379/0"
+    CACHE_REDIS_MAX_CONNECTIONS: int = 20  # Redis 连接池上限
+    CACHE_KEY_PREFIX: str = "financial_helper:cache:"  # Redis 键与失效频道前缀
+    CACHE_NEAR_TTL_SECONDS: int = 60  # 近端缓存条目最长存活时间（秒），兜底漏收的失效消息
+    CONCEPT_QUERY_CACHE_TTL_SECONDS: int = 86400  # 概念列表与成分股查询缓存时长（秒），同步变更后即时失效
+    HTTP_CACHE_MAX_AGE_SECONDS: int = 0  # 带 ETag 的 GET 响应允许客户端免验证复用的时长（秒），0 表示每次验证
+
+    # 后台任务配置
+    JOB_RUNNER_MAX_WORKERS: int = 2  # 后台任务最大并发数
+    JOB_PROGRESS_FLUSH_SECONDS: float = 2.0  # 任务进度落库间隔（秒）
+    JOB_SHUTDOWN_TIMEOUT_SECONDS: float = 30.0  # 关闭时等待任务保存断点的最长秒数
+    JOB_LEASE_SECONDS: float = 60.0  # 任务认领租约（秒），实例失联后其任务最迟在此时间后被其他实例接管
+
+    # 定时任务配置
+    SCHEDULER_MAX_CONCURRENT_TASKS: int = 4  # 定时任务（含依赖链下游任务）全局并发上限
+    SCHEDULER_EXECUTION_MODE: str = "inline"  # inline：与 API 共用事件循环；process：分派到独立工作进程（按需开启）
+    SCHEDULER_PROCESS_WORKERS: int = 2  # process 模式的工作进程数
+    SCHEDULER_LEADER_ELECTION_ENABLED: bool = True  # 多 worker / 多副本时只有主节点运行调度器；单进程部署可关闭
+    SCHEDULER_LEADER_LEASE_SECONDS: int = 30  # 主节点租约时长（秒），主节点失联后最迟在此时间后被接管
+    SCHEDULER_LEADER_RENEW_SECONDS: float = 10.0  # 竞选与续约周期（秒），须小于租约时长
 
 
 settings = Settings()
@@ -0,0 +1,47 @@
+"""条件 GET：ETag、If-None-Match 与 Cache-Control。
+
+路由先取资源版本号（见 app.shared_kernel.infrastructure.resource_version），再交给 ConditionalGet 判断：
+客户端持有的 ETag 仍有效时直接返回 304，不加载数据；否则在响应上附加 ETag 与 Cache-Control 后照常返回。
+"""
+
+from fastapi import Request, Response, status
+
+
+def strong_etag(version: str) -> str:
+    return f'"{version}"'
+
+
+def etag_matches(if_none_match: str | None, etag: str) -> bool:
+    """If-None-Match 是否命中 etag。按 RFC 9110 对 If-None-Match 使用弱比较，"*" 匹配任意版本。"""
+    if not if_none_match:
+        return False
+    candidates = [tag.strip() for tag in if_none_match.split(",")]
+    return any(tag == "*" or tag.removeprefix("W/") == etag for tag in candidates)
+
+
+class ConditionalGet:
+    """路由依赖：按资源版本号处理条件请求。
+
+    用法::
+
+        version = await versions.current("concepts")
+        if (not_modified := conditional.evaluate(version)) is not None:
+            return not_modified
+    """
+
+    def __init__(self, request: Request, response: Response) -> None:
+        self._request = request
+        self._response = response
+
+    def evaluate(self, version: str, max_age_seconds: int = 0) -> Response | None:
+        """命中时返回 304 响应；否则把 ETag 与 Cache-Control 写入本次响应并返回 None。
+
+        Cache-Control 为 private + must-revalidate：max_age_seconds 内客户端可直接复用，
+        过期后带 If-None-Match 重新验证。
+        """
+        etag = strong_etag(version)
+        headers = {"ETag": etag, "Cache-Control": f"private, max-age={max_age_seconds}, must-revalidate"}
+        if etag_matches(self._request.headers.get("if-none-match"), etag):
+            return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        self._response.headers.update(headers)
+        return None
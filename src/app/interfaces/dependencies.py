@@ -4,7 +4,9 @@ from typing import cast
 from fastapi import Request
 
 from app.shared_kernel.application.mediator import Mediator
+from app.shared_kernel.infrastructure.cache import CacheClient
 from app.shared_kernel.infrastructure.database import Database
+from app.shared_kernel.infrastructure.resource_version import ResourceVersions
 from app.shared_kernel.infrastructure.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
 
 
@@ -16,6 +18,14 @@ def get_mediator(request: Request) -> Mediator:
     return cast(Mediator, request.app.state.mediator)
 
 
+def get_cache(request: Request) -> CacheClient:
+    return cast(CacheClient, request.app.state.cache)
+
+
+def get_resource_versions(request: Request) -> ResourceVersions:
+    return ResourceVersions(get_cache(request))
+
+
 async def get_uow(request: Request) -> AsyncGenerator[SqlAlchemyUnitOfWork, None]:
     """创建一个请求级别的 session，并将其传入 UoW。
 
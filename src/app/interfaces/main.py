@@ -2,12 +2,11 @@ from collections.abc import AsyncGenerator, Awaitable, Callable
 from contextlib import asynccontextmanager
 from typing import cast
 
-from fastapi import FastAPI
+from fastapi import FastAPI, Request
 from fastapi.exceptions import RequestValidationError
 from starlette.responses import Response
 
 from app.config import settings
-from app.modules.foundation.application.module_registry import ModuleRegistry
 from app.interfaces.exception_handler import (
     domain_exception_handler,
     general_exception_handler,
@@ -16,8 +15,14 @@ from app.interfaces.exception_handler import (
 from app.interfaces.middleware import setup_middleware
 from app.interfaces.module_registry import register_modules
 from app.interfaces.response import ApiResponse
+from app.modules.foundation.application.job_runner import JobRunner
+from app.modules.foundation.application.module_registry import ModuleRegistry
+from app.modules.foundation.application.scheduler import Scheduler
+from app.shared_kernel.application.event_bus import EventBus, InProcessEventBus, set_event_bus
 from app.shared_kernel.application.mediator import Mediator
 from app.shared_kernel.domain.exception import DomainException
+from app.shared_kernel.infrastructure.cache import CacheClient, create_cache_client
+from app.shared_kernel.infrastructure.cache_serializer import CacheSerializer
 from app.shared_kernel.infrastructure.database import Database
 from app.shared_kernel.infrastructure.logging import configure_logging, get_logger
 
@@ -29,7 +34,7 @@ def _register_handlers(mediator: Mediator, db: Database) -> None:
     # 各模块的 command/query 若需通过 Mediator 分发，在此注册
 
 
-def _initialize_scheduler(db: Database) -> tuple[ModuleRegistry, "Scheduler"]:
+def _initialize_scheduler(db: Database) -> tuple[ModuleRegistry, Scheduler]:
     """初始化调度器和模块注册器。
 
     Args:
@@ -38,16 +43,26 @@ def _initialize_scheduler(db: Database) -> tuple[ModuleRegistry, "Scheduler"]:
     Returns:
         (ModuleRegistry, Scheduler) 元组。
     """
-    from app.modules.foundation.interfaces.scheduler import get_scheduler
-
-    # 创建调度器实例
-    scheduler = get_scheduler()
-
-    # 创建模块注册器并注册所有业务模块的定时任务
-    registry = ModuleRegistry()
+    from app.interfaces.task_worker import load_scheduled_task_callables
+    from app.modules.foundation.interfaces.scheduler import (
+        create_task_dispatcher,
+        create_task_run_store,
+        get_scheduler,
+    )
+
+    # 创建调度器实例（持久化任务的下次执行时间，重启后恢复错过的执行）
+    scheduler = get_scheduler(db.session_factory)
+
+    # 创建模块注册器并注册所有业务模块的定时任务；process 模式下任务在独立工作进程中执行，不阻塞 API
+    registry = ModuleRegistry(
+        max_concurrent_tasks=settings.SCHEDULER_MAX_CONCURRENT_TASKS,
+        dispatcher=create_task_dispatcher(load_scheduled_task_callables),
+        run_store=create_task_run_store(db.session_factory),
+    )
 
     # 注册业务模块的定时任务（传递 session_factory）
     import app.modules  # noqa: PLC0415
+
     app.modules.register_scheduled_tasks(registry, db.session_factory)
 
     # 将所有任务注册到调度器
@@ -56,6 +71,52 @@ def _initialize_scheduler(db: Database) -> tuple[ModuleRegistry, "Scheduler"]:
     return registry, scheduler
 
 
+def _initialize_cache() -> CacheClient:
+    """按配置创建缓存客户端（进程内缓存或 Redis 两级缓存），并注册各模块缓存的实体类型。"""
+    import app.modules  # noqa: PLC0415
+
+    serializer = CacheSerializer()
+    app.modules.register_cache_types(serializer)
+    return create_cache_client(
+        settings.CACHE_BACKEND,
+        max_entries=settings.CACHE_MAX_ENTRIES,
+        redis_url=settings.CACHE_REDIS_URL,
+        redis_max_connections=settings.CACHE_REDIS_MAX_CONNECTIONS,
+        key_prefix=settings.CACHE_KEY_PREFIX,
+        near_ttl_seconds=settings.CACHE_NEAR_TTL_SECONDS,
+        serializer=serializer,
+    )
+
+
+def _initialize_event_bus(cache: CacheClient) -> EventBus:
+    """创建本进程的事件总线并注册各模块的领域事件订阅者。"""
+    import app.modules  # noqa: PLC0415
+
+    event_bus = InProcessEventBus()
+    app.modules.register_event_handlers(event_bus, cache)
+    return event_bus
+
+
+def _initialize_job_runner(db: Database) -> JobRunner:
+    """创建后台任务执行器并注册所有业务模块的任务类型。
+
+    Args:
+        db: Database 实例，提供 session_factory。
+
+    Returns:
+        JobRunner 实例。
+    """
+    from app.modules.foundation.interfaces.jobs import create_job_runner
+
+    job_runner = create_job_runner(db.session_factory)
+
+    import app.modules  # noqa: PLC0415
+
+    app.modules.register_background_jobs(job_runner, db.session_factory)
+
+    return job_runner
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     configure_logging(log_level=settings.LOG_LEVEL, app_env=settings.APP_ENV)
@@ -64,6 +125,15 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     db = Database(url=settings.DATABASE_URL, echo=False)
     app.state.db = db
 
+    cache = _initialize_cache()
+    await cache.start()
+    app.state.cache = cache
+
+    # 同步等写操作发布的领域事件（如概念变更后的缓存失效）经此分发
+    event_bus = _initialize_event_bus(cache)
+    set_event_bus(event_bus)
+    app.state.event_bus = event_bus
+
     mediator = Mediator()
     _register_handlers(mediator, db)
     app.state.mediator = mediator
@@ -73,16 +143,39 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
     app.state.module_registry = module_registry
     app.state.scheduler = scheduler
 
-    # 启动调度器
-    scheduler.start()
-    logger.info("Scheduler started")
+    # 启动调度器：开启主节点选举时只有主节点运行调度器，其余进程待命
+    if settings.SCHEDULER_LEADER_ELECTION_ENABLED:
+        from app.modules.foundation.interfaces.scheduler import create_leader_elector
+
+        leader_elector = create_leader_elector(db.engine, scheduler)
+        app.state.leader_elector = leader_elector
+        await leader_elector.start()
+    else:
+        app.state.leader_elector = None
+        await scheduler.restore()
+        scheduler.start()
+        logger.info("Scheduler started")
+
+    # 初始化并启动后台任务执行器（恢复重启前未完成的任务）
+    job_runner = _initialize_job_runner(db)
+    app.state.job_runner = job_runner
+    await job_runner.start()
 
     yield
 
-    # 关闭调度器
+    # 关闭后台任务执行器
+    await job_runner.shutdown()
+
+    # 关闭调度器后再释放主节点身份，避免接管的实例与本进程未结束的任务重叠
     scheduler.shutdown(wait=True)
+    if module_registry.dispatcher is not None:
+        await module_registry.dispatcher.shutdown(wait=True)
+    if app.state.leader_elector is not None:
+        await app.state.leader_elector.stop()
     logger.info("Scheduler shut down")
 
+    set_event_bus(InProcessEventBus())
+    await cache.close()
     await db.dispose()
     logger.info("Application shut down")
 
@@ -105,5 +198,9 @@ register_modules(app)
 
 
 @app.get("/health", response_model=ApiResponse[dict])
-async def health_check() -> ApiResponse[dict]:
-    return ApiResponse.success(data={"status": "healthy"})
+async def health_check(request: Request) -> ApiResponse[dict]:
+    data: dict = {"status": "healthy"}
+    leader_elector = getattr(request.app.state, "leader_elector", None)
+    if leader_elector is not None:
+        data["scheduler"] = leader_elector.status()
+    return ApiResponse.success(data=data)
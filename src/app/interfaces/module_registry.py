@@ -17,12 +17,20 @@ def _collect_module_routers() -> list[tuple[APIRouter, str]]:
     from app.modules.data_engineering.interfaces.api.stock_daily_router import (
         router as stock_daily_router,
     )
+    from app.modules.data_engineering.interfaces.api.trade_calendar_router import (
+        router as trade_calendar_router,
+    )
+    from app.modules.foundation.interfaces.api.job_router import router as job_router
+    from app.modules.foundation.interfaces.api.scheduler_router import router as scheduler_router
 
     return [
         (stock_basic_router, "/api/v1"),
         (stock_daily_router, "/api/v1"),
         (finance_indicator_router, "/api/v1"),
         (concept_router, "/api/v1"),
+        (trade_calendar_router, "/api/v1"),
+        (job_router, "/api/v1"),
+        (scheduler_router, "/api/v1"),
     ]
 
 
@@ -0,0 +1,20 @@
+"""分页接口的公共处理：字段投影参数解析与 Link 下一页头。
+
+列表数据仍放在 ApiResponse.data 中，下一页地址通过 RFC 8288 Link 头（rel="next"）返回，不改变响应结构。
+"""
+
+from fastapi import Request, Response
+
+
+def parse_fields(fields: str | None) -> tuple[str, ...] | None:
+    """解析逗号分隔的 fields 参数，空值表示全部字段。"""
+    if not fields:
+        return None
+    parsed = tuple(dict.fromkeys(f.strip() for f in fields.split(",") if f.strip()))
+    return parsed or None
+
+
+def set_next_link(request: Request, response: Response, next_cursor: str | None) -> None:
+    """存在下一页时写入 Link 头：沿用本次请求的查询参数，仅替换 cursor。"""
+    if next_cursor is not None:
+        response.headers["Link"] = f'<{request.url.include_query_params(cursor=next_cursor)}>; rel="next"'
@@ -0,0 +1,34 @@
+"""定时任务工作进程入口。
+
+工作进程不运行调度器，只按任务 ID 执行主进程分派来的任务；
+load_scheduled_task_callables() 在工作进程启动时调用，构建与主进程相同的任务执行函数。
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import TYPE_CHECKING
+
+from app.modules.foundation.application.module_registry import ModuleRegistry
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+def load_scheduled_task_callables(
+    session_factory: async_sessionmaker[AsyncSession],
+) -> dict[str, Callable[[], Awaitable[int | None]]]:
+    """构建全部业务模块的定时任务执行函数。
+
+    Args:
+        session_factory: 工作进程自己的 async_sessionmaker。
+
+    Returns:
+        任务 ID 到 async callable 的映射。
+    """
+    import app.modules  # noqa: PLC0415
+
+    registry = ModuleRegistry()
+    app.modules.register_scheduled_tasks(registry, session_factory)
+    _, task_callables = registry.collect_tasks()
+    return task_callables
@@ -1,6 +1,7 @@
 """业务模块注册中心。
 
-提供 register_scheduled_tasks() 函数，供应用启动时注册所有模块的定时任务。
+提供 register_scheduled_tasks() / register_background_jobs() / register_event_handlers() /
+register_cache_types() 函数，供应用启动时注册所有模块的定时任务、后台任务、领域事件订阅者与缓存类型。
 """
 
 from __future__ import annotations
@@ -11,16 +12,20 @@ from typing import TYPE_CHECKING, TypeAlias
 if TYPE_CHECKING:
     from sqlalchemy.ext.asyncio import async_sessionmaker
 
+    from app.modules.foundation.application.job_runner import JobRunner
     from app.modules.foundation.application.module_registry import ModuleRegistry
+    from app.shared_kernel.application.event_bus import EventBus
+    from app.shared_kernel.infrastructure.cache import CacheClient
+    from app.shared_kernel.infrastructure.cache_serializer import CacheSerializer
 
 # 定义任务工厂类型
 ScheduledTaskFactory: TypeAlias = Callable[
     [],
-    tuple[list, dict[str, Callable[[], Awaitable[None]]]],
+    tuple[list, dict[str, Callable[[], Awaitable[int | None]]]],
 ]
 
 
-def register_scheduled_tasks(registry: "ModuleRegistry", session_factory: "async_sessionmaker") -> None:
+def register_scheduled_tasks(registry: ModuleRegistry, session_factory: async_sessionmaker) -> None:
     """注册所有业务模块的定时任务到 ModuleRegistry。
 
     新增业务模块时，需要在此函数中添加该模块的任务注册代码。
@@ -32,13 +37,18 @@ def register_scheduled_tasks(registry: "ModuleRegistry", session_factory: "async
     # 注册 data_engineering 模块的定时任务
     # 注意：这里使用延迟导入避免循环依赖
     try:
-        from app.modules.data_engineering.interfaces.schedulers import create_scheduled_tasks
+        from app.modules.data_engineering.interfaces.schedulers import (
+            TradeCalendarProvider,
+            create_scheduled_tasks,
+        )
 
         # 创建工厂闭包，捕获 session_factory
-        def de_factory() -> tuple[list, dict[str, Callable[[], Awaitable[None]]]]:
+        def de_factory() -> tuple[list, dict[str, Callable[[], Awaitable[int | None]]]]:
             return create_scheduled_tasks(session_factory)
 
         registry.register_scheduled_tasks(de_factory)
+        # data_engineering 维护交易所交易日历，供交易日触发器使用
+        registry.register_trading_calendar(TradeCalendarProvider(session_factory))
     except ImportError:
         # 如果 data_engineering 模块尚未实现任务注册，跳过
         pass
@@ -46,6 +56,40 @@ def register_scheduled_tasks(registry: "ModuleRegistry", session_factory: "async
     # 新增模块时，在此处添加注册代码
     # 例如：
     # from app.modules.new_module.interfaces.schedulers import create_scheduled_tasks
-    # def new_module_factory() -> tuple[list, dict[str, Callable[[], Awaitable[None]]]]:
+    # def new_module_factory() -> tuple[list, dict[str, Callable[[], Awaitable[int | None]]]]:
     #     return create_scheduled_tasks(session_factory)
-    # registry.register_scheduled_tasks(new_module_factory)
\ No newline at end of file
+    # registry.register_scheduled_tasks(new_module_factory)
+
+
+def register_background_jobs(runner: JobRunner, session_factory: async_sessionmaker) -> None:
+    """注册所有业务模块的后台任务类型到 JobRunner。
+
+    新增业务模块时，需要在此函数中添加该模块的任务注册代码。
+
+    Args:
+        runner: JobRunner 实例。
+        session_factory: SQLAlchemy async_sessionmaker 实例。
+    """
+    from app.modules.data_engineering.interfaces.jobs import create_background_jobs
+
+    for job_type, factory in create_background_jobs(session_factory).items():
+        runner.register(job_type, factory)
+
+
+def register_event_handlers(event_bus: EventBus, cache: CacheClient) -> None:
+    """注册所有业务模块的领域事件订阅者。
+
+    Args:
+        event_bus: 本进程的事件总线。
+        cache: 订阅者失效查询缓存所用的缓存客户端。
+    """
+    from app.modules.data_engineering.interfaces.consumers import register_event_handlers as register_de_handlers
+
+    register_de_handlers(event_bus, cache)
+
+
+def register_cache_types(serializer: CacheSerializer) -> None:
+    """注册所有业务模块缓存的实体类型，供 Redis 缓存后端序列化与还原。"""
+    from app.modules.data_engineering.interfaces.dependencies import register_cache_types as register_de_types
+
+    register_de_types(serializer)
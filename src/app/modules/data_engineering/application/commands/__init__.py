@@ -11,12 +11,14 @@ from .sync_finance_indicator_commands import (
 )
 from .sync_finance_indicator_full_handler import SyncFinanceIndicatorFullHandler
 from .sync_finance_indicator_increment_handler import SyncFinanceIndicatorIncrementHandler
-from .sync_stock_basic import SyncStockBasic
+from .sync_stock_basic import SyncStockBasic, SyncStockBasicResult
 from .sync_stock_basic_handler import SyncStockBasicHandler
 from .sync_stock_daily_history import SyncStockDailyHistory
 from .sync_stock_daily_history_handler import SyncStockDailyHistoryHandler
 from .sync_stock_daily_increment import SyncStockDailyIncrement
 from .sync_stock_daily_increment_handler import SyncStockDailyIncrementHandler
+from .sync_trade_calendar import SyncTradeCalendar
+from .sync_trade_calendar_handler import SyncTradeCalendarHandler
 
 __all__ = [
     "RetryStockDailySyncFailuresHandler",
@@ -30,8 +32,11 @@ __all__ = [
     "SyncFinanceIndicatorIncrement",
     "SyncStockBasicHandler",
     "SyncStockBasic",
+    "SyncStockBasicResult",
     "SyncStockDailyHistoryHandler",
     "SyncStockDailyHistory",
     "SyncStockDailyIncrementHandler",
     "SyncStockDailyIncrement",
+    "SyncTradeCalendarHandler",
+    "SyncTradeCalendar",
 ]
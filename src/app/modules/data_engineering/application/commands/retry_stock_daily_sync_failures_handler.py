@@ -9,6 +9,7 @@ from app.modules.data_engineering.domain.repositories.stock_daily_repository imp
 from app.modules.data_engineering.domain.repositories.stock_daily_sync_failure_repository import (
     StockDailySyncFailureRepository,
 )
+from app.modules.data_engineering.domain.services.security_master import SecurityMaster
 from app.shared_kernel.application.command_handler import CommandHandler
 from app.shared_kernel.domain.unit_of_work import UnitOfWork
 from app.shared_kernel.infrastructure.logging import get_logger
@@ -19,7 +20,7 @@ logger = get_logger(__name__)
 
 
 class RetryStockDailySyncFailuresHandler(CommandHandler[RetryStockDailySyncFailures, RetryResult]):
-    """重试失败记录 Handler。查询未解决且未超限的记录，逐个重试。"""
+    """重试失败记录 Handler。查询未解决且未超限的记录，逐个重试；注入证券主数据时填充 symbol。"""
 
     def __init__(
         self,
@@ -27,11 +28,13 @@ class RetryStockDailySyncFailuresHandler(CommandHandler[RetryStockDailySyncFailu
         daily_repo: StockDailyRepository,
         failure_repo: StockDailySyncFailureRepository,
         uow: UnitOfWork,
+        securities: SecurityMaster | None = None,
     ) -> None:
         self.gateway = gateway
         self.daily_repo = daily_repo
         self.failure_repo = failure_repo
         self.uow = uow
+        self.securities = securities
 
     async def handle(self, command: RetryStockDailySyncFailures) -> RetryResult:
         async with self.uow:
@@ -65,6 +68,10 @@ class RetryStockDailySyncFailuresHandler(CommandHandler[RetryStockDailySyncFailu
                 )
 
                 records = await self.gateway.fetch_stock_daily(failure.third_code, failure.start_date, failure.end_date)
+                symbol = self.securities.symbol_of(failure.third_code) if self.securities is not None else None
+                if symbol is not None:
+                    for record in records:
+                        record.symbol = symbol
 
                 async with self.uow:
                     if records:
@@ -1,15 +1,23 @@
 """概念板块同步命令。"""
 
 from dataclasses import dataclass
+from enum import StrEnum
 
 from app.shared_kernel.application.command import Command
 
 
+class ConceptSyncStrategy(StrEnum):
+    """概念同步策略。"""
+
+    INCREMENTAL = "incremental"  # 逐概念独立事务比对写入
+    SNAPSHOT = "snapshot"  # 完整快照写入影子表，单个短事务合并
+
+
 @dataclass(frozen=True)
 class SyncConcepts(Command):
     """触发一次概念板块同步。"""
 
-    pass
+    strategy: ConceptSyncStrategy = ConceptSyncStrategy.INCREMENTAL
 
 
 @dataclass(frozen=True)
@@ -24,3 +32,6 @@ class SyncConceptsResult:
     deleted_stocks: int
     duration_ms: int
     failed_concepts: int = 0  # 新增失败概念计数
+    unchanged_concepts: int = 0  # 内容与成分股均未变化而跳过的概念数
+    interrupted: bool = False  # 因取消或超时在批次之间停止，结果只含已处理部分
+    stop_reason: str | None = None  # 提前停止的原因（cancelled / deadline）
@@ -1,3 +1,4 @@
+import asyncio
 import os
 from collections.abc import Mapping
 from dataclasses import replace
@@ -9,21 +10,30 @@ import psutil  # type: ignore
 from app.config import settings
 from app.modules.data_engineering.domain.entities.concept import Concept
 from app.modules.data_engineering.domain.entities.concept_stock import ConceptStock
-from app.modules.data_engineering.domain.entities.stock_basic import StockBasic
+from app.modules.data_engineering.domain.events import ConceptsChanged
 from app.modules.data_engineering.domain.gateways.concept_gateway import ConceptGateway
 from app.modules.data_engineering.domain.repositories.concept_repository import ConceptRepository
+from app.modules.data_engineering.domain.repositories.concept_snapshot_repository import (
+    ConceptSnapshotRepository,
+)
 from app.modules.data_engineering.domain.repositories.concept_stock_repository import (
     ConceptStockRepository,
 )
 from app.modules.data_engineering.domain.repositories.stock_basic_repository import (
     StockBasicRepository,
 )
+from app.modules.data_engineering.domain.services.security_master import SecurityMaster
+from app.modules.data_engineering.domain.value_objects.concept_snapshot import ConceptSnapshotMember
 from app.modules.data_engineering.domain.value_objects.data_source import DataSource
+from app.modules.data_engineering.domain.value_objects.stock_status import StockStatus
 from app.shared_kernel.application.command_handler import CommandHandler
+from app.shared_kernel.application.event_bus import EventBus
+from app.shared_kernel.application.execution_budget import ExecutionBudget, StopReason
+from app.shared_kernel.application.progress import NullProgressReporter, ProgressReporter
 from app.shared_kernel.domain.unit_of_work import UnitOfWork
 from app.shared_kernel.infrastructure.logging import get_logger
 
-from .sync_concepts import SyncConcepts, SyncConceptsResult
+from .sync_concepts import ConceptSyncStrategy, SyncConcepts, SyncConceptsResult
 
 logger = get_logger(__name__)
 
@@ -38,16 +48,26 @@ class SyncConceptsHandler(CommandHandler[SyncConcepts, SyncConceptsResult]):
     - 全量同步：每次同步都处理所有概念，确保数据最终一致性
     - 独立事务：每个概念使用独立事务，错误隔离，避免影响其他概念
     - 批量处理：支持分批处理大量概念，避免内存溢出
+    - 并发预取：按批次以有界并发拉取成分股，并与上一批次的写入重叠执行
+    - 变更跳过：概念内容哈希与成分股聚合哈希均未变化时跳过写入与事务
     - 性能监控：记录处理时间、内存使用等性能指标
+    - 执行预算：内存超过阈值时缩小预取并发与批次并停止重叠预取；取消或超时时在批次之间停止，返回已处理部分
     - 错误处理：单个概念失败不影响其他概念的处理
+    - 变更事件：同步结束后发布 ConceptsChanged（仅含已提交的变更），供查询缓存精确失效
 
     Attributes:
         _gateway: 概念数据网关，用于获取远程数据
         _concept_repo: 概念仓储，用于持久化概念数据
         _concept_stock_repo: 概念-股票关联仓储，用于持久化股票关系
-        _stock_basic_repo: 股票基础信息仓储，用于股票匹配
+        _stock_basic_repo: 股票基础信息仓储，未注入证券主数据时用于构建匹配索引
         _uow: 工作单元，管理事务
         _batch_size: 批次大小，用于分批处理大量概念
+        _fetch_concurrency: 成分股预取的最大并发数
+        _snapshot_repo: 概念快照仓储，快照策略下使用
+        _progress: 进度上报器
+        _budget: 执行预算（截止时间、内存阈值、取消标记）
+        _event_bus: 领域事件总线，为 None 时不发布事件
+        _securities: 证券主数据，用于将 AKShare 代码解析为股票；为 None 时每次同步从仓储构建
     """
 
     def __init__(
@@ -58,6 +78,12 @@ class SyncConceptsHandler(CommandHandler[SyncConcepts, SyncConceptsResult]):
         stock_basic_repo: StockBasicRepository,
         uow: UnitOfWork,
         batch_size: int | None = None,  # 可选，默认使用配置
+        fetch_concurrency: int | None = None,  # 可选，默认使用配置
+        snapshot_repo: ConceptSnapshotRepository | None = None,  # 快照策略所需
+        progress: ProgressReporter | None = None,  # 可选，后台任务进度上报
+        budget: ExecutionBudget | None = None,  # 可选，默认不限时间与内存
+        event_bus: EventBus | None = None,  # 可选，发布 ConceptsChanged
+        securities: SecurityMaster | None = None,  # 可选，进程内共享的证券主数据
     ) -> None:
         """初始化同步处理器。
 
@@ -68,6 +94,12 @@ class SyncConceptsHandler(CommandHandler[SyncConcepts, SyncConceptsResult]):
             stock_basic_repo: 股票基础信息仓储
             uow: 工作单元
             batch_size: 批次大小，默认使用配置文件中的值
+            fetch_concurrency: 成分股预取并发数，默认使用配置文件中的值
+            snapshot_repo: 概念快照仓储，仅快照策略使用
+            progress: 进度上报器，默认丢弃进度
+            budget: 执行预算，默认不限时间与内存
+            event_bus: 领域事件总线，默认不发布事件
+            securities: 证券主数据，默认每次同步从仓储加载上市股票构建
         """
         self._gateway = gateway
         self._concept_repo = concept_repo
@@ -75,6 +107,12 @@ class SyncConceptsHandler(CommandHandler[SyncConcepts, SyncConceptsResult]):
         self._stock_basic_repo = stock_basic_repo
         self._uow = uow
         self._batch_size = batch_size or settings.CONCEPT_SYNC_BATCH_SIZE
+        self._fetch_concurrency = fetch_concurrency or settings.CONCEPT_SYNC_FETCH_CONCURRENCY
+        self._snapshot_repo = snapshot_repo
+        self._progress = progress or NullProgressReporter()
+        self._budget = budget or ExecutionBudget()
+        self._event_bus = event_bus
+        self._securities = securities
 
     def _get_memory_usage(self) -> dict[str, int]:
         """获取当前进程的内存使用情况。
@@ -94,11 +132,15 @@ class SyncConceptsHandler(CommandHandler[SyncConcepts, SyncConceptsResult]):
 
         同步流程：
         1. 准备阶段：获取所有远程概念、本地概念和股票基础数据
-        2. 分批处理：按批次处理所有远程概念，每个概念使用独立事务
-        3. 清理阶段：删除本地存在但远程不存在的过时概念
+        2. 分批处理：按批次并发预取成分股，再逐个概念以独立事务写入；
+           下一批次的预取与当前批次的写入重叠进行
+        3. 清理阶段：以单个事务批量删除本地存在但远程不存在的过时概念
+
+        快照策略（SNAPSHOT）下，第 2、3 步改为：完整快照批量写入影子表，
+        再在单个短事务内以集合运算合并到正式表，读者只会看到旧快照或新快照。
 
         Args:
-            command: 同步命令（当前无参数）
+            command: 同步命令，strategy 指定同步策略
 
         Returns:
             包含同步结果统计的 SyncConceptsResult 对象
@@ -115,22 +157,28 @@ class SyncConceptsHandler(CommandHandler[SyncConcepts, SyncConceptsResult]):
         # 准备阶段：获取所有必要数据
         remote_concepts = await self._gateway.fetch_concepts()
         local_concepts = await self._concept_repo.find_all(DataSource.AKSHARE)
-        stock_basics = await self._stock_basic_repo.find_all_listed(DataSource.TUSHARE)
+        securities = self._securities
+        if securities is None:
+            securities = SecurityMaster(await self._stock_basic_repo.find_all_listed(DataSource.TUSHARE))
+        # 一次性加载全部成分股关联，按 concept_id 分组作为内存索引，避免逐概念查询
+        local_memberships = await self._concept_stock_repo.find_all_grouped_by_concept(DataSource.AKSHARE)
 
         logger.info(
             "数据准备完成",
             remote_concepts_count=len(remote_concepts),
             local_concepts_count=len(local_concepts),
-            stock_basics_count=len(stock_basics),
+            stock_basics_count=len(securities),
+            local_memberships_count=sum(len(stocks) for stocks in local_memberships.values()),
             **self._get_memory_usage(),
         )
 
         # 构建映射表用于快速查找
-        symbol_map = {s.symbol: s for s in stock_basics}
-        third_code_map = {s.third_code: s for s in stock_basics}
         remote_map = {c.third_code: c for c in remote_concepts}
         local_map = {c.third_code: c for c in local_concepts}
 
+        if command.strategy is ConceptSyncStrategy.SNAPSHOT:
+            return await self._sync_snapshot(remote_map, local_map, local_memberships, securities, now, start)
+
         # 统计计数器
         new_concepts = 0
         modified_concepts = 0
@@ -139,37 +187,70 @@ class SyncConceptsHandler(CommandHandler[SyncConcepts, SyncConceptsResult]):
         modified_stocks = 0
         deleted_stocks = 0
         failed_concepts = 0
+        unchanged_concepts = 0
+        changed_ids: list[int] = []
+
+        stop_reason: StopReason | None = None
 
         # 第一阶段：分批处理所有远程概念（每个概念独立事务）
+        # 批次大小按执行预算动态调整：内存压力下逐级减半，因此批次在处理过程中逐个切分
         remote_items = list(remote_map.items())
-        total_batches = (len(remote_items) + self._batch_size - 1) // self._batch_size
-
-        for batch_idx in range(total_batches):
-            start_idx = batch_idx * self._batch_size
-            end_idx = start_idx + self._batch_size
-            batch_items = remote_items[start_idx:end_idx]
-
+        next_prefetch: asyncio.Task[dict[str, list[tuple[str, str]] | BaseException]] | None = None
+        self._progress.report(total=len(remote_items), processed=0, rows_written=0, failures=0)
+
+        processed = 0
+        batch_number = 0
+        batch_items = remote_items[: self._budget.scale(self._batch_size)]
+        while batch_items:
+            batch_number += 1
             logger.info(
                 "开始处理批次",
-                batch_number=batch_idx + 1,
-                total_batches=total_batches,
+                batch_number=batch_number,
                 batch_size=len(batch_items),
                 **self._get_memory_usage(),
             )
 
+            prefetched = await (next_prefetch or self._prefetch_concept_stocks(batch_items))
+            next_start = processed + len(batch_items)
+            next_items = remote_items[next_start : next_start + self._budget.scale(self._batch_size)]
+            # 当前批次写入期间提前拉取下一批次的成分股；内存压力下不重叠，先释放当前批次再拉取
+            next_prefetch = (
+                asyncio.create_task(self._prefetch_concept_stocks(next_items))
+                if next_items and not self._budget.under_pressure
+                else None
+            )
+
             for i, (third_code, remote) in enumerate(batch_items, 1):
                 try:
-                    global_progress = f"{batch_idx * self._batch_size + i}/{len(remote_items)}"
+                    global_progress = f"{processed + i}/{len(remote_items)}"
                     logger.info(
                         "开始处理概念", third_code=third_code, concept_name=remote.name, progress=global_progress
                     )
 
+                    remote_tuples = prefetched[third_code]
+                    if isinstance(remote_tuples, BaseException):
+                        raise remote_tuples
+
+                    resolved = self._resolve_members(remote_tuples, securities)
+                    remote = replace(remote, membership_hash=self._membership_hash(resolved))
+                    local = local_map.get(third_code)
+                    if (
+                        local is not None
+                        and local.content_hash == remote.content_hash
+                        and local.membership_hash == remote.membership_hash
+                    ):
+                        # 名称与成分股均未变化：不写库、不开事务
+                        unchanged_concepts += 1
+                        logger.debug("概念未变化，跳过", third_code=third_code)
+                        continue
+
                     # 在独立事务中处理单个概念
-                    n, m, d = await self._process_single_concept(
-                        remote, local_map.get(third_code), now, symbol_map, third_code_map
+                    concept_id, n, m, d = await self._process_single_concept(
+                        remote, local, now, resolved, local_memberships
                     )
+                    changed_ids.append(concept_id)
 
-                    if local_map.get(third_code) is None:
+                    if local is None:
                         new_concepts += 1
                     else:
                         modified_concepts += 1
@@ -188,31 +269,55 @@ class SyncConceptsHandler(CommandHandler[SyncConcepts, SyncConceptsResult]):
                     # 继续处理下一个概念
                     continue
 
+            processed = next_start
+            self._progress.report(
+                processed=processed,
+                rows_written=new_stocks + modified_stocks + deleted_stocks,
+                failures=failed_concepts,
+            )
             # 批次完成后记录内存使用情况
-            logger.info("批次处理完成", batch_number=batch_idx + 1, **self._get_memory_usage())
-
-        # 第二阶段：清理过时概念（每个概念独立事务）
-        obsolete_third_codes = set(local_map.keys()) - set(remote_map.keys())
-        logger.info("开始清理过时概念", obsolete_count=len(obsolete_third_codes))
-
-        for third_code in obsolete_third_codes:
-            try:
-                local = local_map[third_code]
-                if local.id is None:
-                    continue
+            logger.info("批次处理完成", batch_number=batch_number, **self._get_memory_usage())
+            del prefetched
+            if self._budget.check_memory():
+                logger.warning(
+                    "内存超过阈值，降低预取并发与批次",
+                    rss_mb=self._budget.last_rss_mb,
+                    pressure_level=self._budget.pressure_level,
+                    next_batch_size=self._budget.scale(self._batch_size),
+                )
 
-                await self._delete_obsolete_concept(local.id)
-                deleted_concepts += 1
+            stop_reason = self._budget.stop_reason()
+            if stop_reason is not None:
+                if next_prefetch is not None:
+                    next_prefetch.cancel()
+                logger.warning(
+                    "概念同步提前停止", reason=stop_reason.value, processed=processed, total=len(remote_items)
+                )
+                break
+            batch_items = next_items
 
-                # 获取该概念的股票数量用于统计
-                old_stocks = await self._concept_stock_repo.find_by_concept_id(local.id)
-                deleted_stocks += len(old_stocks)
+        # 第二阶段：清理过时概念（单个事务内批量删除）；提前停止时留待下次同步
+        obsolete_third_codes = set(local_map.keys()) - set(remote_map.keys()) if stop_reason is None else set()
+        # 海象变量绑定在函数作用域，另起名以免与上文的 concept_id: int 冲突
+        obsolete_ids = [obsolete_id for code in obsolete_third_codes if (obsolete_id := local_map[code].id) is not None]
+        logger.info("开始清理过时概念", obsolete_count=len(obsolete_ids))
 
-                logger.info("过时概念清理完成", third_code=third_code)
+        if obsolete_ids:
+            try:
+                await self._delete_obsolete_concepts(obsolete_ids)
+                deleted_concepts += len(obsolete_ids)
+                changed_ids.extend(obsolete_ids)
+                # 删除前的成分股数量来自预加载索引
+                deleted_stocks += sum(len(local_memberships.get(concept_id, [])) for concept_id in obsolete_ids)
+                logger.info("过时概念清理完成", deleted_concepts=len(obsolete_ids))
 
             except Exception as e:
-                logger.error("过时概念清理失败", third_code=third_code, error=str(e), exc_info=True)
-                continue
+                logger.error(
+                    "过时概念清理失败", obsolete_third_codes=sorted(obsolete_third_codes), error=str(e), exc_info=True
+                )
+
+        if changed_ids:
+            await self._publish(ConceptsChanged(source=DataSource.AKSHARE, concept_ids=tuple(changed_ids)))
 
         total_stocks = new_stocks + modified_stocks + deleted_stocks
         duration_ms = int((perf_counter() - start) * 1000)
@@ -229,6 +334,8 @@ class SyncConceptsHandler(CommandHandler[SyncConcepts, SyncConceptsResult]):
             modified_stocks=modified_stocks,
             deleted_stocks=deleted_stocks,
             failed_concepts=failed_concepts,
+            unchanged_concepts=unchanged_concepts,
+            stop_reason=stop_reason.value if stop_reason else None,
             duration_ms=duration_ms,
             **final_memory,
         )
@@ -243,20 +350,152 @@ class SyncConceptsHandler(CommandHandler[SyncConcepts, SyncConceptsResult]):
             modified_stocks=modified_stocks,
             deleted_stocks=deleted_stocks,
             duration_ms=duration_ms,
+            failed_concepts=failed_concepts,
+            unchanged_concepts=unchanged_concepts,
+            interrupted=stop_reason is not None,
+            stop_reason=stop_reason.value if stop_reason else None,
+        )
+
+    async def _sync_snapshot(
+        self,
+        remote_map: dict[str, Concept],
+        local_map: dict[str, Concept],
+        local_memberships: Mapping[int, list[ConceptStock]],
+        securities: SecurityMaster,
+        now: datetime,
+        start: float,
+    ) -> SyncConceptsResult:
+        """快照策略：预取全部成分股 → 批量写入影子表 → 单个短事务合并。
+
+        成分股拉取失败的概念沿用本地已有关系（及其聚合哈希）写入快照，避免被误判为成分股清空。
+        快照只能整体合并：预取结束时若已请求取消，则不写入任何数据直接返回；
+        仅超过截止时间时仍合并已拉取完整的快照，合并语句数固定，丢弃快照只会让下次同步重新全部拉取。
+        """
+        if self._snapshot_repo is None:
+            raise ValueError("快照同步策略需要注入 ConceptSnapshotRepository")
+
+        remote_items = list(remote_map.items())
+        self._progress.report(total=len(remote_items), processed=0, rows_written=0, failures=0)
+        prefetched = await self._prefetch_concept_stocks(remote_items)
+        stop_reason = self._budget.stop_reason()
+        if stop_reason is StopReason.DEADLINE:
+            logger.warning("概念快照预取超过截止时间，仍合并已拉取的快照", total=len(remote_items))
+            stop_reason = None
+        if stop_reason is not None:
+            logger.warning("概念快照同步提前停止，未合并快照", reason=stop_reason.value, total=len(remote_items))
+            return SyncConceptsResult(
+                total_concepts=len(remote_items),
+                new_concepts=0,
+                modified_concepts=0,
+                deleted_concepts=0,
+                total_stocks=0,
+                new_stocks=0,
+                modified_stocks=0,
+                deleted_stocks=0,
+                duration_ms=int((perf_counter() - start) * 1000),
+                interrupted=True,
+                stop_reason=stop_reason.value,
+            )
+
+        concepts: list[Concept] = []
+        members: list[ConceptSnapshotMember] = []
+        failed_concepts = 0
+        for third_code, remote in remote_items:
+            remote_tuples = prefetched[third_code]
+            if isinstance(remote_tuples, BaseException):
+                failed_concepts += 1
+                logger.error("概念成分股拉取失败，沿用本地关系", third_code=third_code, error=str(remote_tuples))
+                local = local_map.get(third_code)
+                existing = local_memberships.get(local.id, []) if local is not None and local.id is not None else []
+                members.extend(
+                    ConceptSnapshotMember(third_code, s.stock_third_code, s.stock_symbol, s.content_hash)
+                    for s in existing
+                )
+                concepts.append(replace(remote, membership_hash=local.membership_hash if local else None))
+                continue
+            resolved = self._resolve_members(remote_tuples, securities)
+            members.extend(
+                ConceptSnapshotMember(third_code, stock_third_code, stock_symbol, content_hash)
+                for stock_third_code, (stock_symbol, content_hash) in resolved.items()
+            )
+            concepts.append(replace(remote, membership_hash=self._membership_hash(resolved)))
+
+        logger.info("快照准备完成", concepts=len(remote_items), members=len(members), **self._get_memory_usage())
+
+        try:
+            await self._snapshot_repo.stage(DataSource.AKSHARE, concepts, members)
+            await self._uow.commit()
+            diff = await self._snapshot_repo.apply(DataSource.AKSHARE, now)
+            await self._uow.commit()
+        except Exception:
+            await self._uow.rollback()
+            raise
+
+        total_stocks = diff.new_stocks + diff.modified_stocks + diff.deleted_stocks
+        if total_stocks or diff.new_concepts or diff.modified_concepts or diff.deleted_concepts:
+            # 集合合并只返回计数，无法精确到概念
+            await self._publish(ConceptsChanged(source=DataSource.AKSHARE, all_concepts=True))
+        self._progress.report(processed=len(remote_items), rows_written=total_stocks, failures=failed_concepts)
+        duration_ms = int((perf_counter() - start) * 1000)
+        logger.info(
+            "快照同步完成",
+            total_concepts=len(remote_items),
+            new_concepts=diff.new_concepts,
+            modified_concepts=diff.modified_concepts,
+            deleted_concepts=diff.deleted_concepts,
+            total_stocks=total_stocks,
+            new_stocks=diff.new_stocks,
+            modified_stocks=diff.modified_stocks,
+            deleted_stocks=diff.deleted_stocks,
+            failed_concepts=failed_concepts,
+            duration_ms=duration_ms,
+            **self._get_memory_usage(),
+        )
+        return SyncConceptsResult(
+            total_concepts=len(remote_items),
+            new_concepts=diff.new_concepts,
+            modified_concepts=diff.modified_concepts,
+            deleted_concepts=diff.deleted_concepts,
+            total_stocks=total_stocks,
+            new_stocks=diff.new_stocks,
+            modified_stocks=diff.modified_stocks,
+            deleted_stocks=diff.deleted_stocks,
+            duration_ms=duration_ms,
+            failed_concepts=failed_concepts,
         )
 
+    async def _prefetch_concept_stocks(
+        self, batch_items: list[tuple[str, Concept]]
+    ) -> dict[str, list[tuple[str, str]] | BaseException]:
+        """以有界并发拉取一个批次内所有概念的成分股。
+
+        单个概念拉取失败不影响其他概念，异常作为结果返回，由调用方计入 failed_concepts。
+
+        Returns:
+            概念 third_code 到成分股列表（或拉取异常）的映射
+        """
+        # 内存压力下按执行预算缩小并发
+        semaphore = asyncio.Semaphore(self._budget.scale(self._fetch_concurrency))
+
+        async def _fetch(concept: Concept) -> list[tuple[str, str]]:
+            async with semaphore:
+                return await self._gateway.fetch_concept_stocks(concept.third_code, concept.name)
+
+        results = await asyncio.gather(*(_fetch(remote) for _, remote in batch_items), return_exceptions=True)
+        return {third_code: result for (third_code, _), result in zip(batch_items, results, strict=True)}
+
     async def _process_single_concept(
         self,
         remote_concept: Concept,
         local_concept: Concept | None,
         now: datetime,
-        symbol_map: dict[str, StockBasic],
-        third_code_map: dict[str, StockBasic],
-    ) -> tuple[int, int, int]:
+        resolved: Mapping[str, tuple[str, str]],
+        local_memberships: Mapping[int, list[ConceptStock]],
+    ) -> tuple[int, int, int, int]:
         """在独立事务中处理单个概念及其股票关系。
 
         Returns:
-            (new_stocks, modified_stocks, deleted_stocks)
+            (concept_id, new_stocks, modified_stocks, deleted_stocks)
         """
         try:
             # 保存或更新概念
@@ -271,37 +510,30 @@ class SyncConceptsHandler(CommandHandler[SyncConcepts, SyncConceptsResult]):
                     replace(remote_concept, id=local_concept.id, last_synced_at=now)
                 )
                 concept_id = saved_concept.id or 0
-                local_stocks = await self._concept_stock_repo.find_by_concept_id(concept_id)
-                local_stock_map = {s.stock_third_code: s for s in local_stocks}
+                local_stock_map = {s.stock_third_code: s for s in local_memberships.get(concept_id, [])}
 
             # 同步股票关系
             new_stocks, modified_stocks, deleted_stocks = await self._sync_concept_stocks(
                 concept_id,
-                remote_concept.name,
-                remote_concept.third_code,
+                resolved,
                 local_stock_map,
-                symbol_map,
-                third_code_map,
             )
 
             # 提交事务
             await self._uow.commit()
 
-            return new_stocks, modified_stocks, deleted_stocks
+            return concept_id, new_stocks, modified_stocks, deleted_stocks
 
         except Exception as e:
             # 回滚事务
             await self._uow.rollback()
             raise e
 
-    async def _delete_obsolete_concept(self, concept_id: int) -> None:
-        """在独立事务中删除过时概念及其股票关系。"""
+    async def _delete_obsolete_concepts(self, concept_ids: list[int]) -> None:
+        """在单个事务中批量删除过时概念及其股票关系。"""
         try:
-            # 删除所有股票关系
-            await self._concept_stock_repo.delete_by_concept_id(concept_id)
-            # 删除概念
-            await self._concept_repo.delete(concept_id)
-            # 提交事务
+            await self._concept_stock_repo.delete_by_concept_ids(concept_ids)
+            await self._concept_repo.delete_many(concept_ids)
             await self._uow.commit()
 
         except Exception as e:
@@ -309,25 +541,48 @@ class SyncConceptsHandler(CommandHandler[SyncConcepts, SyncConceptsResult]):
             await self._uow.rollback()
             raise e
 
+    async def _publish(self, event: ConceptsChanged) -> None:
+        """发布变更事件；事件总线不可用时只记录日志，同步结果以已提交的数据为准。"""
+        if self._event_bus is None:
+            return
+        try:
+            await self._event_bus.publish(event)
+        except Exception as e:
+            logger.warning("概念变更事件发布失败", error=str(e))
+
+    def _resolve_members(
+        self,
+        remote_tuples: list[tuple[str, str]],
+        securities: SecurityMaster,
+    ) -> dict[str, tuple[str, str]]:
+        """将远程成分股解析为 {stock_third_code: (stock_symbol, content_hash)}。
+
+        AKShare 返回裸代码（如 000001），经证券主数据解析；匹配不上或未上市的股票跳过，
+        同一股票重复出现时只保留首条。
+        """
+        resolved: dict[str, tuple[str, str]] = {}
+        for stock_symbol, _stock_name in remote_tuples:
+            matched_stock = securities.resolve(stock_symbol)
+            if (
+                matched_stock is None
+                or matched_stock.status is not StockStatus.LISTED
+                or matched_stock.third_code in resolved
+            ):
+                continue
+            content_hash = ConceptStock.compute_hash(DataSource.AKSHARE, matched_stock.third_code, stock_symbol)
+            resolved[matched_stock.third_code] = (stock_symbol, content_hash)
+        return resolved
+
+    @staticmethod
+    def _membership_hash(resolved: Mapping[str, tuple[str, str]]) -> str:
+        return Concept.compute_membership_hash({code: content_hash for code, (_, content_hash) in resolved.items()})
+
     async def _sync_concept_stocks(
         self,
         concept_id: int,
-        concept_name: str,
-        concept_third_code: str,
+        resolved: Mapping[str, tuple[str, str]],
         local_map: dict[str, ConceptStock],
-        symbol_map: Mapping[str, StockBasic],
-        third_code_map: Mapping[str, StockBasic],
     ) -> tuple[int, int, int]:
-        remote_tuples = await self._gateway.fetch_concept_stocks(concept_third_code, concept_name)
-        # 构建实际使用的third_code集合，用于删除逻辑
-        remote_actual_third_codes = set()
-        for stock_third_code, _stock_name in remote_tuples:
-            stock_symbol = stock_third_code
-            if stock_symbol in symbol_map:
-                stock = symbol_map[stock_symbol]
-                if stock is not None:
-                    remote_actual_third_codes.add(stock.third_code)
-
         to_upsert: list[ConceptStock] = []
         to_delete_ids: list[int] = []
         now = datetime.now(UTC)
@@ -335,41 +590,15 @@ class SyncConceptsHandler(CommandHandler[SyncConcepts, SyncConceptsResult]):
         modified_count = 0
         deleted_count = 0
 
-        for stock_third_code, _stock_name in remote_tuples:
-            # AKShare返回的代码可能需要格式转换才能匹配symbol
-            stock_symbol = stock_third_code
-            matched_stock: StockBasic | None = None
-
-            # 首先尝试直接匹配symbol
-            if stock_symbol in symbol_map:
-                matched_stock = symbol_map[stock_symbol]
-            else:
-                # 尝试添加市场后缀匹配（如000001 -> 000001.SZ）
-                for suffix in [".SZ", ".SH", ".BJ"]:
-                    candidate = stock_symbol + suffix
-                    if candidate in symbol_map:
-                        matched_stock = symbol_map[candidate]
-                        break
-
-            # 如果仍然匹配不上，跳过这个股票
-            if not matched_stock:
-                continue
-
-            actual_third_code = matched_stock.third_code
-
-            content_hash = ConceptStock.compute_hash(
-                DataSource.AKSHARE,
-                actual_third_code,
-                stock_symbol,
-            )
-            local = local_map.get(actual_third_code)
+        for stock_third_code, (stock_symbol, content_hash) in resolved.items():
+            local = local_map.get(stock_third_code)
             if local is None:
                 to_upsert.append(
                     ConceptStock(
                         id=None,
                         concept_id=concept_id,
                         source=DataSource.AKSHARE,
-                        stock_third_code=actual_third_code,
+                        stock_third_code=stock_third_code,
                         stock_symbol=stock_symbol,
                         content_hash=content_hash,
                         added_at=now,
@@ -383,7 +612,7 @@ class SyncConceptsHandler(CommandHandler[SyncConcepts, SyncConceptsResult]):
                         id=local.id,
                         concept_id=concept_id,
                         source=DataSource.AKSHARE,
-                        stock_third_code=actual_third_code,
+                        stock_third_code=stock_third_code,
                         stock_symbol=stock_symbol,
                         content_hash=content_hash,
                         added_at=local.added_at,
@@ -392,7 +621,7 @@ class SyncConceptsHandler(CommandHandler[SyncConcepts, SyncConceptsResult]):
                 modified_count += 1
 
         for code, local in local_map.items():
-            if code in remote_actual_third_codes:
+            if code in resolved:
                 continue
             if local.id is not None:
                 to_delete_ids.append(local.id)
@@ -9,6 +9,7 @@ from app.modules.data_engineering.domain.repositories.stock_financial_repository
 from app.modules.data_engineering.domain.repositories.stock_basic_repository import (
     StockBasicRepository,
 )
+from app.modules.data_engineering.domain.services.security_master import SecurityMaster
 from app.modules.data_engineering.domain.value_objects.data_source import DataSource
 from app.shared_kernel.application.command_handler import CommandHandler
 from app.shared_kernel.domain.unit_of_work import UnitOfWork
@@ -23,7 +24,10 @@ logger = get_logger(__name__)
 
 
 class SyncFinanceIndicatorByStockHandler(CommandHandler[SyncFinanceIndicatorByStock, SyncFinanceIndicatorResult]):
-    """单股同步：拉取单只股票全部历史财务指标，单次事务。"""
+    """单股同步：拉取单只股票全部历史财务指标，单次事务。
+
+    注入证券主数据时 ts_code 可为任意写法（如 000001、sz000001），经主数据解析为 third_code。
+    """
 
     def __init__(
         self,
@@ -31,11 +35,13 @@ class SyncFinanceIndicatorByStockHandler(CommandHandler[SyncFinanceIndicatorBySt
         fi_repo: StockFinancialRepository,
         gateway: FinancialIndicatorGateway,
         uow: UnitOfWork,
+        securities: SecurityMaster | None = None,
     ) -> None:
         self._basic_repo = basic_repo
         self._fi_repo = fi_repo
         self._gateway = gateway
         self._uow = uow
+        self._securities = securities
 
     async def handle(self, command: SyncFinanceIndicatorByStock) -> SyncFinanceIndicatorResult:
         logger.info(
@@ -45,7 +51,11 @@ class SyncFinanceIndicatorByStockHandler(CommandHandler[SyncFinanceIndicatorBySt
         )
         
         # 获取stock_basic信息以得到symbol
-        stocks = await self._basic_repo.find_by_third_codes(DataSource.TUSHARE, [command.ts_code])
+        if self._securities is not None:
+            resolved = self._securities.resolve(command.ts_code)
+            stocks = [resolved] if resolved is not None else []
+        else:
+            stocks = await self._basic_repo.find_by_third_codes(DataSource.TUSHARE, [command.ts_code])
         if not stocks:
             logger.error(
                 "未找到股票基础信息",
@@ -55,7 +65,7 @@ class SyncFinanceIndicatorByStockHandler(CommandHandler[SyncFinanceIndicatorBySt
         
         stock = stocks[0]
         
-        records = await self._gateway.fetch_by_stock(command.ts_code)
+        records = await self._gateway.fetch_by_stock(stock.third_code)
         # 填充symbol字段
         for record in records:
             record.symbol = stock.symbol
@@ -7,9 +7,15 @@ from app.shared_kernel.application.command import Command
 
 @dataclass(frozen=True)
 class SyncFinanceIndicatorFull(Command):
-    """全量同步财务指标。ts_codes 为空则同步全市场。"""
+    """全量同步财务指标。ts_codes 为空则同步全市场。
+
+    revision_aware 为 True 时启用变更检测模式：仅拉取可能包含新披露或重述的公告窗口，
+    并跳过 (end_date, ann_date, update_flag) 指纹未变化的报告期。
+    """
 
     ts_codes: list[str] = field(default_factory=list)
+    revision_aware: bool = False
+    run_key: str | None = None  # 对应未完成的同步运行时从第一个未完成股票续跑
 
 
 @dataclass(frozen=True)
@@ -34,3 +40,7 @@ class SyncFinanceIndicatorResult:
     success_count: int
     failure_count: int
     synced_records: int
+    skipped_records: int = 0
+    interrupted: bool = False  # 因取消或超时在股票之间停止；全量同步可凭 run_key 续跑
+    run_id: int | None = None
+    stop_reason: str | None = None  # 提前停止的原因（cancelled / deadline）
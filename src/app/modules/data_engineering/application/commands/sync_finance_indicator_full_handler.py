@@ -1,16 +1,27 @@
 """财务指标全量同步 Handler。"""
 
+from datetime import date, timedelta
+
+from app.modules.data_engineering.domain.entities.stock_basic import StockBasic
+from app.modules.data_engineering.domain.entities.stock_financial import StockFinancial
 from app.modules.data_engineering.domain.gateways.financial_indicator_gateway import (
     FinancialIndicatorGateway,
 )
-from app.modules.data_engineering.domain.repositories.stock_financial_repository import (
-    StockFinancialRepository,
-)
 from app.modules.data_engineering.domain.repositories.stock_basic_repository import (
     StockBasicRepository,
 )
+from app.modules.data_engineering.domain.repositories.stock_financial_repository import (
+    StockFinancialRepository,
+)
+from app.modules.data_engineering.domain.repositories.sync_run_repository import SyncRunRepository
+from app.modules.data_engineering.domain.services.security_master import SecurityMaster
 from app.modules.data_engineering.domain.value_objects.data_source import DataSource
+from app.modules.data_engineering.domain.value_objects.financial_report_fingerprint import (
+    FinancialReportFingerprint,
+)
 from app.shared_kernel.application.command_handler import CommandHandler
+from app.shared_kernel.application.execution_budget import ExecutionBudget
+from app.shared_kernel.application.progress import NullProgressReporter, ProgressReporter
 from app.shared_kernel.domain.unit_of_work import UnitOfWork
 from app.shared_kernel.infrastructure.logging import get_logger
 
@@ -18,12 +29,26 @@ from .sync_finance_indicator_commands import (
     SyncFinanceIndicatorFull,
     SyncFinanceIndicatorResult,
 )
+from .sync_run_tracker import SyncRunTracker
 
 logger = get_logger(__name__)
 
+# 变更检测模式下，从已知最新公告日往前回看的天数，覆盖数据源补录延迟
+RESTATEMENT_LOOKBACK_DAYS = 90
+
+SYNC_RUN_KIND = "finance_indicator_full"
+# 单条 upsert 语句的记录数，内存压力下按退让级别逐级减半
+WRITE_CHUNK_SIZE = 500
+
 
 class SyncFinanceIndicatorFullHandler(CommandHandler[SyncFinanceIndicatorFull, SyncFinanceIndicatorResult]):
-    """全量同步：逐股拉取全部历史财务指标，每股独立事务，失败独立捕获继续。"""
+    """全量同步：逐股拉取全部历史财务指标，每股独立事务，失败独立捕获继续。
+
+    变更检测模式（revision_aware）下按已落库指纹缩小拉取窗口，并只 upsert 新增或被重述的报告期。
+    注入 run_repo 时逐股记录断点，执行预算要求停止（取消或超时）后可凭 run_key 从第一个未完成股票续跑。
+    注入证券主数据时股票列表取自进程内快照，不再查询 stock_basic 全表。
+    内存超过阈值时按执行预算缩小写入分块，单股数据写入后即释放。
+    """
 
     def __init__(
         self,
@@ -31,58 +56,122 @@ class SyncFinanceIndicatorFullHandler(CommandHandler[SyncFinanceIndicatorFull, S
         fi_repo: StockFinancialRepository,
         gateway: FinancialIndicatorGateway,
         uow: UnitOfWork,
+        progress: ProgressReporter | None = None,
+        run_repo: SyncRunRepository | None = None,
+        budget: ExecutionBudget | None = None,
+        securities: SecurityMaster | None = None,
     ) -> None:
         self._basic_repo = basic_repo
         self._fi_repo = fi_repo
         self._gateway = gateway
         self._uow = uow
+        self._progress = progress or NullProgressReporter()
+        self._run_repo = run_repo
+        self._budget = budget or ExecutionBudget()
+        self._securities = securities
 
     async def handle(self, command: SyncFinanceIndicatorFull) -> SyncFinanceIndicatorResult:
-        if command.ts_codes:
-            stocks = await self._basic_repo.find_by_third_codes(DataSource.TUSHARE, command.ts_codes)
+        tracker = SyncRunTracker(self._run_repo, self._uow, SYNC_RUN_KIND)
+        pending_codes = await tracker.resume(command.run_key)
+        if pending_codes is not None:
+            stocks = await self._find_in_order(pending_codes)
         else:
-            stocks = await self._basic_repo.find_all(DataSource.TUSHARE)
+            if command.ts_codes:
+                stocks = await self._find(command.ts_codes)
+            elif self._securities is not None:
+                stocks = self._securities.stocks()
+            else:
+                stocks = await self._basic_repo.find_all(DataSource.TUSHARE)
+            await tracker.begin(command.run_key, [s.third_code for s in stocks])
 
         logger.info(
             "财务指标全量同步开始",
             command="SyncFinanceIndicatorFull",
             stock_count=len(stocks),
+            revision_aware=command.revision_aware,
         )
 
         success_count = 0
         failure_count = 0
         synced_records = 0
+        skipped_records = 0
+        stop_reason = None
+        self._progress.report(total=len(stocks), processed=0, rows_written=0, failures=0)
 
-        for stock in stocks:
+        for processed, stock in enumerate(stocks, 1):
+            stop_reason = self._budget.stop_reason()
+            if stop_reason is not None:
+                logger.info(
+                    "财务指标全量同步提前停止，保留断点",
+                    reason=stop_reason.value,
+                    run_id=tracker.run_id,
+                    remaining=len(stocks) - processed + 1,
+                )
+                break
+            if self._budget.check_memory():
+                logger.warning(
+                    "内存超过阈值，缩小写入分块",
+                    rss_mb=self._budget.last_rss_mb,
+                    pressure_level=self._budget.pressure_level,
+                    write_chunk_size=self._budget.scale(WRITE_CHUNK_SIZE),
+                )
             try:
-                records = await self._gateway.fetch_by_stock(stock.third_code)
+                start_date: date | None = None
+                fingerprints: dict[date, FinancialReportFingerprint] = {}
+                if command.revision_aware:
+                    fingerprints = await self._fi_repo.find_fingerprints(DataSource.TUSHARE, stock.third_code)
+                    start_date = self._restatement_window_start(fingerprints)
+
+                records = await self._gateway.fetch_by_stock(stock.third_code, start_date=start_date)
+                fetched_count = len(records)
+                if command.revision_aware:
+                    records = self._filter_changed(records, fingerprints)
+                    skipped_records += fetched_count - len(records)
                 # 填充symbol字段
                 for record in records:
                     record.symbol = stock.symbol
                 async with self._uow:
                     if records:
-                        await self._fi_repo.upsert_many(records)
+                        for chunk in self._budget.chunks(records, WRITE_CHUNK_SIZE):
+                            await self._fi_repo.upsert_many(list(chunk))
                         synced_records += len(records)
+                    await tracker.mark_done(stock.third_code)
                     await self._uow.commit()
                 success_count += 1
                 logger.info(
                     "单股财务指标全量同步完成",
                     third_code=stock.third_code,
+                    start_date=str(start_date) if start_date else None,
+                    fetched_count=fetched_count,
                     record_count=len(records),
                 )
-            except Exception:
+            except Exception as e:
                 failure_count += 1
                 logger.error(
                     "单股财务指标全量同步失败",
                     third_code=stock.third_code,
                     exc_info=True,
                 )
+                try:
+                    async with self._uow:
+                        await tracker.mark_failed(stock.third_code, str(e))
+                        await self._uow.commit()
+                except Exception:
+                    logger.warning("断点记录失败", third_code=stock.third_code, exc_info=True)
+            self._progress.report(processed=processed, rows_written=synced_records, failures=failure_count)
+
+        interrupted = stop_reason is not None
+        await tracker.finish(interrupted)
 
         result = SyncFinanceIndicatorResult(
             total=len(stocks),
             success_count=success_count,
             failure_count=failure_count,
             synced_records=synced_records,
+            skipped_records=skipped_records,
+            interrupted=interrupted,
+            run_id=tracker.run_id,
+            stop_reason=stop_reason.value if stop_reason else None,
         )
         logger.info(
             "财务指标全量同步结束",
@@ -91,5 +180,46 @@ class SyncFinanceIndicatorFullHandler(CommandHandler[SyncFinanceIndicatorFull, S
             success_count=result.success_count,
             failure_count=result.failure_count,
             synced_records=result.synced_records,
+            skipped_records=result.skipped_records,
+            interrupted=result.interrupted,
+            stop_reason=result.stop_reason,
         )
         return result
+
+    async def _find(self, third_codes: list[str]) -> list[StockBasic]:
+        if self._securities is not None:
+            return self._securities.find(third_codes)
+        return await self._basic_repo.find_by_third_codes(DataSource.TUSHARE, third_codes)
+
+    async def _find_in_order(self, third_codes: list[str]) -> list[StockBasic]:
+        """按断点记录的顺序取股票，已不存在的代码跳过。"""
+        found = {s.third_code: s for s in await self._find(third_codes)}
+        return [found[code] for code in third_codes if code in found]
+
+    @staticmethod
+    def _restatement_window_start(fingerprints: dict[date, FinancialReportFingerprint]) -> date | None:
+        """新披露与重述都会带来更晚的公告日，因此只需从已知最新公告日（减回看期）开始拉取。
+
+        无历史指纹（或均缺公告日）时返回 None，退化为拉取全部历史。
+        """
+        ann_dates = [fp.ann_date for fp in fingerprints.values() if fp.ann_date is not None]
+        if not ann_dates:
+            return None
+        return max(ann_dates) - timedelta(days=RESTATEMENT_LOOKBACK_DAYS)
+
+    @staticmethod
+    def _filter_changed(
+        records: list[StockFinancial],
+        fingerprints: dict[date, FinancialReportFingerprint],
+    ) -> list[StockFinancial]:
+        """按报告期去重（与仓储 upsert 一致保留首条），剔除指纹未变化的报告期。"""
+        seen: set[date] = set()
+        changed: list[StockFinancial] = []
+        for record in records:
+            if record.end_date in seen:
+                continue
+            seen.add(record.end_date)
+            if fingerprints.get(record.end_date) == record.fingerprint():
+                continue
+            changed.append(record)
+        return changed
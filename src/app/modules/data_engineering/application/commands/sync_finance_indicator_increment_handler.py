@@ -11,8 +11,10 @@ from app.modules.data_engineering.domain.repositories.stock_financial_repository
 from app.modules.data_engineering.domain.repositories.stock_basic_repository import (
     StockBasicRepository,
 )
+from app.modules.data_engineering.domain.services.security_master import SecurityMaster
 from app.modules.data_engineering.domain.value_objects.data_source import DataSource
 from app.shared_kernel.application.command_handler import CommandHandler
+from app.shared_kernel.application.execution_budget import ExecutionBudget
 from app.shared_kernel.domain.unit_of_work import UnitOfWork
 from app.shared_kernel.infrastructure.logging import get_logger
 
@@ -20,12 +22,18 @@ from .sync_finance_indicator_commands import (
     SyncFinanceIndicatorIncrement,
     SyncFinanceIndicatorResult,
 )
+from .sync_finance_indicator_full_handler import WRITE_CHUNK_SIZE
 
 logger = get_logger(__name__)
 
 
 class SyncFinanceIndicatorIncrementHandler(CommandHandler[SyncFinanceIndicatorIncrement, SyncFinanceIndicatorResult]):
-    """增量同步：逐股查最新报告期 → start_date = latest + 1day，再拉取增量数据，逐股独立事务。"""
+    """增量同步：逐股查最新报告期 → start_date = latest + 1day，再拉取增量数据，逐股独立事务。
+
+    注入证券主数据时股票列表取自进程内快照，不再查询 stock_basic 全表。
+    执行预算要求停止（取消或超时）时在股票之间停止，返回已处理部分；下次增量从各股最新报告期继续。
+    内存超过阈值时按执行预算缩小写入分块。
+    """
 
     def __init__(
         self,
@@ -33,14 +41,20 @@ class SyncFinanceIndicatorIncrementHandler(CommandHandler[SyncFinanceIndicatorIn
         fi_repo: StockFinancialRepository,
         gateway: FinancialIndicatorGateway,
         uow: UnitOfWork,
+        securities: SecurityMaster | None = None,
+        budget: ExecutionBudget | None = None,
     ) -> None:
         self._basic_repo = basic_repo
         self._fi_repo = fi_repo
         self._gateway = gateway
         self._uow = uow
+        self._securities = securities
+        self._budget = budget or ExecutionBudget()
 
     async def handle(self, command: SyncFinanceIndicatorIncrement) -> SyncFinanceIndicatorResult:
-        if command.ts_codes:
+        if self._securities is not None:
+            stocks = self._securities.find(command.ts_codes) if command.ts_codes else self._securities.listed()
+        elif command.ts_codes:
             stocks = await self._basic_repo.find_by_third_codes(DataSource.TUSHARE, command.ts_codes)
         else:
             stocks = await self._basic_repo.find_all_listed(DataSource.TUSHARE)
@@ -54,8 +68,24 @@ class SyncFinanceIndicatorIncrementHandler(CommandHandler[SyncFinanceIndicatorIn
         success_count = 0
         failure_count = 0
         synced_records = 0
+        stop_reason = None
 
-        for stock in stocks:
+        for processed, stock in enumerate(stocks, 1):
+            stop_reason = self._budget.stop_reason()
+            if stop_reason is not None:
+                logger.info(
+                    "财务指标增量同步提前停止",
+                    reason=stop_reason.value,
+                    remaining=len(stocks) - processed + 1,
+                )
+                break
+            if self._budget.check_memory():
+                logger.warning(
+                    "内存超过阈值，缩小写入分块",
+                    rss_mb=self._budget.last_rss_mb,
+                    pressure_level=self._budget.pressure_level,
+                    write_chunk_size=self._budget.scale(WRITE_CHUNK_SIZE),
+                )
             try:
                 latest = await self._fi_repo.get_latest_end_date(DataSource.TUSHARE, stock.third_code)
                 start_date = (latest + timedelta(days=1)) if latest else None
@@ -66,7 +96,8 @@ class SyncFinanceIndicatorIncrementHandler(CommandHandler[SyncFinanceIndicatorIn
                     record.symbol = stock.symbol
                 async with self._uow:
                     if records:
-                        await self._fi_repo.upsert_many(records)
+                        for chunk in self._budget.chunks(records, WRITE_CHUNK_SIZE):
+                            await self._fi_repo.upsert_many(list(chunk))
                         synced_records += len(records)
                     await self._uow.commit()
                 success_count += 1
@@ -89,6 +120,8 @@ class SyncFinanceIndicatorIncrementHandler(CommandHandler[SyncFinanceIndicatorIn
             success_count=success_count,
             failure_count=failure_count,
             synced_records=synced_records,
+            interrupted=stop_reason is not None,
+            stop_reason=stop_reason.value if stop_reason else None,
         )
         logger.info(
             "财务指标增量同步结束",
@@ -97,5 +130,7 @@ class SyncFinanceIndicatorIncrementHandler(CommandHandler[SyncFinanceIndicatorIn
             success_count=result.success_count,
             failure_count=result.failure_count,
             synced_records=result.synced_records,
+            interrupted=result.interrupted,
+            stop_reason=result.stop_reason,
         )
         return result
@@ -0,0 +1,99 @@
+"""同步运行断点记录：长耗时同步 Handler 共用的计划、续跑与逐条打点。"""
+
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from app.modules.data_engineering.domain.entities.sync_run import SyncRun
+from app.modules.data_engineering.domain.repositories.sync_run_repository import SyncRunRepository
+from app.modules.data_engineering.domain.value_objects.sync_run_status import SyncRunItemStatus, SyncRunStatus
+from app.shared_kernel.domain.unit_of_work import UnitOfWork
+from app.shared_kernel.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class SyncRunTracker:
+    """一次同步运行的断点记录器。
+
+    - resume：按 run_key 找到未完成的运行，返回其未完成条目（按计划顺序）
+    - begin：新建运行并写入全部计划条目
+    - mark_done / mark_failed：不提交，须在调用方写入数据的同一事务内调用，保证数据与断点原子一致
+    - finish：标记运行完成或中断
+
+    未注入仓储时所有操作均为空操作，Handler 行为与无断点时一致。
+    """
+
+    def __init__(self, repo: SyncRunRepository | None, uow: UnitOfWork, kind: str) -> None:
+        self._repo = repo
+        self._uow = uow
+        self._kind = kind
+        self._run: SyncRun | None = None
+
+    @property
+    def run_id(self) -> int | None:
+        return self._run.id if self._run is not None else None
+
+    async def resume(self, run_key: str | None) -> list[str] | None:
+        """续跑 run_key 对应的未完成运行。
+
+        Returns:
+            未完成条目列表；无可续跑的运行时返回 None。
+        """
+        if self._repo is None or run_key is None:
+            return None
+        async with self._uow:
+            run = await self._repo.find_unfinished(self._kind, run_key)
+            if run is None or run.id is None:
+                return None
+            pending = await self._repo.find_pending_item_keys(run.id)
+            run.status = SyncRunStatus.RUNNING
+            await self._repo.save(run)
+            await self._uow.commit()
+        self._run = run
+        logger.info(
+            "续跑同步运行",
+            kind=self._kind,
+            run_id=run.id,
+            run_key=run_key,
+            total_items=run.total_items,
+            pending_items=len(pending),
+        )
+        return pending
+
+    async def begin(self, run_key: str | None, item_keys: list[str]) -> None:
+        """新建运行并写入计划条目。run_key 为空时自动生成。"""
+        if self._repo is None:
+            return
+        run = SyncRun(
+            id=None,
+            kind=self._kind,
+            run_key=run_key or uuid4().hex,
+            status=SyncRunStatus.RUNNING,
+            total_items=len(item_keys),
+            started_at=datetime.now(UTC),
+        )
+        async with self._uow:
+            self._run = await self._repo.create(run, item_keys)
+            await self._uow.commit()
+        logger.info(
+            "同步运行开始", kind=self._kind, run_id=self.run_id, run_key=run.run_key, total_items=len(item_keys)
+        )
+
+    async def mark_done(self, item_key: str) -> None:
+        if self._repo is not None and self._run is not None and self._run.id is not None:
+            await self._repo.mark_item(self._run.id, item_key, SyncRunItemStatus.DONE)
+
+    async def mark_failed(self, item_key: str, error_message: str) -> None:
+        if self._repo is not None and self._run is not None and self._run.id is not None:
+            await self._repo.mark_item(self._run.id, item_key, SyncRunItemStatus.FAILED, error_message)
+
+    async def finish(self, interrupted: bool) -> None:
+        """中断时保留 INTERRUPTED 状态供续跑，否则标记完成。"""
+        if self._repo is None or self._run is None:
+            return
+        self._run.status = SyncRunStatus.INTERRUPTED if interrupted else SyncRunStatus.COMPLETED
+        self._run.finished_at = None if interrupted else datetime.now(UTC)
+        async with self._uow:
+            await self._repo.save(self._run)
+            await self._uow.commit()
+        logger.info("同步运行结束", kind=self._kind, run_id=self.run_id, status=self._run.status.value)
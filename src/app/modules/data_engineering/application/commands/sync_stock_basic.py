@@ -10,3 +10,11 @@ class SyncStockBasic(Command):
     """触发一次从外部数据源拉取并写入本地仓储的同步。"""
 
     pass
+
+
+@dataclass(frozen=True)
+class SyncStockBasicResult:
+    synced_count: int  # 已写入并提交的股票数
+    total: int  # 数据源返回的股票数
+    interrupted: bool = False  # 因取消或超时在分块之间停止，股票全集只更新了一部分
+    stop_reason: str | None = None  # 提前停止的原因（cancelled / deadline）
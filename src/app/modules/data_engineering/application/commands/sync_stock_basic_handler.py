@@ -1,21 +1,75 @@
-"""SyncStockBasic 命令的 Handler：编排网关拉取 → 仓储 upsert，返回 synced_count。"""
+"""SyncStockBasic 命令的 Handler：编排网关拉取 → 仓储 upsert，返回 SyncStockBasicResult。"""
 
+from app.modules.data_engineering.domain.events import StockBasicChanged
 from app.modules.data_engineering.domain.gateways import StockGateway
 from app.modules.data_engineering.domain.repositories import StockBasicRepository
+from app.modules.data_engineering.domain.value_objects.data_source import DataSource
 from app.shared_kernel.application.command_handler import CommandHandler
+from app.shared_kernel.application.event_bus import EventBus
+from app.shared_kernel.application.execution_budget import ExecutionBudget
 from app.shared_kernel.domain.unit_of_work import UnitOfWork
+from app.shared_kernel.infrastructure.logging import get_logger
 
-from .sync_stock_basic import SyncStockBasic
+from .sync_stock_basic import SyncStockBasic, SyncStockBasicResult
 
+logger = get_logger(__name__)
 
-class SyncStockBasicHandler(CommandHandler[SyncStockBasic, int]):
-    def __init__(self, gateway: StockGateway, repository: StockBasicRepository, uow: UnitOfWork) -> None:
+WRITE_CHUNK_SIZE = 1000  # 每次 upsert 并提交的股票数，内存压力下按执行预算缩小
+
+
+class SyncStockBasicHandler(CommandHandler[SyncStockBasic, SyncStockBasicResult]):
+    """
+    - 按执行预算分块 upsert，每块单独提交；内存超过阈值时缩小分块
+    - 执行预算要求停止（取消或超时）时在分块之间停止，结果标记 interrupted，调用方据此判断股票全集不完整
+    - 有数据提交后发布 StockBasicChanged（提前停止时同样发布，已提交部分须使快照失效）；event_bus 为 None 时不发布
+    """
+
+    def __init__(
+        self,
+        gateway: StockGateway,
+        repository: StockBasicRepository,
+        uow: UnitOfWork,
+        event_bus: EventBus | None = None,
+        budget: ExecutionBudget | None = None,
+    ) -> None:
         self._gateway = gateway
         self._repository = repository
         self._uow = uow
+        self._event_bus = event_bus
+        self._budget = budget or ExecutionBudget()
 
-    async def handle(self, command: SyncStockBasic) -> int:
+    async def handle(self, command: SyncStockBasic) -> SyncStockBasicResult:
         stocks = await self._gateway.fetch_stock_basic()
-        await self._repository.upsert_many(stocks)
-        await self._uow.commit()
-        return len(stocks)
+        synced_count = 0
+        stop_reason = None
+        for chunk in self._budget.chunks(stocks, WRITE_CHUNK_SIZE):
+            if (stop_reason := self._budget.stop_reason()) is not None:
+                logger.info(
+                    "股票基础信息同步提前停止",
+                    reason=stop_reason.value,
+                    synced_count=synced_count,
+                    total=len(stocks),
+                )
+                break
+            if self._budget.check_memory():
+                logger.warning(
+                    "内存超过阈值，缩小写入分块",
+                    rss_mb=self._budget.last_rss_mb,
+                    pressure_level=self._budget.pressure_level,
+                    write_chunk_size=self._budget.scale(WRITE_CHUNK_SIZE),
+                )
+            await self._repository.upsert_many(list(chunk))
+            await self._uow.commit()
+            synced_count += len(chunk)
+        if self._event_bus is not None and synced_count:
+            try:
+                await self._event_bus.publish(StockBasicChanged(source=DataSource.TUSHARE, synced_count=synced_count))
+            except Exception as e:
+                # 数据已提交，快照最迟在下一次定期重新加载时更新
+                logger.warning("股票基础信息变更事件发布失败", error=str(e))
+        return SyncStockBasicResult(
+            synced_count=synced_count,
+            total=len(stocks),
+            interrupted=stop_reason is not None,
+            stop_reason=stop_reason.value if stop_reason else None,
+        )
@@ -11,10 +11,17 @@ class SyncHistoryResult:
     success_count: int
     failure_count: int
     synced_days: int
+    interrupted: bool = False  # 因取消或超时在条目之间停止，可凭 run_key 续跑
+    run_id: int | None = None
+    stop_reason: str | None = None  # 提前停止的原因（cancelled / deadline）
 
 
 @dataclass(frozen=True)
 class SyncStockDailyHistory(Command):
-    """历史同步指令。不传 ts_codes 则全量同步。"""
+    """历史同步指令。不传 ts_codes 则全量同步。
+
+    run_key 对应一个未完成的同步运行时，忽略 ts_codes，从该运行的第一个未完成股票续跑。
+    """
 
     ts_codes: list[str] | None = None
+    run_key: str | None = None
@@ -2,6 +2,7 @@
 
 from datetime import UTC, date, datetime, timedelta
 
+from app.modules.data_engineering.domain.entities.stock_basic import StockBasic
 from app.modules.data_engineering.domain.entities.stock_daily_sync_failure import (
     StockDailySyncFailure,
 )
@@ -15,18 +16,35 @@ from app.modules.data_engineering.domain.repositories.stock_daily_repository imp
 from app.modules.data_engineering.domain.repositories.stock_daily_sync_failure_repository import (
     StockDailySyncFailureRepository,
 )
+from app.modules.data_engineering.domain.repositories.sync_run_repository import SyncRunRepository
+from app.modules.data_engineering.domain.services.security_master import SecurityMaster
+from app.modules.data_engineering.domain.services.trade_calendar import TradeCalendar
 from app.modules.data_engineering.domain.value_objects.data_source import DataSource
 from app.shared_kernel.application.command_handler import CommandHandler
+from app.shared_kernel.application.execution_budget import ExecutionBudget
+from app.shared_kernel.application.progress import NullProgressReporter, ProgressReporter
 from app.shared_kernel.domain.unit_of_work import UnitOfWork
 from app.shared_kernel.infrastructure.logging import get_logger
 
+from .sync_run_tracker import SyncRunTracker
 from .sync_stock_daily_history import SyncHistoryResult, SyncStockDailyHistory
 
 logger = get_logger(__name__)
 
+SYNC_RUN_KIND = "stock_daily_history"
+# 内存压力下单次拉取的自然日跨度，按退让级别逐级减半；无压力时整段区间一次拉取
+PRESSURE_FETCH_WINDOW_DAYS = 3650
+
 
 class SyncStockDailyHistoryHandler(CommandHandler[SyncStockDailyHistory, SyncHistoryResult]):
-    """历史同步 Handler。带断点续传、失败记录、独立事务。"""
+    """历史同步 Handler。带断点续传、失败记录、独立事务。
+
+    注入 run_repo 时，计划的股票列表与逐股完成状态记录在同步运行中（与数据同事务提交）；
+    执行预算要求停止（取消或超时）时在股票之间停止，运行保留为中断状态，之后可凭 run_key 续跑。
+    内存超过阈值时单只股票的区间按退让级别分段拉取，每段写入后立即提交，不再整段缓存在内存中。
+    本地最新日期之后没有交易日（如周末、节假日执行）的股票不发起请求，直接记为完成。
+    注入证券主数据时股票列表取自进程内快照，不再查询 stock_basic 全表。
+    """
 
     def __init__(
         self,
@@ -35,18 +53,36 @@ class SyncStockDailyHistoryHandler(CommandHandler[SyncStockDailyHistory, SyncHis
         basic_repo: StockBasicRepository,
         failure_repo: StockDailySyncFailureRepository,
         uow: UnitOfWork,
+        progress: ProgressReporter | None = None,
+        run_repo: SyncRunRepository | None = None,
+        budget: ExecutionBudget | None = None,
+        calendar: TradeCalendar | None = None,
+        securities: SecurityMaster | None = None,
     ) -> None:
         self.gateway = gateway
         self.daily_repo = daily_repo
         self.basic_repo = basic_repo
         self.failure_repo = failure_repo
         self.uow = uow
+        self.progress = progress or NullProgressReporter()
+        self.run_repo = run_repo
+        self.budget = budget or ExecutionBudget()
+        self.calendar = calendar or TradeCalendar()
+        self.securities = securities
 
     async def handle(self, command: SyncStockDailyHistory) -> SyncHistoryResult:
-        if command.ts_codes:
-            stocks = await self.basic_repo.find_by_third_codes(DataSource.TUSHARE, command.ts_codes)
+        tracker = SyncRunTracker(self.run_repo, self.uow, SYNC_RUN_KIND)
+        pending_codes = await tracker.resume(command.run_key)
+        if pending_codes is not None:
+            stocks = await self._find_in_order(pending_codes)
         else:
-            stocks = await self.basic_repo.find_all(DataSource.TUSHARE)
+            if command.ts_codes:
+                stocks = await self._find(command.ts_codes)
+            elif self.securities is not None:
+                stocks = self.securities.stocks()
+            else:
+                stocks = await self.basic_repo.find_all(DataSource.TUSHARE)
+            await tracker.begin(command.run_key, [s.third_code for s in stocks])
 
         today = date.today()
         logger.info(
@@ -60,8 +96,26 @@ class SyncStockDailyHistoryHandler(CommandHandler[SyncStockDailyHistory, SyncHis
         success_count = 0
         failure_count = 0
         synced_days = 0
+        stop_reason = None
+        self.progress.report(total=len(stocks), processed=0, rows_written=0, failures=0)
 
-        for stock in stocks:
+        for processed, stock in enumerate(stocks, 1):
+            stop_reason = self.budget.stop_reason()
+            if stop_reason is not None:
+                logger.info(
+                    "历史同步提前停止，保留断点",
+                    reason=stop_reason.value,
+                    run_id=tracker.run_id,
+                    remaining=len(stocks) - processed + 1,
+                )
+                break
+            if self.budget.check_memory():
+                logger.warning(
+                    "内存超过阈值，分段拉取并逐段提交",
+                    rss_mb=self.budget.last_rss_mb,
+                    pressure_level=self.budget.pressure_level,
+                    window_days=self.budget.scale(PRESSURE_FETCH_WINDOW_DAYS),
+                )
             start_date = None
             try:
                 async with self.uow:
@@ -69,12 +123,15 @@ class SyncStockDailyHistoryHandler(CommandHandler[SyncStockDailyHistory, SyncHis
 
                 start_date = latest_date + timedelta(days=1) if latest_date else stock.list_date
 
-                if start_date > today:
+                if self.calendar.count_trading_days(start_date, today) == 0:
                     logger.info(
                         "已是最新数据，跳过同步",
                         third_code=stock.third_code,
                         start_date=str(start_date),
                     )
+                    async with self.uow:
+                        await tracker.mark_done(stock.third_code)
+                        await self.uow.commit()
                     continue
 
                 logger.info(
@@ -84,35 +141,41 @@ class SyncStockDailyHistoryHandler(CommandHandler[SyncStockDailyHistory, SyncHis
                     end_date=str(today),
                 )
 
-                records = await self.gateway.fetch_stock_daily(stock.third_code, start_date, today)
-                # 填充symbol字段
-                for record in records:
-                    record.symbol = stock.symbol
-
-                async with self.uow:
-                    if records:
-                        await self.daily_repo.upsert_many(records)
-                        synced_days += len(records)
-                        logger.info(
-                            "获取并写入日线数据完成",
-                            third_code=stock.third_code,
-                            record_count=len(records),
-                        )
-                    else:
-                        logger.info(
-                            "未获取到数据",
-                            third_code=stock.third_code,
-                            start_date=str(start_date),
-                            end_date=str(today),
-                        )
-
-                    await self.uow.commit()
-                    success_count += 1
-                    logger.info(
-                        "事务已提交",
-                        third_code=stock.third_code,
-                        success=True,
-                    )
+                windows = self._fetch_windows(start_date, today)
+                for index, (window_start, window_end) in enumerate(windows, 1):
+                    records = await self.gateway.fetch_stock_daily(stock.third_code, window_start, window_end)
+                    # 填充symbol字段
+                    for record in records:
+                        record.symbol = stock.symbol
+
+                    async with self.uow:
+                        if records:
+                            await self.daily_repo.upsert_many(records)
+                            synced_days += len(records)
+                            logger.info(
+                                "获取并写入日线数据完成",
+                                third_code=stock.third_code,
+                                record_count=len(records),
+                            )
+                        else:
+                            logger.info(
+                                "未获取到数据",
+                                third_code=stock.third_code,
+                                start_date=str(window_start),
+                                end_date=str(window_end),
+                            )
+
+                        # 分段时前几段只提交数据；中途失败后按本地最新日期从断开处续拉
+                        if index == len(windows):
+                            await tracker.mark_done(stock.third_code)
+                        await self.uow.commit()
+                    del records
+                success_count += 1
+                logger.info(
+                    "事务已提交",
+                    third_code=stock.third_code,
+                    success=True,
+                )
 
             except Exception as e:
                 logger.error(
@@ -137,13 +200,22 @@ class SyncStockDailyHistoryHandler(CommandHandler[SyncStockDailyHistory, SyncHis
                         resolved=False,
                     )
                     await self.failure_repo.save(failure)
+                    await tracker.mark_failed(stock.third_code, str(e))
                     await self.uow.commit()
+            finally:
+                self.progress.report(processed=processed, rows_written=synced_days, failures=failure_count)
+
+        interrupted = stop_reason is not None
+        await tracker.finish(interrupted)
 
         result = SyncHistoryResult(
             total=len(stocks),
             success_count=success_count,
             failure_count=failure_count,
             synced_days=synced_days,
+            interrupted=interrupted,
+            run_id=tracker.run_id,
+            stop_reason=stop_reason.value if stop_reason else None,
         )
         logger.info(
             "历史同步结束",
@@ -152,5 +224,30 @@ class SyncStockDailyHistoryHandler(CommandHandler[SyncStockDailyHistory, SyncHis
             success_count=result.success_count,
             failure_count=result.failure_count,
             synced_days=result.synced_days,
+            interrupted=result.interrupted,
+            stop_reason=result.stop_reason,
         )
         return result
+
+    def _fetch_windows(self, start_date: date, end_date: date) -> list[tuple[date, date]]:
+        """拉取区间：无内存压力时为整段区间，压力下按退让后的跨度切分。"""
+        if not self.budget.under_pressure:
+            return [(start_date, end_date)]
+        span = timedelta(days=self.budget.scale(PRESSURE_FETCH_WINDOW_DAYS))
+        windows: list[tuple[date, date]] = []
+        window_start = start_date
+        while window_start <= end_date:
+            window_end = min(window_start + span - timedelta(days=1), end_date)
+            windows.append((window_start, window_end))
+            window_start = window_end + timedelta(days=1)
+        return windows
+
+    async def _find(self, third_codes: list[str]) -> list[StockBasic]:
+        if self.securities is not None:
+            return self.securities.find(third_codes)
+        return await self.basic_repo.find_by_third_codes(DataSource.TUSHARE, third_codes)
+
+    async def _find_in_order(self, third_codes: list[str]) -> list[StockBasic]:
+        """按断点记录的顺序取股票，已不存在的代码跳过。"""
+        found = {s.third_code: s for s in await self._find(third_codes)}
+        return [found[code] for code in third_codes if code in found]
@@ -1,6 +1,6 @@
 """增量同步与重试 Command 与 Result。"""
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from datetime import date
 
 from app.shared_kernel.application.command import Command
@@ -11,13 +11,26 @@ class SyncIncrementResult:
     trade_date: date
     synced_count: int
     duration_ms: int = 0
+    end_date: date | None = None  # 多日同步的最后一日
+    days: int = 1
+    chunks: int = 0  # 独立提交的写入分块数
+    trade_dates: list[date] = field(default_factory=list)  # 实际同步的日期（补齐模式下为缺口日期）
+    interrupted: bool = False  # 因取消或超时在日期之间停止，trade_dates 只含已写入的日期
+    stop_reason: str | None = None  # 提前停止的原因（cancelled / deadline）
 
 
 @dataclass(frozen=True)
 class SyncStockDailyIncrement(Command):
-    """增量同步指令。不传 trade_date 则默认昨天自然日。"""
+    """增量同步指令。不传 trade_date 则默认昨天自然日。
+
+    传入 end_date 时同步 [trade_date, end_date] 区间内的每个交易日，非交易日跳过。
+    catch_up 为 True 时进入补齐模式：以 end_date / trade_date（默认昨天）为终点，
+    按日期补齐全局水位（本地最新交易日）之后缺失的交易日。
+    """
 
     trade_date: date | None = None
+    end_date: date | None = None
+    catch_up: bool = False
 
 
 @dataclass(frozen=True)
@@ -1,16 +1,23 @@
 """增量同步 Handler。"""
 
+import asyncio
+from collections import deque
 from datetime import date, timedelta
+from time import perf_counter
 
+from app.modules.data_engineering.domain.entities.stock_daily import StockDaily
 from app.modules.data_engineering.domain.gateways.stock_daily_gateway import StockDailyGateway
-from app.modules.data_engineering.domain.repositories.stock_daily_repository import (
-    StockDailyRepository,
-)
 from app.modules.data_engineering.domain.repositories.stock_basic_repository import (
     StockBasicRepository,
 )
+from app.modules.data_engineering.domain.repositories.stock_daily_repository import (
+    StockDailyRepository,
+)
+from app.modules.data_engineering.domain.services.security_master import SecurityMaster
+from app.modules.data_engineering.domain.services.trade_calendar import TradeCalendar
 from app.modules.data_engineering.domain.value_objects.data_source import DataSource
 from app.shared_kernel.application.command_handler import CommandHandler
+from app.shared_kernel.application.execution_budget import ExecutionBudget
 from app.shared_kernel.domain.unit_of_work import UnitOfWork
 from app.shared_kernel.infrastructure.logging import get_logger
 
@@ -18,9 +25,27 @@ from .sync_stock_daily_increment import SyncIncrementResult, SyncStockDailyIncre
 
 logger = get_logger(__name__)
 
+# 单个写入事务的记录数：全市场单日约 5000 条，拆为数个短事务
+DEFAULT_WRITE_CHUNK_SIZE = 1000
+# 单个分块写入失败后的最大重试次数
+DEFAULT_WRITE_MAX_RETRIES = 3
+# 补齐模式最多回溯的自然日数，更早的缺口交由逐股历史同步处理
+DEFAULT_MAX_CATCH_UP_DAYS = 31
+
 
 class SyncStockDailyIncrementHandler(CommandHandler[SyncStockDailyIncrement, SyncIncrementResult]):
-    """增量同步 Handler。整体事务，失败即回滚抛异常。"""
+    """增量同步 Handler。拉取在事务之外，写入按分块独立提交。
+
+    - 网络拉取不占用事务与锁；多日同步时以至多 fetch_concurrency 个并发按日期拉取，
+      第 N+1 日起的拉取与第 N 日的写入重叠执行
+    - 只拉取交易日历中的交易日，周末与节假日不发起请求；未注入日历时按工作日近似
+    - 补齐模式按全局水位找出缺失交易日，每个交易日一次全市场拉取，代替逐股历史同步
+    - 每个分块一个短事务；upsert 按 (source, third_code, trade_date) 幂等，失败分块可直接重试
+    - 分块重试耗尽后抛出异常，已提交的分块保留，重新执行同一命令即可补齐
+    - symbol 由证券主数据按 third_code 填充；未注入时每次同步从仓储构建
+    - 执行预算要求停止（取消或超时）时在日期之间停止，返回已写入的日期；补齐模式下次执行从水位继续
+    - 内存超过阈值时按执行预算缩小拉取并发与写入分块
+    """
 
     def __init__(
         self,
@@ -28,50 +53,185 @@ class SyncStockDailyIncrementHandler(CommandHandler[SyncStockDailyIncrement, Syn
         daily_repo: StockDailyRepository,
         basic_repo: StockBasicRepository,
         uow: UnitOfWork,
+        write_chunk_size: int = DEFAULT_WRITE_CHUNK_SIZE,
+        write_max_retries: int = DEFAULT_WRITE_MAX_RETRIES,
+        retry_backoff_seconds: float = 0.5,
+        fetch_concurrency: int = 2,
+        max_catch_up_days: int = DEFAULT_MAX_CATCH_UP_DAYS,
+        calendar: TradeCalendar | None = None,
+        securities: SecurityMaster | None = None,
+        budget: ExecutionBudget | None = None,
     ) -> None:
         self.gateway = gateway
         self.daily_repo = daily_repo
         self.basic_repo = basic_repo
         self.uow = uow
+        self.write_chunk_size = write_chunk_size
+        self.write_max_retries = write_max_retries
+        self.retry_backoff_seconds = retry_backoff_seconds
+        self.fetch_concurrency = max(1, fetch_concurrency)
+        self.max_catch_up_days = max_catch_up_days
+        self.calendar = calendar or TradeCalendar()
+        self.securities = securities
+        self.budget = budget or ExecutionBudget()
 
     async def handle(self, command: SyncStockDailyIncrement) -> SyncIncrementResult:
-        trade_date = command.trade_date or (date.today() - timedelta(days=1))
+        start = perf_counter()
+        if command.catch_up:
+            end_date = command.end_date or command.trade_date or (date.today() - timedelta(days=1))
+            trade_dates = await self._missing_trade_dates(end_date)
+            trade_date = trade_dates[0] if trade_dates else end_date
+        else:
+            trade_date = command.trade_date or (date.today() - timedelta(days=1))
+            end_date = max(command.end_date or trade_date, trade_date)
+            trade_dates = self.calendar.trading_days(trade_date, end_date)
         logger.info(
             "增量同步开始",
             command="SyncStockDailyIncrement",
             trade_date=str(trade_date),
+            end_date=str(end_date),
+            days=len(trade_dates),
+            catch_up=command.catch_up,
         )
+        if not trade_dates:
+            logger.info("无待同步交易日，跳过同步", end_date=str(end_date))
+            return SyncIncrementResult(
+                trade_date=trade_date,
+                synced_count=0,
+                duration_ms=int((perf_counter() - start) * 1000),
+                end_date=end_date,
+                days=0,
+            )
 
-        # 获取所有股票的symbol映射
-        stocks = await self.basic_repo.find_all(DataSource.TUSHARE)
-        symbol_map = {stock.third_code: stock.symbol for stock in stocks}
-        logger.info(
-            "获取股票symbol映射完成",
-            stock_count=len(symbol_map),
-        )
+        securities = self.securities
+        if securities is None:
+            securities = SecurityMaster(await self.basic_repo.find_all(DataSource.TUSHARE))
+        logger.info("获取证券主数据完成", stock_count=len(securities))
 
-        async with self.uow:
-            records = await self.gateway.fetch_daily_all_by_date(trade_date)
-            # 填充symbol字段
-            for record in records:
-                if record.third_code in symbol_map:
-                    record.symbol = symbol_map[record.third_code]
-            
-            logger.info(
-                "拉取日线全市场数据完成",
-                trade_date=str(trade_date),
-                record_count=len(records),
-            )
-            if records:
-                await self.daily_repo.upsert_many(records)
-                logger.info("批量写入完成", trade_date=str(trade_date), upsert_count=len(records))
-            await self.uow.commit()
+        synced_count = 0
+        chunk_count = 0
+        synced_dates: list[date] = []
+        stop_reason = None
+        upcoming = iter(trade_dates)
+        fetches: deque[asyncio.Task[list[StockDaily]]] = deque()
+        try:
+            for day in trade_dates:
+                stop_reason = self.budget.stop_reason()
+                if stop_reason is not None:
+                    logger.info(
+                        "增量同步提前停止",
+                        reason=stop_reason.value,
+                        remaining_days=len(trade_dates) - len(synced_dates),
+                    )
+                    break
+                if self.budget.check_memory():
+                    logger.warning(
+                        "内存超过阈值，降低拉取并发与写入分块",
+                        rss_mb=self.budget.last_rss_mb,
+                        pressure_level=self.budget.pressure_level,
+                        fetch_concurrency=self.budget.scale(self.fetch_concurrency),
+                        write_chunk_size=self.budget.scale(self.write_chunk_size),
+                    )
+                # 至多 fetch_concurrency 个日期同时在拉取中，写入当日数据期间后续日期继续拉取；内存压力下按预算缩小
+                while (
+                    len(fetches) < self.budget.scale(self.fetch_concurrency)
+                    and (nxt := next(upcoming, None)) is not None
+                ):
+                    fetches.append(asyncio.create_task(self._fetch(nxt)))
+                records = await fetches.popleft()
+                # 填充symbol字段
+                for record in records:
+                    if (symbol := securities.symbol_of(record.third_code)) is not None:
+                        record.symbol = symbol
+
+                for chunk in self.budget.chunks(records, self.write_chunk_size):
+                    await self._write_chunk(day, list(chunk))
+                    chunk_count += 1
+                synced_count += len(records)
+                synced_dates.append(day)
+                logger.info("单日写入完成", trade_date=str(day), upsert_count=len(records))
+                del records
+        finally:
+            for pending in fetches:
+                pending.cancel()
 
-        result = SyncIncrementResult(trade_date=trade_date, synced_count=len(records))
+        result = SyncIncrementResult(
+            trade_date=trade_date,
+            synced_count=synced_count,
+            duration_ms=int((perf_counter() - start) * 1000),
+            end_date=end_date,
+            days=len(synced_dates),
+            chunks=chunk_count,
+            trade_dates=synced_dates,
+            interrupted=stop_reason is not None,
+            stop_reason=stop_reason.value if stop_reason else None,
+        )
         logger.info(
             "增量同步结束",
             command="SyncStockDailyIncrement",
             trade_date=str(trade_date),
+            end_date=str(end_date),
             synced_count=result.synced_count,
+            chunks=result.chunks,
+            duration_ms=result.duration_ms,
+            interrupted=result.interrupted,
         )
         return result
+
+    async def _missing_trade_dates(self, end_date: date) -> list[date]:
+        """全局水位之后、end_date 之前（含）缺失的交易日，最多回溯 max_catch_up_days 个自然日。
+
+        无水位（空表）时只同步 end_date（非交易日则不同步）。
+        """
+        watermark = await self.daily_repo.get_global_latest_trade_date(DataSource.TUSHARE)
+        earliest = end_date - timedelta(days=self.max_catch_up_days - 1)
+        if watermark is None:
+            start_date = end_date
+        elif watermark + timedelta(days=1) < earliest:
+            logger.warning(
+                "缺口超过补齐窗口，更早的日期需逐股历史同步",
+                watermark=str(watermark),
+                earliest=str(earliest),
+            )
+            start_date = earliest
+        else:
+            start_date = watermark + timedelta(days=1)
+        missing = self.calendar.trading_days(start_date, end_date)
+        logger.info("补齐模式缺失日期", watermark=str(watermark) if watermark else None, missing_days=len(missing))
+        return missing
+
+    async def _fetch(self, trade_date: date) -> list[StockDaily]:
+        records = await self.gateway.fetch_daily_all_by_date(trade_date)
+        logger.info(
+            "拉取日线全市场数据完成",
+            trade_date=str(trade_date),
+            record_count=len(records),
+        )
+        return records
+
+    async def _write_chunk(self, trade_date: date, chunk: list[StockDaily]) -> None:
+        """在独立短事务中写入一个分块，失败按退避重试；upsert 幂等，重试不会产生重复数据。"""
+        for attempt in range(1, self.write_max_retries + 2):
+            try:
+                async with self.uow:
+                    await self.daily_repo.upsert_many(chunk)
+                    await self.uow.commit()
+                return
+            except Exception as e:
+                if attempt > self.write_max_retries:
+                    logger.error(
+                        "分块写入失败，重试耗尽",
+                        trade_date=str(trade_date),
+                        chunk_size=len(chunk),
+                        attempts=attempt,
+                        error=str(e),
+                    )
+                    raise
+                logger.warning(
+                    "分块写入失败，准备重试",
+                    trade_date=str(trade_date),
+                    chunk_size=len(chunk),
+                    attempt=attempt,
+                    error=str(e),
+                )
+                await asyncio.sleep(self.retry_backoff_seconds * attempt)
@@ -0,0 +1,32 @@
+"""同步交易日历命令与结果。"""
+
+from dataclasses import dataclass
+from datetime import date
+
+from app.shared_kernel.application.command import Command
+
+# 交易日历默认起点：覆盖 A 股全部历史
+DEFAULT_CALENDAR_START = date(1990, 1, 1)
+
+
+@dataclass(frozen=True)
+class SyncTradeCalendarResult:
+    exchange: str
+    start_date: date
+    end_date: date
+    synced_count: int
+    open_count: int
+    duration_ms: int = 0
+
+
+@dataclass(frozen=True)
+class SyncTradeCalendar(Command):
+    """同步交易所交易日历。
+
+    不传 start_date 时从 1990-01-01 起；不传 end_date 时至次年 12 月 31 日，
+    交易所通常在年底前发布下一年的休市安排。
+    """
+
+    exchange: str = "SSE"
+    start_date: date | None = None
+    end_date: date | None = None
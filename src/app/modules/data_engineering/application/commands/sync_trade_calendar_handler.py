@@ -0,0 +1,60 @@
+"""SyncTradeCalendar 命令的 Handler：拉取交易日历并按 (exchange, cal_date) upsert。"""
+
+from datetime import date
+from time import perf_counter
+
+from app.modules.data_engineering.domain.gateways.trade_calendar_gateway import TradeCalendarGateway
+from app.modules.data_engineering.domain.repositories.trade_calendar_repository import (
+    TradeCalendarRepository,
+)
+from app.shared_kernel.application.command_handler import CommandHandler
+from app.shared_kernel.domain.unit_of_work import UnitOfWork
+from app.shared_kernel.infrastructure.logging import get_logger
+
+from .sync_trade_calendar import DEFAULT_CALENDAR_START, SyncTradeCalendar, SyncTradeCalendarResult
+
+logger = get_logger(__name__)
+
+
+class SyncTradeCalendarHandler(CommandHandler[SyncTradeCalendar, SyncTradeCalendarResult]):
+    """日历数据量小（每年约 365 行），拉取后在单个事务内整体写入。"""
+
+    def __init__(self, gateway: TradeCalendarGateway, repository: TradeCalendarRepository, uow: UnitOfWork) -> None:
+        self._gateway = gateway
+        self._repository = repository
+        self._uow = uow
+
+    async def handle(self, command: SyncTradeCalendar) -> SyncTradeCalendarResult:
+        start = perf_counter()
+        start_date = command.start_date or DEFAULT_CALENDAR_START
+        end_date = command.end_date or date(date.today().year + 1, 12, 31)
+        logger.info(
+            "交易日历同步开始",
+            command="SyncTradeCalendar",
+            exchange=command.exchange,
+            start_date=str(start_date),
+            end_date=str(end_date),
+        )
+
+        days = await self._gateway.fetch_trade_calendar(command.exchange, start_date, end_date)
+        async with self._uow:
+            synced_count = await self._repository.upsert_many(days)
+            await self._uow.commit()
+
+        result = SyncTradeCalendarResult(
+            exchange=command.exchange,
+            start_date=start_date,
+            end_date=end_date,
+            synced_count=synced_count,
+            open_count=sum(1 for d in days if d.is_open),
+            duration_ms=int((perf_counter() - start) * 1000),
+        )
+        logger.info(
+            "交易日历同步结束",
+            command="SyncTradeCalendar",
+            exchange=command.exchange,
+            synced_count=result.synced_count,
+            open_count=result.open_count,
+            duration_ms=result.duration_ms,
+        )
+        return result
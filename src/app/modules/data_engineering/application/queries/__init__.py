@@ -1,13 +1,43 @@
 """CQRS 查询侧：Query DTO 与 QueryHandler。"""
 
+from .concept_membership_index import (
+    ConceptMembershipIndex,
+    ConceptMembershipIndexCache,
+    ConceptMembershipIndexProvider,
+    ConceptMemberships,
+    ConceptSummary,
+)
+from .concept_query_cache import CONCEPTS_RESOURCE, ConceptQueryCacheInvalidator, concept_stocks_resource
+from .get_concept_memberships import GetConceptMemberships
+from .get_concept_memberships_handler import GetConceptMembershipsHandler
+from .get_concept_overlap import ConceptOverlap, GetConceptOverlap
+from .get_concept_overlap_handler import GetConceptOverlapHandler
 from .get_concept_stocks import GetConceptStocks
 from .get_concept_stocks_handler import GetConceptStocksHandler
 from .get_concepts import GetConcepts
 from .get_concepts_handler import GetConceptsHandler
+from .screen_concept_stocks import ConceptStockScreen, ScreenConceptStocks
+from .screen_concept_stocks_handler import ScreenConceptStocksHandler
 
 __all__ = [
+    "CONCEPTS_RESOURCE",
+    "ConceptMembershipIndex",
+    "ConceptMembershipIndexCache",
+    "ConceptMembershipIndexProvider",
+    "ConceptMemberships",
+    "ConceptOverlap",
+    "ConceptQueryCacheInvalidator",
+    "ConceptStockScreen",
+    "ConceptSummary",
+    "GetConceptMemberships",
+    "GetConceptMembershipsHandler",
+    "GetConceptOverlap",
+    "GetConceptOverlapHandler",
     "GetConceptStocks",
     "GetConceptStocksHandler",
     "GetConcepts",
     "GetConceptsHandler",
+    "ScreenConceptStocks",
+    "ScreenConceptStocksHandler",
+    "concept_stocks_resource",
 ]
@@ -0,0 +1,168 @@
+"""概念成分关系的进程内索引：股票到概念的倒排索引与概念成分位图。
+
+概念成分关系只在同步时变化，查询却常是“某只股票属于哪些概念”或“在 A 与 B 中但不在 C 中的股票”。
+逐个概念扫描或反复关联 concept_stock 代价高，因此每个进程按数据源缓存一份索引快照：
+一次查询两列构建，之后按股票代码 O(1) 查找，集合运算为位图按位运算（见 domain.services.concept_bitmap）。
+
+快照以概念资源版本号（见 concept_query_cache.CONCEPTS_RESOURCE）标记，ConceptsChanged 作废版本号后
+下次查找时重建；版本号存于共享缓存，多副本部署时任一副本的同步都会让其他副本重建。
+"""
+
+import asyncio
+from collections import defaultdict
+from collections.abc import Awaitable, Callable, Iterable
+from dataclasses import dataclass, field
+
+from app.modules.data_engineering.domain.repositories.concept_repository import ConceptRepository
+from app.modules.data_engineering.domain.repositories.concept_stock_repository import ConceptStockRepository
+from app.modules.data_engineering.domain.repositories.stock_basic_repository import StockBasicRepository
+from app.modules.data_engineering.domain.services.concept_bitmap import ConceptBitmaps
+from app.modules.data_engineering.domain.value_objects.data_source import DataSource
+from app.shared_kernel.infrastructure.logging import get_logger
+from app.shared_kernel.infrastructure.resource_version import ResourceVersions
+
+from .concept_query_cache import CONCEPTS_RESOURCE
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class ConceptSummary:
+    id: int
+    third_code: str
+    name: str
+
+
+@dataclass(frozen=True)
+class ConceptMemberships:
+    """批量成员关系查询结果。
+
+    Attributes:
+        concepts: memberships 中出现的概念，按 id 升序，每个概念只出现一次。
+        memberships: 股票代码到所属概念 id（升序）的映射；不属于任何概念的代码对应空列表。
+    """
+
+    concepts: list[ConceptSummary] = field(default_factory=list)
+    memberships: dict[str, list[int]] = field(default_factory=dict)
+
+
+class ConceptMembershipIndex:
+    """不可变的索引快照：股票代码 -> 概念 id 的倒排索引，以及概念 id -> 成分股位图。"""
+
+    def __init__(
+        self,
+        concepts: dict[int, ConceptSummary],
+        by_stock: dict[str, tuple[int, ...]],
+        bitmaps: ConceptBitmaps,
+    ) -> None:
+        self._concepts = concepts
+        self._by_stock = by_stock
+        self._bitmaps = bitmaps
+        self._ids_by_code = {c.third_code.upper(): c.id for c in concepts.values()}
+
+    @classmethod
+    async def load(
+        cls,
+        source: DataSource,
+        concept_repo: ConceptRepository,
+        concept_stock_repo: ConceptStockRepository,
+        stock_basic_repo: StockBasicRepository,
+    ) -> "ConceptMembershipIndex":
+        concepts = {
+            c.id: ConceptSummary(id=c.id, third_code=c.third_code, name=c.name)
+            for c in await concept_repo.find_all(source)
+            if c.id is not None
+        }
+        by_stock: defaultdict[str, list[int]] = defaultdict(list)
+        by_concept: defaultdict[int, list[str]] = defaultdict(list)
+        for code, concept_id in await concept_stock_repo.find_memberships(source):
+            if concept_id in concepts:
+                by_stock[code].append(concept_id)
+                by_concept[concept_id].append(code)
+        # 成分股只来自上市股票（见 SyncConceptsHandler），NOT 的补集同样取上市股票
+        bitmaps = ConceptBitmaps(s.third_code for s in await stock_basic_repo.find_all_listed(DataSource.TUSHARE))
+        for concept_id in concepts:
+            bitmaps.add_concept(concept_id, by_concept.get(concept_id, ()))
+        return cls(concepts, {code: tuple(sorted(ids)) for code, ids in by_stock.items()}, bitmaps)
+
+    @property
+    def stock_count(self) -> int:
+        return len(self._by_stock)
+
+    @property
+    def bitmaps(self) -> ConceptBitmaps:
+        return self._bitmaps
+
+    @property
+    def ids_by_code(self) -> dict[str, int]:
+        """概念代码（大写）到概念 id，供位图表达式解析。"""
+        return self._ids_by_code
+
+    def concept(self, concept_id: int) -> ConceptSummary:
+        return self._concepts[concept_id]
+
+    def lookup(self, stock_third_codes: Iterable[str]) -> ConceptMemberships:
+        memberships = {code: list(self._by_stock.get(code, ())) for code in stock_third_codes}
+        concept_ids = sorted({cid for ids in memberships.values() for cid in ids})
+        return ConceptMemberships(
+            concepts=[self._concepts[cid] for cid in concept_ids],
+            memberships=memberships,
+        )
+
+
+class ConceptMembershipIndexCache:
+    """按数据源保存最新的索引快照及其版本号，版本号变化时重建。并发重建只执行一次。"""
+
+    def __init__(self) -> None:
+        self._entries: dict[DataSource, tuple[str, ConceptMembershipIndex]] = {}
+        self._lock = asyncio.Lock()
+
+    async def get(
+        self,
+        source: DataSource,
+        version: str,
+        load: Callable[[], Awaitable[ConceptMembershipIndex]],
+    ) -> ConceptMembershipIndex:
+        entry = self._entries.get(source)
+        if entry is not None and entry[0] == version:
+            return entry[1]
+        async with self._lock:
+            entry = self._entries.get(source)
+            if entry is not None and entry[0] == version:
+                return entry[1]
+            index = await load()
+            self._entries[source] = (version, index)
+        logger.info("概念成分索引已重建", source=source.value, stocks=index.stock_count)
+        return index
+
+
+class ConceptMembershipIndexProvider:
+    """按当前概念资源版本号取索引快照，快照落后时用本次请求的仓储重建。供各成分关系查询 Handler 共用。"""
+
+    def __init__(
+        self,
+        index_cache: ConceptMembershipIndexCache,
+        versions: ResourceVersions,
+        concept_repo: ConceptRepository,
+        concept_stock_repo: ConceptStockRepository,
+        stock_basic_repo: StockBasicRepository,
+        version_ttl_seconds: int | None = None,
+    ) -> None:
+        self._index_cache = index_cache
+        self._versions = versions
+        self._concept_repo = concept_repo
+        self._concept_stock_repo = concept_stock_repo
+        self._stock_basic_repo = stock_basic_repo
+        self._version_ttl_seconds = version_ttl_seconds
+
+    async def get(self, source: DataSource | None = None) -> ConceptMembershipIndex:
+        source = source or DataSource.AKSHARE
+        # 先取版本号再加载：加载期间发生的变更会让下次查找再次重建，而不是沿用旧快照
+        version = await self._versions.current(CONCEPTS_RESOURCE, self._version_ttl_seconds)
+        return await self._index_cache.get(
+            source,
+            version,
+            lambda: ConceptMembershipIndex.load(
+                source, self._concept_repo, self._concept_stock_repo, self._stock_basic_repo
+            ),
+        )
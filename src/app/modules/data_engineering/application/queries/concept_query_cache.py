@@ -0,0 +1,53 @@
+"""概念查询缓存失效：订阅 ConceptsChanged，删除受影响的 GetConcepts / GetConceptStocks 缓存。
+
+同时作废对应资源版本号，使客户端持有的 ETag 失效。
+"""
+
+from app.modules.data_engineering.domain.events import ConceptsChanged
+from app.shared_kernel.application.queries import query_cache_prefix
+from app.shared_kernel.infrastructure.cache import CacheClient
+from app.shared_kernel.infrastructure.logging import get_logger
+from app.shared_kernel.infrastructure.resource_version import ResourceVersions
+
+from .get_concept_stocks import GetConceptStocks
+from .get_concepts import GetConcepts
+
+logger = get_logger(__name__)
+
+# 概念列表的资源名，各数据源共用一个版本号
+CONCEPTS_RESOURCE = "concepts"
+_CONCEPT_STOCKS_RESOURCE_PREFIX = "concept_stocks:"
+# 变化概念数超过此值时整体失效成分股缓存：Redis 上每次前缀删除都要 SCAN 全部键
+_PRECISE_INVALIDATION_LIMIT = 32
+
+
+def concept_stocks_resource(concept_id: int) -> str:
+    """某一概念成分股列表的资源名。"""
+    return f"{_CONCEPT_STOCKS_RESOURCE_PREFIX}{concept_id}"
+
+
+class ConceptQueryCacheInvalidator:
+    """概念列表随任一概念变化整体失效；成分股缓存只失效发生变化的概念（含其全部分页），
+    快照合并或变化概念过多时整体失效。
+    """
+
+    def __init__(self, cache: CacheClient) -> None:
+        self._cache = cache
+        self._versions = ResourceVersions(cache)
+
+    async def handle(self, event: ConceptsChanged) -> None:
+        await self._cache.delete_prefix(query_cache_prefix(GetConcepts))
+        await self._versions.bump(CONCEPTS_RESOURCE)
+        if event.all_concepts or len(event.concept_ids) > _PRECISE_INVALIDATION_LIMIT:
+            await self._cache.delete_prefix(query_cache_prefix(GetConceptStocks))
+            await self._versions.bump_prefix(_CONCEPT_STOCKS_RESOURCE_PREFIX)
+        else:
+            for concept_id in event.concept_ids:
+                await self._cache.delete_prefix(f"{query_cache_prefix(GetConceptStocks)}concept_id={concept_id!r},")
+                await self._versions.bump(concept_stocks_resource(concept_id))
+        logger.info(
+            "概念查询缓存已失效",
+            source=event.source.value,
+            concepts=len(event.concept_ids),
+            all_concepts=event.all_concepts,
+        )
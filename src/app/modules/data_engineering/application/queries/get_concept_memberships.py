@@ -0,0 +1,12 @@
+"""批量查询股票所属概念。"""
+
+from dataclasses import dataclass
+
+from app.modules.data_engineering.domain.value_objects.data_source import DataSource
+from app.shared_kernel.application.query import Query
+
+
+@dataclass(frozen=True)
+class GetConceptMemberships(Query):
+    stock_third_codes: tuple[str, ...]
+    source: DataSource | None = None
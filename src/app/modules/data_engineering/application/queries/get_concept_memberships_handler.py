@@ -0,0 +1,18 @@
+"""GetConceptMemberships 查询处理器。"""
+
+from app.shared_kernel.application.query_handler import QueryHandler
+
+from .concept_membership_index import ConceptMembershipIndexProvider, ConceptMemberships
+from .get_concept_memberships import GetConceptMemberships
+
+
+class GetConceptMembershipsHandler(QueryHandler[GetConceptMemberships, ConceptMemberships]):
+    """从倒排索引快照查找；代码统一为大写并去重。"""
+
+    def __init__(self, index_provider: ConceptMembershipIndexProvider) -> None:
+        self._index_provider = index_provider
+
+    async def handle(self, query: GetConceptMemberships) -> ConceptMemberships:
+        index = await self._index_provider.get(query.source)
+        codes = dict.fromkeys(code.strip().upper() for code in query.stock_third_codes)
+        return index.lookup(codes)
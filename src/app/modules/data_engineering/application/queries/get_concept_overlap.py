@@ -0,0 +1,30 @@
+"""查询概念之间的成分股重叠度。"""
+
+from dataclasses import dataclass, field
+
+from app.modules.data_engineering.domain.value_objects.data_source import DataSource
+from app.shared_kernel.application.query import Query
+
+from .concept_membership_index import ConceptSummary
+
+
+@dataclass(frozen=True)
+class GetConceptOverlap(Query):
+    """concept_codes 指定概念；为空时取成分股最多的 top 个概念。"""
+
+    concept_codes: tuple[str, ...] = ()
+    top: int = 50
+    source: DataSource | None = None
+
+
+@dataclass(frozen=True)
+class ConceptOverlap:
+    """两两 Jaccard 系数矩阵，行列顺序与 concepts 一致。
+
+    Attributes:
+        sizes: 各概念的成分股数量。
+    """
+
+    concepts: list[ConceptSummary] = field(default_factory=list)
+    sizes: list[int] = field(default_factory=list)
+    jaccard: list[list[float]] = field(default_factory=list)
@@ -0,0 +1,28 @@
+"""GetConceptOverlap 查询处理器。"""
+
+from app.modules.data_engineering.domain.exceptions import ConceptNotFoundError
+from app.shared_kernel.application.query_handler import QueryHandler
+
+from .concept_membership_index import ConceptMembershipIndexProvider
+from .get_concept_overlap import ConceptOverlap, GetConceptOverlap
+
+
+class GetConceptOverlapHandler(QueryHandler[GetConceptOverlap, ConceptOverlap]):
+    def __init__(self, index_provider: ConceptMembershipIndexProvider) -> None:
+        self._index_provider = index_provider
+
+    async def handle(self, query: GetConceptOverlap) -> ConceptOverlap:
+        index = await self._index_provider.get(query.source)
+        if query.concept_codes:
+            codes = [code.strip().upper() for code in query.concept_codes]
+            missing = [code for code in codes if code not in index.ids_by_code]
+            if missing:
+                raise ConceptNotFoundError(f"Concept not found: {', '.join(missing)}")
+            concept_ids = list(dict.fromkeys(index.ids_by_code[code] for code in codes))
+        else:
+            concept_ids = index.bitmaps.largest(query.top)
+        return ConceptOverlap(
+            concepts=[index.concept(cid) for cid in concept_ids],
+            sizes=[index.bitmaps.size(cid) for cid in concept_ids],
+            jaccard=index.bitmaps.overlap_matrix(concept_ids),
+        )
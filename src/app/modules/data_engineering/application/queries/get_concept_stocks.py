@@ -7,4 +7,12 @@ from app.shared_kernel.application.query import Query
 
 @dataclass(frozen=True)
 class GetConceptStocks(Query):
+    """按 id 升序分页查询概念成分股，cursor / limit / fields 含义同 GetConcepts。
+
+    concept_id 须为第一个字段：缓存失效按 "concept_id=<id>," 前缀删除该概念的全部分页。
+    """
+
     concept_id: int
+    cursor: str | None = None
+    limit: int = 500
+    fields: tuple[str, ...] | None = None
@@ -1,17 +1,20 @@
 """GetConceptStocks 查询处理器。"""
 
-from app.modules.data_engineering.domain.entities.concept_stock import ConceptStock
+from typing import Any
+
 from app.modules.data_engineering.domain.exceptions import ConceptNotFoundError
 from app.modules.data_engineering.domain.repositories.concept_repository import ConceptRepository
 from app.modules.data_engineering.domain.repositories.concept_stock_repository import (
+    CONCEPT_STOCK_PAGE_FIELDS,
     ConceptStockRepository,
 )
+from app.shared_kernel.application.pagination import Page, decode_cursor, paginate, resolve_fields
 from app.shared_kernel.application.query_handler import QueryHandler
 
 from .get_concept_stocks import GetConceptStocks
 
 
-class GetConceptStocksHandler(QueryHandler[GetConceptStocks, list[ConceptStock]]):
+class GetConceptStocksHandler(QueryHandler[GetConceptStocks, Page[dict[str, Any]]]):
     def __init__(
         self,
         concept_repo: ConceptRepository,
@@ -20,8 +23,14 @@ class GetConceptStocksHandler(QueryHandler[GetConceptStocks, list[ConceptStock]]
         self._concept_repo = concept_repo
         self._concept_stock_repo = concept_stock_repo
 
-    async def handle(self, query: GetConceptStocks) -> list[ConceptStock]:
+    async def handle(self, query: GetConceptStocks) -> Page[dict[str, Any]]:
         concept = await self._concept_repo.find_by_id(query.concept_id)
         if concept is None:
             raise ConceptNotFoundError(f"Concept not found: id={query.concept_id}")
-        return await self._concept_stock_repo.find_by_concept_id(query.concept_id)
+        rows = await self._concept_stock_repo.find_page_by_concept_id(
+            query.concept_id,
+            fields=resolve_fields(query.fields, CONCEPT_STOCK_PAGE_FIELDS),
+            limit=query.limit + 1,
+            after_id=decode_cursor(query.cursor) if query.cursor else None,
+        )
+        return paginate(rows, query.limit)
@@ -8,4 +8,17 @@ from app.shared_kernel.application.query import Query
 
 @dataclass(frozen=True)
 class GetConcepts(Query):
+    """按 id 升序分页查询概念。
+
+    Attributes:
+        name_prefix: 名称前缀过滤。
+        cursor: 上一页返回的 next_cursor，None 为第一页。
+        limit: 每页条数。
+        fields: 字段投影，None 为全部字段；id 始终返回。
+    """
+
     source: DataSource | None = None
+    name_prefix: str | None = None
+    cursor: str | None = None
+    limit: int = 500
+    fields: tuple[str, ...] | None = None
@@ -1,17 +1,29 @@
 """GetConcepts 查询处理器。"""
 
-from app.modules.data_engineering.domain.entities.concept import Concept
-from app.modules.data_engineering.domain.repositories.concept_repository import ConceptRepository
+from typing import Any
+
+from app.modules.data_engineering.domain.repositories.concept_repository import (
+    CONCEPT_PAGE_FIELDS,
+    ConceptRepository,
+)
 from app.modules.data_engineering.domain.value_objects.data_source import DataSource
+from app.shared_kernel.application.pagination import Page, decode_cursor, paginate, resolve_fields
 from app.shared_kernel.application.query_handler import QueryHandler
 
 from .get_concepts import GetConcepts
 
 
-class GetConceptsHandler(QueryHandler[GetConcepts, list[Concept]]):
+class GetConceptsHandler(QueryHandler[GetConcepts, Page[dict[str, Any]]]):
     def __init__(self, concept_repo: ConceptRepository) -> None:
         self._concept_repo = concept_repo
 
-    async def handle(self, query: GetConcepts) -> list[Concept]:
+    async def handle(self, query: GetConcepts) -> Page[dict[str, Any]]:
         source = query.source or DataSource.AKSHARE
-        return await self._concept_repo.find_all(source)
+        rows = await self._concept_repo.find_page(
+            source,
+            fields=resolve_fields(query.fields, CONCEPT_PAGE_FIELDS),
+            limit=query.limit + 1,
+            after_id=decode_cursor(query.cursor) if query.cursor else None,
+            name_prefix=query.name_prefix,
+        )
+        return paginate(rows, query.limit)
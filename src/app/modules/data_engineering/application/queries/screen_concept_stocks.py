@@ -0,0 +1,23 @@
+"""按概念集合表达式筛选股票。"""
+
+from dataclasses import dataclass, field
+
+from app.modules.data_engineering.domain.value_objects.data_source import DataSource
+from app.shared_kernel.application.query import Query
+
+
+@dataclass(frozen=True)
+class ScreenConceptStocks(Query):
+    """expression 如 "BK0818 AND (BK0001 OR BK0002) AND NOT BK0003"，操作数为概念代码。"""
+
+    expression: str
+    source: DataSource | None = None
+    limit: int = 1000
+
+
+@dataclass(frozen=True)
+class ConceptStockScreen:
+    """筛选结果。count 为命中总数，stock_third_codes 至多 limit 个。"""
+
+    count: int
+    stock_third_codes: list[str] = field(default_factory=list)
@@ -0,0 +1,19 @@
+"""ScreenConceptStocks 查询处理器。"""
+
+from app.shared_kernel.application.query_handler import QueryHandler
+
+from .concept_membership_index import ConceptMembershipIndexProvider
+from .screen_concept_stocks import ConceptStockScreen, ScreenConceptStocks
+
+
+class ScreenConceptStocksHandler(QueryHandler[ScreenConceptStocks, ConceptStockScreen]):
+    def __init__(self, index_provider: ConceptMembershipIndexProvider) -> None:
+        self._index_provider = index_provider
+
+    async def handle(self, query: ScreenConceptStocks) -> ConceptStockScreen:
+        index = await self._index_provider.get(query.source)
+        bitmap = index.bitmaps.evaluate(query.expression, index.ids_by_code)
+        return ConceptStockScreen(
+            count=bitmap.bit_count(),
+            stock_third_codes=index.bitmaps.decode(bitmap, query.limit),
+        )
@@ -1,5 +1,6 @@
 """概念板块聚合根。"""
 
+from collections.abc import Mapping
 from dataclasses import dataclass
 from datetime import datetime
 from hashlib import sha256
@@ -19,6 +20,7 @@ class Concept(AggregateRoot[int | None]):
     name: str
     content_hash: str
     last_synced_at: datetime
+    membership_hash: str | None = None  # 成分股聚合哈希，未计算过时为 None
 
     @staticmethod
     def compute_hash(source: DataSource, third_code: str, name: str) -> str:
@@ -28,3 +30,9 @@ class Concept(AggregateRoot[int | None]):
     @staticmethod
     def calculate_content_hash(source: DataSource, third_code: str, name: str) -> str:
         return Concept.compute_hash(source, third_code, name)
+
+    @staticmethod
+    def compute_membership_hash(member_hashes: Mapping[str, str]) -> str:
+        """成分股聚合哈希：按股票代码排序后对全部 (代码, 成分股内容哈希) 求哈希，与顺序无关。"""
+        content = "|".join(f"{code}:{member_hashes[code]}" for code in sorted(member_hashes))
+        return sha256(content.encode("utf-8")).hexdigest()[:16]
@@ -7,6 +7,7 @@ from decimal import Decimal
 from app.shared_kernel.domain.entity import Entity
 
 from ..value_objects.data_source import DataSource
+from ..value_objects.financial_report_fingerprint import FinancialReportFingerprint
 
 
 @dataclass(eq=False)
@@ -233,6 +234,14 @@ class StockFinancial(Entity[int | None]):
     q_ocf_to_or: Decimal | None
     update_flag: str | None
 
+    def fingerprint(self) -> FinancialReportFingerprint:
+        """返回本期报告的披露版本指纹，用于识别重述与未变更报告期。"""
+        return FinancialReportFingerprint(
+            end_date=self.end_date,
+            ann_date=self.ann_date,
+            update_flag=self.update_flag,
+        )
+
     def __eq__(self, other: object) -> bool:
         if not isinstance(other, StockFinancial):
             return False
@@ -0,0 +1,32 @@
+"""同步运行实体。"""
+
+from dataclasses import dataclass
+from datetime import datetime
+
+from app.shared_kernel.domain.entity import Entity
+
+from ..value_objects.sync_run_status import SyncRunStatus
+
+
+@dataclass(eq=False)
+class SyncRun(Entity[int | None]):
+    """一次长耗时同步的运行记录。计划的工作条目（股票代码）随运行一并落库，逐条记录完成状态，
+    进程中断后可据此从第一个未完成条目续跑。
+
+    Attributes:
+        id: 主键；新建未持久化时为 None。
+        kind: 同步类型（如 'stock_daily_history'）。
+        run_key: 调用方提供的运行标识（如后台任务 ID），同类型下唯一，用于续跑定位。
+        status: 运行状态。
+        total_items: 计划的工作条目总数。
+        started_at: 首次开始时间（含时区）。
+        finished_at: 完成时间；未完成时为 None。
+    """
+
+    id: int | None
+    kind: str
+    run_key: str
+    status: SyncRunStatus
+    total_items: int
+    started_at: datetime
+    finished_at: datetime | None = None
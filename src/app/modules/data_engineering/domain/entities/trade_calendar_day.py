@@ -0,0 +1,25 @@
+"""交易日历实体。"""
+
+from dataclasses import dataclass
+from datetime import date
+
+from app.shared_kernel.domain.entity import Entity
+
+
+@dataclass(eq=False)
+class TradeCalendarDay(Entity[int | None]):
+    """某交易所某自然日的开市状态。
+
+    Attributes:
+        id: 主键；新建未持久化时为 None。
+        exchange: 交易所代码（如 SSE、SZSE）。
+        cal_date: 自然日。
+        is_open: 是否开市。
+        pretrade_date: 上一个交易日；数据源未提供时为 None。
+    """
+
+    id: int | None
+    exchange: str
+    cal_date: date
+    is_open: bool
+    pretrade_date: date | None = None
@@ -1 +1,6 @@
 """领域事件定义。"""
+
+from .concept_events import ConceptsChanged
+from .stock_basic_events import StockBasicChanged
+
+__all__ = ["ConceptsChanged", "StockBasicChanged"]
@@ -0,0 +1,22 @@
+"""概念板块领域事件。"""
+
+from dataclasses import dataclass
+
+from app.shared_kernel.domain.domain_event import DomainEvent
+
+from ..value_objects.data_source import DataSource
+
+
+@dataclass(frozen=True)
+class ConceptsChanged(DomainEvent):
+    """概念同步已提交变更。
+
+    Attributes:
+        source: 数据源。
+        concept_ids: 概念本身或成分股有变化（含新增、删除）的概念 ID。
+        all_concepts: 无法精确到单个概念（如快照合并）时为 True，订阅方应按全部概念处理。
+    """
+
+    source: DataSource = DataSource.AKSHARE
+    concept_ids: tuple[int, ...] = ()
+    all_concepts: bool = False
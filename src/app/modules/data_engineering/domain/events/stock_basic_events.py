@@ -0,0 +1,20 @@
+"""股票基础信息领域事件。"""
+
+from dataclasses import dataclass
+
+from app.shared_kernel.domain.domain_event import DomainEvent
+
+from ..value_objects.data_source import DataSource
+
+
+@dataclass(frozen=True)
+class StockBasicChanged(DomainEvent):
+    """股票基础信息同步已提交。
+
+    Attributes:
+        source: 数据源。
+        synced_count: 本次写入的股票数。
+    """
+
+    source: DataSource = DataSource.TUSHARE
+    synced_count: int = 0
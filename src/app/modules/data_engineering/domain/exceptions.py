@@ -1,6 +1,6 @@
 """领域异常，供网关解析/网络失败时抛出。"""
 
-from app.shared_kernel.domain.exception import DomainException, NotFoundException
+from app.shared_kernel.domain.exception import DomainException, NotFoundException, ValidationException
 
 
 class ExternalStockServiceError(DomainException):
@@ -15,7 +15,19 @@ class ExternalConceptServiceError(DomainException):
     pass
 
 
+class SyncInterruptedError(DomainException):
+    """同步因取消或超时提前停止，只写入了一部分数据；定时任务据此使依赖它的下游任务跳过。"""
+
+    pass
+
+
 class ConceptNotFoundError(NotFoundException):
     """查询的概念板块不存在。"""
 
     pass
+
+
+class InvalidConceptExpressionError(ValidationException):
+    """概念集合表达式语法错误或引用了不存在的概念。"""
+
+    pass
@@ -0,0 +1,14 @@
+"""交易日历网关接口。"""
+
+from abc import ABC, abstractmethod
+from datetime import date
+
+from ..entities.trade_calendar_day import TradeCalendarDay
+
+
+class TradeCalendarGateway(ABC):
+    """从外部数据源拉取交易所交易日历。"""
+
+    @abstractmethod
+    async def fetch_trade_calendar(self, exchange: str, start_date: date, end_date: date) -> list[TradeCalendarDay]:
+        """获取指定交易所在日期范围（含两端）内每个自然日的开市状态。"""
@@ -1,8 +1,13 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any
 
 from app.modules.data_engineering.domain.entities.concept import Concept
 from app.modules.data_engineering.domain.value_objects.data_source import DataSource
 
+# find_page 可投影的字段（对外只读视图）
+CONCEPT_PAGE_FIELDS = ("id", "source", "third_code", "name", "last_synced_at")
+
 
 class ConceptRepository(ABC):
     """概念板块仓储接口。不 commit，由调用方 UnitOfWork 管理事务。"""
@@ -12,6 +17,21 @@ class ConceptRepository(ABC):
         """获取指定数据源的所有概念板块。"""
         ...
 
+    @abstractmethod
+    async def find_page(
+        self,
+        source: DataSource,
+        fields: Sequence[str],
+        limit: int,
+        after_id: int | None = None,
+        name_prefix: str | None = None,
+    ) -> list[dict[str, Any]]:
+        """按 id 升序取 after_id 之后至多 limit 行，只查询 fields 对应的列，返回列名到值的映射。
+
+        fields 取自 CONCEPT_PAGE_FIELDS；name_prefix 按名称前缀过滤（区分大小写）。
+        """
+        ...
+
     @abstractmethod
     async def find_by_id(self, concept_id: int) -> Concept | None:
         """根据 ID 查找概念板块。"""
@@ -0,0 +1,34 @@
+"""概念全量快照仓储接口。"""
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from app.modules.data_engineering.domain.entities.concept import Concept
+from app.modules.data_engineering.domain.value_objects.concept_snapshot import (
+    ConceptSnapshotDiff,
+    ConceptSnapshotMember,
+)
+from app.modules.data_engineering.domain.value_objects.data_source import DataSource
+
+
+class ConceptSnapshotRepository(ABC):
+    """以影子表承载一次完整的远程快照，再整体合并到 concept / concept_stock。
+
+    stage 与 apply 均不 commit，由调用方 UnitOfWork 管理事务；
+    apply 应在单个短事务内完成，读者只会看到旧快照或新快照。
+    """
+
+    @abstractmethod
+    async def stage(
+        self,
+        source: DataSource,
+        concepts: list[Concept],
+        members: list[ConceptSnapshotMember],
+    ) -> None:
+        """清空该来源的影子数据后，批量写入完整快照。"""
+        ...
+
+    @abstractmethod
+    async def apply(self, source: DataSource, synced_at: datetime) -> ConceptSnapshotDiff:
+        """以集合运算将影子快照合并进正式表并清理影子数据，返回变更统计。"""
+        ...
@@ -1,6 +1,12 @@
 from abc import ABC, abstractmethod
+from collections.abc import Sequence
+from typing import Any
 
 from app.modules.data_engineering.domain.entities.concept_stock import ConceptStock
+from app.modules.data_engineering.domain.value_objects.data_source import DataSource
+
+# find_page_by_concept_id 可投影的字段（对外只读视图）
+CONCEPT_STOCK_PAGE_FIELDS = ("id", "concept_id", "source", "stock_third_code", "stock_symbol", "added_at")
 
 
 class ConceptStockRepository(ABC):
@@ -11,6 +17,30 @@ class ConceptStockRepository(ABC):
         """获取指定概念的所有成分股。"""
         ...
 
+    @abstractmethod
+    async def find_page_by_concept_id(
+        self,
+        concept_id: int,
+        fields: Sequence[str],
+        limit: int,
+        after_id: int | None = None,
+    ) -> list[dict[str, Any]]:
+        """按 id 升序取指定概念 after_id 之后至多 limit 个成分股，只查询 fields 对应的列。
+
+        fields 取自 CONCEPT_STOCK_PAGE_FIELDS。
+        """
+        ...
+
+    @abstractmethod
+    async def find_memberships(self, source: DataSource) -> list[tuple[str, int]]:
+        """指定来源全部 (stock_third_code, concept_id) 对，只查询这两列，用于构建股票到概念的倒排索引。"""
+        ...
+
+    @abstractmethod
+    async def find_all_grouped_by_concept(self, source: DataSource) -> dict[int, list[ConceptStock]]:
+        """一次查询加载指定来源的全部成分股关联，按 concept_id 在内存中分组。"""
+        ...
+
     @abstractmethod
     async def save_many(self, concept_stocks: list[ConceptStock]) -> None:
         """批量保存（新增或更新）。"""
@@ -25,3 +55,8 @@ class ConceptStockRepository(ABC):
     async def delete_by_concept_id(self, concept_id: int) -> None:
         """删除指定概念的所有关联关系。"""
         ...
+
+    @abstractmethod
+    async def delete_by_concept_ids(self, concept_ids: list[int]) -> None:
+        """以单条 DELETE ... WHERE concept_id IN (...) 删除多个概念的全部关联关系。"""
+        ...
@@ -19,3 +19,7 @@ class StockDailyRepository(ABC):
     @abstractmethod
     async def get_latest_trade_date(self, source: DataSource, third_code: str) -> date | None:
         """查询某只股票本地已有的最新交易日期，用于断点续传。无记录返回 None。"""
+
+    @abstractmethod
+    async def get_global_latest_trade_date(self, source: DataSource) -> date | None:
+        """查询全市场本地已有的最新交易日期（全局水位），用于按日期补齐缺口。无记录返回 None。"""
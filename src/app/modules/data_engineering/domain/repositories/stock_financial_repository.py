@@ -5,6 +5,7 @@ from datetime import date
 
 from ..entities.stock_financial import StockFinancial
 from ..value_objects.data_source import DataSource
+from ..value_objects.financial_report_fingerprint import FinancialReportFingerprint
 
 
 class StockFinancialRepository(ABC):
@@ -19,3 +20,7 @@ class StockFinancialRepository(ABC):
     @abstractmethod
     async def get_latest_end_date(self, source: DataSource, third_code: str) -> date | None:
         """查最新报告期截止日，无记录返回 None。"""
+
+    @abstractmethod
+    async def find_fingerprints(self, source: DataSource, third_code: str) -> dict[date, FinancialReportFingerprint]:
+        """查单只股票已落库各报告期的披露版本指纹，以 end_date 为键；无记录返回空字典。"""
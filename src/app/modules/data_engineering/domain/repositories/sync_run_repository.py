@@ -0,0 +1,36 @@
+"""同步运行仓储接口。"""
+
+from abc import ABC, abstractmethod
+
+from ..entities.sync_run import SyncRun
+from ..value_objects.sync_run_status import SyncRunItemStatus
+
+
+class SyncRunRepository(ABC):
+    """同步运行及其工作条目仓储。不 commit，由调用方 UnitOfWork 管理。"""
+
+    @abstractmethod
+    async def create(self, run: SyncRun, item_keys: list[str]) -> SyncRun:
+        """新建运行并按顺序写入计划的工作条目（均为 PENDING），返回带 id 的运行。"""
+
+    @abstractmethod
+    async def save(self, run: SyncRun) -> None:
+        """更新运行状态。"""
+
+    @abstractmethod
+    async def find_unfinished(self, kind: str, run_key: str) -> SyncRun | None:
+        """按 (kind, run_key) 查询未完成（RUNNING / INTERRUPTED）的运行。"""
+
+    @abstractmethod
+    async def find_pending_item_keys(self, run_id: int) -> list[str]:
+        """按计划顺序返回运行中仍为 PENDING 的工作条目。"""
+
+    @abstractmethod
+    async def mark_item(
+        self,
+        run_id: int,
+        item_key: str,
+        status: SyncRunItemStatus,
+        error_message: str | None = None,
+    ) -> None:
+        """更新单个工作条目的状态。"""
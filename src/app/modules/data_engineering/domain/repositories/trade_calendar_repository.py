@@ -0,0 +1,17 @@
+"""交易日历仓储接口。"""
+
+from abc import ABC, abstractmethod
+
+from ..entities.trade_calendar_day import TradeCalendarDay
+
+
+class TradeCalendarRepository(ABC):
+    """交易日历仓储。不 commit，由调用方 UnitOfWork 管理。"""
+
+    @abstractmethod
+    async def upsert_many(self, days: list[TradeCalendarDay]) -> int:
+        """按 (exchange, cal_date) 批量插入或更新，返回写入条数。"""
+
+    @abstractmethod
+    async def find_all(self, exchange: str) -> list[TradeCalendarDay]:
+        """查询交易所全部日历记录，按 cal_date 升序。"""
@@ -0,0 +1,184 @@
+"""概念成分位图：为集合筛选提供微秒级的与/或/非与重叠度计算。
+
+每只股票分配一个稠密整数 id，每个概念的成分股存为一个位图（Python int 的二进制位），
+集合运算即整数按位运算，计数为 int.bit_count()，均在 C 层完成，无需逐行关联 concept_stock。
+全 A 股约五千只，单个位图不足 1KB。
+
+表达式语法（关键字不区分大小写，优先级 NOT > AND > OR）::
+
+    BK0818 AND (BK0001 OR BK0002) AND NOT BK0003
+"""
+
+import re
+from collections.abc import Iterable, Mapping
+
+from ..exceptions import InvalidConceptExpressionError
+
+_TOKEN = re.compile(r"\s*(?:(\()|(\))|([A-Za-z0-9_.]+))")
+_KEYWORDS = {"AND", "OR", "NOT"}
+# 括号与 NOT 的最大嵌套层数；递归下降每层占用若干栈帧，超出即按语法错误拒绝，避免 RecursionError
+_MAX_EXPRESSION_DEPTH = 32
+
+
+class ConceptBitmaps:
+    """概念成分位图集合。构建完成后只读。
+
+    Attributes:
+        _codes: 稠密 id 到股票代码。
+        _ids: 股票代码到稠密 id。
+        _universe: 全部上市股票的位图，NOT 取其补集。
+        _bitmaps: 概念 id 到成分股位图。
+    """
+
+    def __init__(self, universe: Iterable[str]) -> None:
+        self._codes: list[str] = []
+        self._ids: dict[str, int] = {}
+        self._universe = self._to_bitmap(universe)
+        self._bitmaps: dict[int, int] = {}
+
+    def add_concept(self, concept_id: int, stock_codes: Iterable[str]) -> None:
+        """设置概念的成分股。不在上市股票中的代码也分配 id，但不参与 NOT 的补集。"""
+        self._bitmaps[concept_id] = self._to_bitmap(stock_codes)
+
+    @property
+    def universe(self) -> int:
+        return self._universe
+
+    def bitmap(self, concept_id: int) -> int:
+        return self._bitmaps.get(concept_id, 0)
+
+    def size(self, concept_id: int) -> int:
+        return self.bitmap(concept_id).bit_count()
+
+    def largest(self, n: int) -> list[int]:
+        """成分股最多的 n 个概念 id，数量相同时按 id 升序。"""
+        return sorted(self._bitmaps, key=lambda cid: (-self._bitmaps[cid].bit_count(), cid))[:n]
+
+    def evaluate(self, expression: str, resolve: Mapping[str, int]) -> int:
+        """计算表达式，返回结果位图。resolve 为概念代码（大写）到概念 id 的映射。
+
+        Raises:
+            InvalidConceptExpressionError: 语法错误或概念代码不存在。
+        """
+        return _Parser(expression, resolve, self).parse()
+
+    def decode(self, bitmap: int, limit: int | None = None) -> list[str]:
+        """位图中的股票代码，按稠密 id 升序，至多 limit 个。"""
+        codes: list[str] = []
+        while bitmap and (limit is None or len(codes) < limit):
+            low = bitmap & -bitmap
+            codes.append(self._codes[low.bit_length() - 1])
+            bitmap ^= low
+        return codes
+
+    def jaccard(self, a: int, b: int) -> float:
+        """两个概念成分股的 Jaccard 系数 |A∩B| / |A∪B|，均为空时为 0。"""
+        left, right = self.bitmap(a), self.bitmap(b)
+        union = (left | right).bit_count()
+        return (left & right).bit_count() / union if union else 0.0
+
+    def overlap_matrix(self, concept_ids: list[int]) -> list[list[float]]:
+        """两两 Jaccard 系数矩阵（对称，对角线为 1，空概念为 0）。"""
+        n = len(concept_ids)
+        matrix = [[0.0] * n for _ in range(n)]
+        for i in range(n):
+            matrix[i][i] = 1.0 if self.bitmap(concept_ids[i]) else 0.0
+            for j in range(i + 1, n):
+                matrix[i][j] = matrix[j][i] = self.jaccard(concept_ids[i], concept_ids[j])
+        return matrix
+
+    def _to_bitmap(self, codes: Iterable[str]) -> int:
+        bitmap = 0
+        for code in codes:
+            stock_id = self._ids.get(code)
+            if stock_id is None:
+                stock_id = self._ids[code] = len(self._codes)
+                self._codes.append(code)
+            bitmap |= 1 << stock_id
+        return bitmap
+
+
+class _Parser:
+    """递归下降：or := and (OR and)*；and := not (AND not)*；not := NOT not | atom；atom := 代码 | ( or )。"""
+
+    def __init__(self, expression: str, resolve: Mapping[str, int], bitmaps: ConceptBitmaps) -> None:
+        self._tokens = self._tokenize(expression)
+        self._pos = 0
+        self._depth = 0
+        self._resolve = resolve
+        self._bitmaps = bitmaps
+
+    def parse(self) -> int:
+        if not self._tokens:
+            raise InvalidConceptExpressionError("Empty concept expression")
+        result = self._or()
+        if self._pos != len(self._tokens):
+            raise InvalidConceptExpressionError(f"Unexpected token '{self._tokens[self._pos]}'")
+        return result
+
+    @staticmethod
+    def _tokenize(expression: str) -> list[str]:
+        tokens: list[str] = []
+        pos = 0
+        expression = expression.rstrip()
+        while pos < len(expression):
+            match = _TOKEN.match(expression, pos)
+            if match is None:
+                raise InvalidConceptExpressionError(f"Invalid character at position {pos}")
+            tokens.append(match.group(match.lastindex or 0).upper())
+            pos = match.end()
+        return tokens
+
+    def _enter(self) -> None:
+        self._depth += 1
+        if self._depth > _MAX_EXPRESSION_DEPTH:
+            raise InvalidConceptExpressionError(f"Concept expression nested deeper than {_MAX_EXPRESSION_DEPTH} levels")
+
+    def _peek(self) -> str | None:
+        return self._tokens[self._pos] if self._pos < len(self._tokens) else None
+
+    def _next(self) -> str:
+        token = self._peek()
+        if token is None:
+            raise InvalidConceptExpressionError("Unexpected end of concept expression")
+        self._pos += 1
+        return token
+
+    def _or(self) -> int:
+        result = self._and()
+        while self._peek() == "OR":
+            self._pos += 1
+            result |= self._and()
+        return result
+
+    def _and(self) -> int:
+        result = self._not()
+        while self._peek() == "AND":
+            self._pos += 1
+            result &= self._not()
+        return result
+
+    def _not(self) -> int:
+        if self._peek() == "NOT":
+            self._pos += 1
+            self._enter()
+            result = self._bitmaps.universe & ~self._not()
+            self._depth -= 1
+            return result
+        return self._atom()
+
+    def _atom(self) -> int:
+        token = self._next()
+        if token == "(":
+            self._enter()
+            result = self._or()
+            if self._next() != ")":
+                raise InvalidConceptExpressionError("Missing ')' in concept expression")
+            self._depth -= 1
+            return result
+        if token == ")" or token in _KEYWORDS:
+            raise InvalidConceptExpressionError(f"Unexpected token '{token}'")
+        concept_id = self._resolve.get(token)
+        if concept_id is None:
+            raise InvalidConceptExpressionError(f"Unknown concept: {token}")
+        return self._bitmaps.bitmap(concept_id)
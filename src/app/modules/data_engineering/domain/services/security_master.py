@@ -0,0 +1,138 @@
+"""证券主数据：由 stock_basic 一次构建的股票全集快照与标识解析索引。
+
+各数据源的股票代码写法不一：TuShare 为 000001.SZ，AKShare 为裸代码 000001，
+部分行情源为 SZ000001 / sz000001。SecurityMaster 把每只股票的 third_code、symbol、
+裸代码与两种交易所限定写法都登记为别名，解析任意写法均为一次字典查找。
+按上市状态、市场、行业的筛选视图在构建时预先分组，各同步 Handler 取股票列表无需再查库。
+"""
+
+import re
+from collections import defaultdict
+from collections.abc import Iterable, Iterator
+
+from ..entities.stock_basic import StockBasic
+from ..value_objects.stock_status import StockStatus
+
+# 裸代码在多个交易所重复时按此顺序取舍，与原先逐个补后缀匹配的顺序一致
+_EXCHANGES = ("SZ", "SH", "BJ")
+_SUFFIXED = re.compile(r"^(\d{6})\.(SZ|SH|BJ)$")
+_PREFIXED = re.compile(r"^(SZ|SH|BJ)(\d{6})$")
+
+
+def _split(identifier: str) -> tuple[str, str] | None:
+    """拆出 (裸代码, 交易所)，不是交易所限定写法时返回 None。"""
+    if m := _SUFFIXED.match(identifier):
+        return m.group(1), m.group(2)
+    if m := _PREFIXED.match(identifier):
+        return m.group(2), m.group(1)
+    return None
+
+
+def _aliases(identifier: str) -> list[str]:
+    """标识自身及其全部等价写法（大写），裸代码排在最后。"""
+    key = identifier.strip().upper()
+    if not key:
+        return []
+    parts = _split(key)
+    if parts is None:
+        return [key]
+    code, exchange = parts
+    return [key, f"{code}.{exchange}", f"{exchange}{code}", code]
+
+
+class SecurityMaster:
+    """不可变的股票全集快照与证券标识索引。
+
+    - get(third_code)：按 third_code 精确查找
+    - resolve(identifier)：按任意写法（third_code、symbol、裸代码、交易所限定代码，不区分大小写）查找
+    - stocks(status, market, industry) / listed() / find(third_codes)：筛选视图，保持加载顺序
+    同一别名对应多只股票时，上市股票优先，其次按深、沪、北交易所顺序。
+    快照中的 StockBasic 由多个调用方共享，须视为只读。
+    """
+
+    def __init__(self, stocks: Iterable[StockBasic] = ()) -> None:
+        self._by_third_code: dict[str, StockBasic] = {}
+        self._by_alias: dict[str, StockBasic] = {}
+        for stock in stocks:
+            self._by_third_code.setdefault(stock.third_code, stock)
+        self._all = tuple(self._by_third_code.values())
+        by_status: defaultdict[StockStatus, list[StockBasic]] = defaultdict(list)
+        by_market: defaultdict[str, list[StockBasic]] = defaultdict(list)
+        by_industry: defaultdict[str, list[StockBasic]] = defaultdict(list)
+        for stock in self._all:
+            by_status[stock.status].append(stock)
+            by_market[stock.market].append(stock)
+            by_industry[stock.industry].append(stock)
+        self._by_status = {k: tuple(v) for k, v in by_status.items()}
+        self._by_market = {k: tuple(v) for k, v in by_market.items()}
+        self._by_industry = {k: tuple(v) for k, v in by_industry.items()}
+        ordered = sorted(self._all, key=self._priority)
+        # third_code 的原始写法优先于派生别名，先整体登记
+        for stock in ordered:
+            self._by_alias.setdefault(stock.third_code.strip().upper(), stock)
+        for stock in ordered:
+            for alias in (*_aliases(stock.third_code), *_aliases(stock.symbol)):
+                self._by_alias.setdefault(alias, stock)
+
+    @staticmethod
+    def _priority(stock: StockBasic) -> tuple[bool, int]:
+        parts = _split(stock.third_code.strip().upper()) or _split(stock.symbol.strip().upper())
+        exchange_rank = _EXCHANGES.index(parts[1]) if parts is not None else len(_EXCHANGES)
+        return stock.status is not StockStatus.LISTED, exchange_rank
+
+    def __len__(self) -> int:
+        return len(self._all)
+
+    def __iter__(self) -> Iterator[StockBasic]:
+        return iter(self._all)
+
+    @property
+    def is_empty(self) -> bool:
+        return not self._by_third_code
+
+    def get(self, third_code: str) -> StockBasic | None:
+        return self._by_third_code.get(third_code)
+
+    def resolve(self, identifier: str) -> StockBasic | None:
+        """解析任意写法的股票代码，无法识别时返回 None。"""
+        stock = self._by_third_code.get(identifier)
+        if stock is not None:
+            return stock
+        for alias in _aliases(identifier):
+            stock = self._by_alias.get(alias)
+            if stock is not None:
+                return stock
+        return None
+
+    def symbol_of(self, third_code: str) -> str | None:
+        stock = self._by_third_code.get(third_code)
+        return stock.symbol if stock is not None else None
+
+    def stocks(
+        self,
+        status: StockStatus | None = None,
+        market: str | None = None,
+        industry: str | None = None,
+    ) -> list[StockBasic]:
+        """按条件筛选的股票列表，条件为 None 时不限；取预分组中最小的一组再过滤其余条件。"""
+        groups = [self._all]
+        if status is not None:
+            groups.append(self._by_status.get(status, ()))
+        if market is not None:
+            groups.append(self._by_market.get(market, ()))
+        if industry is not None:
+            groups.append(self._by_industry.get(industry, ()))
+        return [
+            s
+            for s in min(groups, key=len)
+            if (status is None or s.status is status)
+            and (market is None or s.market == market)
+            and (industry is None or s.industry == industry)
+        ]
+
+    def listed(self) -> list[StockBasic]:
+        return list(self._by_status.get(StockStatus.LISTED, ()))
+
+    def find(self, third_codes: Iterable[str]) -> list[StockBasic]:
+        """按 third_code 列表查找，保持给定顺序，不存在的代码跳过。"""
+        return [s for code in third_codes if (s := self._by_third_code.get(code)) is not None]
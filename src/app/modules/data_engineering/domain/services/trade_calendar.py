@@ -0,0 +1,134 @@
+"""内存交易日历：基于有序交易日列表的二分查找索引。"""
+
+from bisect import bisect_left, bisect_right
+from collections.abc import Iterable
+from datetime import date, timedelta
+
+from ..entities.trade_calendar_day import TradeCalendarDay
+
+_ONE_DAY = timedelta(days=1)
+
+
+def _count_weekdays(start: date, end: date) -> int:
+    """[start, end] 内的工作日数，O(1)。"""
+    if start > end:
+        return 0
+    days = (end - start).days + 1
+    full_weeks, rest = divmod(days, 7)
+    first = start.weekday()
+    return full_weeks * 5 + sum(1 for i in range(rest) if (first + i) % 7 < 5)
+
+
+class TradeCalendar:
+    """不可变的交易日索引。
+
+    open_dates 为覆盖范围 [coverage_start, coverage_end] 内的全部交易日；
+    覆盖范围之外（或日历为空时）按工作日近似，保证未同步日历时调用方行为与按工作日处理一致。
+    查询均为 O(log n) 二分查找，区间计数不展开日期。
+    """
+
+    def __init__(self, open_dates: Iterable[date] = (), coverage: tuple[date, date] | None = None) -> None:
+        self._open = sorted(set(open_dates))
+        if coverage is None and self._open:
+            coverage = (self._open[0], self._open[-1])
+        self._coverage = coverage
+
+    @classmethod
+    def from_days(cls, days: Iterable[TradeCalendarDay]) -> "TradeCalendar":
+        """由日历记录构建；覆盖范围取全部记录（含休市日）的最早与最晚日期。"""
+        all_dates: list[date] = []
+        open_dates: list[date] = []
+        for day in days:
+            all_dates.append(day.cal_date)
+            if day.is_open:
+                open_dates.append(day.cal_date)
+        coverage = (min(all_dates), max(all_dates)) if all_dates else None
+        return cls(open_dates, coverage)
+
+    @property
+    def is_empty(self) -> bool:
+        return self._coverage is None
+
+    @property
+    def coverage(self) -> tuple[date, date] | None:
+        return self._coverage
+
+    def _covers(self, d: date) -> bool:
+        return self._coverage is not None and self._coverage[0] <= d <= self._coverage[1]
+
+    def is_trading_day(self, d: date) -> bool:
+        if not self._covers(d):
+            return d.weekday() < 5
+        i = bisect_left(self._open, d)
+        return i < len(self._open) and self._open[i] == d
+
+    def next_trading_day(self, d: date) -> date:
+        """d 之后（不含 d）的第一个交易日。"""
+        if self._coverage is not None and self._coverage[0] <= d < self._coverage[1]:
+            i = bisect_right(self._open, d)
+            if i < len(self._open):
+                return self._open[i]
+            d = self._coverage[1]
+        d += _ONE_DAY
+        while not self.is_trading_day(d):
+            d += _ONE_DAY
+        return d
+
+    def prev_trading_day(self, d: date) -> date:
+        """d 之前（不含 d）的最近一个交易日。"""
+        if self._coverage is not None and self._coverage[0] < d <= self._coverage[1]:
+            i = bisect_left(self._open, d)
+            if i > 0:
+                return self._open[i - 1]
+            d = self._coverage[0]
+        d -= _ONE_DAY
+        while not self.is_trading_day(d):
+            d -= _ONE_DAY
+        return d
+
+    def latest_trading_day(self, d: date) -> date:
+        """d 当日或之前的最近一个交易日。"""
+        return d if self.is_trading_day(d) else self.prev_trading_day(d)
+
+    def trading_days(self, start: date, end: date) -> list[date]:
+        """[start, end] 内的全部交易日，升序。"""
+        result: list[date] = []
+        for lo, hi, covered in self._segments(start, end):
+            if covered:
+                result.extend(self._open[bisect_left(self._open, lo) : bisect_right(self._open, hi)])
+            else:
+                result.extend(d for d in (lo + timedelta(days=i) for i in range((hi - lo).days + 1)) if d.weekday() < 5)
+        return result
+
+    def count_trading_days(self, start: date, end: date) -> int:
+        """[start, end] 内的交易日数。"""
+        total = 0
+        for lo, hi, covered in self._segments(start, end):
+            if covered:
+                total += bisect_right(self._open, hi) - bisect_left(self._open, lo)
+            else:
+                total += _count_weekdays(lo, hi)
+        return total
+
+    def split_by_trading_days(self, start: date, end: date, max_days: int) -> list[tuple[date, date]]:
+        """将 [start, end] 按每段至多 max_days 个交易日切分，区间两端均为交易日；无交易日时返回空列表。"""
+        days = self.trading_days(start, end)
+        step = max(1, max_days)
+        return [(days[i], days[min(i + step, len(days)) - 1]) for i in range(0, len(days), step)]
+
+    def _segments(self, start: date, end: date) -> list[tuple[date, date, bool]]:
+        """将 [start, end] 拆为覆盖范围之前、之内、之后三段，返回 (起, 止, 是否在覆盖范围内)。"""
+        if start > end:
+            return []
+        if self._coverage is None:
+            return [(start, end, False)]
+        cov_start, cov_end = self._coverage
+        segments: list[tuple[date, date, bool]] = []
+        if start < cov_start:
+            segments.append((start, min(end, cov_start - _ONE_DAY), False))
+        lo, hi = max(start, cov_start), min(end, cov_end)
+        if lo <= hi:
+            segments.append((lo, hi, True))
+        if end > cov_end:
+            segments.append((max(start, cov_end + _ONE_DAY), end, False))
+        return segments
@@ -1,6 +1,17 @@
 """领域值对象。"""
 
+from .concept_snapshot import ConceptSnapshotDiff, ConceptSnapshotMember
 from .data_source import DataSource
+from .financial_report_fingerprint import FinancialReportFingerprint
 from .stock_status import StockStatus
+from .sync_run_status import SyncRunItemStatus, SyncRunStatus
 
-__all__ = ["DataSource", "StockStatus"]
+__all__ = [
+    "ConceptSnapshotDiff",
+    "ConceptSnapshotMember",
+    "DataSource",
+    "FinancialReportFingerprint",
+    "StockStatus",
+    "SyncRunItemStatus",
+    "SyncRunStatus",
+]
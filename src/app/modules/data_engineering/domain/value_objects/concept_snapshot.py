@@ -0,0 +1,43 @@
+"""概念全量快照相关值对象。"""
+
+from dataclasses import dataclass
+
+from app.shared_kernel.domain.value_object import ValueObject
+
+
+@dataclass(frozen=True)
+class ConceptSnapshotMember(ValueObject):
+    """快照中的一条成分股关系。概念尚未落库时没有 id，因此以概念 third_code 关联。
+
+    Attributes:
+        concept_third_code: 所属概念在数据源中的代码。
+        stock_third_code: 股票在行情数据源中的代码。
+        stock_symbol: 数据源返回的股票代码。
+        content_hash: 成分股内容哈希，与 ConceptStock.compute_hash 一致。
+    """
+
+    concept_third_code: str
+    stock_third_code: str
+    stock_symbol: str | None
+    content_hash: str
+
+
+@dataclass(frozen=True)
+class ConceptSnapshotDiff(ValueObject):
+    """快照合并到正式表后的变更统计。
+
+    Attributes:
+        new_concepts: 新增概念数。
+        modified_concepts: 内容变化的概念数。
+        deleted_concepts: 删除的过时概念数。
+        new_stocks: 新增成分股关系数。
+        modified_stocks: 内容变化的成分股关系数。
+        deleted_stocks: 删除的成分股关系数（含过时概念下的关系）。
+    """
+
+    new_concepts: int
+    modified_concepts: int
+    deleted_concepts: int
+    new_stocks: int
+    modified_stocks: int
+    deleted_stocks: int
@@ -0,0 +1,24 @@
+"""财务报告指纹值对象。"""
+
+from dataclasses import dataclass
+from datetime import date
+
+from app.shared_kernel.domain.value_object import ValueObject
+
+
+@dataclass(frozen=True)
+class FinancialReportFingerprint(ValueObject):
+    """单期财务报告的披露版本指纹。
+
+    同一报告期被更正（重述）时，TuShare 会以新的公告日期和 update_flag 重新发布，
+    因此 (end_date, ann_date, update_flag) 相同即可认为该期数据未发生变化。
+
+    Attributes:
+        end_date: 报告期截止日。
+        ann_date: 公告日期。
+        update_flag: 更新标识。
+    """
+
+    end_date: date
+    ann_date: date | None
+    update_flag: str | None
@@ -0,0 +1,19 @@
+"""同步运行状态值对象。"""
+
+from enum import StrEnum
+
+
+class SyncRunStatus(StrEnum):
+    """同步运行状态。INTERRUPTED 的运行可从第一个未完成条目续跑。"""
+
+    RUNNING = "running"
+    INTERRUPTED = "interrupted"
+    COMPLETED = "completed"
+
+
+class SyncRunItemStatus(StrEnum):
+    """同步运行中单个工作条目（如一只股票）的状态。FAILED 视为已处理，由失败重试流程兜底。"""
+
+    PENDING = "pending"
+    DONE = "done"
+    FAILED = "failed"
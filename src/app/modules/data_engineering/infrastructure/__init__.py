@@ -5,27 +5,35 @@ from .gateways.mappers.tushare_stock_daily_mapper import TuShareStockDailyMapper
 from .gateways.tushare_finance_indicator_gateway import TuShareFinanceIndicatorGateway
 from .gateways.tushare_stock_daily_gateway import TuShareStockDailyGateway
 from .gateways.tushare_stock_gateway import TuShareStockGateway
+from .gateways.tushare_trade_calendar_gateway import TuShareTradeCalendarGateway
 from .repositories.sqlalchemy_concept_repository import SqlAlchemyConceptRepository
+from .repositories.sqlalchemy_concept_snapshot_repository import SqlAlchemyConceptSnapshotRepository
 from .repositories.sqlalchemy_concept_stock_repository import SqlAlchemyConceptStockRepository
-from .repositories.sqlalchemy_stock_financial_repository import (
-    SqlAlchemyStockFinancialRepository,
-)
 from .repositories.sqlalchemy_stock_basic_repository import SqlAlchemyStockBasicRepository
 from .repositories.sqlalchemy_stock_daily_repository import SqlAlchemyStockDailyRepository
 from .repositories.sqlalchemy_stock_daily_sync_failure_repository import (
     SqlAlchemyStockDailySyncFailureRepository,
 )
+from .repositories.sqlalchemy_stock_financial_repository import (
+    SqlAlchemyStockFinancialRepository,
+)
+from .repositories.sqlalchemy_sync_run_repository import SqlAlchemySyncRunRepository
+from .repositories.sqlalchemy_trade_calendar_repository import SqlAlchemyTradeCalendarRepository
 
 __all__ = [
     "AkShareConceptGateway",
     "TuShareFinanceIndicatorGateway",
     "TuShareStockDailyGateway",
     "TuShareStockGateway",
+    "TuShareTradeCalendarGateway",
     "TuShareStockDailyMapper",
     "SqlAlchemyConceptRepository",
+    "SqlAlchemyConceptSnapshotRepository",
     "SqlAlchemyConceptStockRepository",
     "SqlAlchemyStockFinancialRepository",
     "SqlAlchemyStockBasicRepository",
     "SqlAlchemyStockDailyRepository",
     "SqlAlchemyStockDailySyncFailureRepository",
+    "SqlAlchemySyncRunRepository",
+    "SqlAlchemyTradeCalendarRepository",
 ]
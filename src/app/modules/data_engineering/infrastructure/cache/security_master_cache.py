@@ -0,0 +1,76 @@
+"""进程内证券主数据缓存：各 Handler 共享的股票全集快照。"""
+
+import asyncio
+from dataclasses import dataclass
+from time import monotonic
+
+from app.modules.data_engineering.domain.repositories.stock_basic_repository import StockBasicRepository
+from app.modules.data_engineering.domain.services.security_master import SecurityMaster
+from app.modules.data_engineering.domain.value_objects.data_source import DataSource
+from app.shared_kernel.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class _Entry:
+    master: SecurityMaster
+    version: int
+    loaded_at: float
+
+
+class SecurityMasterCache:
+    """按数据源持有一份 SecurityMaster，首次使用时从仓储读取全部股票构建（read-through）。
+
+    每个数据源有一个版本号，invalidate() 使其加一；版本号变化或超过 refresh_seconds 的快照在下次 get() 时重建，
+    加载期间发生的失效使本次结果在下次 get() 时仍被重建。
+    本进程同步股票基础信息后由 StockBasicChanged 的订阅者失效；其他进程的同步在下一次重新加载时生效。
+    重新加载失败时沿用旧快照；首次加载失败则抛出异常，空快照会让代码解析与股票列表全部落空。
+    """
+
+    def __init__(self, refresh_seconds: float = 3600.0) -> None:
+        self._refresh_seconds = refresh_seconds
+        self._entries: dict[DataSource, _Entry] = {}
+        self._versions: dict[DataSource, int] = {}
+        self._lock: asyncio.Lock | None = None
+
+    def version(self, source: DataSource = DataSource.TUSHARE) -> int:
+        return self._versions.get(source, 0)
+
+    def _fresh(self, source: DataSource) -> SecurityMaster | None:
+        entry = self._entries.get(source)
+        if entry is None or entry.version != self.version(source):
+            return None
+        if monotonic() - entry.loaded_at >= self._refresh_seconds:
+            return None
+        return entry.master
+
+    async def get(self, repository: StockBasicRepository, source: DataSource = DataSource.TUSHARE) -> SecurityMaster:
+        master = self._fresh(source)
+        if master is not None:
+            return master
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            # 等锁期间可能已由其他协程加载完成
+            master = self._fresh(source)
+            if master is not None:
+                return master
+            version = self.version(source)
+            previous = self._entries.get(source)
+            try:
+                master = SecurityMaster(await repository.find_all(source))
+            except Exception as e:
+                if previous is None:
+                    raise
+                logger.warning("证券主数据加载失败，沿用旧快照", source=source.value, error=str(e))
+                master = previous.master
+            else:
+                logger.info("证券主数据已加载", source=source.value, version=version, stock_count=len(master))
+            self._entries[source] = _Entry(master, version, monotonic())
+            return master
+
+    def invalidate(self, source: DataSource | None = None) -> None:
+        """作废指定数据源（None 表示全部）的快照，下次 get() 时重新加载；加载失败时仍可沿用当前快照。"""
+        for s in [source] if source is not None else list(self._entries):
+            self._versions[s] = self.version(s) + 1
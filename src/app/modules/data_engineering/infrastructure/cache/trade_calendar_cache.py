@@ -0,0 +1,54 @@
+"""进程内交易日历缓存。"""
+
+import asyncio
+from time import monotonic
+
+from app.modules.data_engineering.domain.repositories.trade_calendar_repository import (
+    TradeCalendarRepository,
+)
+from app.modules.data_engineering.domain.services.trade_calendar import TradeCalendar
+from app.shared_kernel.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+class TradeCalendarCache:
+    """持有一份 TradeCalendar，首次使用时从仓储加载，之后按 refresh_seconds 重新加载。
+
+    本进程同步日历后调用 invalidate() 立即失效；其他进程的同步在下一次重新加载时生效。
+    加载失败时沿用旧日历（首次加载失败则为按工作日近似的空日历），不影响调用方。
+    """
+
+    def __init__(self, exchange: str = "SSE", refresh_seconds: float = 3600.0) -> None:
+        self._exchange = exchange
+        self._refresh_seconds = refresh_seconds
+        self._calendar: TradeCalendar | None = None
+        self._loaded_at = 0.0
+        self._lock: asyncio.Lock | None = None
+
+    async def get(self, repository: TradeCalendarRepository) -> TradeCalendar:
+        if self._calendar is not None and monotonic() - self._loaded_at < self._refresh_seconds:
+            return self._calendar
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            # 等锁期间可能已由其他协程加载完成
+            if self._calendar is not None and monotonic() - self._loaded_at < self._refresh_seconds:
+                return self._calendar
+            try:
+                calendar = TradeCalendar.from_days(await repository.find_all(self._exchange))
+            except Exception as e:
+                logger.warning("交易日历加载失败，沿用旧日历", exchange=self._exchange, error=str(e))
+                calendar = self._calendar or TradeCalendar()
+            else:
+                logger.info("交易日历已加载", exchange=self._exchange, coverage=calendar.coverage)
+            self._calendar = calendar
+            self._loaded_at = monotonic()
+            return calendar
+
+    def current(self) -> TradeCalendar:
+        """不触发加载，返回当前持有的日历；尚未加载时返回按工作日近似的空日历。"""
+        return self._calendar or TradeCalendar()
+
+    def invalidate(self) -> None:
+        self._calendar = None
@@ -8,16 +8,36 @@ from app.modules.data_engineering.domain.gateways.concept_gateway import Concept
 from app.modules.data_engineering.infrastructure.gateways.mappers.akshare_concept_mapper import (
     AkShareConceptMapper,
 )
+from app.modules.data_engineering.infrastructure.gateways.tushare_stock_daily_gateway import (
+    TokenBucket,
+)
+
+# 允许的瞬时突发请求数，避免并发预取时集中冲击数据源
+DEFAULT_BURST = 5
 
 
 class AkShareConceptGateway(ConceptGateway):
-    def __init__(self, mapper: AkShareConceptMapper | None = None) -> None:
+    """调用 AKShare 东方财富概念板块接口，请求经令牌桶限流，保证并发拉取时仍对数据源友好。
+
+    未注入 rate_limiter 时按 rate_limit / burst 新建令牌桶，仅约束本实例；
+    多个同步（定时任务与 API 触发的作业）可能同时进行，进程内应注入同一个令牌桶使总速率不超过上限。
+    """
+
+    def __init__(
+        self,
+        mapper: AkShareConceptMapper | None = None,
+        rate_limit: int = 120,
+        burst: int = DEFAULT_BURST,
+        rate_limiter: TokenBucket | None = None,
+    ) -> None:
         self._mapper = mapper or AkShareConceptMapper()
+        self._rate_limiter = rate_limiter or TokenBucket(capacity=burst, tokens_per_minute=rate_limit)
 
     async def fetch_concepts(self) -> list[Concept]:
         try:
             import akshare as ak  # type: ignore[import-untyped]
 
+            await self._rate_limiter.acquire()
             df = await asyncio.to_thread(ak.stock_board_concept_name_em)
             return self._mapper.rows_to_concepts(df)
         except ExternalConceptServiceError:
@@ -29,6 +49,7 @@ class AkShareConceptGateway(ConceptGateway):
         try:
             import akshare as ak  # type: ignore[import-untyped]
 
+            await self._rate_limiter.acquire()
             df = await asyncio.to_thread(ak.stock_board_concept_cons_em, symbol=concept_name)
             return self._mapper.rows_to_stock_tuples(df)
         except ExternalConceptServiceError:
@@ -0,0 +1,38 @@
+"""TuShare trade_cal 原始行 → TradeCalendarDay 映射。"""
+
+from datetime import date
+from typing import Any
+
+from app.modules.data_engineering.domain.entities.trade_calendar_day import TradeCalendarDay
+from app.modules.data_engineering.domain.exceptions import ExternalStockServiceError
+
+
+def _parse_date(value: Any, field: str) -> date | None:
+    """YYYYMMDD → date；空值返回 None，格式错误抛 ExternalStockServiceError。"""
+    if value is None or (isinstance(value, float) and value != value):
+        return None
+    s = str(value).strip()
+    if not s:
+        return None
+    if len(s) != 8 or not s.isdigit():
+        raise ExternalStockServiceError(f"Invalid {field} format: {value!r}")
+    try:
+        return date(int(s[:4]), int(s[4:6]), int(s[6:8]))
+    except ValueError as e:
+        raise ExternalStockServiceError(f"Invalid {field}: {value!r}") from e
+
+
+class TuShareTradeCalendarMapper:
+    """TuShare trade_cal 单行 dict（exchange, cal_date, is_open, pretrade_date）→ TradeCalendarDay。"""
+
+    def row_to_day(self, row: dict[str, Any], exchange: str) -> TradeCalendarDay:
+        cal_date = _parse_date(row.get("cal_date"), "cal_date")
+        if cal_date is None:
+            raise ExternalStockServiceError("cal_date is required")
+        return TradeCalendarDay(
+            id=None,
+            exchange=str(row.get("exchange") or exchange).strip(),
+            cal_date=cal_date,
+            is_open=str(row.get("is_open")).strip() in ("1", "1.0", "True"),
+            pretrade_date=_parse_date(row.get("pretrade_date"), "pretrade_date"),
+        )
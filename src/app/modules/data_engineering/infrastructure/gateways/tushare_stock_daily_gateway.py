@@ -7,12 +7,16 @@ from typing import Any
 from app.modules.data_engineering.domain.entities.stock_daily import StockDaily
 from app.modules.data_engineering.domain.exceptions import ExternalStockServiceError
 from app.modules.data_engineering.domain.gateways.stock_daily_gateway import StockDailyGateway
+from app.modules.data_engineering.domain.services.trade_calendar import TradeCalendar
 from app.shared_kernel.infrastructure.logging import get_logger
 
 from .mappers.tushare_stock_daily_mapper import TuShareStockDailyMapper
 
 logger = get_logger(__name__)
 
+# 按交易日切分时每批的交易日数：单只股票每个交易日一行，低于 TuShare 单次 6000 条上限
+TRADING_DAYS_PER_BATCH = 5000
+
 
 class TokenBucket:
     """令牌桶限流器。"""
@@ -51,11 +55,20 @@ class TokenBucket:
 
 
 class TuShareStockDailyGateway(StockDailyGateway):
-    """调用 TuShare 接口，拉取数据后使用 Mapper 合并解析。"""
+    """调用 TuShare 接口，拉取数据后使用 Mapper 合并解析。
+
+    注入交易日历时按交易日数切分请求区间，并跳过不含交易日的区间与非交易日的全市场请求。
+    """
 
-    def __init__(self, token: str, mapper: TuShareStockDailyMapper | None = None) -> None:
+    def __init__(
+        self,
+        token: str,
+        mapper: TuShareStockDailyMapper | None = None,
+        calendar: TradeCalendar | None = None,
+    ) -> None:
         self._token = token
         self._mapper = mapper or TuShareStockDailyMapper()
+        self._calendar = calendar
         # 每分钟 200 次调用
         self._rate_limiter = TokenBucket(capacity=200, tokens_per_minute=200)
 
@@ -80,7 +93,12 @@ class TuShareStockDailyGateway(StockDailyGateway):
     def _split_date_ranges(
         self, start_date: date, end_date: date, days_per_batch: int = 5000
     ) -> list[tuple[date, date]]:
-        """将日期范围按 days_per_batch 分割为多个子区间，防止超过 TuShare 6000 条响应上限。"""
+        """将日期范围分割为多个子区间，防止超过 TuShare 6000 条响应上限。
+
+        有交易日历时每段至多 TRADING_DAYS_PER_BATCH 个交易日，否则每段 days_per_batch 个自然日。
+        """
+        if self._calendar is not None:
+            return self._calendar.split_by_trading_days(start_date, end_date, TRADING_DAYS_PER_BATCH)
         ranges: list[tuple[date, date]] = []
         current_start = start_date
         while current_start <= end_date:
@@ -139,6 +157,9 @@ class TuShareStockDailyGateway(StockDailyGateway):
 
     async def fetch_daily_all_by_date(self, trade_date: date) -> list[StockDaily]:
         date_str = trade_date.strftime("%Y%m%d")
+        if self._calendar is not None and not self._calendar.is_trading_day(trade_date):
+            logger.info("非交易日，跳过全市场拉取", trade_date=date_str)
+            return []
         logger.info("全市场按日拉取开始", trade_date=date_str)
 
         daily_data = await self._fetch_api("daily", trade_date=date_str)
@@ -0,0 +1,56 @@
+"""TuShare 交易日历网关：拉取 trade_cal 并委托 Mapper 解析。"""
+
+import asyncio
+from datetime import date
+from typing import Any
+
+from app.modules.data_engineering.domain.entities.trade_calendar_day import TradeCalendarDay
+from app.modules.data_engineering.domain.exceptions import ExternalStockServiceError
+from app.modules.data_engineering.domain.gateways.trade_calendar_gateway import TradeCalendarGateway
+from app.shared_kernel.infrastructure.logging import get_logger
+
+from .mappers.tushare_trade_calendar_mapper import TuShareTradeCalendarMapper
+
+logger = get_logger(__name__)
+
+
+class TuShareTradeCalendarGateway(TradeCalendarGateway):
+    """调用 TuShare trade_cal。单次返回上限足以覆盖全部历史，无需分页。"""
+
+    def __init__(self, token: str, mapper: TuShareTradeCalendarMapper | None = None) -> None:
+        self._token = token
+        self._mapper = mapper or TuShareTradeCalendarMapper()
+
+    async def _fetch_raw(self, exchange: str, start_date: date, end_date: date) -> list[dict[str, Any]]:
+        """拉取原始数据（list of dict）。可被单测 patch。"""
+        import tushare as ts  # type: ignore[import-untyped]
+
+        def _sync_fetch() -> list[dict[str, Any]]:
+            pro = ts.pro_api(self._token)
+            df = pro.trade_cal(
+                exchange=exchange,
+                start_date=start_date.strftime("%Y%m%d"),
+                end_date=end_date.strftime("%Y%m%d"),
+                fields="exchange,cal_date,is_open,pretrade_date",
+            )
+            if df is None or df.empty:
+                return []
+            return list(df.to_dict("records"))
+
+        try:
+            return await asyncio.to_thread(_sync_fetch)
+        except Exception as e:
+            raise ExternalStockServiceError(f"TuShare API trade_cal error: {e}") from e
+
+    async def fetch_trade_calendar(self, exchange: str, start_date: date, end_date: date) -> list[TradeCalendarDay]:
+        raw = await self._fetch_raw(exchange, start_date, end_date)
+        days = [self._mapper.row_to_day(row, exchange) for row in raw]
+        logger.info(
+            "交易日历拉取完成",
+            exchange=exchange,
+            start_date=str(start_date),
+            end_date=str(end_date),
+            day_count=len(days),
+            open_count=sum(1 for d in days if d.is_open),
+        )
+        return days
@@ -1,15 +1,24 @@
 from .concept_model import ConceptModel
+from .concept_shadow_model import ConceptShadowModel
 from .concept_stock_model import ConceptStockModel
-from .stock_financial_model import StockFinancialModel
+from .concept_stock_shadow_model import ConceptStockShadowModel
 from .stock_basic_model import StockBasicModel
 from .stock_daily_model import StockDailyModel
 from .stock_daily_sync_failure_model import StockDailySyncFailureModel
+from .stock_financial_model import StockFinancialModel
+from .sync_run_model import SyncRunItemModel, SyncRunModel
+from .trade_calendar_model import TradeCalendarModel
 
 __all__ = [
     "ConceptModel",
+    "ConceptShadowModel",
     "ConceptStockModel",
+    "ConceptStockShadowModel",
     "StockFinancialModel",
     "StockBasicModel",
     "StockDailyModel",
     "StockDailySyncFailureModel",
+    "SyncRunItemModel",
+    "SyncRunModel",
+    "TradeCalendarModel",
 ]
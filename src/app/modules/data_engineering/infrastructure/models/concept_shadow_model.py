@@ -0,0 +1,24 @@
+"""概念快照影子表 SQLAlchemy 模型。"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.shared_kernel.infrastructure.database import Base
+
+
+class ConceptShadowModel(Base):
+    """表 concept_shadow。UNIQUE(source, third_code)。仅在快照同步期间暂存远程概念。"""
+
+    __tablename__ = "concept_shadow"
+    __table_args__ = (UniqueConstraint("source", "third_code", name="uq_concept_shadow_source_third_code"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    source: Mapped[str] = mapped_column(String(32), nullable=False)
+    third_code: Mapped[str] = mapped_column(String(32), nullable=False)
+    name: Mapped[str] = mapped_column(String(100), nullable=False)
+    content_hash: Mapped[str] = mapped_column(String(16), nullable=False)
+    membership_hash: Mapped[str | None] = mapped_column(String(16), nullable=True)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
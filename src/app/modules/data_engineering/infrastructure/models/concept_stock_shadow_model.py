@@ -0,0 +1,29 @@
+"""概念成分股快照影子表 SQLAlchemy 模型。"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.shared_kernel.infrastructure.database import Base
+
+
+class ConceptStockShadowModel(Base):
+    """表 concept_stock_shadow。UNIQUE(source, concept_third_code, stock_third_code)。
+
+    概念此时可能尚未落库，因此以 concept_third_code 而非 concept_id 关联。
+    """
+
+    __tablename__ = "concept_stock_shadow"
+    __table_args__ = (
+        UniqueConstraint("source", "concept_third_code", "stock_third_code", name="uq_concept_stock_shadow_key"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    source: Mapped[str] = mapped_column(String(32), nullable=False)
+    concept_third_code: Mapped[str] = mapped_column(String(32), nullable=False)
+    stock_third_code: Mapped[str] = mapped_column(String(32), nullable=False)
+    stock_symbol: Mapped[str | None] = mapped_column(String(32), nullable=True)
+    content_hash: Mapped[str] = mapped_column(String(16), nullable=False)
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
@@ -0,0 +1,66 @@
+"""同步运行 SQLAlchemy 模型。"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.shared_kernel.infrastructure.database import Base
+
+
+class SyncRunModel(Base):
+    """表 sync_run：长耗时同步的运行记录。UNIQUE(kind, run_key)。
+
+    Attributes:
+        id: 主键，自增。
+        kind: 同步类型（如 'stock_daily_history'）。
+        run_key: 运行标识（如后台任务 ID）。
+        status: 运行状态，存枚举值。
+        total_items: 计划的工作条目总数。
+        started_at: 首次开始时间。
+        finished_at: 完成时间。
+        updated_at: 最后更新时间（UTC）。
+    """
+
+    __tablename__ = "sync_run"
+    __table_args__ = (UniqueConstraint("kind", "run_key", name="uq_sync_run_kind_run_key"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    kind: Mapped[str] = mapped_column(String(64), nullable=False)
+    run_key: Mapped[str] = mapped_column(String(64), nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False)
+    total_items: Mapped[int] = mapped_column(Integer, nullable=False)
+    started_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+
+
+class SyncRunItemModel(Base):
+    """表 sync_run_item：运行计划中的单个工作条目。UNIQUE(run_id, item_key)。
+
+    Attributes:
+        id: 主键，自增。
+        run_id: 所属运行。
+        position: 计划顺序，续跑时按此顺序取第一个未完成条目。
+        item_key: 条目标识（如股票 third_code）。
+        status: 条目状态，存枚举值。
+        error_message: 失败原因。
+        finished_at: 处理完成时间。
+    """
+
+    __tablename__ = "sync_run_item"
+    __table_args__ = (
+        UniqueConstraint("run_id", "item_key", name="uq_sync_run_item_run_id_item_key"),
+        Index("ix_sync_run_item_run_id_status_position", "run_id", "status", "position"),
+    )
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    run_id: Mapped[int] = mapped_column(Integer, nullable=False)
+    position: Mapped[int] = mapped_column(Integer, nullable=False)
+    item_key: Mapped[str] = mapped_column(String(32), nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False)
+    error_message: Mapped[str | None] = mapped_column(String, nullable=True)
+    finished_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
@@ -0,0 +1,39 @@
+"""交易日历 SQLAlchemy 模型。"""
+
+from datetime import date, datetime
+
+from sqlalchemy import Boolean, Date, DateTime, Integer, String, UniqueConstraint
+from sqlalchemy.orm import Mapped, mapped_column
+from sqlalchemy.sql import func
+
+from app.shared_kernel.infrastructure.database import Base
+
+
+class TradeCalendarModel(Base):
+    """表 trade_calendar：交易所交易日历，每个自然日一行。UNIQUE(exchange, cal_date)。
+
+    Attributes:
+        id: 主键，自增。
+        exchange: 交易所代码（如 SSE、SZSE）。
+        cal_date: 自然日。
+        is_open: 是否开市。
+        pretrade_date: 上一个交易日。
+        created_at: 创建时间（UTC）。
+        updated_at: 最后更新时间（UTC）。
+        version: 乐观锁版本号。
+    """
+
+    __tablename__ = "trade_calendar"
+    __table_args__ = (UniqueConstraint("exchange", "cal_date", name="uq_trade_calendar_exchange_cal_date"),)
+
+    id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
+    exchange: Mapped[str] = mapped_column(String(16), nullable=False)
+    cal_date: Mapped[date] = mapped_column(Date, nullable=False)
+    is_open: Mapped[bool] = mapped_column(Boolean, nullable=False)
+    pretrade_date: Mapped[date | None] = mapped_column(Date, nullable=True)
+
+    created_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), server_default=func.now(), nullable=False)
+    updated_at: Mapped[datetime] = mapped_column(
+        DateTime(timezone=True), server_default=func.now(), onupdate=func.now(), nullable=False
+    )
+    version: Mapped[int] = mapped_column(Integer, default=1, nullable=False)
@@ -1,5 +1,8 @@
 """Concept SQLAlchemy 仓储实现。"""
 
+from collections.abc import Sequence
+from typing import Any
+
 from sqlalchemy import delete, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
@@ -23,6 +26,7 @@ class SqlAlchemyConceptRepository(ConceptRepository):
             name=model.name,
             content_hash=model.content_hash,
             last_synced_at=model.last_synced_at,
+            membership_hash=model.membership_hash,
         )
 
     async def find_all(self, source: DataSource) -> list[Concept]:
@@ -30,6 +34,27 @@ class SqlAlchemyConceptRepository(ConceptRepository):
         result = await self._session.execute(stmt)
         return [self._to_entity(m) for m in result.scalars().all()]
 
+    async def find_page(
+        self,
+        source: DataSource,
+        fields: Sequence[str],
+        limit: int,
+        after_id: int | None = None,
+        name_prefix: str | None = None,
+    ) -> list[dict[str, Any]]:
+        stmt = (
+            select(*(getattr(ConceptModel, f) for f in fields))
+            .where(ConceptModel.source == source.value)
+            .order_by(ConceptModel.id.asc())
+            .limit(limit)
+        )
+        if after_id is not None:
+            stmt = stmt.where(ConceptModel.id > after_id)
+        if name_prefix:
+            stmt = stmt.where(ConceptModel.name.startswith(name_prefix, autoescape=True))
+        result = await self._session.execute(stmt)
+        return [dict(row) for row in result.mappings()]
+
     async def find_by_id(self, concept_id: int) -> Concept | None:
         model = await self._session.get(ConceptModel, concept_id)
         if model is None:
@@ -65,6 +90,7 @@ class SqlAlchemyConceptRepository(ConceptRepository):
                 third_code=concept.third_code,
                 name=concept.name,
                 content_hash=concept.content_hash,
+                membership_hash=concept.membership_hash,
                 last_synced_at=concept.last_synced_at,
             )
             self._session.add(model)
@@ -73,6 +99,7 @@ class SqlAlchemyConceptRepository(ConceptRepository):
 
         existing.name = concept.name
         existing.content_hash = concept.content_hash
+        existing.membership_hash = concept.membership_hash
         existing.last_synced_at = concept.last_synced_at
         existing.version = existing.version + 1
         await self._session.flush()
@@ -103,6 +130,7 @@ class SqlAlchemyConceptRepository(ConceptRepository):
                     third_code=concept.third_code,
                     name=concept.name,
                     content_hash=concept.content_hash,
+                    membership_hash=concept.membership_hash,
                     last_synced_at=concept.last_synced_at,
                 )
                 self._session.add(model)
@@ -110,6 +138,7 @@ class SqlAlchemyConceptRepository(ConceptRepository):
             else:
                 existing.name = concept.name
                 existing.content_hash = concept.content_hash
+                existing.membership_hash = concept.membership_hash
                 existing.last_synced_at = concept.last_synced_at
                 existing.version = existing.version + 1
                 saved_entities.append(existing)
@@ -0,0 +1,194 @@
+"""概念全量快照 SQLAlchemy 仓储实现。"""
+
+from datetime import datetime
+from typing import Any, cast
+
+from sqlalchemy import Table, and_, delete, exists, insert, literal, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.data_engineering.domain.entities.concept import Concept
+from app.modules.data_engineering.domain.repositories.concept_snapshot_repository import (
+    ConceptSnapshotRepository,
+)
+from app.modules.data_engineering.domain.value_objects.concept_snapshot import (
+    ConceptSnapshotDiff,
+    ConceptSnapshotMember,
+)
+from app.modules.data_engineering.domain.value_objects.data_source import DataSource
+
+from ..models.concept_model import ConceptModel
+from ..models.concept_shadow_model import ConceptShadowModel
+from ..models.concept_stock_model import ConceptStockModel
+from ..models.concept_stock_shadow_model import ConceptStockShadowModel
+
+
+class SqlAlchemyConceptSnapshotRepository(ConceptSnapshotRepository):
+    """影子表 + 集合运算合并。
+
+    stage 以 executemany 批量写入影子表；apply 只执行固定数量的 INSERT ... SELECT / UPDATE / DELETE，
+    语句数与概念数量无关，且均为 PostgreSQL 与 SQLite 通用语法。
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def stage(
+        self,
+        source: DataSource,
+        concepts: list[Concept],
+        members: list[ConceptSnapshotMember],
+    ) -> None:
+        await self._clear_shadow(source)
+        if concepts:
+            await self._session.execute(
+                insert(ConceptShadowModel),
+                [
+                    {
+                        "source": source.value,
+                        "third_code": c.third_code,
+                        "name": c.name,
+                        "content_hash": c.content_hash,
+                        "membership_hash": c.membership_hash,
+                    }
+                    for c in concepts
+                ],
+            )
+        if members:
+            await self._session.execute(
+                insert(ConceptStockShadowModel),
+                [
+                    {
+                        "source": source.value,
+                        "concept_third_code": m.concept_third_code,
+                        "stock_third_code": m.stock_third_code,
+                        "stock_symbol": m.stock_symbol,
+                        "content_hash": m.content_hash,
+                    }
+                    for m in members
+                ],
+            )
+
+    async def apply(self, source: DataSource, synced_at: datetime) -> ConceptSnapshotDiff:
+        src = source.value
+        # __table__ 声明为 FromClause，集合运算需要 Table 的 insert / update / delete
+        c = cast(Table, ConceptModel.__table__)
+        sc = cast(Table, ConceptShadowModel.__table__)
+        cs = cast(Table, ConceptStockModel.__table__)
+        ss = cast(Table, ConceptStockShadowModel.__table__)
+
+        shadow_concept = and_(sc.c.source == c.c.source, sc.c.third_code == c.c.third_code)
+
+        # 1. 内容或成分股聚合哈希变化的概念：就地更新
+        modified_concepts = await self._rowcount(
+            update(c)
+            .where(
+                c.c.source == src,
+                exists().where(
+                    shadow_concept,
+                    or_(
+                        sc.c.content_hash != c.c.content_hash,
+                        sc.c.membership_hash.is_distinct_from(c.c.membership_hash),
+                    ),
+                ),
+            )
+            .values(
+                name=select(sc.c.name).where(shadow_concept).scalar_subquery(),
+                content_hash=select(sc.c.content_hash).where(shadow_concept).scalar_subquery(),
+                membership_hash=select(sc.c.membership_hash).where(shadow_concept).scalar_subquery(),
+                last_synced_at=synced_at,
+                version=c.c.version + 1,
+            )
+        )
+
+        # 2. 新概念：INSERT ... SELECT
+        new_concepts = await self._rowcount(
+            insert(c).from_select(
+                ["source", "third_code", "name", "content_hash", "membership_hash", "last_synced_at", "version"],
+                select(
+                    sc.c.source,
+                    sc.c.third_code,
+                    sc.c.name,
+                    sc.c.content_hash,
+                    sc.c.membership_hash,
+                    literal(synced_at, c.c.last_synced_at.type),
+                    literal(1),
+                ).where(
+                    sc.c.source == src,
+                    ~exists().where(c.c.source == sc.c.source, c.c.third_code == sc.c.third_code),
+                ),
+            )
+        )
+
+        # 快照中的目标成分股关系：影子成分股 JOIN 正式概念（此时新概念均已有 id）
+        target = (
+            select(c.c.id.label("concept_id"), ss.c.stock_third_code, ss.c.stock_symbol, ss.c.content_hash)
+            .select_from(ss.join(c, and_(c.c.source == ss.c.source, c.c.third_code == ss.c.concept_third_code)))
+            .where(ss.c.source == src)
+            .subquery()
+        )
+        same_member = and_(
+            target.c.concept_id == cs.c.concept_id,
+            target.c.stock_third_code == cs.c.stock_third_code,
+        )
+
+        # 3. 快照中已不存在的关系（含过时概念下的全部关系）
+        deleted_stocks = await self._rowcount(delete(cs).where(cs.c.source == src, ~exists().where(same_member)))
+
+        # 4. 内容变化的关系
+        modified_stocks = await self._rowcount(
+            update(cs)
+            .where(
+                cs.c.source == src,
+                exists().where(same_member, target.c.content_hash != cs.c.content_hash),
+            )
+            .values(
+                stock_symbol=select(target.c.stock_symbol).where(same_member).scalar_subquery(),
+                content_hash=select(target.c.content_hash).where(same_member).scalar_subquery(),
+                version=cs.c.version + 1,
+            )
+        )
+
+        # 5. 新增关系
+        new_stocks = await self._rowcount(
+            insert(cs).from_select(
+                ["concept_id", "source", "stock_third_code", "stock_symbol", "content_hash", "added_at", "version"],
+                select(
+                    target.c.concept_id,
+                    literal(src),
+                    target.c.stock_third_code,
+                    target.c.stock_symbol,
+                    target.c.content_hash,
+                    literal(synced_at, cs.c.added_at.type),
+                    literal(1),
+                ).where(
+                    ~exists().where(
+                        cs.c.source == src,
+                        cs.c.concept_id == target.c.concept_id,
+                        cs.c.stock_third_code == target.c.stock_third_code,
+                    )
+                ),
+            )
+        )
+
+        # 6. 过时概念
+        deleted_concepts = await self._rowcount(delete(c).where(c.c.source == src, ~exists().where(shadow_concept)))
+
+        await self._clear_shadow(source)
+        return ConceptSnapshotDiff(
+            new_concepts=new_concepts,
+            modified_concepts=modified_concepts,
+            deleted_concepts=deleted_concepts,
+            new_stocks=new_stocks,
+            modified_stocks=modified_stocks,
+            deleted_stocks=deleted_stocks,
+        )
+
+    async def _clear_shadow(self, source: DataSource) -> None:
+        await self._session.execute(
+            delete(ConceptStockShadowModel).where(ConceptStockShadowModel.source == source.value)
+        )
+        await self._session.execute(delete(ConceptShadowModel).where(ConceptShadowModel.source == source.value))
+
+    async def _rowcount(self, stmt: Any) -> int:
+        result: Any = await self._session.execute(stmt)
+        return int(result.rowcount or 0)
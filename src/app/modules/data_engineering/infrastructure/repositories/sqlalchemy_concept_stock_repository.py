@@ -1,5 +1,7 @@
 """ConceptStock SQLAlchemy 仓储实现。"""
 
+from collections import defaultdict
+from collections.abc import Sequence
 from datetime import UTC, datetime
 from typing import Any
 
@@ -38,6 +40,39 @@ class SqlAlchemyConceptStockRepository(ConceptStockRepository):
         result = await self._session.execute(stmt)
         return [self._to_entity(m) for m in result.scalars().all()]
 
+    async def find_page_by_concept_id(
+        self,
+        concept_id: int,
+        fields: Sequence[str],
+        limit: int,
+        after_id: int | None = None,
+    ) -> list[dict[str, Any]]:
+        stmt = (
+            select(*(getattr(ConceptStockModel, f) for f in fields))
+            .where(ConceptStockModel.concept_id == concept_id)
+            .order_by(ConceptStockModel.id.asc())
+            .limit(limit)
+        )
+        if after_id is not None:
+            stmt = stmt.where(ConceptStockModel.id > after_id)
+        result = await self._session.execute(stmt)
+        return [dict(row) for row in result.mappings()]
+
+    async def find_memberships(self, source: DataSource) -> list[tuple[str, int]]:
+        stmt = select(ConceptStockModel.stock_third_code, ConceptStockModel.concept_id).where(
+            ConceptStockModel.source == source.value
+        )
+        result = await self._session.execute(stmt)
+        return [(code, concept_id) for code, concept_id in result.all()]
+
+    async def find_all_grouped_by_concept(self, source: DataSource) -> dict[int, list[ConceptStock]]:
+        stmt = select(ConceptStockModel).where(ConceptStockModel.source == source.value)
+        result = await self._session.execute(stmt)
+        grouped: dict[int, list[ConceptStock]] = defaultdict(list)
+        for model in result.scalars().all():
+            grouped[model.concept_id].append(self._to_entity(model))
+        return dict(grouped)
+
     async def save_many(self, concept_stocks: list[ConceptStock]) -> None:
         if not concept_stocks:
             return
@@ -85,3 +120,9 @@ class SqlAlchemyConceptStockRepository(ConceptStockRepository):
     async def delete_by_concept_id(self, concept_id: int) -> None:
         stmt = delete(ConceptStockModel).where(ConceptStockModel.concept_id == concept_id)
         await self._session.execute(stmt)
+
+    async def delete_by_concept_ids(self, concept_ids: list[int]) -> None:
+        if not concept_ids:
+            return
+        stmt = delete(ConceptStockModel).where(ConceptStockModel.concept_id.in_(concept_ids))
+        await self._session.execute(stmt)
@@ -3,7 +3,7 @@
 from datetime import UTC, date, datetime
 from typing import Any
 
-from sqlalchemy import select
+from sqlalchemy import func, select
 from sqlalchemy.dialects.postgresql import insert as pg_insert
 from sqlalchemy.dialects.sqlite import insert as sqlite_insert
 from sqlalchemy.ext.asyncio import AsyncSession
@@ -81,3 +81,9 @@ class SqlAlchemyStockDailyRepository(SqlAlchemyEntityRepository[StockDaily, int
         )
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
+
+    async def get_global_latest_trade_date(self, source: DataSource) -> date | None:
+        # trade_date 上有单列索引，MAX 可直接走索引
+        stmt = select(func.max(StockDailyModel.trade_date)).where(StockDailyModel.source == source.value)
+        result = await self._session.execute(stmt)
+        return result.scalar_one_or_none()
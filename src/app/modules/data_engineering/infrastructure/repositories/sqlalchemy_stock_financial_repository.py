@@ -13,6 +13,9 @@ from app.modules.data_engineering.domain.repositories.stock_financial_repository
     StockFinancialRepository,
 )
 from app.modules.data_engineering.domain.value_objects.data_source import DataSource
+from app.modules.data_engineering.domain.value_objects.financial_report_fingerprint import (
+    FinancialReportFingerprint,
+)
 from app.modules.data_engineering.infrastructure.models.stock_financial_model import (
     StockFinancialModel,
 )
@@ -72,3 +75,23 @@ class SqlAlchemyStockFinancialRepository(StockFinancialRepository):
         )
         result = await self._session.execute(stmt)
         return result.scalar_one_or_none()
+
+    async def find_fingerprints(self, source: DataSource, third_code: str) -> dict[date, FinancialReportFingerprint]:
+        # 仅投影指纹三列，避免为比对加载 ~100 列的完整行
+        stmt = select(
+            StockFinancialModel.end_date,
+            StockFinancialModel.ann_date,
+            StockFinancialModel.update_flag,
+        ).where(
+            StockFinancialModel.source == source.value,
+            StockFinancialModel.third_code == third_code,
+        )
+        result = await self._session.execute(stmt)
+        return {
+            row.end_date: FinancialReportFingerprint(
+                end_date=row.end_date,
+                ann_date=row.ann_date,
+                update_flag=row.update_flag,
+            )
+            for row in result
+        }
@@ -0,0 +1,101 @@
+"""SyncRun SQLAlchemy 仓储实现。"""
+
+from datetime import UTC, datetime
+
+from sqlalchemy import insert, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.data_engineering.domain.entities.sync_run import SyncRun
+from app.modules.data_engineering.domain.repositories.sync_run_repository import SyncRunRepository
+from app.modules.data_engineering.domain.value_objects.sync_run_status import SyncRunItemStatus, SyncRunStatus
+
+from ..models.sync_run_model import SyncRunItemModel, SyncRunModel
+
+
+class SqlAlchemySyncRunRepository(SyncRunRepository):
+    """同步运行仓储实现。工作条目以 executemany 批量写入。"""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def create(self, run: SyncRun, item_keys: list[str]) -> SyncRun:
+        model = SyncRunModel(
+            kind=run.kind,
+            run_key=run.run_key,
+            status=run.status.value,
+            total_items=run.total_items,
+            started_at=run.started_at,
+            finished_at=run.finished_at,
+        )
+        self._session.add(model)
+        await self._session.flush()
+        if item_keys:
+            await self._session.execute(
+                insert(SyncRunItemModel),
+                [
+                    {
+                        "run_id": model.id,
+                        "position": position,
+                        "item_key": key,
+                        "status": SyncRunItemStatus.PENDING.value,
+                    }
+                    for position, key in enumerate(item_keys)
+                ],
+            )
+        return self._to_entity(model)
+
+    async def save(self, run: SyncRun) -> None:
+        await self._session.execute(
+            update(SyncRunModel)
+            .where(SyncRunModel.id == run.id)
+            .values(status=run.status.value, total_items=run.total_items, finished_at=run.finished_at)
+        )
+
+    async def find_unfinished(self, kind: str, run_key: str) -> SyncRun | None:
+        stmt = select(SyncRunModel).where(
+            SyncRunModel.kind == kind,
+            SyncRunModel.run_key == run_key,
+            SyncRunModel.status != SyncRunStatus.COMPLETED.value,
+        )
+        model = (await self._session.execute(stmt)).scalar_one_or_none()
+        return self._to_entity(model) if model is not None else None
+
+    async def find_pending_item_keys(self, run_id: int) -> list[str]:
+        stmt = (
+            select(SyncRunItemModel.item_key)
+            .where(
+                SyncRunItemModel.run_id == run_id,
+                SyncRunItemModel.status == SyncRunItemStatus.PENDING.value,
+            )
+            .order_by(SyncRunItemModel.position)
+        )
+        return list((await self._session.execute(stmt)).scalars().all())
+
+    async def mark_item(
+        self,
+        run_id: int,
+        item_key: str,
+        status: SyncRunItemStatus,
+        error_message: str | None = None,
+    ) -> None:
+        await self._session.execute(
+            update(SyncRunItemModel)
+            .where(SyncRunItemModel.run_id == run_id, SyncRunItemModel.item_key == item_key)
+            .values(
+                status=status.value,
+                error_message=error_message,
+                finished_at=datetime.now(UTC) if status is not SyncRunItemStatus.PENDING else None,
+            )
+        )
+
+    @staticmethod
+    def _to_entity(model: SyncRunModel) -> SyncRun:
+        return SyncRun(
+            id=model.id,
+            kind=model.kind,
+            run_key=model.run_key,
+            status=SyncRunStatus(model.status),
+            total_items=model.total_items,
+            started_at=model.started_at,
+            finished_at=model.finished_at,
+        )
@@ -0,0 +1,75 @@
+"""交易日历 SQLAlchemy 仓储实现。"""
+
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from app.modules.data_engineering.domain.entities.trade_calendar_day import TradeCalendarDay
+from app.modules.data_engineering.domain.repositories.trade_calendar_repository import (
+    TradeCalendarRepository,
+)
+
+from ..models.trade_calendar_model import TradeCalendarModel
+
+UPSERT_BATCH_SIZE = 1000
+
+
+class SqlAlchemyTradeCalendarRepository(TradeCalendarRepository):
+    """使用 ON CONFLICT (exchange, cal_date) DO UPDATE 的批量 upsert。"""
+
+    def __init__(self, session: AsyncSession) -> None:
+        self._session = session
+
+    async def upsert_many(self, days: list[TradeCalendarDay]) -> int:
+        if not days:
+            return 0
+        now = datetime.now(UTC)
+        dialect_name = self._session.get_bind().dialect.name
+
+        for i in range(0, len(days), UPSERT_BATCH_SIZE):
+            values = [
+                {
+                    "exchange": d.exchange,
+                    "cal_date": d.cal_date,
+                    "is_open": d.is_open,
+                    "pretrade_date": d.pretrade_date,
+                }
+                for d in days[i : i + UPSERT_BATCH_SIZE]
+            ]
+            if dialect_name == "postgresql":
+                insert_stmt: Any = pg_insert(TradeCalendarModel).values(values)
+            else:
+                insert_stmt = sqlite_insert(TradeCalendarModel).values(values)
+            stmt = insert_stmt.on_conflict_do_update(
+                index_elements=["exchange", "cal_date"],
+                set_={
+                    "is_open": insert_stmt.excluded.is_open,
+                    "pretrade_date": insert_stmt.excluded.pretrade_date,
+                    "updated_at": now,
+                    "version": TradeCalendarModel.version + 1,
+                },
+            )
+            await self._session.execute(stmt)
+        return len(days)
+
+    async def find_all(self, exchange: str) -> list[TradeCalendarDay]:
+        stmt = (
+            select(TradeCalendarModel)
+            .where(TradeCalendarModel.exchange == exchange)
+            .order_by(TradeCalendarModel.cal_date.asc())
+        )
+        result = await self._session.execute(stmt)
+        return [
+            TradeCalendarDay(
+                id=m.id,
+                exchange=m.exchange,
+                cal_date=m.cal_date,
+                is_open=m.is_open,
+                pretrade_date=m.pretrade_date,
+            )
+            for m in result.scalars().all()
+        ]
@@ -1,122 +1,234 @@
 """概念板块相关 API。"""
 
 from datetime import datetime
+from typing import Any
 
-from fastapi import APIRouter, Depends, Query
-from pydantic import BaseModel
+from fastapi import APIRouter, Depends, Query, Request, Response, status
+from pydantic import BaseModel, Field
 
+from app.config import settings
+from app.interfaces.conditional import ConditionalGet
+from app.interfaces.dependencies import get_resource_versions
+from app.interfaces.pagination import parse_fields, set_next_link
 from app.interfaces.response import ApiResponse
-from app.modules.data_engineering.application.commands.sync_concepts import SyncConcepts
-from app.modules.data_engineering.application.commands.sync_concepts_handler import (
-    SyncConceptsHandler,
+from app.modules.data_engineering.application.commands.sync_concepts import ConceptSyncStrategy
+from app.modules.data_engineering.application.queries import (
+    CONCEPTS_RESOURCE,
+    ConceptMemberships,
+    ConceptOverlap,
+    ConceptStockScreen,
+    GetConceptMemberships,
+    GetConceptOverlap,
+    ScreenConceptStocks,
+    concept_stocks_resource,
 )
 from app.modules.data_engineering.application.queries.get_concept_stocks import (
     GetConceptStocks,
 )
-from app.modules.data_engineering.application.queries.get_concept_stocks_handler import (
-    GetConceptStocksHandler,
-)
 from app.modules.data_engineering.application.queries.get_concepts import GetConcepts
-from app.modules.data_engineering.application.queries.get_concepts_handler import (
-    GetConceptsHandler,
-)
 from app.modules.data_engineering.domain.value_objects.data_source import DataSource
 from app.modules.data_engineering.interfaces.dependencies import (
+    get_get_concept_memberships_handler,
+    get_get_concept_overlap_handler,
     get_get_concept_stocks_handler,
     get_get_concepts_handler,
-    get_sync_concepts_handler,
+    get_screen_concept_stocks_handler,
 )
+from app.modules.data_engineering.interfaces.jobs import SYNC_CONCEPTS_JOB
+from app.modules.foundation.application.job_runner import JobRunner
+from app.modules.foundation.interfaces.api.job_router import JobResponse
+from app.modules.foundation.interfaces.jobs import get_job_runner
+from app.shared_kernel.application.pagination import Page
+from app.shared_kernel.application.query_handler import QueryHandler
+from app.shared_kernel.infrastructure.resource_version import ResourceVersions
 
 router = APIRouter(prefix="/data-engineering/concepts", tags=["data_engineering"])
 
-
-class SyncConceptsResponse(BaseModel):
-    total_concepts: int
-    new_concepts: int
-    modified_concepts: int
-    deleted_concepts: int
-    total_stocks: int
-    new_stocks: int
-    modified_stocks: int
-    deleted_stocks: int
-    duration_ms: int
-    failed_concepts: int = 0
+_FIELDS_DESCRIPTION = "逗号分隔的字段投影，如 third_code,name；缺省返回全部字段，id 始终返回"
 
 
+# 字段均可被 fields 投影省略，未查询的字段不出现在响应中（response_model_exclude_unset）
 class ConceptResponse(BaseModel):
     id: int
-    source: str
-    third_code: str
-    name: str
-    last_synced_at: datetime
+    source: str | None = None
+    third_code: str | None = None
+    name: str | None = None
+    last_synced_at: datetime | None = None
 
 
 class ConceptStockResponse(BaseModel):
     id: int
-    concept_id: int
-    source: str
-    stock_third_code: str
-    stock_symbol: str | None
-    added_at: datetime
+    concept_id: int | None = None
+    source: str | None = None
+    stock_third_code: str | None = None
+    stock_symbol: str | None = None
+    added_at: datetime | None = None
 
 
-@router.post("/sync", response_model=ApiResponse[SyncConceptsResponse])
-async def sync_concepts(
-    handler: SyncConceptsHandler = Depends(get_sync_concepts_handler),
-) -> ApiResponse[SyncConceptsResponse]:
-    result = await handler.handle(SyncConcepts())
-    return ApiResponse.success(
-        data=SyncConceptsResponse(
-            total_concepts=result.total_concepts,
-            new_concepts=result.new_concepts,
-            modified_concepts=result.modified_concepts,
-            deleted_concepts=result.deleted_concepts,
-            total_stocks=result.total_stocks,
-            new_stocks=result.new_stocks,
-            modified_stocks=result.modified_stocks,
-            deleted_stocks=result.deleted_stocks,
-            duration_ms=result.duration_ms,
-            failed_concepts=result.failed_concepts,
-        )
+class ConceptSummaryResponse(BaseModel):
+    id: int
+    third_code: str
+    name: str
+
+
+class ConceptMembershipsRequest(BaseModel):
+    stock_third_codes: list[str] = Field(min_length=1, max_length=5000, description="股票代码，如 600519.SH")
+    source: DataSource | None = None
+
+
+class ConceptMembershipsResponse(BaseModel):
+    """concepts 中每个概念只出现一次，memberships 以概念 id 引用。"""
+
+    concepts: list[ConceptSummaryResponse]
+    memberships: dict[str, list[int]]
+
+
+class ConceptScreenRequest(BaseModel):
+    expression: str = Field(
+        min_length=1, max_length=2000, description="概念代码的 AND / OR / NOT 表达式，如 BK0818 AND NOT BK0001"
     )
+    source: DataSource | None = None
+    limit: int = Field(default=1000, ge=1, le=10000)
+
 
+class ConceptScreenResponse(BaseModel):
+    count: int
+    stock_third_codes: list[str]
 
-@router.get("", response_model=ApiResponse[list[ConceptResponse]])
+
+class ConceptOverlapRequest(BaseModel):
+    concept_codes: list[str] = Field(default_factory=list, max_length=200, description="为空时取成分股最多的 top 个")
+    top: int = Field(default=50, ge=1, le=200)
+    source: DataSource | None = None
+
+
+class ConceptOverlapResponse(BaseModel):
+    concepts: list[ConceptSummaryResponse]
+    sizes: list[int]
+    jaccard: list[list[float]]
+
+
+@router.post("/sync", response_model=ApiResponse[JobResponse], status_code=status.HTTP_202_ACCEPTED)
+async def sync_concepts(
+    strategy: ConceptSyncStrategy = Query(default=ConceptSyncStrategy.INCREMENTAL),
+    runner: JobRunner = Depends(get_job_runner),
+) -> ApiResponse[JobResponse]:
+    """提交概念同步后台任务，进度通过 /jobs/{job_id} 查询，结果摘要见任务 result。"""
+    job = await runner.submit(SYNC_CONCEPTS_JOB, {"strategy": strategy.value})
+    return ApiResponse.success(data=JobResponse.from_job(job), message="Concept sync accepted")
+
+
+@router.get("", response_model=ApiResponse[list[ConceptResponse]], response_model_exclude_unset=True)
 async def get_concepts(
+    request: Request,
+    response: Response,
     source: DataSource | None = Query(default=None),
-    handler: GetConceptsHandler = Depends(get_get_concepts_handler),
-) -> ApiResponse[list[ConceptResponse]]:
-    concepts = await handler.handle(GetConcepts(source=source))
-    return ApiResponse.success(
-        data=[
-            ConceptResponse(
-                id=concept.id or 0,
-                source=concept.source.value,
-                third_code=concept.third_code,
-                name=concept.name,
-                last_synced_at=concept.last_synced_at,
-            )
-            for concept in concepts
-        ]
+    name_prefix: str | None = Query(default=None, min_length=1, max_length=100),
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=500, ge=1, le=5000),
+    fields: str | None = Query(default=None, description=_FIELDS_DESCRIPTION),
+    handler: QueryHandler[GetConcepts, Page[dict[str, Any]]] = Depends(get_get_concepts_handler),
+    versions: ResourceVersions = Depends(get_resource_versions),
+    conditional: ConditionalGet = Depends(),
+) -> ApiResponse[list[ConceptResponse]] | Response:
+    """概念列表，按 id 升序游标分页，下一页地址见 Link 头。支持 If-None-Match，概念未变化时返回 304。"""
+    version = await versions.current(CONCEPTS_RESOURCE, settings.CONCEPT_QUERY_CACHE_TTL_SECONDS)
+    if (not_modified := conditional.evaluate(version, settings.HTTP_CACHE_MAX_AGE_SECONDS)) is not None:
+        return not_modified
+    page = await handler.handle(
+        GetConcepts(source=source, name_prefix=name_prefix, cursor=cursor, limit=limit, fields=parse_fields(fields))
     )
+    set_next_link(request, response, page.next_cursor)
+    return ApiResponse.success(data=[ConceptResponse.model_validate(row) for row in page.items])
 
 
-@router.get("/{concept_id}/stocks", response_model=ApiResponse[list[ConceptStockResponse]])
+@router.get(
+    "/{concept_id}/stocks",
+    response_model=ApiResponse[list[ConceptStockResponse]],
+    response_model_exclude_unset=True,
+)
 async def get_concept_stocks(
+    request: Request,
+    response: Response,
     concept_id: int,
-    handler: GetConceptStocksHandler = Depends(get_get_concept_stocks_handler),
-) -> ApiResponse[list[ConceptStockResponse]]:
-    rows = await handler.handle(GetConceptStocks(concept_id=concept_id))
+    cursor: str | None = Query(default=None),
+    limit: int = Query(default=500, ge=1, le=5000),
+    fields: str | None = Query(default=None, description=_FIELDS_DESCRIPTION),
+    handler: QueryHandler[GetConceptStocks, Page[dict[str, Any]]] = Depends(get_get_concept_stocks_handler),
+    versions: ResourceVersions = Depends(get_resource_versions),
+    conditional: ConditionalGet = Depends(),
+) -> ApiResponse[list[ConceptStockResponse]] | Response:
+    """概念成分股，分页方式同概念列表。支持 If-None-Match，成分股未变化时返回 304。"""
+    version = await versions.current(concept_stocks_resource(concept_id), settings.CONCEPT_QUERY_CACHE_TTL_SECONDS)
+    if (not_modified := conditional.evaluate(version, settings.HTTP_CACHE_MAX_AGE_SECONDS)) is not None:
+        return not_modified
+    page = await handler.handle(
+        GetConceptStocks(concept_id=concept_id, cursor=cursor, limit=limit, fields=parse_fields(fields))
+    )
+    set_next_link(request, response, page.next_cursor)
+    return ApiResponse.success(data=[ConceptStockResponse.model_validate(row) for row in page.items])
+
+
+@router.get("/by-stock/{stock_third_code}", response_model=ApiResponse[list[ConceptSummaryResponse]])
+async def get_concepts_by_stock(
+    stock_third_code: str,
+    source: DataSource | None = Query(default=None),
+    handler: QueryHandler[GetConceptMemberships, ConceptMemberships] = Depends(get_get_concept_memberships_handler),
+    versions: ResourceVersions = Depends(get_resource_versions),
+    conditional: ConditionalGet = Depends(),
+) -> ApiResponse[list[ConceptSummaryResponse]] | Response:
+    """股票所属概念（倒排索引查找）。支持 If-None-Match，概念未变化时返回 304。"""
+    version = await versions.current(CONCEPTS_RESOURCE, settings.CONCEPT_QUERY_CACHE_TTL_SECONDS)
+    if (not_modified := conditional.evaluate(version, settings.HTTP_CACHE_MAX_AGE_SECONDS)) is not None:
+        return not_modified
+    result = await handler.handle(GetConceptMemberships(stock_third_codes=(stock_third_code,), source=source))
+    return ApiResponse.success(
+        data=[ConceptSummaryResponse(id=c.id, third_code=c.third_code, name=c.name) for c in result.concepts]
+    )
+
+
+@router.post("/memberships", response_model=ApiResponse[ConceptMembershipsResponse])
+async def get_concept_memberships(
+    body: ConceptMembershipsRequest,
+    handler: QueryHandler[GetConceptMemberships, ConceptMemberships] = Depends(get_get_concept_memberships_handler),
+) -> ApiResponse[ConceptMembershipsResponse]:
+    """批量查询股票所属概念，单次最多 5000 个代码。代码统一为大写后作为 memberships 的键。"""
+    result = await handler.handle(
+        GetConceptMemberships(stock_third_codes=tuple(body.stock_third_codes), source=body.source)
+    )
+    return ApiResponse.success(
+        data=ConceptMembershipsResponse(
+            concepts=[ConceptSummaryResponse(id=c.id, third_code=c.third_code, name=c.name) for c in result.concepts],
+            memberships=result.memberships,
+        )
+    )
+
+
+@router.post("/screen", response_model=ApiResponse[ConceptScreenResponse])
+async def screen_concept_stocks(
+    body: ConceptScreenRequest,
+    handler: QueryHandler[ScreenConceptStocks, ConceptStockScreen] = Depends(get_screen_concept_stocks_handler),
+) -> ApiResponse[ConceptScreenResponse]:
+    """按概念集合表达式筛选上市股票（位图运算）。count 为命中总数，列表至多 limit 个。"""
+    result = await handler.handle(ScreenConceptStocks(expression=body.expression, source=body.source, limit=body.limit))
     return ApiResponse.success(
-        data=[
-            ConceptStockResponse(
-                id=row.id or 0,
-                concept_id=row.concept_id,
-                source=row.source.value,
-                stock_third_code=row.stock_third_code,
-                stock_symbol=row.stock_symbol,
-                added_at=row.added_at,
-            )
-            for row in rows
-        ]
+        data=ConceptScreenResponse(count=result.count, stock_third_codes=result.stock_third_codes)
+    )
+
+
+@router.post("/overlap", response_model=ApiResponse[ConceptOverlapResponse])
+async def get_concept_overlap(
+    body: ConceptOverlapRequest,
+    handler: QueryHandler[GetConceptOverlap, ConceptOverlap] = Depends(get_get_concept_overlap_handler),
+) -> ApiResponse[ConceptOverlapResponse]:
+    """概念两两 Jaccard 重叠度矩阵。"""
+    result = await handler.handle(
+        GetConceptOverlap(concept_codes=tuple(body.concept_codes), top=body.top, source=body.source)
+    )
+    return ApiResponse.success(
+        data=ConceptOverlapResponse(
+            concepts=[ConceptSummaryResponse(id=c.id, third_code=c.third_code, name=c.name) for c in result.concepts],
+            sizes=result.sizes,
+            jaccard=result.jaccard,
+        )
     )
@@ -2,28 +2,33 @@
 
 from typing import Any
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, status
 
+from app.interfaces.response import ApiResponse
 from app.modules.data_engineering.application.commands.sync_finance_indicator_commands import (
     SyncFinanceIndicatorByStock,
-    SyncFinanceIndicatorFull,
     SyncFinanceIndicatorIncrement,
 )
 from app.modules.data_engineering.interfaces.dependencies import (
     get_sync_finance_indicator_by_stock_handler,
-    get_sync_finance_indicator_full_handler,
     get_sync_finance_indicator_increment_handler,
 )
+from app.modules.data_engineering.interfaces.jobs import SYNC_FINANCE_INDICATOR_FULL_JOB
+from app.modules.foundation.application.job_runner import JobRunner
+from app.modules.foundation.interfaces.api.job_router import JobResponse
+from app.modules.foundation.interfaces.jobs import get_job_runner
 
 router = APIRouter(prefix="/data-engineering/finance-indicator", tags=["finance-indicator"])
 
 
-@router.post("/sync/full")
+@router.post("/sync/full", response_model=ApiResponse[JobResponse], status_code=status.HTTP_202_ACCEPTED)
 async def sync_full(
-    handler: Any = Depends(get_sync_finance_indicator_full_handler),
-) -> dict[str, Any]:
-    r = await handler.handle(SyncFinanceIndicatorFull())
-    return dict(r.__dict__)
+    revision_aware: bool = False,
+    runner: JobRunner = Depends(get_job_runner),
+) -> ApiResponse[JobResponse]:
+    """提交全量同步后台任务，进度通过 /jobs/{job_id} 查询。"""
+    job = await runner.submit(SYNC_FINANCE_INDICATOR_FULL_JOB, {"revision_aware": revision_aware})
+    return ApiResponse.success(data=JobResponse.from_job(job), message="Full sync accepted")
 
 
 @router.post("/sync/by-stock/{ts_code}")
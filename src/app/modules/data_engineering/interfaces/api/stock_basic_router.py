@@ -19,9 +19,15 @@ async def sync_stock_basic(
     handler: SyncStockBasicHandler = Depends(get_sync_stock_basic_handler),
 ) -> ApiResponse[dict]:
     start = time.perf_counter()
-    synced_count = await handler.handle(SyncStockBasic())
+    result = await handler.handle(SyncStockBasic())
     duration_ms = int((time.perf_counter() - start) * 1000)
     return ApiResponse.success(
-        data={"synced_count": synced_count, "duration_ms": duration_ms},
+        data={
+            "synced_count": result.synced_count,
+            "total": result.total,
+            "interrupted": result.interrupted,
+            "stop_reason": result.stop_reason,
+            "duration_ms": duration_ms,
+        },
         message="Sync completed",
     )
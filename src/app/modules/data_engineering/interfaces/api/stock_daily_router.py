@@ -3,19 +3,13 @@
 import time
 from datetime import date
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, status
 from pydantic import BaseModel
 
 from app.interfaces.response import ApiResponse
 from app.modules.data_engineering.application.commands import (
     RetryStockDailySyncFailuresHandler,
 )
-from app.modules.data_engineering.application.commands.sync_stock_daily_history import (
-    SyncStockDailyHistory,
-)
-from app.modules.data_engineering.application.commands.sync_stock_daily_history_handler import (
-    SyncStockDailyHistoryHandler,
-)
 from app.modules.data_engineering.application.commands.sync_stock_daily_increment import (
     RetryStockDailySyncFailures,
     SyncStockDailyIncrement,
@@ -25,9 +19,12 @@ from app.modules.data_engineering.application.commands.sync_stock_daily_incremen
 )
 from app.modules.data_engineering.interfaces.dependencies import (
     get_retry_stock_daily_sync_failures_handler,
-    get_sync_stock_daily_history_handler,
     get_sync_stock_daily_increment_handler,
 )
+from app.modules.data_engineering.interfaces.jobs import SYNC_STOCK_DAILY_HISTORY_JOB
+from app.modules.foundation.application.job_runner import JobRunner
+from app.modules.foundation.interfaces.api.job_router import JobResponse
+from app.modules.foundation.interfaces.jobs import get_job_runner
 
 router = APIRouter(prefix="/data-engineering/stock-daily", tags=["data_engineering"])
 
@@ -38,32 +35,27 @@ class SyncHistoryRequest(BaseModel):
 
 class SyncIncrementRequest(BaseModel):
     trade_date: date | None = None
+    end_date: date | None = None
+    catch_up: bool = False  # 补齐全局水位之后缺失的日期，以 end_date / trade_date 为终点
 
 
 class RetryFailuresRequest(BaseModel):
     max_retries: int = 3
 
 
-@router.post("/sync/history", response_model=ApiResponse[dict])
+@router.post(
+    "/sync/history",
+    response_model=ApiResponse[JobResponse],
+    status_code=status.HTTP_202_ACCEPTED,
+)
 async def sync_stock_daily_history(
     request: SyncHistoryRequest | None = None,
-    handler: SyncStockDailyHistoryHandler = Depends(get_sync_stock_daily_history_handler),
-) -> ApiResponse[dict]:
-    start = time.perf_counter()
+    runner: JobRunner = Depends(get_job_runner),
+) -> ApiResponse[JobResponse]:
+    """提交历史同步后台任务，进度通过 /jobs/{job_id} 查询。"""
     ts_codes = request.ts_codes if request else None
-    result = await handler.handle(SyncStockDailyHistory(ts_codes=ts_codes))
-    duration_ms = int((time.perf_counter() - start) * 1000)
-
-    return ApiResponse.success(
-        data={
-            "total": result.total,
-            "success_count": result.success_count,
-            "failure_count": result.failure_count,
-            "synced_days": result.synced_days,
-            "duration_ms": duration_ms,
-        },
-        message="History sync completed",
-    )
+    job = await runner.submit(SYNC_STOCK_DAILY_HISTORY_JOB, {"ts_codes": ts_codes})
+    return ApiResponse.success(data=JobResponse.from_job(job), message="History sync accepted")
 
 
 @router.post("/sync/increment", response_model=ApiResponse[dict])
@@ -73,13 +65,20 @@ async def sync_stock_daily_increment(
 ) -> ApiResponse[dict]:
     start = time.perf_counter()
     trade_date = request.trade_date if request else None
-    result = await handler.handle(SyncStockDailyIncrement(trade_date=trade_date))
+    end_date = request.end_date if request else None
+    catch_up = request.catch_up if request else False
+    result = await handler.handle(SyncStockDailyIncrement(trade_date=trade_date, end_date=end_date, catch_up=catch_up))
     duration_ms = int((time.perf_counter() - start) * 1000)
 
     return ApiResponse.success(
         data={
             "trade_date": result.trade_date.isoformat(),
+            "end_date": result.end_date.isoformat() if result.end_date else None,
+            "trade_dates": [d.isoformat() for d in result.trade_dates],
             "synced_count": result.synced_count,
+            "chunks": result.chunks,
+            "interrupted": result.interrupted,
+            "stop_reason": result.stop_reason,
             "duration_ms": duration_ms,
         },
         message="Increment sync completed",
@@ -0,0 +1,62 @@
+"""交易日历同步与查询 HTTP 接口。"""
+
+from datetime import date
+
+from fastapi import APIRouter, Depends, Query
+from pydantic import BaseModel
+
+from app.interfaces.response import ApiResponse
+from app.modules.data_engineering.application.commands.sync_trade_calendar import SyncTradeCalendar
+from app.modules.data_engineering.application.commands.sync_trade_calendar_handler import (
+    SyncTradeCalendarHandler,
+)
+from app.modules.data_engineering.domain.services.trade_calendar import TradeCalendar
+from app.modules.data_engineering.interfaces.dependencies import (
+    get_sync_trade_calendar_handler,
+    get_trade_calendar,
+    trade_calendar_cache,
+)
+
+router = APIRouter(prefix="/data-engineering/trade-calendar", tags=["data_engineering"])
+
+
+class SyncTradeCalendarRequest(BaseModel):
+    exchange: str = "SSE"
+    start_date: date | None = None
+    end_date: date | None = None
+
+
+@router.post("/sync", response_model=ApiResponse[dict])
+async def sync_trade_calendar(
+    request: SyncTradeCalendarRequest | None = None,
+    handler: SyncTradeCalendarHandler = Depends(get_sync_trade_calendar_handler),
+) -> ApiResponse[dict]:
+    req = request or SyncTradeCalendarRequest()
+    result = await handler.handle(
+        SyncTradeCalendar(exchange=req.exchange, start_date=req.start_date, end_date=req.end_date)
+    )
+    trade_calendar_cache.invalidate()
+    return ApiResponse.success(
+        data={
+            "exchange": result.exchange,
+            "start_date": result.start_date.isoformat(),
+            "end_date": result.end_date.isoformat(),
+            "synced_count": result.synced_count,
+            "open_count": result.open_count,
+            "duration_ms": result.duration_ms,
+        },
+        message="Sync completed",
+    )
+
+
+@router.get("/trading-days", response_model=ApiResponse[dict])
+async def get_trading_days(
+    start_date: date = Query(...),
+    end_date: date = Query(...),
+    calendar: TradeCalendar = Depends(get_trade_calendar),
+) -> ApiResponse[dict]:
+    """查询区间内的交易日（含两端）。"""
+    days = calendar.trading_days(start_date, end_date)
+    return ApiResponse.success(
+        data={"count": len(days), "trading_days": [d.isoformat() for d in days]},
+    )
@@ -1 +1,16 @@
 """MQ 消费者（入站适配器）。"""
+
+from app.shared_kernel.application.event_bus import EventBus
+from app.shared_kernel.infrastructure.cache import CacheClient
+
+from .concept_events import register_concept_event_handlers
+from .stock_basic_events import register_stock_basic_event_handlers
+
+
+def register_event_handlers(event_bus: EventBus, cache: CacheClient) -> None:
+    """注册本模块全部领域事件订阅者。"""
+    register_concept_event_handlers(event_bus, cache)
+    register_stock_basic_event_handlers(event_bus)
+
+
+__all__ = ["register_event_handlers"]
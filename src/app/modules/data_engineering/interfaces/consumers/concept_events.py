@@ -0,0 +1,11 @@
+"""概念领域事件的订阅者注册。"""
+
+from app.modules.data_engineering.application.queries import ConceptQueryCacheInvalidator
+from app.modules.data_engineering.domain.events import ConceptsChanged
+from app.shared_kernel.application.event_bus import EventBus
+from app.shared_kernel.infrastructure.cache import CacheClient
+
+
+def register_concept_event_handlers(event_bus: EventBus, cache: CacheClient) -> None:
+    """概念同步提交变更后失效概念查询缓存。"""
+    event_bus.subscribe(ConceptsChanged, ConceptQueryCacheInvalidator(cache).handle)
@@ -0,0 +1,14 @@
+"""股票基础信息领域事件的订阅者注册。"""
+
+from app.modules.data_engineering.domain.events import StockBasicChanged
+from app.modules.data_engineering.interfaces.dependencies import security_master_cache
+from app.shared_kernel.application.event_bus import EventBus
+
+
+async def _invalidate_security_master(event: StockBasicChanged) -> None:
+    security_master_cache.invalidate(event.source)
+
+
+def register_stock_basic_event_handlers(event_bus: EventBus) -> None:
+    """股票基础信息同步提交后失效进程内股票全集快照。"""
+    event_bus.subscribe(StockBasicChanged, _invalidate_security_master)
@@ -1,32 +1,69 @@
-"""data_engineering 模块专属依赖：组装 Gateway、Repository、Handler，供本模块 Router 注入。"""
+"""data_engineering 模块专属依赖：组装 Gateway、Repository、Handler，供本模块 Router 注入。
 
-from typing import TYPE_CHECKING
+长耗时同步由后台任务执行，对应 Handler 通过 build_* 函数以任务自有的 UoW 组装。
+"""
+
+from typing import TYPE_CHECKING, Any
 
 from fastapi import Depends
 
 from app.config import settings
-from app.interfaces.dependencies import get_uow
+from app.interfaces.dependencies import get_cache, get_resource_versions, get_uow
 from app.modules.data_engineering.application.commands import (
     RetryStockDailySyncFailuresHandler,
     SyncConceptsHandler,
     SyncStockBasicHandler,
     SyncStockDailyHistoryHandler,
     SyncStockDailyIncrementHandler,
+    SyncTradeCalendarHandler,
 )
 from app.modules.data_engineering.application.queries import (
+    ConceptMembershipIndexCache,
+    ConceptMembershipIndexProvider,
+    ConceptMemberships,
+    ConceptOverlap,
+    ConceptStockScreen,
+    GetConceptMemberships,
+    GetConceptMembershipsHandler,
+    GetConceptOverlap,
+    GetConceptOverlapHandler,
+    GetConcepts,
     GetConceptsHandler,
+    GetConceptStocks,
     GetConceptStocksHandler,
+    ScreenConceptStocks,
+    ScreenConceptStocksHandler,
 )
+from app.modules.data_engineering.domain.services.security_master import SecurityMaster
+from app.modules.data_engineering.domain.services.trade_calendar import TradeCalendar
 from app.modules.data_engineering.infrastructure import (
     AkShareConceptGateway,
     SqlAlchemyConceptRepository,
+    SqlAlchemyConceptSnapshotRepository,
     SqlAlchemyConceptStockRepository,
     SqlAlchemyStockBasicRepository,
     SqlAlchemyStockDailyRepository,
     SqlAlchemyStockDailySyncFailureRepository,
+    SqlAlchemySyncRunRepository,
+    SqlAlchemyTradeCalendarRepository,
     TuShareStockDailyGateway,
     TuShareStockGateway,
+    TuShareTradeCalendarGateway,
 )
+from app.modules.data_engineering.infrastructure.cache.security_master_cache import SecurityMasterCache
+from app.modules.data_engineering.infrastructure.cache.trade_calendar_cache import TradeCalendarCache
+from app.modules.data_engineering.infrastructure.gateways.akshare_concept_gateway import DEFAULT_BURST
+from app.modules.data_engineering.infrastructure.gateways.tushare_stock_daily_gateway import TokenBucket
+from app.shared_kernel.application.cancellation import CancellationToken
+from app.shared_kernel.application.event_bus import get_event_bus
+from app.shared_kernel.application.execution_budget import ExecutionBudget
+from app.shared_kernel.application.pagination import Page
+from app.shared_kernel.application.progress import ProgressReporter
+from app.shared_kernel.application.queries import CachedQueryHandler
+from app.shared_kernel.application.query_handler import QueryHandler
+from app.shared_kernel.infrastructure.cache import CacheClient
+from app.shared_kernel.infrastructure.cache_serializer import CacheSerializer
+from app.shared_kernel.infrastructure.resource_version import ResourceVersions
 from app.shared_kernel.infrastructure.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
 
 if TYPE_CHECKING:
@@ -36,6 +73,44 @@ if TYPE_CHECKING:
         SyncFinanceIndicatorIncrementHandler,
     )
 
+# 进程内共享的交易日历，交易日历同步后由路由失效
+trade_calendar_cache = TradeCalendarCache(
+    exchange=settings.TRADE_CALENDAR_EXCHANGE,
+    refresh_seconds=settings.TRADE_CALENDAR_REFRESH_SECONDS,
+)
+
+
+async def load_trade_calendar(uow: SqlAlchemyUnitOfWork) -> TradeCalendar:
+    """从进程内缓存获取交易日历，缓存失效时经 uow 的 session 重新加载。"""
+    return await trade_calendar_cache.get(SqlAlchemyTradeCalendarRepository(uow.session))
+
+
+async def get_trade_calendar(uow: SqlAlchemyUnitOfWork = Depends(get_uow)) -> TradeCalendar:
+    return await load_trade_calendar(uow)
+
+
+# 进程内共享的证券主数据（股票全集快照与代码解析索引），股票基础信息同步提交后由 StockBasicChanged 失效
+security_master_cache = SecurityMasterCache(refresh_seconds=settings.SECURITY_MASTER_REFRESH_SECONDS)
+
+
+async def load_security_master(uow: SqlAlchemyUnitOfWork) -> SecurityMaster:
+    """从进程内缓存获取证券主数据，缓存失效时经 uow 的 session 重新加载。"""
+    return await security_master_cache.get(SqlAlchemyStockBasicRepository(uow.session))
+
+
+async def get_security_master(uow: SqlAlchemyUnitOfWork = Depends(get_uow)) -> SecurityMaster:
+    return await load_security_master(uow)
+
+
+def get_sync_trade_calendar_handler(
+    uow: SqlAlchemyUnitOfWork = Depends(get_uow),
+) -> SyncTradeCalendarHandler:
+    return SyncTradeCalendarHandler(
+        gateway=TuShareTradeCalendarGateway(token=settings.TUSHARE_TOKEN),
+        repository=SqlAlchemyTradeCalendarRepository(uow.session),
+        uow=uow,
+    )
+
 
 def get_sync_stock_basic_handler(
     uow: SqlAlchemyUnitOfWork = Depends(get_uow),
@@ -43,40 +118,122 @@ def get_sync_stock_basic_handler(
     """构造 SyncStockBasic 的 Handler，供 /sync 等路由注入。"""
     gateway = TuShareStockGateway(token=settings.TUSHARE_TOKEN)
     repository = SqlAlchemyStockBasicRepository(uow.session)
-    return SyncStockBasicHandler(gateway=gateway, repository=repository, uow=uow)
+    return SyncStockBasicHandler(
+        gateway=gateway,
+        repository=repository,
+        uow=uow,
+        event_bus=get_event_bus(),
+        budget=ExecutionBudget(
+            deadline_seconds=settings.SYNC_TIMEOUT_SECONDS,
+            memory_threshold_mb=settings.SYNC_MEMORY_THRESHOLD_MB,
+        ),
+    )
 
 
-def get_sync_concepts_handler(
-    uow: SqlAlchemyUnitOfWork = Depends(get_uow),
+# 进程内全部 AKShare 概念网关共享的令牌桶，并发的概念同步合计不超过 AKSHARE_RATE_LIMIT_PER_MINUTE；
+# 进程池 worker 与其他副本各持有一个
+akshare_rate_limiter = TokenBucket(capacity=DEFAULT_BURST, tokens_per_minute=settings.AKSHARE_RATE_LIMIT_PER_MINUTE)
+
+
+def build_sync_concepts_handler(
+    uow: SqlAlchemyUnitOfWork,
+    progress: ProgressReporter | None = None,
+    cancellation: CancellationToken | None = None,
+    securities: SecurityMaster | None = None,
 ) -> SyncConceptsHandler:
     return SyncConceptsHandler(
-        gateway=AkShareConceptGateway(),
+        gateway=AkShareConceptGateway(rate_limiter=akshare_rate_limiter),
         concept_repo=SqlAlchemyConceptRepository(uow.session),
         concept_stock_repo=SqlAlchemyConceptStockRepository(uow.session),
         stock_basic_repo=SqlAlchemyStockBasicRepository(uow.session),
         uow=uow,
+        snapshot_repo=SqlAlchemyConceptSnapshotRepository(uow.session),
+        progress=progress,
+        budget=ExecutionBudget(
+            deadline_seconds=settings.CONCEPT_SYNC_TIMEOUT_SECONDS,
+            memory_threshold_mb=settings.CONCEPT_SYNC_MEMORY_THRESHOLD_MB,
+            cancellation=cancellation,
+        ),
+        event_bus=get_event_bus(),
+        securities=securities,
     )
 
 
+def register_cache_types(serializer: CacheSerializer) -> None:
+    """注册本模块缓存的结果类型，供 Redis 缓存后端还原。"""
+    serializer.register(Page)
+
+
+# 概念数据每日同步一次，查询结果长期缓存，同步提交变更后由 ConceptsChanged 精确失效
 def get_get_concepts_handler(
     uow: SqlAlchemyUnitOfWork = Depends(get_uow),
-) -> GetConceptsHandler:
-    return GetConceptsHandler(concept_repo=SqlAlchemyConceptRepository(uow.session))
+    cache: CacheClient = Depends(get_cache),
+) -> QueryHandler[GetConcepts, Page[dict[str, Any]]]:
+    return CachedQueryHandler(
+        GetConceptsHandler(concept_repo=SqlAlchemyConceptRepository(uow.session)),
+        cache,
+        ttl_seconds=settings.CONCEPT_QUERY_CACHE_TTL_SECONDS,
+    )
 
 
 def get_get_concept_stocks_handler(
     uow: SqlAlchemyUnitOfWork = Depends(get_uow),
-) -> GetConceptStocksHandler:
-    return GetConceptStocksHandler(
+    cache: CacheClient = Depends(get_cache),
+) -> QueryHandler[GetConceptStocks, Page[dict[str, Any]]]:
+    return CachedQueryHandler(
+        GetConceptStocksHandler(
+            concept_repo=SqlAlchemyConceptRepository(uow.session),
+            concept_stock_repo=SqlAlchemyConceptStockRepository(uow.session),
+        ),
+        cache,
+        ttl_seconds=settings.CONCEPT_QUERY_CACHE_TTL_SECONDS,
+    )
+
+
+# 进程内概念成分索引快照（倒排索引 + 位图），跨请求复用
+_concept_membership_index = ConceptMembershipIndexCache()
+
+
+def get_concept_membership_index_provider(
+    uow: SqlAlchemyUnitOfWork = Depends(get_uow),
+    versions: ResourceVersions = Depends(get_resource_versions),
+) -> ConceptMembershipIndexProvider:
+    return ConceptMembershipIndexProvider(
+        index_cache=_concept_membership_index,
+        versions=versions,
         concept_repo=SqlAlchemyConceptRepository(uow.session),
         concept_stock_repo=SqlAlchemyConceptStockRepository(uow.session),
+        stock_basic_repo=SqlAlchemyStockBasicRepository(uow.session),
+        version_ttl_seconds=settings.CONCEPT_QUERY_CACHE_TTL_SECONDS,
     )
 
 
-def get_sync_stock_daily_history_handler(
-    uow: SqlAlchemyUnitOfWork = Depends(get_uow),
+def get_get_concept_memberships_handler(
+    index_provider: ConceptMembershipIndexProvider = Depends(get_concept_membership_index_provider),
+) -> QueryHandler[GetConceptMemberships, ConceptMemberships]:
+    return GetConceptMembershipsHandler(index_provider)
+
+
+def get_screen_concept_stocks_handler(
+    index_provider: ConceptMembershipIndexProvider = Depends(get_concept_membership_index_provider),
+) -> QueryHandler[ScreenConceptStocks, ConceptStockScreen]:
+    return ScreenConceptStocksHandler(index_provider)
+
+
+def get_get_concept_overlap_handler(
+    index_provider: ConceptMembershipIndexProvider = Depends(get_concept_membership_index_provider),
+) -> QueryHandler[GetConceptOverlap, ConceptOverlap]:
+    return GetConceptOverlapHandler(index_provider)
+
+
+def build_sync_stock_daily_history_handler(
+    uow: SqlAlchemyUnitOfWork,
+    progress: ProgressReporter | None = None,
+    cancellation: CancellationToken | None = None,
+    calendar: TradeCalendar | None = None,
+    securities: SecurityMaster | None = None,
 ) -> SyncStockDailyHistoryHandler:
-    gateway = TuShareStockDailyGateway(token=settings.TUSHARE_TOKEN)
+    gateway = TuShareStockDailyGateway(token=settings.TUSHARE_TOKEN, calendar=calendar)
     daily_repo = SqlAlchemyStockDailyRepository(uow.session)
     basic_repo = SqlAlchemyStockBasicRepository(uow.session)
     failure_repo = SqlAlchemyStockDailySyncFailureRepository(uow.session)
@@ -86,25 +243,50 @@ def get_sync_stock_daily_history_handler(
         basic_repo=basic_repo,
         failure_repo=failure_repo,
         uow=uow,
+        progress=progress,
+        run_repo=SqlAlchemySyncRunRepository(uow.session),
+        budget=ExecutionBudget(
+            deadline_seconds=settings.SYNC_TIMEOUT_SECONDS,
+            memory_threshold_mb=settings.SYNC_MEMORY_THRESHOLD_MB,
+            cancellation=cancellation,
+        ),
+        calendar=calendar,
+        securities=securities,
     )
 
 
-def get_sync_stock_daily_increment_handler(
-    uow: SqlAlchemyUnitOfWork = Depends(get_uow),
+def build_sync_stock_daily_increment_handler(
+    uow: SqlAlchemyUnitOfWork,
+    calendar: TradeCalendar | None = None,
+    securities: SecurityMaster | None = None,
 ) -> SyncStockDailyIncrementHandler:
-    gateway = TuShareStockDailyGateway(token=settings.TUSHARE_TOKEN)
-    daily_repo = SqlAlchemyStockDailyRepository(uow.session)
-    basic_repo = SqlAlchemyStockBasicRepository(uow.session)
     return SyncStockDailyIncrementHandler(
-        gateway=gateway,
-        daily_repo=daily_repo,
-        basic_repo=basic_repo,
+        gateway=TuShareStockDailyGateway(token=settings.TUSHARE_TOKEN, calendar=calendar),
+        daily_repo=SqlAlchemyStockDailyRepository(uow.session),
+        basic_repo=SqlAlchemyStockBasicRepository(uow.session),
         uow=uow,
+        fetch_concurrency=settings.STOCK_DAILY_FETCH_CONCURRENCY,
+        max_catch_up_days=settings.STOCK_DAILY_CATCH_UP_MAX_DAYS,
+        calendar=calendar,
+        securities=securities,
+        budget=ExecutionBudget(
+            deadline_seconds=settings.SYNC_TIMEOUT_SECONDS,
+            memory_threshold_mb=settings.SYNC_MEMORY_THRESHOLD_MB,
+        ),
     )
 
 
+def get_sync_stock_daily_increment_handler(
+    uow: SqlAlchemyUnitOfWork = Depends(get_uow),
+    calendar: TradeCalendar = Depends(get_trade_calendar),
+    securities: SecurityMaster = Depends(get_security_master),
+) -> SyncStockDailyIncrementHandler:
+    return build_sync_stock_daily_increment_handler(uow, calendar, securities)
+
+
 def get_retry_stock_daily_sync_failures_handler(
     uow: SqlAlchemyUnitOfWork = Depends(get_uow),
+    securities: SecurityMaster = Depends(get_security_master),
 ) -> RetryStockDailySyncFailuresHandler:
     gateway = TuShareStockDailyGateway(token=settings.TUSHARE_TOKEN)
     daily_repo = SqlAlchemyStockDailyRepository(uow.session)
@@ -114,11 +296,15 @@ def get_retry_stock_daily_sync_failures_handler(
         daily_repo=daily_repo,
         failure_repo=failure_repo,
         uow=uow,
+        securities=securities,
     )
 
 
-def get_sync_finance_indicator_full_handler(
-    uow: SqlAlchemyUnitOfWork = Depends(get_uow),
+def build_sync_finance_indicator_full_handler(
+    uow: SqlAlchemyUnitOfWork,
+    progress: ProgressReporter | None = None,
+    cancellation: CancellationToken | None = None,
+    securities: SecurityMaster | None = None,
 ) -> "SyncFinanceIndicatorFullHandler":
     import tushare as ts  # type: ignore[import-untyped]
 
@@ -134,18 +320,27 @@ def get_sync_finance_indicator_full_handler(
         fi_repo=SqlAlchemyStockFinancialRepository(uow.session),
         gateway=TuShareFinanceIndicatorGateway(pro=pro),
         uow=uow,
+        progress=progress,
+        run_repo=SqlAlchemySyncRunRepository(uow.session),
+        budget=ExecutionBudget(
+            deadline_seconds=settings.SYNC_TIMEOUT_SECONDS,
+            memory_threshold_mb=settings.SYNC_MEMORY_THRESHOLD_MB,
+            cancellation=cancellation,
+        ),
+        securities=securities,
     )
 
 
 def get_sync_finance_indicator_by_stock_handler(
     uow: SqlAlchemyUnitOfWork = Depends(get_uow),
+    securities: SecurityMaster = Depends(get_security_master),
 ) -> "SyncFinanceIndicatorByStockHandler":
     import tushare as ts  # type: ignore[import-untyped]
 
     from app.modules.data_engineering.application.commands import SyncFinanceIndicatorByStockHandler
     from app.modules.data_engineering.infrastructure import (
-        SqlAlchemyStockFinancialRepository,
         SqlAlchemyStockBasicRepository,
+        SqlAlchemyStockFinancialRepository,
         TuShareFinanceIndicatorGateway,
     )
 
@@ -155,11 +350,12 @@ def get_sync_finance_indicator_by_stock_handler(
         fi_repo=SqlAlchemyStockFinancialRepository(uow.session),
         gateway=TuShareFinanceIndicatorGateway(pro=pro),
         uow=uow,
+        securities=securities,
     )
 
 
-def get_sync_finance_indicator_increment_handler(
-    uow: SqlAlchemyUnitOfWork = Depends(get_uow),
+def build_sync_finance_indicator_increment_handler(
+    uow: SqlAlchemyUnitOfWork, securities: SecurityMaster | None = None
 ) -> "SyncFinanceIndicatorIncrementHandler":
     import tushare as ts  # type: ignore[import-untyped]
 
@@ -177,4 +373,16 @@ def get_sync_finance_indicator_increment_handler(
         fi_repo=SqlAlchemyStockFinancialRepository(uow.session),
         gateway=TuShareFinanceIndicatorGateway(pro=pro),
         uow=uow,
+        securities=securities,
+        budget=ExecutionBudget(
+            deadline_seconds=settings.SYNC_TIMEOUT_SECONDS,
+            memory_threshold_mb=settings.SYNC_MEMORY_THRESHOLD_MB,
+        ),
     )
+
+
+def get_sync_finance_indicator_increment_handler(
+    uow: SqlAlchemyUnitOfWork = Depends(get_uow),
+    securities: SecurityMaster = Depends(get_security_master),
+) -> "SyncFinanceIndicatorIncrementHandler":
+    return build_sync_finance_indicator_increment_handler(uow, securities)
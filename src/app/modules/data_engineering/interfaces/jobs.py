@@ -0,0 +1,110 @@
+"""Data Engineering 模块后台任务定义。
+
+长耗时同步（日线历史、财务指标全量、概念板块）以后台任务执行，HTTP 接口只负责提交。
+"""
+
+from __future__ import annotations
+
+from dataclasses import asdict
+from typing import TYPE_CHECKING, Any
+
+from app.modules.data_engineering.application.commands.sync_concepts import (
+    ConceptSyncStrategy,
+    SyncConcepts,
+)
+from app.modules.data_engineering.application.commands.sync_finance_indicator_commands import (
+    SyncFinanceIndicatorFull,
+)
+from app.modules.data_engineering.application.commands.sync_stock_daily_history import (
+    SyncStockDailyHistory,
+)
+from app.modules.data_engineering.interfaces.dependencies import (
+    build_sync_concepts_handler,
+    build_sync_finance_indicator_full_handler,
+    build_sync_stock_daily_history_handler,
+    load_security_master,
+    load_trade_calendar,
+)
+from app.modules.foundation.application.job_runner import JobContext, JobInterrupted
+from app.shared_kernel.application.execution_budget import StopReason
+from app.shared_kernel.infrastructure.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+    from app.modules.foundation.application.job_runner import JobFactory
+
+SYNC_STOCK_DAILY_HISTORY_JOB = "de.sync_stock_daily_history"
+SYNC_FINANCE_INDICATOR_FULL_JOB = "de.sync_finance_indicator_full"
+SYNC_CONCEPTS_JOB = "de.sync_concepts"
+
+
+def create_background_jobs(session_factory: async_sessionmaker) -> dict[str, JobFactory]:
+    """创建任务类型到任务工厂的映射。
+
+    任务工厂自行管理 Session 生命周期：
+    创建 session → 构造 Handler（注入进度上报器与取消令牌）→ 执行 command → 关闭 session。
+
+    日线历史与财务指标全量以任务 ID 作为断点 run_key：任务被中断后重新入队时，
+    Handler 会从第一只未完成的股票续跑。Handler 因取消而提前停止时抛出 JobInterrupted，任务回到 PENDING；
+    因超时停止时任务正常结束，结果中带 interrupted 与已处理部分的统计。
+
+    Args:
+        session_factory: SQLAlchemy async_sessionmaker 实例。
+
+    Returns:
+        任务类型到任务工厂的映射。
+    """
+
+    async def sync_stock_daily_history(params: dict[str, Any], ctx: JobContext) -> dict[str, Any]:
+        async with session_factory() as session:
+            uow = SqlAlchemyUnitOfWork(session)
+            handler = build_sync_stock_daily_history_handler(
+                uow,
+                ctx.progress,
+                ctx.cancellation,
+                calendar=await load_trade_calendar(uow),
+                securities=await load_security_master(uow),
+            )
+            result = await handler.handle(SyncStockDailyHistory(ts_codes=params.get("ts_codes"), run_key=ctx.job_id))
+        _raise_if_cancelled(result.stop_reason, result.run_id)
+        return asdict(result)
+
+    async def sync_finance_indicator_full(params: dict[str, Any], ctx: JobContext) -> dict[str, Any]:
+        async with session_factory() as session:
+            uow = SqlAlchemyUnitOfWork(session)
+            handler = build_sync_finance_indicator_full_handler(
+                uow, ctx.progress, ctx.cancellation, securities=await load_security_master(uow)
+            )
+            result = await handler.handle(
+                SyncFinanceIndicatorFull(
+                    ts_codes=params.get("ts_codes") or [],
+                    revision_aware=bool(params.get("revision_aware", False)),
+                    run_key=ctx.job_id,
+                )
+            )
+        _raise_if_cancelled(result.stop_reason, result.run_id)
+        return asdict(result)
+
+    async def sync_concepts(params: dict[str, Any], ctx: JobContext) -> dict[str, Any]:
+        async with session_factory() as session:
+            uow = SqlAlchemyUnitOfWork(session)
+            handler = build_sync_concepts_handler(
+                uow, ctx.progress, ctx.cancellation, securities=await load_security_master(uow)
+            )
+            strategy = ConceptSyncStrategy(params.get("strategy", ConceptSyncStrategy.INCREMENTAL))
+            result = await handler.handle(SyncConcepts(strategy=strategy))
+        _raise_if_cancelled(result.stop_reason)
+        return asdict(result)
+
+    return {
+        SYNC_STOCK_DAILY_HISTORY_JOB: sync_stock_daily_history,
+        SYNC_FINANCE_INDICATOR_FULL_JOB: sync_finance_indicator_full,
+        SYNC_CONCEPTS_JOB: sync_concepts,
+    }
+
+
+def _raise_if_cancelled(stop_reason: str | None, run_id: int | None = None) -> None:
+    """Handler 因取消在安全点停止时，通知执行器将任务保留为待续跑。"""
+    if stop_reason == StopReason.CANCELLED:
+        raise JobInterrupted(f"Checkpointed at sync run {run_id}" if run_id is not None else "Cancelled")
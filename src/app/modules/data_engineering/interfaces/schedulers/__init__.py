@@ -1,6 +1,7 @@
 """Data Engineering 模块定时任务入口。
 
-提供 create_scheduled_tasks() 函数，供 app.modules 注册定时任务。
+提供 create_scheduled_tasks() 函数，供 app.modules 注册定时任务；
+提供 TradeCalendarProvider，供调度器的交易日触发器使用。
 """
 
 from __future__ import annotations
@@ -12,6 +13,7 @@ from app.modules.data_engineering.interfaces.schedulers.tasks import (
     create_task_callables,
     get_scheduled_tasks,
 )
+from app.modules.data_engineering.interfaces.schedulers.trading_calendar_provider import TradeCalendarProvider
 
 if TYPE_CHECKING:
     from app.modules.foundation.application.scheduled_task_config import ScheduledTaskConfig
@@ -19,7 +21,7 @@ if TYPE_CHECKING:
 
 def create_scheduled_tasks(
     session_factory: "async_sessionmaker",
-) -> tuple[list["ScheduledTaskConfig"], dict[str, Callable[[], Awaitable[None]]]]:
+) -> tuple[list["ScheduledTaskConfig"], dict[str, Callable[[], Awaitable[int | None]]]]:
     """创建 data_engineering 模块的定时任务配置和执行函数。
 
     这是模块入口函数，返回 (configs, task_callables) 元组，
@@ -36,4 +38,4 @@ def create_scheduled_tasks(
     return configs, task_callables
 
 
-__all__ = ["create_scheduled_tasks", "get_scheduled_tasks", "create_task_callables"]
+__all__ = ["TradeCalendarProvider", "create_scheduled_tasks", "get_scheduled_tasks", "create_task_callables"]
@@ -1,6 +1,9 @@
 """Data Engineering 模块定时任务定义。
 
-提供股票日线增量同步定时任务，每天 16:30 执行。
+- 收盘后同步链：每个交易日 16:30 由股票基础信息同步触发（交易日触发器），依次执行
+  股票基础信息 → 日线增量（补齐模式，自动补上错过的交易日）→ 财务指标增量 → 概念板块；
+  下游任务在上游成功后立即启动，上游失败时跳过
+- 交易日历同步：每周一 08:00 执行，拉取至次年年底的交易日历
 """
 
 from __future__ import annotations
@@ -9,14 +12,30 @@ from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING
 
 from app.config import settings
-from app.modules.foundation.application.scheduled_task_config import CronTrigger, ScheduledTaskConfig
+from app.modules.data_engineering.application.commands.sync_concepts import SyncConcepts
+from app.modules.data_engineering.application.commands.sync_finance_indicator_commands import (
+    SyncFinanceIndicatorIncrement,
+)
+from app.modules.data_engineering.application.commands.sync_stock_basic import SyncStockBasic
 from app.modules.data_engineering.application.commands.sync_stock_daily_increment import (
     SyncStockDailyIncrement,
 )
-from app.modules.data_engineering.infrastructure import (
-    SqlAlchemyStockBasicRepository,
-    SqlAlchemyStockDailyRepository,
-    TuShareStockDailyGateway,
+from app.modules.data_engineering.application.commands.sync_trade_calendar import SyncTradeCalendar
+from app.modules.data_engineering.domain.exceptions import SyncInterruptedError
+from app.modules.data_engineering.interfaces.dependencies import (
+    build_sync_concepts_handler,
+    build_sync_finance_indicator_increment_handler,
+    build_sync_stock_daily_increment_handler,
+    get_sync_stock_basic_handler,
+    get_sync_trade_calendar_handler,
+    load_security_master,
+    load_trade_calendar,
+    trade_calendar_cache,
+)
+from app.modules.foundation.application.scheduled_task_config import (
+    CronTrigger,
+    ScheduledTaskConfig,
+    TradingDayTrigger,
 )
 from app.shared_kernel.infrastructure.logging import get_logger
 from app.shared_kernel.infrastructure.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
@@ -34,25 +53,59 @@ def get_scheduled_tasks() -> list[ScheduledTaskConfig]:
         任务配置列表。
     """
     return [
+        ScheduledTaskConfig(
+            id="de.sync_stock_basic",
+            trigger=TradingDayTrigger(hour=16, minute=30),
+            name="同步股票基础信息",
+            module="data_engineering",
+            max_instances=1,
+            coalesce=True,
+            misfire_grace_time=7200,
+        ),
         ScheduledTaskConfig(
             id="de.sync_stock_daily_increment",
-            trigger=CronTrigger(hour=16, minute=30),
+            trigger=None,
             name="同步股票日线增量",
             module="data_engineering",
             max_instances=1,
             coalesce=True,
             misfire_grace_time=7200,
+            depends_on=("de.sync_stock_basic",),
+        ),
+        ScheduledTaskConfig(
+            id="de.sync_finance_indicator_increment",
+            trigger=None,
+            name="同步财务指标增量",
+            module="data_engineering",
+            depends_on=("de.sync_stock_daily_increment",),
+        ),
+        ScheduledTaskConfig(
+            id="de.sync_concepts",
+            trigger=None,
+            name="同步概念板块",
+            module="data_engineering",
+            depends_on=("de.sync_finance_indicator_increment",),
+        ),
+        ScheduledTaskConfig(
+            id="de.sync_trade_calendar",
+            trigger=CronTrigger(hour=8, minute=0, day_of_week="mon"),
+            name="同步交易日历",
+            module="data_engineering",
+            max_instances=1,
+            coalesce=True,
+            misfire_grace_time=86400,
         ),
     ]
 
 
 def create_task_callables(
     session_factory: async_sessionmaker,
-) -> dict[str, Callable[[], Awaitable[None]]]:
+) -> dict[str, Callable[[], Awaitable[int | None]]]:
     """创建任务执行函数映射。
 
     任务执行函数自行管理 Session 生命周期：
     创建 session → 构造 Handler → 执行 command → 关闭 session。
+    执行函数返回本次写入的行数，记入定时任务运行历史。
 
     Args:
         session_factory: SQLAlchemy async_sessionmaker 实例。
@@ -60,35 +113,99 @@ def create_task_callables(
     Returns:
         任务 ID 到 async callable 的映射。
     """
-    async def sync_stock_daily_increment() -> None:
+
+    async def sync_stock_basic() -> int:
+        """同步股票基础信息，供下游日线、财务指标与概念同步使用最新股票列表。
+
+        提前停止时股票全集只更新了一部分，抛出 SyncInterruptedError，下游任务随之跳过。
+        """
+        async with session_factory() as session:
+            handler = get_sync_stock_basic_handler(SqlAlchemyUnitOfWork(session))
+            result = await handler.handle(SyncStockBasic())
+        if result.interrupted:
+            raise SyncInterruptedError(
+                f"Stock basic sync stopped early ({result.stop_reason}): {result.synced_count}/{result.total} written"
+            )
+        logger.info("Scheduled task completed", task_id="de.sync_stock_basic", synced_count=result.synced_count)
+        return result.synced_count
+
+    async def sync_stock_daily_increment() -> int:
         """同步股票日线增量数据。
 
         任务执行函数自行管理 Session 生命周期，不通过 Mediator 分发。
         """
         async with session_factory() as session:
             uow = SqlAlchemyUnitOfWork(session)
-            gateway = TuShareStockDailyGateway(token=settings.TUSHARE_TOKEN)
-            daily_repo = SqlAlchemyStockDailyRepository(session)
-            basic_repo = SqlAlchemyStockBasicRepository(session)
-
             # 直接构造 Handler，避免 Mediator 与 session 管理的耦合
-            from app.modules.data_engineering.application.commands import SyncStockDailyIncrementHandler
-
-            handler = SyncStockDailyIncrementHandler(
-                gateway=gateway,
-                daily_repo=daily_repo,
-                basic_repo=basic_repo,
-                uow=uow,
+            handler = build_sync_stock_daily_increment_handler(
+                uow, await load_trade_calendar(uow), await load_security_master(uow)
             )
 
-            command = SyncStockDailyIncrement()
+            # 补齐模式：任务错过（节假日、停机）的日期按日期补齐，而不是逐股历史同步
+            command = SyncStockDailyIncrement(catch_up=True)
             result = await handler.handle(command)
             logger.info(
                 "Scheduled task completed",
                 task_id="de.sync_stock_daily_increment",
                 synced_count=result.synced_count,
+                days=result.days,
+                interrupted=result.interrupted,
             )
+            return result.synced_count
+
+    async def sync_finance_indicator_increment() -> int:
+        """同步财务指标增量数据。"""
+        async with session_factory() as session:
+            uow = SqlAlchemyUnitOfWork(session)
+            handler = build_sync_finance_indicator_increment_handler(uow, await load_security_master(uow))
+            result = await handler.handle(SyncFinanceIndicatorIncrement())
+        logger.info(
+            "Scheduled task completed",
+            task_id="de.sync_finance_indicator_increment",
+            success_count=result.success_count,
+            failure_count=result.failure_count,
+        )
+        return result.synced_records
+
+    async def sync_concepts() -> int:
+        """同步概念板块及成分股。"""
+        async with session_factory() as session:
+            uow = SqlAlchemyUnitOfWork(session)
+            handler = build_sync_concepts_handler(uow, securities=await load_security_master(uow))
+            result = await handler.handle(SyncConcepts())
+        logger.info(
+            "Scheduled task completed",
+            task_id="de.sync_concepts",
+            total_concepts=result.total_concepts,
+            failed_concepts=result.failed_concepts,
+        )
+        return (
+            result.new_concepts
+            + result.modified_concepts
+            + result.deleted_concepts
+            + result.new_stocks
+            + result.modified_stocks
+            + result.deleted_stocks
+        )
+
+    async def sync_trade_calendar() -> int:
+        """同步交易日历，完成后失效进程内日历缓存。"""
+        async with session_factory() as session:
+            handler = get_sync_trade_calendar_handler(SqlAlchemyUnitOfWork(session))
+            result = await handler.handle(SyncTradeCalendar(exchange=settings.TRADE_CALENDAR_EXCHANGE))
+        trade_calendar_cache.invalidate()
+        logger.info(
+            "Scheduled task completed",
+            task_id="de.sync_trade_calendar",
+            synced_count=result.synced_count,
+            open_count=result.open_count,
+        )
+        return result.synced_count
 
     return {
+        "de.sync_stock_basic": sync_stock_basic,
         "de.sync_stock_daily_increment": sync_stock_daily_increment,
+        "de.sync_finance_indicator_increment": sync_finance_indicator_increment,
+        "de.sync_concepts": sync_concepts,
+        "de.sync_trade_calendar": sync_trade_calendar,
     }
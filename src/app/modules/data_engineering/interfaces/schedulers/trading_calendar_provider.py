@@ -0,0 +1,29 @@
+"""Data Engineering 模块提供给调度器的交易日历。"""
+
+from __future__ import annotations
+
+from datetime import date
+from typing import TYPE_CHECKING
+
+from app.modules.data_engineering.interfaces.dependencies import load_trade_calendar, trade_calendar_cache
+from app.shared_kernel.infrastructure.sqlalchemy_unit_of_work import SqlAlchemyUnitOfWork
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import async_sessionmaker
+
+
+class TradeCalendarProvider:
+    """以进程内交易日历缓存实现 foundation 的 TradingCalendarProvider 协议。
+
+    is_trading_day 只读取缓存中已加载的日历；refresh 在缓存过期或失效时经新 session 重新加载。
+    """
+
+    def __init__(self, session_factory: async_sessionmaker) -> None:
+        self._session_factory = session_factory
+
+    def is_trading_day(self, day: date) -> bool:
+        return trade_calendar_cache.current().is_trading_day(day)
+
+    async def refresh(self) -> None:
+        async with self._session_factory() as session:
+            await load_trade_calendar(SqlAlchemyUnitOfWork(session))
@@ -0,0 +1,58 @@
+"""后台任务状态模型。
+
+提供 JobStatus（任务状态枚举）和 BackgroundJob（任务快照）。
+"""
+
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from datetime import datetime
+from enum import StrEnum
+from typing import Any
+
+
+class JobStatus(StrEnum):
+    """后台任务状态。"""
+
+    PENDING = "pending"
+    RUNNING = "running"
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+
+    @property
+    def is_terminal(self) -> bool:
+        """是否为终态（不会再变化）。"""
+        return self in (JobStatus.SUCCEEDED, JobStatus.FAILED)
+
+
+@dataclass
+class BackgroundJob:
+    """后台任务快照。
+
+    Attributes:
+        id: 任务 ID（uuid4 hex）。
+        job_type: 任务类型（如 'de.sync_concepts'），对应已注册的任务工厂。
+        params: 任务参数，须可 JSON 序列化，进程重启后据此重新入队。
+        status: 任务状态。
+        progress: 进度计数器（如 processed、total、rows_written、failures）。
+        result: 成功时的结果摘要。
+        error: 失败时的错误信息。
+        created_at: 提交时间。
+        started_at: 开始执行时间。
+        finished_at: 结束时间。
+        owner: 认领任务的执行器实例 ID，同一时刻只有租约有效的持有者执行任务。
+        lease_expires_at: 认领租约到期时间，过期后其他实例可重新认领。
+    """
+
+    id: str
+    job_type: str
+    params: dict[str, Any]
+    status: JobStatus
+    created_at: datetime
+    progress: dict[str, int] = field(default_factory=dict)
+    result: dict[str, Any] | None = None
+    error: str | None = None
+    started_at: datetime | None = None
+    finished_at: datetime | None = None
+    owner: str | None = None
+    lease_expires_at: datetime | None = None
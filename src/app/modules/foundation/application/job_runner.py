@@ -0,0 +1,111 @@
+"""后台任务执行器抽象接口。
+
+定义 JobRunner Protocol、任务上下文 JobContext 及任务工厂类型 JobFactory。
+"""
+
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Awaitable, Callable
+from dataclasses import dataclass
+from typing import Any, Protocol, TypeAlias, runtime_checkable
+
+from app.modules.foundation.application.background_job import BackgroundJob
+from app.shared_kernel.application.cancellation import CancellationToken
+from app.shared_kernel.application.progress import ProgressReporter
+
+
+@dataclass(frozen=True)
+class JobContext:
+    """任务执行上下文。
+
+    Attributes:
+        job_id: 任务 ID。同一任务重新入队后不变，可作为业务侧断点续跑的标识。
+        progress: 进度上报器。
+        cancellation: 取消标记，执行器关闭时置位，任务应在安全点保存断点后抛出 JobInterrupted。
+    """
+
+    job_id: str
+    progress: ProgressReporter
+    cancellation: CancellationToken
+
+
+class JobInterrupted(Exception):
+    """任务响应取消、已保存断点而提前结束。执行器将其保留为 PENDING，下次启动时重新入队续跑。"""
+
+
+# 任务工厂：接收任务参数与执行上下文，自行管理 Session 生命周期，返回结果摘要
+JobFactory: TypeAlias = Callable[[dict[str, Any], JobContext], Awaitable[dict[str, Any]]]
+
+
+@runtime_checkable
+class JobRunner(Protocol):
+    """后台任务执行器抽象接口。
+
+    Methods:
+        register: 注册任务类型及其工厂。
+        submit: 提交任务，立即返回 PENDING 状态的任务快照。
+        get: 查询任务快照。
+        resume: 将失败的任务按原 ID 与参数重新入队。
+        subscribe: 订阅任务状态变化，任务结束后迭代终止。
+        start: 启动工作协程并恢复重启前未完成的任务。
+        shutdown: 请求正在执行的任务保存断点，限时等待后停止工作协程。
+    """
+
+    def register(self, job_type: str, factory: JobFactory) -> None:
+        """注册任务类型。
+
+        Args:
+            job_type: 任务类型标识（如 'de.sync_concepts'）。
+            factory: 任务工厂。
+        """
+        ...
+
+    async def submit(self, job_type: str, params: dict[str, Any] | None = None) -> BackgroundJob:
+        """提交任务。
+
+        Args:
+            job_type: 已注册的任务类型。
+            params: 任务参数，须可 JSON 序列化。
+
+        Returns:
+            PENDING 状态的任务快照。
+
+        Raises:
+            ValueError: 任务类型未注册时抛出。
+        """
+        ...
+
+    async def get(self, job_id: str) -> BackgroundJob | None:
+        """查询任务快照，不存在返回 None。"""
+        ...
+
+    async def resume(self, job_id: str) -> BackgroundJob:
+        """将失败的任务重新入队。任务 ID 不变，业务侧据此从断点续跑。
+
+        Raises:
+            NotFoundException: 任务不存在时抛出。
+            ValidationException: 任务不是失败状态时抛出。
+        """
+        ...
+
+    def subscribe(self, job_id: str) -> AsyncIterator[BackgroundJob]:
+        """订阅任务状态变化。
+
+        先推送当前快照，之后每次进度或状态变化推送一次，任务进入终态后结束。
+        """
+        ...
+
+    async def start(self) -> None:
+        """启动工作协程，并恢复重启前遗留的任务。"""
+        ...
+
+    async def shutdown(self, timeout: float | None = None) -> None:
+        """关闭执行器。
+
+        置位所有正在执行任务的取消标记，最多等待 timeout 秒让其在安全点保存断点；
+        超时仍未结束的任务被强制取消（保留 RUNNING 状态，下次启动时重新入队）。
+
+        Args:
+            timeout: 等待断点保存的最长秒数，None 表示使用执行器默认值。
+        """
+        ...
@@ -0,0 +1,49 @@
+"""后台任务持久化抽象接口。"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+from app.modules.foundation.application.background_job import BackgroundJob, JobStatus
+
+
+class BackgroundJobStore(ABC):
+    """后台任务状态存储。每个方法自行管理事务，调用即落库。"""
+
+    @abstractmethod
+    async def save(self, job: BackgroundJob) -> None:
+        """插入或覆盖任务快照。"""
+        ...
+
+    @abstractmethod
+    async def get(self, job_id: str) -> BackgroundJob | None:
+        """按 ID 查询任务，不存在返回 None。"""
+        ...
+
+    @abstractmethod
+    async def find_by_status(self, statuses: list[JobStatus]) -> list[BackgroundJob]:
+        """按状态查询任务，按提交时间升序。"""
+        ...
+
+    @abstractmethod
+    async def claim(self, job_id: str, owner: str, lease_expires_at: datetime) -> bool:
+        """原子地认领未完成任务（PENDING / RUNNING）。
+
+        仅在任务无持有者、持有者即 owner 或原租约已过期时写入新的持有者与租约，返回是否认领成功；
+        多个实例并发认领同一任务时只有一个成功。
+        """
+        ...
+
+    @abstractmethod
+    async def save_if_owned(self, job: BackgroundJob, owner: str) -> bool:
+        """owner 仍为持有者时覆盖任务快照（含续约），返回是否写入。
+
+        返回 False 表示租约已被其他实例接管，调用方须停止执行并不再写入该任务。
+        """
+        ...
+
+    @abstractmethod
+    async def release(self, job_id: str, owner: str) -> None:
+        """owner 仍为持有者时清除持有者与租约，使其他实例可立即认领。"""
+        ...
@@ -0,0 +1,159 @@
+"""调度器主节点选举。
+
+多 worker / 多副本部署时，每个进程都会执行 lifespan；只有持有 LeaderLock 的进程运行调度器，
+其余进程待命，主节点失联后由待命进程接管。
+
+提供 LeaderInfo（当前主节点信息）、LeaderLock（选举锁抽象）与 LeaderElector（周期性竞选与续约）。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+from abc import ABC, abstractmethod
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any
+
+from app.shared_kernel.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+
+@dataclass(frozen=True)
+class LeaderInfo:
+    """当前主节点。
+
+    Attributes:
+        instance_id: 主节点实例标识（主机名:进程号:随机后缀）。
+        acquired_at: 成为主节点的时间（UTC）。
+        expires_at: 租约到期时间（UTC），主节点在此之前续约。
+    """
+
+    instance_id: str
+    acquired_at: datetime
+    expires_at: datetime
+
+
+class LeaderLock(ABC):
+    """主节点选举锁。同一时刻至多一个实例持有，持有者失联后锁自动失效。"""
+
+    @property
+    @abstractmethod
+    def instance_id(self) -> str:
+        """本实例标识。"""
+        ...
+
+    @abstractmethod
+    async def try_acquire(self) -> bool:
+        """尝试成为主节点，不阻塞。已被其他实例持有时返回 False。"""
+        ...
+
+    @abstractmethod
+    async def renew(self) -> bool:
+        """主节点续约。返回 False 表示已失去主节点身份。"""
+        ...
+
+    @abstractmethod
+    async def release(self) -> None:
+        """主动释放，供其他实例立即接管。"""
+        ...
+
+    @abstractmethod
+    async def current_leader(self) -> LeaderInfo | None:
+        """查询当前主节点，租约已过期或无主节点时返回 None。"""
+        ...
+
+
+class LeaderElector:
+    """周期性竞选与续约，在身份变化时回调。
+
+    - 待命时每个周期尝试获取锁，成功后调用 on_elected（恢复错过的执行并启动/恢复调度器）
+    - 主节点每个周期续约，续约失败或锁操作异常时调用 on_demoted（暂停调度器），避免双主
+    - 每个周期刷新当前主节点信息，供 /health 报告
+
+    Attributes:
+        _lock: 选举锁。
+        _renew_interval: 竞选与续约周期（秒），须小于锁的租约时长。
+    """
+
+    def __init__(
+        self,
+        lock: LeaderLock,
+        on_elected: Callable[[], Awaitable[None]],
+        on_demoted: Callable[[], Awaitable[None]],
+        renew_interval: float = 10.0,
+    ) -> None:
+        self._lock = lock
+        self._on_elected = on_elected
+        self._on_demoted = on_demoted
+        self._renew_interval = renew_interval
+        self._is_leader = False
+        self._leader: LeaderInfo | None = None
+        self._task: asyncio.Task[None] | None = None
+
+    @property
+    def is_leader(self) -> bool:
+        return self._is_leader
+
+    @property
+    def leader(self) -> LeaderInfo | None:
+        """最近一个周期观察到的主节点。"""
+        return self._leader
+
+    def status(self) -> dict[str, Any]:
+        """选举状态摘要，供健康检查使用。"""
+        return {
+            "instance_id": self._lock.instance_id,
+            "is_leader": self._is_leader,
+            "leader": self._leader.instance_id if self._leader is not None else None,
+            "leader_since": self._leader.acquired_at.isoformat() if self._leader is not None else None,
+        }
+
+    async def start(self) -> None:
+        """立即竞选一次，随后在后台周期性竞选与续约。"""
+        await self.tick()
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """停止后台周期；当前为主节点时释放锁，供其他实例立即接管。"""
+        if self._task is not None:
+            self._task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._task
+            self._task = None
+        if self._is_leader:
+            self._is_leader = False
+            try:
+                await self._lock.release()
+            except Exception as e:
+                logger.warning("Leader lock release failed", instance_id=self._lock.instance_id, error=str(e))
+            logger.info("Leadership released", instance_id=self._lock.instance_id)
+
+    async def tick(self) -> None:
+        """执行一个竞选/续约周期。"""
+        if self._is_leader:
+            if not await self._call(self._lock.renew):
+                self._is_leader = False
+                logger.warning("Leadership lost", instance_id=self._lock.instance_id)
+                await self._on_demoted()
+        elif await self._call(self._lock.try_acquire):
+            self._is_leader = True
+            logger.info("Elected as scheduler leader", instance_id=self._lock.instance_id)
+            await self._on_elected()
+        with contextlib.suppress(Exception):
+            self._leader = await self._lock.current_leader()
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._renew_interval)
+            await self.tick()
+
+    async def _call(self, op: Callable[[], Awaitable[bool]]) -> bool:
+        """执行锁操作，异常视为失败（数据库不可用时主节点降级，待命节点保持待命）。"""
+        try:
+            return await op()
+        except Exception as e:
+            logger.warning("Leader lock operation failed", instance_id=self._lock.instance_id, error=str(e))
+            return False
@@ -9,16 +9,22 @@ from __future__ import annotations
 from collections.abc import Awaitable, Callable
 from typing import TYPE_CHECKING, TypeAlias
 
+from app.modules.foundation.application.task_dag import TaskDag, TaskDagExecutor
 from app.shared_kernel.infrastructure.logging import get_logger
 
 if TYPE_CHECKING:
+    from app.modules.foundation.application.scheduled_task_config import (
+        ScheduledTaskConfig,
+        TradingCalendarProvider,
+    )
     from app.modules.foundation.application.scheduler import Scheduler
-    from app.modules.foundation.application.scheduled_task_config import ScheduledTaskConfig
+    from app.modules.foundation.application.task_dispatcher import TaskDispatcher
+    from app.modules.foundation.application.task_run_store import TaskRunStore
 
-# 定义任务工厂类型：返回 (configs, task_callables) 元组
+# 定义任务工厂类型：返回 (configs, task_callables) 元组；执行函数可返回本次写入的行数
 ScheduledTaskFactory: TypeAlias = Callable[
     [],
-    tuple[list["ScheduledTaskConfig"], dict[str, Callable[[], Awaitable[None]]]],
+    tuple[list["ScheduledTaskConfig"], dict[str, Callable[[], Awaitable[int | None]]]],
 ]
 
 logger = get_logger(__name__)
@@ -29,16 +35,52 @@ class ModuleRegistry:
 
     业务模块通过 `register_scheduled_tasks()` 方法注册任务工厂，
     应用启动时调用 `register_all_to_scheduler()` 将所有任务注册到调度器。
+    提供交易日历的模块通过 `register_trading_calendar()` 注册，供 TradingDayTrigger 使用。
+
+    全部任务按 depends_on 组成依赖图：只有根任务注册到调度器，下游任务由 TaskDagExecutor
+    在上游成功后启动；所有任务共享 max_concurrent_tasks 个并发名额。
+    配置 dispatcher 时任务在其工作进程中执行，依赖编排与并发控制仍在调度器所在进程。
+    配置 run_store 时每次运行的执行记录写入运行历史。
 
     使用实例变量存储状态，确保不同实例之间状态隔离。
 
     Attributes:
         _scheduled_task_factories: 已注册的任务工厂列表。
+        _trading_calendar: 已注册的交易日历提供者，未注册时调度器按工作日近似。
+        _max_concurrent_tasks: 定时任务全局并发上限。
+        _dispatcher: 任务分派器，为 None 时任务在调度器所在事件循环中执行。
+        _run_store: 运行历史存储，为 None 时执行记录只保留在内存中。
+        _executor: 注册到调度器后生成的依赖图执行器。
     """
 
-    def __init__(self) -> None:
-        """初始化模块注册器。"""
+    def __init__(
+        self,
+        max_concurrent_tasks: int = 4,
+        dispatcher: TaskDispatcher | None = None,
+        run_store: TaskRunStore | None = None,
+    ) -> None:
+        """初始化模块注册器。
+
+        Args:
+            max_concurrent_tasks: 定时任务全局并发上限，默认为 4。
+            dispatcher: 任务分派器，默认为 None（在当前进程执行）。
+            run_store: 运行历史存储，默认为 None。
+        """
         self._scheduled_task_factories: list[ScheduledTaskFactory] = []
+        self._trading_calendar: TradingCalendarProvider | None = None
+        self._max_concurrent_tasks = max_concurrent_tasks
+        self._dispatcher = dispatcher
+        self._run_store = run_store
+        self._executor: TaskDagExecutor | None = None
+
+    @property
+    def dispatcher(self) -> TaskDispatcher | None:
+        return self._dispatcher
+
+    @property
+    def executor(self) -> TaskDagExecutor | None:
+        """依赖图执行器，register_all_to_scheduler() 之前为 None。"""
+        return self._executor
 
     def register_scheduled_tasks(self, factory: ScheduledTaskFactory) -> None:
         """注册任务工厂。
@@ -49,32 +91,71 @@ class ModuleRegistry:
         self._scheduled_task_factories.append(factory)
         logger.debug("Task factory registered", factory=factory.__name__)
 
-    def register_all_to_scheduler(self, scheduler: "Scheduler") -> None:
+    def register_trading_calendar(self, provider: TradingCalendarProvider) -> None:
+        """注册交易日历提供者，后注册的覆盖先注册的。
+
+        Args:
+            provider: 交易日历提供者。
+        """
+        self._trading_calendar = provider
+        logger.debug("Trading calendar registered", provider=type(provider).__name__)
+
+    def register_all_to_scheduler(self, scheduler: Scheduler) -> None:
         """将所有已注册的任务注册到调度器。
 
         Args:
             scheduler: 调度器实例。
 
         Raises:
-            ValueError: 当任务配置没有对应的 callable 时抛出。
+            ValueError: 当任务配置没有对应的 callable、依赖的任务不存在或依赖成环时抛出。
         """
-        for factory in self._scheduled_task_factories:
-            configs, task_callables = factory()
-            self._validate_tasks(configs, task_callables, factory.__name__)
-
-            for config in configs:
-                task_callable = task_callables[config.id]
-                scheduler.add_job(config, task_callable)
+        if self._trading_calendar is not None:
+            scheduler.set_trading_calendar(self._trading_calendar)
+        all_configs, all_callables = self.collect_tasks()
+        if self._dispatcher is not None:
+            all_callables = {task_id: self._dispatcher.remote(task_id) for task_id in all_callables}
+
+        dag = TaskDag(all_configs)
+        self._executor = TaskDagExecutor(dag, all_callables, self._max_concurrent_tasks, self._run_store)
+        for config in dag.roots:
+            scheduler.add_job(config, self._executor.runner_for(config.id))
+            logger.info(
+                "Task registered to scheduler",
+                task_id=config.id,
+                module=config.module,
+            )
+        for config in all_configs:
+            if config.depends_on:
                 logger.info(
-                    "Task registered to scheduler",
+                    "Task registered as downstream",
                     task_id=config.id,
                     module=config.module,
+                    depends_on=list(config.depends_on),
                 )
 
+    def collect_tasks(
+        self,
+    ) -> tuple[list[ScheduledTaskConfig], dict[str, Callable[[], Awaitable[int | None]]]]:
+        """调用全部任务工厂，返回合并后的任务配置与执行函数。
+
+        工作进程也通过本方法按任务 ID 构建执行函数。
+
+        Raises:
+            ValueError: 当任务配置没有对应的 callable 时抛出。
+        """
+        all_configs: list[ScheduledTaskConfig] = []
+        all_callables: dict[str, Callable[[], Awaitable[int | None]]] = {}
+        for factory in self._scheduled_task_factories:
+            configs, task_callables = factory()
+            self._validate_tasks(configs, task_callables, factory.__name__)
+            all_configs.extend(configs)
+            all_callables.update({config.id: task_callables[config.id] for config in configs})
+        return all_configs, all_callables
+
     def _validate_tasks(
         self,
-        configs: list["ScheduledTaskConfig"],
-        task_callables: dict[str, Callable[[], Awaitable[None]]],
+        configs: list[ScheduledTaskConfig],
+        task_callables: dict[str, Callable[[], Awaitable[int | None]]],
         factory_name: str,
     ) -> None:
         """验证任务配置和 callable 的完整性。
@@ -1,12 +1,15 @@
 """调度任务配置相关类。
 
-提供 CronTrigger（cron 触发器值对象）和 ScheduledTaskConfig（任务配置类）。
+提供 CronTrigger（cron 触发器值对象）、TradingDayTrigger（交易日触发器值对象）、
+TradingCalendarProvider（交易日历提供者协议）和 ScheduledTaskConfig（任务配置类）。
 """
 
 from __future__ import annotations
 
 from dataclasses import dataclass
-from typing import Any
+from datetime import date, timedelta
+from enum import StrEnum
+from typing import Any, Protocol, runtime_checkable
 
 
 def _validate_range(value: int, name: str, min_val: int, max_val: int) -> None:
@@ -78,24 +81,129 @@ class CronTrigger:
         return kwargs
 
 
+@runtime_checkable
+class TradingCalendarProvider(Protocol):
+    """交易日历提供者协议，供 TradingDayTrigger 判断某日是否为交易日。
+
+    foundation 不依赖具体业务模块：由业务模块实现并通过 ModuleRegistry 注册。
+    is_trading_day 在调度器计算下次触发时间时同步调用，须只查询内存数据；
+    refresh 在每次触发前调用，用于从持久化存储重新加载。
+    """
+
+    def is_trading_day(self, day: date) -> bool:
+        """判断 day 是否为交易日。"""
+        ...
+
+    async def refresh(self) -> None:
+        """重新加载日历数据。"""
+        ...
+
+
+class WeekdayTradingCalendar:
+    """按工作日近似的交易日历，未注册提供者时的默认实现。"""
+
+    def is_trading_day(self, day: date) -> bool:
+        return day.weekday() < 5
+
+    async def refresh(self) -> None:
+        return None
+
+
+class TradingDayRule(StrEnum):
+    """交易日触发规则。"""
+
+    EVERY_DAY = "every_day"  # 每个交易日（T+0）
+    MONTH_FIRST = "month_first"  # 每月第 offset + 1 个交易日
+    MONTH_LAST = "month_last"  # 每月倒数第 offset + 1 个交易日
+
+
+@dataclass(frozen=True)
+class TradingDayTrigger:
+    """交易日触发器值对象：只在交易所交易日的指定时刻触发。
+
+    示例：
+        - TradingDayTrigger(hour=16, minute=30)：每个交易日 16:30（T+0 16:30）
+        - TradingDayTrigger(hour=9, minute=0, rule=TradingDayRule.MONTH_FIRST)：每月第一个交易日 09:00
+        - TradingDayTrigger(hour=15, minute=30, rule=TradingDayRule.MONTH_LAST, offset=1)：每月倒数第二个交易日
+
+    Attributes:
+        hour: 小时（0-23）。
+        minute: 分钟（0-59）。
+        second: 秒（0-59），默认为 0。
+        rule: 触发规则，默认为每个交易日。
+        offset: 月度规则下相对月初 / 月末的交易日偏移（0-22），每日规则下必须为 0。
+    """
+
+    hour: int
+    minute: int
+    second: int = 0
+    rule: TradingDayRule = TradingDayRule.EVERY_DAY
+    offset: int = 0
+
+    def __post_init__(self) -> None:
+        """初始化后校验字段范围。"""
+        _validate_range(self.hour, "hour", 0, 23)
+        _validate_range(self.minute, "minute", 0, 59)
+        _validate_range(self.second, "second", 0, 59)
+        _validate_range(self.offset, "offset", 0, 22)
+        if self.rule is TradingDayRule.EVERY_DAY and self.offset:
+            raise ValueError("offset is only supported for monthly rules")
+
+    def matches(self, day: date, calendar: TradingCalendarProvider) -> bool:
+        """判断 day 是否为本触发器的触发日。
+
+        Args:
+            day: 待判断的日期。
+            calendar: 交易日历提供者。
+
+        Returns:
+            day 为交易日且满足触发规则时返回 True。
+        """
+        if not calendar.is_trading_day(day):
+            return False
+        if self.rule is TradingDayRule.EVERY_DAY:
+            return True
+        if self.rule is TradingDayRule.MONTH_FIRST:
+            d, before = day.replace(day=1), 0
+            while d < day:
+                before += calendar.is_trading_day(d)
+                d += timedelta(days=1)
+            return before == self.offset
+        d, after = day + timedelta(days=1), 0
+        while d.month == day.month:
+            after += calendar.is_trading_day(d)
+            d += timedelta(days=1)
+        return after == self.offset
+
+
 @dataclass(frozen=True)
 class ScheduledTaskConfig:
     """调度任务配置类，包含任务执行所需的所有配置信息。
 
     Attributes:
         id: 任务唯一标识符（如 'de.sync_stock_daily_increment'）。
-        trigger: Cron 触发器，定义任务执行时间。
+        trigger: 触发器，定义任务执行时间：CronTrigger 按 cron 表达式，TradingDayTrigger 只在交易日触发；
+            声明了 depends_on 的任务由上游完成后启动，trigger 须为 None。
         name: 任务显示名称（如 '同步股票日线'）。
         module: 所属模块名（如 'data_engineering'）。
         max_instances: 最大并发实例数，默认为 1（防止任务重叠）。
         coalesce: 是否合并错过的执行，默认为 True。
         misfire_grace_time: 补执行时间窗口（秒），默认为 7200（2 小时）。
+        depends_on: 上游任务 ID；上游在同一次运行中全部成功后立即启动，默认无依赖。
     """
 
     id: str
-    trigger: CronTrigger
+    trigger: CronTrigger | TradingDayTrigger | None
     name: str
     module: str
     max_instances: int = 1
     coalesce: bool = True
     misfire_grace_time: int = 7200
+    depends_on: tuple[str, ...] = ()
+
+    def __post_init__(self) -> None:
+        """校验触发器与依赖声明二选一。"""
+        if self.depends_on and self.trigger is not None:
+            raise ValueError(f"Task '{self.id}' declares depends_on and must not have its own trigger")
+        if not self.depends_on and self.trigger is None:
+            raise ValueError(f"Task '{self.id}' requires a trigger or depends_on")
@@ -8,7 +8,7 @@ from __future__ import annotations
 from collections.abc import Awaitable, Callable
 from typing import Protocol, runtime_checkable
 
-from app.modules.foundation.application.scheduled_task_config import ScheduledTaskConfig
+from app.modules.foundation.application.scheduled_task_config import ScheduledTaskConfig, TradingCalendarProvider
 
 
 @runtime_checkable
@@ -20,8 +20,12 @@ class Scheduler(Protocol):
 
     Methods:
         add_job: 添加定时任务到调度器。
+        set_trading_calendar: 设置交易日触发器使用的交易日历。
         start: 启动调度器。
         shutdown: 关闭调度器。
+        pause: 暂停触发任务（失去主节点身份时）。
+        resume: 恢复触发任务，尚未启动时启动（成为主节点时）。
+        restore: 从持久化状态恢复停机期间错过的执行。
     """
 
     def add_job(
@@ -37,6 +41,14 @@ class Scheduler(Protocol):
         """
         ...
 
+    def set_trading_calendar(self, provider: TradingCalendarProvider) -> None:
+        """设置 TradingDayTrigger 使用的交易日历提供者。
+
+        Args:
+            provider: 交易日历提供者。
+        """
+        ...
+
     def start(self) -> None:
         """启动调度器，开始触发已注册的任务。"""
         ...
@@ -48,3 +60,15 @@ class Scheduler(Protocol):
             wait: 是否等待正在执行的任务完成。
         """
         ...
+
+    def pause(self) -> None:
+        """暂停触发任务，正在执行的任务不受影响。"""
+        ...
+
+    def resume(self) -> None:
+        """恢复触发任务；尚未启动时启动调度器。"""
+        ...
+
+    async def restore(self) -> None:
+        """从持久化状态恢复停机期间错过的执行，在 start()/resume() 之前调用。"""
+        ...
@@ -0,0 +1,25 @@
+"""调度器状态持久化抽象接口。
+
+调度器只在内存中保存任务的下次执行时间，重启后会丢失错过的执行，misfire_grace_time 与 coalesce 形同虚设。
+SchedulerStateStore 持久化每个任务的下次执行时间；调度器启动（或成为主节点）时恢复，
+重启期间错过的执行按 misfire_grace_time 与 coalesce 补执行或跳过。
+"""
+
+from __future__ import annotations
+
+from abc import ABC, abstractmethod
+from datetime import datetime
+
+
+class SchedulerStateStore(ABC):
+    """任务下次执行时间的存储。每个方法自行管理事务，调用即落库。"""
+
+    @abstractmethod
+    async def load_next_run_times(self) -> dict[str, datetime]:
+        """全部任务的下次执行时间，任务 ID 到时间（UTC）的映射。"""
+        ...
+
+    @abstractmethod
+    async def save_next_run_time(self, task_id: str, next_run_time: datetime | None) -> None:
+        """保存任务的下次执行时间，None 表示任务不再触发。"""
+        ...
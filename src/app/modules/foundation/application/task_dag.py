@@ -0,0 +1,207 @@
+"""定时任务依赖图与执行器。
+
+提供 TaskDag（由 depends_on 构建的有向无环图）、TaskRunRecord（单个任务的一次执行记录）
+与 TaskDagExecutor（按依赖顺序并行执行下游任务，受全局并发上限约束）。
+
+任务执行函数可返回本次写入的行数（int），记录在 TaskRunRecord.rows 中；返回 None 表示不统计。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from collections import deque
+from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime
+from uuid import uuid4
+
+from app.modules.foundation.application.scheduled_task_config import ScheduledTaskConfig
+from app.modules.foundation.application.task_run_store import TaskRunRecord, TaskRunStatus, TaskRunStore
+from app.shared_kernel.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 执行器在内存中保留的最近执行记录数
+_RECENT_RUNS_LIMIT = 200
+
+
+class TaskDag:
+    """由 ScheduledTaskConfig.depends_on 构建的任务依赖图。
+
+    构建时校验：依赖的任务必须存在，且不能成环。
+    无 depends_on 的任务为根任务，由自身触发器启动；其余任务在上游全部成功后立即启动。
+    """
+
+    def __init__(self, configs: list[ScheduledTaskConfig]) -> None:
+        self._configs = {c.id: c for c in configs}
+        self._downstream: dict[str, list[str]] = {c.id: [] for c in configs}
+        for config in configs:
+            for upstream in config.depends_on:
+                if upstream not in self._configs:
+                    raise ValueError(f"Task '{config.id}' depends on unknown task '{upstream}'")
+                self._downstream[upstream].append(config.id)
+        self._check_acyclic()
+
+    @property
+    def roots(self) -> list[ScheduledTaskConfig]:
+        """无上游依赖、由触发器启动的任务。"""
+        return [c for c in self._configs.values() if not c.depends_on]
+
+    def config(self, task_id: str) -> ScheduledTaskConfig:
+        return self._configs[task_id]
+
+    def reachable_from(self, root_id: str) -> list[str]:
+        """根任务及其全部（传递）下游任务，按拓扑序排列。"""
+        seen = {root_id}
+        queue = deque([root_id])
+        while queue:
+            for child in self._downstream[queue.popleft()]:
+                if child not in seen:
+                    seen.add(child)
+                    queue.append(child)
+        return [task_id for task_id in self._topological_order() if task_id in seen]
+
+    def _topological_order(self) -> list[str]:
+        indegree = {task_id: len(c.depends_on) for task_id, c in self._configs.items()}
+        queue = deque(task_id for task_id, d in indegree.items() if d == 0)
+        order: list[str] = []
+        while queue:
+            task_id = queue.popleft()
+            order.append(task_id)
+            for child in self._downstream[task_id]:
+                indegree[child] -= 1
+                if indegree[child] == 0:
+                    queue.append(child)
+        return order
+
+    def _check_acyclic(self) -> None:
+        order = self._topological_order()
+        if len(order) != len(self._configs):
+            cyclic = sorted(set(self._configs) - set(order))
+            raise ValueError(f"Task dependencies contain a cycle: {cyclic}")
+
+
+class TaskDagExecutor:
+    """按依赖图执行一次触发：根任务完成后，下游任务在其全部上游成功时立即启动。
+
+    无依赖关系的分支并行执行；所有运行共享同一个信号量，同时执行的任务数不超过 max_concurrency。
+    上游失败时下游标记为 SKIPPED。最近的执行记录保留在内存中；配置 run_store 时每次运行结束后写入运行历史，
+    写入失败只记录日志，不影响任务结果。
+
+    Attributes:
+        _dag: 任务依赖图。
+        _callables: 任务 ID 到执行函数的映射。
+        _semaphore: 全局并发上限。
+        _run_store: 运行历史存储。
+    """
+
+    def __init__(
+        self,
+        dag: TaskDag,
+        callables: dict[str, Callable[[], Awaitable[int | None]]],
+        max_concurrency: int = 4,
+        run_store: TaskRunStore | None = None,
+    ) -> None:
+        self._dag = dag
+        self._callables = callables
+        self._max_concurrency = max(1, max_concurrency)
+        self._run_store = run_store
+        self._semaphore: asyncio.Semaphore | None = None
+        self._recent: deque[TaskRunRecord] = deque(maxlen=_RECENT_RUNS_LIMIT)
+
+    def recent_runs(self, task_id: str | None = None) -> list[TaskRunRecord]:
+        """最近的执行记录，按结束时间先后排列。"""
+        return [r for r in self._recent if task_id is None or r.task_id == task_id]
+
+    def runner_for(self, root_id: str) -> Callable[[], Awaitable[None]]:
+        """返回以 root_id 为根执行一次的无参 async callable，供调度器注册。"""
+
+        async def run() -> None:
+            await self.run(root_id)
+
+        return run
+
+    async def run(self, root_id: str) -> list[TaskRunRecord]:
+        """执行 root_id 及其全部下游任务。
+
+        Returns:
+            本次运行各任务的执行记录（按拓扑序）。
+
+        Raises:
+            Exception: 有任务失败时，在全部可执行任务结束后重新抛出第一个失败任务的异常。
+        """
+        if self._semaphore is None:
+            self._semaphore = asyncio.Semaphore(self._max_concurrency)
+        semaphore = self._semaphore
+        run_id = uuid4().hex
+        task_ids = self._dag.reachable_from(root_id)
+        in_run = set(task_ids)
+        done: dict[str, asyncio.Future[TaskRunStatus]] = {
+            task_id: asyncio.get_running_loop().create_future() for task_id in task_ids
+        }
+        records: dict[str, TaskRunRecord] = {}
+        errors: list[BaseException] = []
+        started = time.perf_counter()
+
+        async def execute(task_id: str) -> None:
+            upstreams = [u for u in self._dag.config(task_id).depends_on if u in in_run]
+            upstream_status = [await done[u] for u in upstreams]
+            if any(s is not TaskRunStatus.SUCCEEDED for s in upstream_status):
+                records[task_id] = TaskRunRecord(
+                    run_id=run_id,
+                    task_id=task_id,
+                    root_id=root_id,
+                    status=TaskRunStatus.SKIPPED,
+                    started_at=None,
+                    finished_at=datetime.now(UTC),
+                )
+                logger.warning("DAG task skipped due to upstream failure", run_id=run_id, task_id=task_id)
+                done[task_id].set_result(TaskRunStatus.SKIPPED)
+                return
+            ready = time.perf_counter()
+            async with semaphore:
+                wait_ms = int((time.perf_counter() - ready) * 1000)
+                started_at = datetime.now(UTC)
+                task_start = time.perf_counter()
+                status, error, rows = TaskRunStatus.SUCCEEDED, None, None
+                try:
+                    result = await self._callables[task_id]()
+                    if isinstance(result, int) and not isinstance(result, bool):
+                        rows = result
+                except Exception as e:
+                    status, error = TaskRunStatus.FAILED, f"{type(e).__name__}: {e}"
+                    errors.append(e)
+                records[task_id] = TaskRunRecord(
+                    run_id=run_id,
+                    task_id=task_id,
+                    root_id=root_id,
+                    status=status,
+                    started_at=started_at,
+                    finished_at=datetime.now(UTC),
+                    duration_ms=int((time.perf_counter() - task_start) * 1000),
+                    wait_ms=wait_ms,
+                    rows=rows,
+                    error=error,
+                )
+            done[task_id].set_result(status)
+
+        await asyncio.gather(*(execute(task_id) for task_id in task_ids))
+
+        ordered = [records[task_id] for task_id in task_ids]
+        self._recent.extend(sorted(ordered, key=lambda r: r.finished_at))
+        if self._run_store is not None:
+            try:
+                await self._run_store.add_many(ordered)
+            except Exception as e:
+                logger.warning("Task run history write failed", run_id=run_id, root_id=root_id, error=str(e))
+        if len(ordered) > 1:
+            logger.info(
+                "DAG run finished",
+                run_id=run_id,
+                root_id=root_id,
+                duration_ms=int((time.perf_counter() - started) * 1000),
+                tasks={r.task_id: {"status": r.status.value, "duration_ms": r.duration_ms} for r in ordered},
+            )
+        if errors:
+            raise errors[0]
+        return ordered
@@ -0,0 +1,43 @@
+"""定时任务分派抽象接口。
+
+定义 TaskDispatcher Protocol：决定定时任务在哪里执行。未配置分派器时任务在调度器所在的事件循环中执行；
+配置后由分派器在独立的工作进程中执行，执行结果与日志回传主进程。
+"""
+
+from __future__ import annotations
+
+from collections.abc import Awaitable, Callable
+from typing import Protocol, runtime_checkable
+
+
+class RemoteTaskError(Exception):
+    """任务在工作进程中执行失败。异常对象不跨进程传递，只携带类型、消息与堆栈文本。"""
+
+
+@runtime_checkable
+class TaskDispatcher(Protocol):
+    """定时任务分派器。
+
+    Methods:
+        remote: 返回在工作进程中执行指定任务的 async callable，可直接注册到调度器或依赖图执行器。
+        shutdown: 关闭工作进程。
+    """
+
+    def remote(self, task_id: str) -> Callable[[], Awaitable[int | None]]:
+        """返回在工作进程中执行 task_id 的无参 async callable，其返回值为任务返回的写入行数。
+
+        Args:
+            task_id: 任务 ID，工作进程按 ID 查找自己构建的任务执行函数。
+
+        Raises:
+            RemoteTaskError: （调用返回的 callable 时）任务在工作进程中失败。
+        """
+        ...
+
+    async def shutdown(self, wait: bool = True) -> None:
+        """关闭工作进程。
+
+        Args:
+            wait: 是否等待正在执行的任务完成；未开始的任务均被取消。
+        """
+        ...
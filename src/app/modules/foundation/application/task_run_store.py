@@ -0,0 +1,131 @@
+"""定时任务运行历史。
+
+定义 TaskRunRecord（任务的一次执行记录）、TaskRunStore（运行历史存储抽象）
+与 summarize_runs()（按任务汇总次数、成功率与耗时分位数，用于发现夜间链路的性能回退）。
+"""
+
+from __future__ import annotations
+
+import math
+from abc import ABC, abstractmethod
+from collections import defaultdict
+from dataclasses import dataclass
+from datetime import datetime
+from enum import StrEnum
+
+
+class TaskRunStatus(StrEnum):
+    """任务单次执行状态。"""
+
+    SUCCEEDED = "succeeded"
+    FAILED = "failed"
+    SKIPPED = "skipped"  # 上游失败，本次未执行
+
+
+@dataclass(frozen=True)
+class TaskRunRecord:
+    """任务的一次执行记录。
+
+    Attributes:
+        run_id: 所属 DAG 运行 ID，同一次触发下的任务共享。
+        task_id: 任务 ID。
+        root_id: 触发本次运行的根任务 ID。
+        status: 执行状态。
+        started_at: 开始时间（UTC），跳过的任务为 None。
+        finished_at: 结束时间（UTC）。
+        duration_ms: 执行耗时（毫秒）。
+        wait_ms: 上游全部完成后等待并发名额的时间（毫秒）。
+        rows: 任务返回的写入行数，未统计时为 None。
+        error: 失败原因。
+    """
+
+    run_id: str
+    task_id: str
+    root_id: str
+    status: TaskRunStatus
+    started_at: datetime | None
+    finished_at: datetime
+    duration_ms: int = 0
+    wait_ms: int = 0
+    rows: int | None = None
+    error: str | None = None
+
+
+@dataclass(frozen=True)
+class TaskRunStats:
+    """单个任务在统计窗口内的运行汇总。耗时分位数只统计成功的运行。
+
+    Attributes:
+        task_id: 任务 ID。
+        runs: 运行次数（含失败与跳过）。
+        succeeded: 成功次数。
+        failed: 失败次数。
+        skipped: 因上游失败跳过的次数。
+        p50_ms: 成功运行耗时的中位数（毫秒），无成功运行时为 None。
+        p95_ms: 成功运行耗时的 95 分位数（毫秒），无成功运行时为 None。
+        last_status: 最近一次运行的状态。
+        last_finished_at: 最近一次运行的结束时间。
+    """
+
+    task_id: str
+    runs: int
+    succeeded: int
+    failed: int
+    skipped: int
+    p50_ms: int | None
+    p95_ms: int | None
+    last_status: TaskRunStatus
+    last_finished_at: datetime
+
+
+def _percentile(sorted_values: list[int], pct: float) -> int | None:
+    """最近秩法分位数。"""
+    if not sorted_values:
+        return None
+    rank = max(1, math.ceil(pct / 100 * len(sorted_values)))
+    return sorted_values[rank - 1]
+
+
+def summarize_runs(records: list[TaskRunRecord]) -> list[TaskRunStats]:
+    """按任务汇总运行记录，结果按任务 ID 排序。"""
+    by_task: dict[str, list[TaskRunRecord]] = defaultdict(list)
+    for record in records:
+        by_task[record.task_id].append(record)
+    stats: list[TaskRunStats] = []
+    for task_id in sorted(by_task):
+        runs = by_task[task_id]
+        durations = sorted(r.duration_ms for r in runs if r.status is TaskRunStatus.SUCCEEDED)
+        last = max(runs, key=lambda r: r.finished_at)
+        stats.append(
+            TaskRunStats(
+                task_id=task_id,
+                runs=len(runs),
+                succeeded=len(durations),
+                failed=sum(1 for r in runs if r.status is TaskRunStatus.FAILED),
+                skipped=sum(1 for r in runs if r.status is TaskRunStatus.SKIPPED),
+                p50_ms=_percentile(durations, 50),
+                p95_ms=_percentile(durations, 95),
+                last_status=last.status,
+                last_finished_at=last.finished_at,
+            )
+        )
+    return stats
+
+
+class TaskRunStore(ABC):
+    """定时任务运行历史存储。每个方法自行管理事务，调用即落库。"""
+
+    @abstractmethod
+    async def add_many(self, records: list[TaskRunRecord]) -> None:
+        """写入一次 DAG 运行的全部记录。"""
+        ...
+
+    @abstractmethod
+    async def find_recent(self, task_id: str | None = None, limit: int = 50) -> list[TaskRunRecord]:
+        """最近的运行记录，按结束时间倒序；task_id 为空时返回全部任务。"""
+        ...
+
+    @abstractmethod
+    async def find_since(self, since: datetime) -> list[TaskRunRecord]:
+        """结束时间不早于 since 的全部运行记录，供汇总统计。"""
+        ...
@@ -0,0 +1,361 @@
+"""基于 asyncio 的进程内后台任务执行器。
+
+提供 AsyncIOJobRunner 类，实现 JobRunner Protocol。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import socket
+from collections import defaultdict
+from collections.abc import AsyncIterator
+from dataclasses import replace
+from datetime import UTC, datetime, timedelta
+from typing import Any
+from uuid import uuid4
+
+from app.modules.foundation.application.background_job import BackgroundJob, JobStatus
+from app.modules.foundation.application.job_runner import JobContext, JobFactory, JobInterrupted, JobRunner
+from app.modules.foundation.application.job_store import BackgroundJobStore
+from app.shared_kernel.application.cancellation import CancellationToken
+from app.shared_kernel.application.progress import ProgressReporter
+from app.shared_kernel.domain.exception import NotFoundException, ValidationException
+from app.shared_kernel.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 单个订阅者最多积压的快照数，超出时丢弃最旧的快照（订阅方只关心最新进度）
+_SUBSCRIBER_QUEUE_SIZE = 100
+
+
+class _JobProgressReporter(ProgressReporter):
+    """将 Handler 的进度写入内存中的任务快照并通知订阅者，落库由执行器定期批量完成。"""
+
+    def __init__(self, runner: AsyncIOJobRunner, job: BackgroundJob) -> None:
+        self._runner = runner
+        self._job = job
+        self.dirty = False
+
+    def report(self, **counters: int) -> None:
+        self._job.progress.update(counters)
+        self.dirty = True
+        self._runner._notify(self._job)
+
+
+class AsyncIOJobRunner(JobRunner):
+    """进程内有界工作池：固定数量的工作协程从队列中取任务执行。
+
+    任务状态在提交、开始、结束时立即落库，进度按 progress_flush_seconds 节流落库；
+    进程重启后，遗留的 PENDING / RUNNING 任务会按原 ID 与参数重新入队。
+    关闭时先置位取消标记，给任务 shutdown_timeout_seconds 在安全点保存断点，再强制取消。
+
+    多个 worker / 副本共用同一任务表：任务开始执行前先经 store.claim() 原子认领，执行期间随进度落库续约，
+    因此同一任务同一时刻只在一个实例上运行。启动时及此后每隔 lease_seconds 扫描未完成任务，
+    只认领无持有者或租约已过期的任务（即持有实例已退出），存活实例正在执行的任务不会被重复执行。
+    认领后的状态写入均以本实例仍为持有者为条件；落库持续失败导致租约过期、任务被其他实例接管时，
+    下一次写入即发现租约丢失，本实例经取消标记停止任务且不再写入。
+
+    Attributes:
+        _store: 任务状态存储。
+        _max_workers: 工作协程数量，即最大并发任务数。
+        _progress_flush_seconds: 进度落库间隔（秒）。
+        _heartbeat_seconds: 订阅者无更新时重新读取状态的间隔（秒）。
+        _shutdown_timeout_seconds: 关闭时等待任务保存断点的默认秒数。
+        _instance_id: 本执行器实例标识，作为任务持有者写入任务表。
+        _lease: 任务认领租约时长，持有实例失联后其任务最迟在此时间后可被其他实例接管。
+    """
+
+    def __init__(
+        self,
+        store: BackgroundJobStore,
+        max_workers: int = 2,
+        progress_flush_seconds: float = 2.0,
+        heartbeat_seconds: float = 15.0,
+        shutdown_timeout_seconds: float = 30.0,
+        lease_seconds: float = 60.0,
+        instance_id: str | None = None,
+    ) -> None:
+        self._store = store
+        self._max_workers = max_workers
+        self._progress_flush_seconds = progress_flush_seconds
+        self._heartbeat_seconds = heartbeat_seconds
+        self._shutdown_timeout_seconds = shutdown_timeout_seconds
+        self._lease = timedelta(seconds=lease_seconds)
+        self._instance_id = instance_id or f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self._factories: dict[str, JobFactory] = {}
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._active: dict[str, BackgroundJob] = {}
+        self._subscribers: defaultdict[str, set[asyncio.Queue[BackgroundJob]]] = defaultdict(set)
+        self._workers: list[asyncio.Task[None]] = []
+        self._recovery: asyncio.Task[None] | None = None
+        self._running: dict[str, tuple[asyncio.Task[None], CancellationToken]] = {}
+        self._stopping = False
+
+    def register(self, job_type: str, factory: JobFactory) -> None:
+        self._factories[job_type] = factory
+        logger.debug("Job type registered", job_type=job_type)
+
+    async def submit(self, job_type: str, params: dict[str, Any] | None = None) -> BackgroundJob:
+        if job_type not in self._factories:
+            raise ValueError(f"Unknown job type: '{job_type}'")
+        job = BackgroundJob(
+            id=uuid4().hex,
+            job_type=job_type,
+            params=dict(params or {}),
+            status=JobStatus.PENDING,
+            created_at=datetime.now(UTC),
+            owner=self._instance_id,
+        )
+        self._extend_lease(job)
+        await self._store.save(job)
+        self._enqueue(job)
+        logger.info("Job submitted", job_id=job.id, job_type=job_type, params=job.params)
+        return self._snapshot(job)
+
+    async def get(self, job_id: str) -> BackgroundJob | None:
+        job = self._active.get(job_id)
+        if job is not None:
+            return self._snapshot(job)
+        return await self._store.get(job_id)
+
+    async def resume(self, job_id: str) -> BackgroundJob:
+        if job_id in self._active:
+            raise ValidationException(f"Job is already queued or running: {job_id}")
+        job = await self._store.get(job_id)
+        if job is None:
+            raise NotFoundException(f"Job not found: {job_id}")
+        if job.status is not JobStatus.FAILED:
+            raise ValidationException(f"Only failed jobs can be resumed, got '{job.status.value}'")
+        job.status = JobStatus.PENDING
+        job.error = None
+        job.started_at = None
+        job.finished_at = None
+        job.owner = self._instance_id
+        self._extend_lease(job)
+        await self._store.save(job)
+        self._enqueue(job)
+        logger.info("Job resumed", job_id=job.id, job_type=job.job_type)
+        return self._snapshot(job)
+
+    async def subscribe(self, job_id: str) -> AsyncIterator[BackgroundJob]:
+        queue: asyncio.Queue[BackgroundJob] = asyncio.Queue(maxsize=_SUBSCRIBER_QUEUE_SIZE)
+        # 先登记再读取当前状态，避免两者之间的状态变化被漏掉
+        self._subscribers[job_id].add(queue)
+        try:
+            job = await self.get(job_id)
+            if job is None:
+                return
+            yield job
+            while not job.status.is_terminal:
+                try:
+                    job = await asyncio.wait_for(queue.get(), timeout=self._heartbeat_seconds)
+                except TimeoutError:
+                    # 任务可能由其他进程执行：定期从存储重新读取
+                    job = await self.get(job_id) or job
+                yield job
+        finally:
+            self._subscribers[job_id].discard(queue)
+            if not self._subscribers[job_id]:
+                del self._subscribers[job_id]
+
+    async def start(self) -> None:
+        self._stopping = False
+        await self._recover()
+        self._workers = [asyncio.create_task(self._worker(), name=f"job-worker-{i}") for i in range(self._max_workers)]
+        self._recovery = asyncio.create_task(self._recovery_loop(), name="job-recovery")
+        logger.info("Job runner started", max_workers=self._max_workers, instance_id=self._instance_id)
+
+    async def shutdown(self, timeout: float | None = None) -> None:
+        timeout = self._shutdown_timeout_seconds if timeout is None else timeout
+        self._stopping = True
+        if self._recovery is not None:
+            self._recovery.cancel()
+            await asyncio.gather(self._recovery, return_exceptions=True)
+            self._recovery = None
+        running = dict(self._running)
+        for _task, token in running.values():
+            token.cancel()
+        if running:
+            logger.info("Waiting for jobs to checkpoint", job_ids=list(running), timeout=timeout)
+            _done, pending = await asyncio.wait([task for task, _ in running.values()], timeout=timeout)
+            if pending:
+                logger.warning("Jobs did not checkpoint before deadline", pending=len(pending))
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+        # 未完成的任务（排队中或被强制取消）释放认领，其他实例无需等待租约过期即可接管
+        for job_id in list(self._active):
+            try:
+                await self._store.release(job_id, self._instance_id)
+            except Exception as e:
+                logger.warning("Job lease release failed", job_id=job_id, error=str(e))
+        logger.info("Job runner shut down", unfinished_jobs=len(self._active))
+
+    async def _recover(self) -> None:
+        """认领已退出实例遗留的未完成任务，按原参数重新入队；其他存活实例持有的任务跳过。"""
+        try:
+            leftovers = await self._store.find_by_status([JobStatus.PENDING, JobStatus.RUNNING])
+            for job in leftovers:
+                if job.id in self._active or not await self._claim(job):
+                    continue
+                job.status = JobStatus.PENDING
+                job.started_at = None
+                await self._store.save(job)
+                self._enqueue(job)
+                logger.info("Job recovered", job_id=job.id, job_type=job.job_type)
+        except Exception as e:
+            logger.warning("Job recovery skipped", error=str(e))
+
+    async def _recovery_loop(self) -> None:
+        """定期接管租约过期的任务：持有实例崩溃后，无需等待任何进程重启。"""
+        while True:
+            await asyncio.sleep(self._lease.total_seconds())
+            await self._recover()
+
+    async def _claim(self, job: BackgroundJob) -> bool:
+        lease_expires_at = datetime.now(UTC) + self._lease
+        if not await self._store.claim(job.id, self._instance_id, lease_expires_at):
+            return False
+        job.owner = self._instance_id
+        job.lease_expires_at = lease_expires_at
+        return True
+
+    def _extend_lease(self, job: BackgroundJob) -> None:
+        job.lease_expires_at = datetime.now(UTC) + self._lease
+
+    def _lease_due(self, job: BackgroundJob) -> bool:
+        """租约已过半，需要续约。"""
+        return job.lease_expires_at is None or job.lease_expires_at - datetime.now(UTC) < self._lease / 2
+
+    def _enqueue(self, job: BackgroundJob) -> None:
+        self._active[job.id] = job
+        self._queue.put_nowait(job.id)
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            token = CancellationToken()
+            run = asyncio.create_task(self._run(self._active[job_id], token))
+            self._running[job_id] = (run, token)
+            try:
+                await run
+            except Exception as e:
+                # 状态落库失败等执行器自身异常：记录后继续处理后续任务
+                logger.error("Job runner error", job_id=job_id, error=str(e), exc_info=True)
+                self._active.pop(job_id, None)
+            finally:
+                self._running.pop(job_id, None)
+                self._queue.task_done()
+
+    async def _run(self, job: BackgroundJob, token: CancellationToken) -> None:
+        if self._stopping:
+            # 关闭过程中不再启动新任务，保持 PENDING 等待下次启动
+            del self._active[job.id]
+            return
+        if not await self._claim(job):
+            # 排队期间租约过期，已由其他实例认领执行
+            del self._active[job.id]
+            logger.info("Job claimed by another instance", job_id=job.id, job_type=job.job_type)
+            return
+        factory = self._factories.get(job.job_type)
+        job.status = JobStatus.RUNNING
+        job.started_at = datetime.now(UTC)
+        if not await self._persist(job):
+            del self._active[job.id]
+            return
+        logger.info("Job started", job_id=job.id, job_type=job.job_type)
+
+        try:
+            if factory is None:
+                raise ValueError(f"Unknown job type: '{job.job_type}'")
+            reporter = _JobProgressReporter(self, job)
+            task = asyncio.ensure_future(factory(dict(job.params), JobContext(job.id, reporter, token)))
+            try:
+                while True:
+                    done, _ = await asyncio.wait({task}, timeout=self._progress_flush_seconds)
+                    if reporter.dirty or self._lease_due(job):
+                        reporter.dirty = False
+                        if not await self._flush_progress(job):
+                            await self._abandon(job, task, token)
+                            return
+                    if done:
+                        break
+            except asyncio.CancelledError:
+                task.cancel()
+                raise
+            job.result = task.result()
+            job.status = JobStatus.SUCCEEDED
+        except asyncio.CancelledError:
+            # 进程关闭：保留 RUNNING 状态，重启后重新入队
+            raise
+        except JobInterrupted:
+            # 任务已在安全点保存断点：回到 PENDING，重启后按原 ID 续跑
+            job.status = JobStatus.PENDING
+            job.owner = None
+            job.lease_expires_at = None
+            await self._flush_progress(job)
+            self._notify(job)
+            del self._active[job.id]
+            logger.info("Job checkpointed", job_id=job.id, job_type=job.job_type, progress=job.progress)
+            return
+        except Exception as e:
+            job.status = JobStatus.FAILED
+            job.error = f"{type(e).__name__}: {e}"
+            logger.error("Job failed", job_id=job.id, job_type=job.job_type, error=job.error, exc_info=True)
+
+        job.finished_at = datetime.now(UTC)
+        job.lease_expires_at = None
+        persisted = await self._persist(job)
+        del self._active[job.id]
+        if not persisted:
+            return
+        logger.info(
+            "Job finished",
+            job_id=job.id,
+            job_type=job.job_type,
+            status=job.status.value,
+            duration_ms=int((job.finished_at - job.started_at).total_seconds() * 1000) if job.started_at else None,
+        )
+
+    async def _persist(self, job: BackgroundJob) -> bool:
+        """以本实例为持有者写入状态，返回 False 表示租约已被其他实例接管、未写入。"""
+        if job.status is JobStatus.RUNNING:
+            self._extend_lease(job)
+        if not await self._store.save_if_owned(self._snapshot(job), self._instance_id):
+            logger.warning("Job lease lost", job_id=job.id, job_type=job.job_type, status=job.status.value)
+            return False
+        self._notify(job)
+        return True
+
+    async def _flush_progress(self, job: BackgroundJob) -> bool:
+        """进度落库（同时续约）。写入异常不影响任务本身，下次刷新会覆盖；返回 False 仅表示租约已被接管。"""
+        if job.status is JobStatus.RUNNING:
+            self._extend_lease(job)
+        try:
+            owned = await self._store.save_if_owned(self._snapshot(job), self._instance_id)
+        except Exception as e:
+            logger.warning("Job progress flush failed", job_id=job.id, error=str(e))
+            return True
+        if not owned:
+            logger.warning("Job lease lost", job_id=job.id, job_type=job.job_type, status=job.status.value)
+        return owned
+
+    async def _abandon(self, job: BackgroundJob, task: asyncio.Future[Any], token: CancellationToken) -> None:
+        """租约已被其他实例接管：经取消标记让任务在安全点停止，等待其退出，不再写入任务状态。"""
+        token.cancel()
+        await asyncio.gather(task, return_exceptions=True)
+        del self._active[job.id]
+        logger.info("Job abandoned after losing lease", job_id=job.id, job_type=job.job_type)
+
+    def _notify(self, job: BackgroundJob) -> None:
+        snapshot = self._snapshot(job)
+        for queue in self._subscribers.get(job.id, ()):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(snapshot)
+
+    @staticmethod
+    def _snapshot(job: BackgroundJob) -> BackgroundJob:
+        return replace(job, params=dict(job.params), progress=dict(job.progress))
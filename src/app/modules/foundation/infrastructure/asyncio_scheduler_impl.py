@@ -7,30 +7,59 @@ from __future__ import annotations
 
 import time
 from collections.abc import Awaitable, Callable
-from typing import Any
+from datetime import UTC, date, datetime
 
 from apscheduler.schedulers.asyncio import AsyncIOScheduler
+from apscheduler.triggers.base import BaseTrigger
 from apscheduler.triggers.cron import CronTrigger as APSchedulerCronTrigger
 
-from app.modules.foundation.application.scheduled_task_config import ScheduledTaskConfig
+from app.modules.foundation.application.scheduled_task_config import (
+    ScheduledTaskConfig,
+    TradingCalendarProvider,
+    TradingDayTrigger,
+    WeekdayTradingCalendar,
+)
 from app.modules.foundation.application.scheduler import Scheduler
+from app.modules.foundation.application.scheduler_state_store import SchedulerStateStore
 from app.shared_kernel.infrastructure.logging import get_logger
 
+from .trading_day_trigger import APSchedulerTradingDayTrigger
+
 logger = get_logger(__name__)
 
 
 class AsyncIOSchedulerImpl(Scheduler):
     """基于 APScheduler AsyncIOScheduler 的调度器实现。
 
-    使用内存 Job Store，支持 cron 触发器，提供详细的结构化日志记录。
+    使用内存 Job Store，支持 cron 触发器与交易日触发器，提供详细的结构化日志记录。
+    交易日触发的任务在执行前刷新交易日历并再次确认当天为触发日，日历更新后不会在新增的休市日执行。
+    配置 state_store 时每次触发都保存任务的下次执行时间，restore() 将停机期间错过的执行时间恢复到内存 Job Store，
+    由 APScheduler 按 misfire_grace_time 与 coalesce 决定补执行或跳过。
 
     Attributes:
         _scheduler: APScheduler AsyncIOScheduler 实例。
+        _trading_calendar: 交易日触发器使用的交易日历，默认按工作日近似。
+        _state_store: 任务下次执行时间的持久化存储，为 None 时不持久化。
     """
 
-    def __init__(self) -> None:
-        """初始化调度器，创建 AsyncIOScheduler 实例（使用内存 Job Store）。"""
+    def __init__(self, state_store: SchedulerStateStore | None = None) -> None:
+        """初始化调度器，创建 AsyncIOScheduler 实例（使用内存 Job Store）。
+
+        Args:
+            state_store: 任务下次执行时间的持久化存储，默认为 None。
+        """
         self._scheduler = AsyncIOScheduler()
+        self._trading_calendar: TradingCalendarProvider = WeekdayTradingCalendar()
+        self._state_store = state_store
+
+    def set_trading_calendar(self, provider: TradingCalendarProvider) -> None:
+        """设置交易日触发器使用的交易日历提供者。
+
+        Args:
+            provider: 交易日历提供者。
+        """
+        self._trading_calendar = provider
+        logger.info("Trading calendar set", provider=type(provider).__name__)
 
     def add_job(
         self,
@@ -42,10 +71,18 @@ class AsyncIOSchedulerImpl(Scheduler):
         Args:
             config: 任务配置，包含触发器、任务 ID 等信息。
             task_callable: 任务执行函数，无参数 async callable。
+
+        Raises:
+            ValueError: 任务没有触发器（声明 depends_on 的任务由上游完成后启动，不注册到调度器）。
         """
-        # 创建 APScheduler CronTrigger
-        trigger_kwargs = config.trigger.to_cron_kwargs()
-        trigger = APSchedulerCronTrigger(**trigger_kwargs)
+        trigger: BaseTrigger
+        if config.trigger is None:
+            raise ValueError(f"Task '{config.id}' has no trigger; tasks with depends_on are started by their upstream")
+        if isinstance(config.trigger, TradingDayTrigger):
+            trigger = APSchedulerTradingDayTrigger(config.trigger, lambda: self._trading_calendar)
+            task_callable = self._wrap_task_with_trading_day_check(config.trigger, config, task_callable)
+        else:
+            trigger = APSchedulerCronTrigger(**config.trigger.to_cron_kwargs())
 
         # 包装任务以添加日志记录
         wrapped_callable = self._wrap_task_with_logging(config, task_callable)
@@ -78,9 +115,77 @@ class AsyncIOSchedulerImpl(Scheduler):
         Args:
             wait: 是否等待正在执行的任务完成。
         """
+        if not self._scheduler.running:
+            return
         self._scheduler.shutdown(wait=wait)
         logger.info("Scheduler shut down", wait=wait)
 
+    async def restore(self) -> None:
+        """恢复停机期间错过的执行时间。
+
+        已保存且早于当前时间的下次执行时间写回对应任务，启动或恢复后由 APScheduler 判定补执行或跳过；
+        尚无保存记录的任务写入其按触发器计算的下次执行时间。
+        """
+        if self._state_store is None:
+            return
+        try:
+            stored = await self._state_store.load_next_run_times()
+        except Exception as e:
+            logger.warning("Scheduler state restore failed", error=str(e))
+            return
+        now = datetime.now(UTC)
+        for job in self._scheduler.get_jobs():
+            next_run_time = stored.get(job.id)
+            if next_run_time is None:
+                await self._save_next_run_time(job.id, job.trigger.get_next_fire_time(None, now))
+            elif next_run_time < now:
+                self._scheduler.modify_job(job.id, next_run_time=next_run_time)
+                logger.info("Missed run restored", task_id=job.id, scheduled_at=next_run_time.isoformat())
+
+    def pause(self) -> None:
+        """暂停触发任务，正在执行的任务不受影响。"""
+        if self._scheduler.running:
+            self._scheduler.pause()
+            logger.info("Scheduler paused")
+
+    def resume(self) -> None:
+        """恢复触发任务；尚未启动时启动调度器。"""
+        if not self._scheduler.running:
+            self.start()
+            return
+        self._scheduler.resume()
+        logger.info("Scheduler resumed")
+
+    def _wrap_task_with_trading_day_check(
+        self,
+        trading_trigger: TradingDayTrigger,
+        config: ScheduledTaskConfig,
+        task_callable: Callable[[], Awaitable[None]],
+    ) -> Callable[[], Awaitable[None]]:
+        """包装交易日任务：执行前刷新交易日历，当天不再是触发日时跳过。
+
+        Args:
+            trading_trigger: 交易日触发器配置。
+            config: 任务配置。
+            task_callable: 原始任务执行函数。
+
+        Returns:
+            包装后的任务执行函数。
+        """
+
+        async def checked_task() -> None:
+            try:
+                await self._trading_calendar.refresh()
+            except Exception as e:
+                logger.warning("Trading calendar refresh failed", task_id=config.id, error=str(e))
+            today = date.today()
+            if not trading_trigger.matches(today, self._trading_calendar):
+                logger.info("Task skipped on non-trigger day", task_id=config.id, date=str(today))
+                return
+            await task_callable()
+
+        return checked_task
+
     def _wrap_task_with_logging(
         self,
         config: ScheduledTaskConfig,
@@ -104,6 +209,10 @@ class AsyncIOSchedulerImpl(Scheduler):
                 task_name=config.name,
                 module=config.module,
             )
+            if self._state_store is not None:
+                # 触发时 APScheduler 已推进到下一次执行时间，保存后本次执行不会在重启后被当作错过
+                job = self._scheduler.get_job(config.id)
+                await self._save_next_run_time(config.id, getattr(job, "next_run_time", None))
             try:
                 await task_callable()
                 duration_ms = int((time.perf_counter() - start_time) * 1000)
@@ -128,3 +237,11 @@ class AsyncIOSchedulerImpl(Scheduler):
                 raise
 
         return wrapped_task
+
+    async def _save_next_run_time(self, task_id: str, next_run_time: datetime | None) -> None:
+        if self._state_store is None:
+            return
+        try:
+            await self._state_store.save_next_run_time(task_id, next_run_time)
+        except Exception as e:
+            logger.warning("Scheduler state save failed", task_id=task_id, error=str(e))
@@ -0,0 +1,250 @@
+"""基于进程池的定时任务分派实现。
+
+定时任务中的映射与 SQL 编译是 CPU 密集的同步代码，与 API 共用事件循环时会阻塞请求。
+ProcessPoolTaskDispatcher 将任务分派到 spawn 启动的工作进程：每个工作进程有自己的事件循环与数据库连接池，
+启动时通过 loader 按 ID 构建任务执行函数（闭包无法跨进程传递）。
+工作进程内的结构化日志被收集后随执行结果回传，由主进程以原事件名重新输出并附加 worker_pid；
+任务发布的领域事件同样回传，由主进程在自己的事件总线上重新发布（如让 API 进程失效查询缓存）。
+"""
+
+from __future__ import annotations
+
+import asyncio
+import atexit
+import logging
+import multiprocessing
+import os
+import time
+import traceback
+from collections.abc import Awaitable, Callable, Mapping, MutableMapping
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from dataclasses import dataclass, field
+from typing import Any, TypeAlias
+
+import structlog
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.modules.foundation.application.task_dispatcher import RemoteTaskError, TaskDispatcher
+from app.shared_kernel.application.event_bus import InProcessEventBus, get_event_bus, set_event_bus
+from app.shared_kernel.domain.domain_event import DomainEvent
+from app.shared_kernel.infrastructure.database import Database
+from app.shared_kernel.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+# 工作进程启动时调用，按 session_factory 构建任务 ID 到执行函数的映射；须为模块级函数以便按引用传递
+WorkerTaskLoader: TypeAlias = Callable[
+    [async_sessionmaker[AsyncSession]], dict[str, Callable[[], Awaitable[int | None]]]
+]
+
+# 回放日志时不透传的字段：由主进程的处理器重新生成
+_REPLAY_EXCLUDED_KEYS = frozenset({"event", "level", "logger", "timestamp"})
+
+
+@dataclass(frozen=True)
+class WorkerOutcome:
+    """工作进程一次任务执行的结果。
+
+    Attributes:
+        task_id: 任务 ID。
+        worker_pid: 工作进程 PID。
+        duration_ms: 执行耗时（毫秒）。
+        rows: 任务返回的写入行数。
+        logs: 执行期间收集的结构化日志事件。
+        events: 执行期间发布的领域事件。
+        error: 失败时的异常类型与消息。
+        error_traceback: 失败时的堆栈文本。
+    """
+
+    task_id: str
+    worker_pid: int
+    duration_ms: int
+    rows: int | None = None
+    logs: list[dict[str, Any]] = field(default_factory=list)
+    events: list[DomainEvent] = field(default_factory=list)
+    error: str | None = None
+    error_traceback: str | None = None
+
+
+@dataclass
+class _WorkerState:
+    loop: asyncio.AbstractEventLoop
+    db: Database
+    callables: dict[str, Callable[[], Awaitable[int | None]]]
+    logs: list[dict[str, Any]]
+    events: list[DomainEvent]
+
+
+_worker_state: _WorkerState | None = None
+
+
+def _picklable(value: Any) -> Any:
+    if value is None or isinstance(value, str | int | float | bool):
+        return value
+    if isinstance(value, list | tuple):
+        return [_picklable(v) for v in value]
+    if isinstance(value, dict):
+        return {str(k): _picklable(v) for k, v in value.items()}
+    return repr(value)
+
+
+def _init_worker(loader: WorkerTaskLoader, database_url: str, log_level: str) -> None:
+    """工作进程初始化：日志与领域事件改为收集模式，建立事件循环与数据库连接池，构建任务执行函数。"""
+    global _worker_state
+    logs: list[dict[str, Any]] = []
+    events: list[DomainEvent] = []
+
+    async def collect_event(event: DomainEvent) -> None:
+        events.append(event)
+
+    def collect(_: Any, __: str, event_dict: MutableMapping[str, Any]) -> Mapping[str, Any]:
+        logs.append(_picklable(dict(event_dict)))
+        raise structlog.DropEvent
+
+    logging.basicConfig(format="%(message)s", level=getattr(logging, log_level.upper(), logging.INFO))
+    structlog.configure(
+        processors=[
+            structlog.stdlib.filter_by_level,
+            structlog.stdlib.add_logger_name,
+            structlog.stdlib.add_log_level,
+            structlog.stdlib.PositionalArgumentsFormatter(),
+            structlog.processors.format_exc_info,
+            collect,
+        ],
+        context_class=dict,
+        logger_factory=structlog.stdlib.LoggerFactory(),
+        wrapper_class=structlog.stdlib.BoundLogger,
+        cache_logger_on_first_use=True,
+    )
+    event_bus = InProcessEventBus()
+    event_bus.subscribe(DomainEvent, collect_event)
+    set_event_bus(event_bus)
+    loop = asyncio.new_event_loop()
+    asyncio.set_event_loop(loop)
+    db = Database(url=database_url, echo=False)
+    _worker_state = _WorkerState(loop=loop, db=db, callables=loader(db.session_factory), logs=logs, events=events)
+    atexit.register(_dispose_worker)
+
+
+def _dispose_worker() -> None:
+    if _worker_state is not None:
+        _worker_state.loop.run_until_complete(_worker_state.db.dispose())
+        _worker_state.loop.close()
+
+
+def _run_in_worker(task_id: str) -> WorkerOutcome:
+    """在工作进程的事件循环中执行任务，返回结果与期间的日志。"""
+    if _worker_state is None:
+        raise RuntimeError("Task worker is not initialized")
+    state = _worker_state
+    state.logs.clear()
+    state.events.clear()
+    start = time.perf_counter()
+    rows: int | None = None
+    error: str | None = None
+    error_traceback: str | None = None
+    try:
+        task_callable = state.callables.get(task_id)
+        if task_callable is None:
+            raise KeyError(f"Task callable not found in worker: {task_id}")
+        result = state.loop.run_until_complete(task_callable())
+        if isinstance(result, int) and not isinstance(result, bool):
+            rows = result
+    except Exception as e:
+        error = f"{type(e).__name__}: {e}"
+        error_traceback = traceback.format_exc()
+    return WorkerOutcome(
+        task_id=task_id,
+        worker_pid=os.getpid(),
+        duration_ms=int((time.perf_counter() - start) * 1000),
+        rows=rows,
+        logs=list(state.logs),
+        events=list(state.events),
+        error=error,
+        error_traceback=error_traceback,
+    )
+
+
+def _replay(outcome: WorkerOutcome) -> None:
+    """在主进程中按原日志名与级别重新输出工作进程的日志。"""
+    for event_dict in outcome.logs:
+        method = getattr(get_logger(event_dict.get("logger", __name__)), event_dict.get("level", "info"), None)
+        if method is None:
+            continue
+        fields = {k: v for k, v in event_dict.items() if k not in _REPLAY_EXCLUDED_KEYS}
+        method(event_dict.get("event", ""), worker_pid=outcome.worker_pid, **fields)
+
+
+async def _republish(outcome: WorkerOutcome) -> None:
+    """在主进程的事件总线上重新发布工作进程中发布的领域事件。"""
+    for event in outcome.events:
+        try:
+            await get_event_bus().publish(event)
+        except Exception as e:
+            logger.warning(
+                "Worker event republish failed",
+                task_id=outcome.task_id,
+                event_type=type(event).__name__,
+                error=str(e),
+            )
+
+
+class ProcessPoolTaskDispatcher(TaskDispatcher):
+    """将定时任务分派到独立工作进程执行。
+
+    工作进程按需启动（首个任务分派时），常驻复用，关闭时随进程池退出。
+    工作进程异常退出（如 OOM 被杀）会使进程池不可用，此时本次任务失败并重建进程池，后续任务不受影响。
+
+    Attributes:
+        _pool: spawn 上下文的进程池；不使用 fork，避免继承主进程的事件循环与数据库连接。
+    """
+
+    def __init__(
+        self,
+        loader: WorkerTaskLoader,
+        database_url: str,
+        max_workers: int = 1,
+        log_level: str = "INFO",
+    ) -> None:
+        self._max_workers = max(1, max_workers)
+        self._initargs = (loader, database_url, log_level)
+        self._pool = self._new_pool()
+
+    def _new_pool(self) -> ProcessPoolExecutor:
+        return ProcessPoolExecutor(
+            max_workers=self._max_workers,
+            mp_context=multiprocessing.get_context("spawn"),
+            initializer=_init_worker,
+            initargs=self._initargs,
+        )
+
+    def remote(self, task_id: str) -> Callable[[], Awaitable[int | None]]:
+        async def run_remote() -> int | None:
+            pool = self._pool
+            try:
+                outcome = await asyncio.get_running_loop().run_in_executor(pool, _run_in_worker, task_id)
+            except BrokenProcessPool as e:
+                if self._pool is pool:
+                    self._pool = self._new_pool()
+                logger.error("Task worker process died", task_id=task_id, error=str(e))
+                raise RemoteTaskError(f"Worker process died while running {task_id}") from e
+            _replay(outcome)
+            # 失败的任务也可能已提交部分变更，事件照常重新发布
+            await _republish(outcome)
+            logger.info(
+                "Task finished in worker process",
+                task_id=task_id,
+                worker_pid=outcome.worker_pid,
+                duration_ms=outcome.duration_ms,
+                succeeded=outcome.error is None,
+            )
+            if outcome.error is not None:
+                raise RemoteTaskError(f"{outcome.error}\n{outcome.error_traceback}")
+            return outcome.rows
+
+        return run_remote
+
+    async def shutdown(self, wait: bool = True) -> None:
+        await asyncio.to_thread(self._pool.shutdown, wait=wait, cancel_futures=True)
+        logger.info("Task worker pool shut down", wait=wait)
@@ -0,0 +1,18 @@
+"""调度器状态 SQLAlchemy 模型。"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.shared_kernel.infrastructure.database import Base
+
+
+class ScheduledJobStateModel(Base):
+    """表 scheduled_job_state：每个定时任务的下次执行时间，重启后据此恢复错过的执行。"""
+
+    __tablename__ = "scheduled_job_state"
+
+    task_id: Mapped[str] = mapped_column(String(128), primary_key=True)
+    next_run_time: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    updated_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,27 @@
+"""定时任务运行历史 SQLAlchemy 模型。"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, Index, Integer, String, Text
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.shared_kernel.infrastructure.database import Base
+
+
+class ScheduledTaskRunModel(Base):
+    """表 scheduled_task_run：定时任务每次执行的开始、结束、耗时、结果与写入行数。"""
+
+    __tablename__ = "scheduled_task_run"
+    __table_args__ = (Index("ix_scheduled_task_run_task_finished", "task_id", "finished_at"),)
+
+    id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
+    run_id: Mapped[str] = mapped_column(String(32), nullable=False, index=True)
+    task_id: Mapped[str] = mapped_column(String(128), nullable=False)
+    root_id: Mapped[str] = mapped_column(String(128), nullable=False)
+    status: Mapped[str] = mapped_column(String(16), nullable=False)
+    started_at: Mapped[datetime | None] = mapped_column(DateTime(timezone=True), nullable=True)
+    finished_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False, index=True)
+    duration_ms: Mapped[int] = mapped_column(Integer, nullable=False)
+    wait_ms: Mapped[int] = mapped_column(Integer, nullable=False)
+    rows: Mapped[int | None] = mapped_column(Integer, nullable=True)
+    error: Mapped[str | None] = mapped_column(Text, nullable=True)
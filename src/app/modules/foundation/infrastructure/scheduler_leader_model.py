@@ -0,0 +1,22 @@
+"""调度器主节点租约 SQLAlchemy 模型。"""
+
+from datetime import datetime
+
+from sqlalchemy import DateTime, String
+from sqlalchemy.orm import Mapped, mapped_column
+
+from app.shared_kernel.infrastructure.database import Base
+
+
+class SchedulerLeaderModel(Base):
+    """表 scheduler_leader：每个选举名一行，记录当前主节点及其租约。
+
+    PostgreSQL 下以 advisory lock 为准，本表仅用于报告当前主节点；其他数据库以本表租约作为锁。
+    """
+
+    __tablename__ = "scheduler_leader"
+
+    name: Mapped[str] = mapped_column(String(64), primary_key=True)
+    instance_id: Mapped[str] = mapped_column(String(128), nullable=False)
+    acquired_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
+    expires_at: Mapped[datetime] = mapped_column(DateTime(timezone=True), nullable=False)
@@ -0,0 +1,124 @@
+"""后台任务状态的 SQLAlchemy 存储实现。"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+from typing import Any
+
+from sqlalchemy import or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.modules.foundation.application.background_job import BackgroundJob, JobStatus
+from app.modules.foundation.application.job_store import BackgroundJobStore
+from app.modules.foundation.infrastructure.background_job_model import BackgroundJobModel
+
+
+class SqlAlchemyBackgroundJobStore(BackgroundJobStore):
+    """任务状态在请求之外更新，因此每次调用使用独立的短 Session 并立即提交。"""
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+
+    async def save(self, job: BackgroundJob) -> None:
+        async with self._session_factory() as session:
+            await session.merge(self._to_model(job))
+            await session.commit()
+
+    async def get(self, job_id: str) -> BackgroundJob | None:
+        async with self._session_factory() as session:
+            model = await session.get(BackgroundJobModel, job_id)
+            return self._to_entity(model) if model is not None else None
+
+    async def find_by_status(self, statuses: list[JobStatus]) -> list[BackgroundJob]:
+        async with self._session_factory() as session:
+            stmt = (
+                select(BackgroundJobModel)
+                .where(BackgroundJobModel.status.in_([s.value for s in statuses]))
+                .order_by(BackgroundJobModel.created_at)
+            )
+            return [self._to_entity(m) for m in (await session.execute(stmt)).scalars()]
+
+    async def claim(self, job_id: str, owner: str, lease_expires_at: datetime) -> bool:
+        # 条件更新由数据库原子执行，并发认领时只有一个实例的 UPDATE 命中
+        stmt = (
+            update(BackgroundJobModel)
+            .where(
+                BackgroundJobModel.id == job_id,
+                BackgroundJobModel.status.in_([JobStatus.PENDING.value, JobStatus.RUNNING.value]),
+                or_(
+                    BackgroundJobModel.owner.is_(None),
+                    BackgroundJobModel.owner == owner,
+                    BackgroundJobModel.lease_expires_at.is_(None),
+                    BackgroundJobModel.lease_expires_at <= datetime.now(UTC),
+                ),
+            )
+            .values(owner=owner, lease_expires_at=lease_expires_at)
+        )
+        async with self._session_factory() as session:
+            result: Any = await session.execute(stmt)
+            await session.commit()
+            return bool(result.rowcount == 1)
+
+    async def save_if_owned(self, job: BackgroundJob, owner: str) -> bool:
+        # 与 claim 相同，以持有者为条件原子更新，被接管后旧持有者的写入不再生效
+        stmt = (
+            update(BackgroundJobModel)
+            .where(BackgroundJobModel.id == job.id, BackgroundJobModel.owner == owner)
+            .values(
+                status=job.status.value,
+                progress=dict(job.progress),
+                result=job.result,
+                error=job.error,
+                started_at=job.started_at,
+                finished_at=job.finished_at,
+                owner=job.owner,
+                lease_expires_at=job.lease_expires_at,
+            )
+        )
+        async with self._session_factory() as session:
+            result: Any = await session.execute(stmt)
+            await session.commit()
+            return bool(result.rowcount == 1)
+
+    async def release(self, job_id: str, owner: str) -> None:
+        async with self._session_factory() as session:
+            await session.execute(
+                update(BackgroundJobModel)
+                .where(BackgroundJobModel.id == job_id, BackgroundJobModel.owner == owner)
+                .values(owner=None, lease_expires_at=None)
+            )
+            await session.commit()
+
+    @staticmethod
+    def _to_model(job: BackgroundJob) -> BackgroundJobModel:
+        return BackgroundJobModel(
+            id=job.id,
+            job_type=job.job_type,
+            params=dict(job.params),
+            status=job.status.value,
+            progress=dict(job.progress),
+            result=job.result,
+            error=job.error,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+            owner=job.owner,
+            lease_expires_at=job.lease_expires_at,
+        )
+
+    @staticmethod
+    def _to_entity(model: BackgroundJobModel) -> BackgroundJob:
+        return BackgroundJob(
+            id=model.id,
+            job_type=model.job_type,
+            params=dict(model.params),
+            status=JobStatus(model.status),
+            created_at=model.created_at,
+            progress=dict(model.progress),
+            result=model.result,
+            error=model.error,
+            started_at=model.started_at,
+            finished_at=model.finished_at,
+            owner=model.owner,
+            lease_expires_at=model.lease_expires_at,
+        )
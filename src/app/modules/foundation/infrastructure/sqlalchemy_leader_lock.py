@@ -0,0 +1,195 @@
+"""基于数据库的主节点选举锁。
+
+PostgreSQL：在一条专用连接上持有会话级 advisory lock，进程退出或连接断开时锁由数据库自动释放；
+scheduler_leader 表仅记录主节点信息供查询。
+其他数据库（SQLite 测试环境）：以 scheduler_leader 表中的租约作为锁，持有者按周期续约，
+租约过期后其他实例可接管。
+"""
+
+from __future__ import annotations
+
+import hashlib
+from datetime import UTC, datetime, timedelta
+from typing import cast
+
+from sqlalchemy import Table, delete, insert, select, text, update
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncConnection, AsyncEngine
+
+from app.modules.foundation.application.leader_election import LeaderInfo, LeaderLock
+from app.modules.foundation.infrastructure.scheduler_leader_model import SchedulerLeaderModel
+from app.shared_kernel.infrastructure.logging import get_logger
+
+logger = get_logger(__name__)
+
+# __table__ 在类型上是 FromClause，delete/insert/update 需要 Table
+_table = cast(Table, SchedulerLeaderModel.__table__)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """SQLite 读回的时间不带时区，统一按 UTC 处理。"""
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+
+
+def _advisory_key(name: str) -> int:
+    """选举名映射为 advisory lock 使用的 64 位有符号整数。"""
+    return int.from_bytes(hashlib.blake2b(name.encode(), digest_size=8).digest(), "big", signed=True)
+
+
+class SqlAlchemyLeaderLock(LeaderLock):
+    """主节点选举锁的 SQLAlchemy 实现。
+
+    Attributes:
+        _name: 选举名，同名实例竞争同一把锁。
+        _lease: 租约时长，须大于选举周期。
+        _lock_conn: PostgreSQL 下持有 advisory lock 的专用连接。
+    """
+
+    def __init__(self, engine: AsyncEngine, name: str, instance_id: str, lease_seconds: int = 30) -> None:
+        self._engine = engine
+        self._name = name
+        self._instance_id = instance_id
+        self._lease = timedelta(seconds=lease_seconds)
+        self._use_advisory = engine.dialect.name == "postgresql"
+        self._lock_conn: AsyncConnection | None = None
+
+    @property
+    def instance_id(self) -> str:
+        return self._instance_id
+
+    async def try_acquire(self) -> bool:
+        if self._use_advisory:
+            if not await self._acquire_advisory():
+                return False
+            # 以 advisory lock 为准，租约行只用于报告
+            await self._write_advisory_lease()
+            return True
+        return await self._write_lease(force=False)
+
+    async def renew(self) -> bool:
+        if self._use_advisory:
+            if self._lock_conn is None:
+                return False
+            try:
+                # 专用连接仍存活即仍持有锁
+                await self._lock_conn.execute(text("SELECT 1"))
+                await self._lock_conn.commit()
+            except Exception:
+                await self._discard_lock_conn()
+                raise
+            await self._write_advisory_lease()
+            return True
+        return await self._write_lease(force=False)
+
+    async def release(self) -> None:
+        if self._lock_conn is not None:
+            try:
+                await self._lock_conn.execute(
+                    text("SELECT pg_advisory_unlock(:key)"), {"key": _advisory_key(self._name)}
+                )
+                await self._lock_conn.commit()
+                await self._lock_conn.close()
+            except Exception:
+                await self._discard_lock_conn()
+            self._lock_conn = None
+        async with self._engine.begin() as conn:
+            await conn.execute(
+                delete(_table).where(_table.c.name == self._name, _table.c.instance_id == self._instance_id)
+            )
+
+    async def current_leader(self) -> LeaderInfo | None:
+        async with self._engine.connect() as conn:
+            row = (await conn.execute(select(_table).where(_table.c.name == self._name))).first()
+        if row is None or _as_utc(row.expires_at) <= datetime.now(UTC):
+            return None
+        return LeaderInfo(
+            instance_id=row.instance_id,
+            acquired_at=_as_utc(row.acquired_at),
+            expires_at=_as_utc(row.expires_at),
+        )
+
+    async def _acquire_advisory(self) -> bool:
+        if self._lock_conn is None:
+            self._lock_conn = await self._engine.connect()
+        try:
+            result = await self._lock_conn.execute(
+                text("SELECT pg_try_advisory_lock(:key)"), {"key": _advisory_key(self._name)}
+            )
+            acquired = bool(result.scalar())
+            # 会话级锁不随事务结束释放，提交以免连接长期处于事务中
+            await self._lock_conn.commit()
+        except Exception:
+            await self._discard_lock_conn()
+            raise
+        if not acquired:
+            await self._lock_conn.close()
+            self._lock_conn = None
+        return acquired
+
+    async def _write_advisory_lease(self) -> None:
+        """持有 advisory lock 时写入租约行；写入失败则废弃专用连接释放锁再上抛。
+
+        调用方把异常视为未当选（或失去主节点），若仍持有锁，下一次 try_acquire 会在同一连接上重入加锁，
+        release 只解锁一次，锁将一直泄漏。
+        """
+        try:
+            await self._write_lease(force=True)
+        except Exception:
+            await self._discard_lock_conn()
+            raise
+
+    async def _discard_lock_conn(self) -> None:
+        """废弃专用连接而不归还连接池，避免残留的会话级锁随连接被复用。"""
+        if self._lock_conn is not None:
+            try:
+                await self._lock_conn.invalidate()
+            except Exception as e:
+                logger.debug("Leader lock connection invalidate failed", error=str(e))
+            self._lock_conn = None
+
+    async def _write_lease(self, force: bool) -> bool:
+        """写入或续约本实例的租约。
+
+        force=False 时仅在无主节点、租约已过期或本实例为持有者时写入；
+        以读到的 (instance_id, expires_at) 作为条件更新，并发竞争时只有一个实例成功。
+        """
+        now = datetime.now(UTC)
+        try:
+            async with self._engine.begin() as conn:
+                row = (
+                    await conn.execute(
+                        select(_table.c.instance_id, _table.c.acquired_at, _table.c.expires_at).where(
+                            _table.c.name == self._name
+                        )
+                    )
+                ).first()
+                if row is None:
+                    await conn.execute(
+                        insert(_table).values(
+                            name=self._name,
+                            instance_id=self._instance_id,
+                            acquired_at=now,
+                            expires_at=now + self._lease,
+                        )
+                    )
+                    return True
+                is_holder = row.instance_id == self._instance_id
+                if not (force or is_holder or _as_utc(row.expires_at) <= now):
+                    return False
+                result = await conn.execute(
+                    update(_table)
+                    .where(
+                        _table.c.name == self._name,
+                        _table.c.instance_id == row.instance_id,
+                        _table.c.expires_at == row.expires_at,
+                    )
+                    .values(
+                        instance_id=self._instance_id,
+                        acquired_at=row.acquired_at if is_holder else now,
+                        expires_at=now + self._lease,
+                    )
+                )
+                return result.rowcount == 1
+        except IntegrityError:
+            # 并发插入首行时落败
+            return False
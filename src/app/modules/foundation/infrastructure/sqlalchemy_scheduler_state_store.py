@@ -0,0 +1,39 @@
+"""调度器状态的 SQLAlchemy 存储实现。"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.modules.foundation.application.scheduler_state_store import SchedulerStateStore
+from app.modules.foundation.infrastructure.scheduled_job_state_model import ScheduledJobStateModel
+
+
+def _as_utc(value: datetime) -> datetime:
+    """SQLite 读回的时间不带时区，统一按 UTC 处理。"""
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+
+
+class SqlAlchemySchedulerStateStore(SchedulerStateStore):
+    """每次调用使用独立的短 Session 并立即提交。"""
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+
+    async def load_next_run_times(self) -> dict[str, datetime]:
+        stmt = select(ScheduledJobStateModel).where(ScheduledJobStateModel.next_run_time.is_not(None))
+        async with self._session_factory() as session:
+            return {
+                m.task_id: _as_utc(m.next_run_time)
+                for m in (await session.execute(stmt)).scalars()
+                if m.next_run_time is not None
+            }
+
+    async def save_next_run_time(self, task_id: str, next_run_time: datetime | None) -> None:
+        async with self._session_factory() as session:
+            await session.merge(
+                ScheduledJobStateModel(task_id=task_id, next_run_time=next_run_time, updated_at=datetime.now(UTC))
+            )
+            await session.commit()
@@ -0,0 +1,78 @@
+"""定时任务运行历史的 SQLAlchemy 存储实现。"""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+from app.modules.foundation.application.task_run_store import TaskRunRecord, TaskRunStatus, TaskRunStore
+from app.modules.foundation.infrastructure.scheduled_task_run_model import ScheduledTaskRunModel
+
+
+def _as_utc(value: datetime) -> datetime:
+    """SQLite 读回的时间不带时区，统一按 UTC 处理。"""
+    return value if value.tzinfo is not None else value.replace(tzinfo=UTC)
+
+
+class SqlAlchemyTaskRunStore(TaskRunStore):
+    """运行历史在请求之外写入，因此每次调用使用独立的短 Session 并立即提交。"""
+
+    def __init__(self, session_factory: async_sessionmaker[AsyncSession]) -> None:
+        self._session_factory = session_factory
+
+    async def add_many(self, records: list[TaskRunRecord]) -> None:
+        if not records:
+            return
+        async with self._session_factory() as session:
+            session.add_all([self._to_model(r) for r in records])
+            await session.commit()
+
+    async def find_recent(self, task_id: str | None = None, limit: int = 50) -> list[TaskRunRecord]:
+        stmt = select(ScheduledTaskRunModel).order_by(
+            ScheduledTaskRunModel.finished_at.desc(), ScheduledTaskRunModel.id.desc()
+        )
+        if task_id is not None:
+            stmt = stmt.where(ScheduledTaskRunModel.task_id == task_id)
+        async with self._session_factory() as session:
+            return [self._to_record(m) for m in (await session.execute(stmt.limit(limit))).scalars()]
+
+    async def find_since(self, since: datetime) -> list[TaskRunRecord]:
+        stmt = (
+            select(ScheduledTaskRunModel)
+            .where(ScheduledTaskRunModel.finished_at >= since)
+            .order_by(ScheduledTaskRunModel.finished_at)
+        )
+        async with self._session_factory() as session:
+            return [self._to_record(m) for m in (await session.execute(stmt)).scalars()]
+
+    @staticmethod
+    def _to_model(record: TaskRunRecord) -> ScheduledTaskRunModel:
+        return ScheduledTaskRunModel(
+            run_id=record.run_id,
+            task_id=record.task_id,
+            root_id=record.root_id,
+            status=record.status.value,
+            started_at=record.started_at,
+            finished_at=record.finished_at,
+            duration_ms=record.duration_ms,
+            wait_ms=record.wait_ms,
+            rows=record.rows,
+            error=record.error,
+        )
+
+    @staticmethod
+    def _to_record(model: ScheduledTaskRunModel) -> TaskRunRecord:
+        return TaskRunRecord(
+            run_id=model.run_id,
+            task_id=model.task_id,
+            root_id=model.root_id,
+            status=TaskRunStatus(model.status),
+            started_at=_as_utc(model.started_at) if model.started_at is not None else None,
+            finished_at=_as_utc(model.finished_at),
+            duration_ms=model.duration_ms,
+            wait_ms=model.wait_ms,
+            rows=model.rows,
+            error=model.error,
+        )
@@ -0,0 +1,59 @@
+"""交易日触发器的 APScheduler 适配。
+
+提供 APSchedulerTradingDayTrigger 类，将 TradingDayTrigger 转为 APScheduler 触发器。
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable
+from datetime import datetime, time, timedelta
+from typing import cast
+
+from apscheduler.triggers.base import BaseTrigger
+from apscheduler.util import localize
+
+from app.modules.foundation.application.scheduled_task_config import (
+    TradingCalendarProvider,
+    TradingDayTrigger,
+)
+
+# 向后查找触发日的最大自然日数：覆盖最长的月度规则与长假
+_MAX_LOOKAHEAD_DAYS = 400
+
+
+class APSchedulerTradingDayTrigger(BaseTrigger):
+    """按交易日历计算下次触发时间的 APScheduler 触发器。
+
+    从当前日期起逐日查找第一个满足 TradingDayTrigger 规则、且触发时刻晚于上次触发的日期。
+    交易日历通过 calendar_getter 延迟获取，调度器更换提供者后无需重建任务。
+
+    Attributes:
+        _trigger: 交易日触发器配置。
+        _calendar_getter: 返回当前交易日历提供者的函数。
+    """
+
+    def __init__(
+        self,
+        trigger: TradingDayTrigger,
+        calendar_getter: Callable[[], TradingCalendarProvider],
+    ) -> None:
+        self._trigger = trigger
+        self._calendar_getter = calendar_getter
+
+    def get_next_fire_time(self, previous_fire_time: datetime | None, now: datetime) -> datetime | None:
+        calendar = self._calendar_getter()
+        fire_at = time(self._trigger.hour, self._trigger.minute, self._trigger.second)
+        earliest = max(now, previous_fire_time + timedelta(seconds=1)) if previous_fire_time else now
+        day = earliest.date()
+        for _ in range(_MAX_LOOKAHEAD_DAYS):
+            candidate = cast(datetime, localize(datetime.combine(day, fire_at), now.tzinfo))
+            if candidate >= earliest and self._trigger.matches(day, calendar):
+                return candidate
+            day += timedelta(days=1)
+        return None
+
+    def __str__(self) -> str:
+        return (
+            f"trading_day[rule={self._trigger.rule.value}, offset={self._trigger.offset}, "
+            f"time={self._trigger.hour:02d}:{self._trigger.minute:02d}:{self._trigger.second:02d}]"
+        )
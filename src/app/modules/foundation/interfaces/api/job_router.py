@@ -0,0 +1,91 @@
+"""后台任务 HTTP 接口：状态轮询、SSE 实时推送与失败任务续跑。"""
+
+import json
+from collections.abc import AsyncIterator
+from datetime import datetime
+from typing import Any
+
+from fastapi import APIRouter, Depends
+from fastapi.responses import StreamingResponse
+from pydantic import BaseModel
+
+from app.interfaces.response import ApiResponse
+from app.modules.foundation.application.background_job import BackgroundJob
+from app.modules.foundation.application.job_runner import JobRunner
+from app.modules.foundation.interfaces.jobs import get_job_runner
+from app.shared_kernel.domain.exception import NotFoundException
+
+router = APIRouter(prefix="/jobs", tags=["jobs"])
+
+
+class JobResponse(BaseModel):
+    id: str
+    job_type: str
+    status: str
+    params: dict[str, Any]
+    progress: dict[str, int]
+    result: dict[str, Any] | None
+    error: str | None
+    created_at: datetime
+    started_at: datetime | None
+    finished_at: datetime | None
+
+    @classmethod
+    def from_job(cls, job: BackgroundJob) -> "JobResponse":
+        return cls(
+            id=job.id,
+            job_type=job.job_type,
+            status=job.status.value,
+            params=job.params,
+            progress=job.progress,
+            result=job.result,
+            error=job.error,
+            created_at=job.created_at,
+            started_at=job.started_at,
+            finished_at=job.finished_at,
+        )
+
+
+async def _require_job(job_id: str, runner: JobRunner) -> BackgroundJob:
+    job = await runner.get(job_id)
+    if job is None:
+        raise NotFoundException(f"Job not found: {job_id}")
+    return job
+
+
+@router.get("/{job_id}", response_model=ApiResponse[JobResponse])
+async def get_job(
+    job_id: str,
+    runner: JobRunner = Depends(get_job_runner),
+) -> ApiResponse[JobResponse]:
+    return ApiResponse.success(data=JobResponse.from_job(await _require_job(job_id, runner)))
+
+
+@router.post("/{job_id}/resume", response_model=ApiResponse[JobResponse], status_code=202)
+async def resume_job(
+    job_id: str,
+    runner: JobRunner = Depends(get_job_runner),
+) -> ApiResponse[JobResponse]:
+    """将失败的任务按原 ID 重新入队；支持断点的任务从上次未完成处继续。"""
+    job = await runner.resume(job_id)
+    return ApiResponse.success(data=JobResponse.from_job(job), message="Job resumed")
+
+
+@router.get("/{job_id}/events")
+async def stream_job_events(
+    job_id: str,
+    runner: JobRunner = Depends(get_job_runner),
+) -> StreamingResponse:
+    """以 Server-Sent Events 推送任务快照：事件名为任务状态，任务进入终态后关闭流。"""
+    await _require_job(job_id, runner)
+
+    async def _events() -> AsyncIterator[str]:
+        async for job in runner.subscribe(job_id):
+            payload = JobResponse.from_job(job).model_dump(mode="json")
+            yield f"event: {job.status.value}\ndata: {json.dumps(payload, ensure_ascii=False)}\n\n"
+
+    return StreamingResponse(
+        _events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
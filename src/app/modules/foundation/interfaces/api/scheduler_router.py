@@ -0,0 +1,92 @@
+"""定时任务运行历史 HTTP 接口：最近运行记录与按任务的耗时分位数。"""
+
+from datetime import UTC, datetime, timedelta
+
+from fastapi import APIRouter, Depends, Query
+from pydantic import BaseModel
+
+from app.interfaces.response import ApiResponse
+from app.modules.foundation.application.task_run_store import (
+    TaskRunRecord,
+    TaskRunStats,
+    TaskRunStore,
+    summarize_runs,
+)
+from app.modules.foundation.interfaces.scheduler import get_task_run_store
+
+router = APIRouter(prefix="/scheduler", tags=["scheduler"])
+
+
+class TaskRunResponse(BaseModel):
+    run_id: str
+    task_id: str
+    root_id: str
+    status: str
+    started_at: datetime | None
+    finished_at: datetime
+    duration_ms: int
+    wait_ms: int
+    rows: int | None
+    error: str | None
+
+    @classmethod
+    def from_record(cls, record: TaskRunRecord) -> "TaskRunResponse":
+        return cls(
+            run_id=record.run_id,
+            task_id=record.task_id,
+            root_id=record.root_id,
+            status=record.status.value,
+            started_at=record.started_at,
+            finished_at=record.finished_at,
+            duration_ms=record.duration_ms,
+            wait_ms=record.wait_ms,
+            rows=record.rows,
+            error=record.error,
+        )
+
+
+class TaskRunStatsResponse(BaseModel):
+    task_id: str
+    runs: int
+    succeeded: int
+    failed: int
+    skipped: int
+    p50_ms: int | None
+    p95_ms: int | None
+    last_status: str
+    last_finished_at: datetime
+
+    @classmethod
+    def from_stats(cls, stats: TaskRunStats) -> "TaskRunStatsResponse":
+        return cls(
+            task_id=stats.task_id,
+            runs=stats.runs,
+            succeeded=stats.succeeded,
+            failed=stats.failed,
+            skipped=stats.skipped,
+            p50_ms=stats.p50_ms,
+            p95_ms=stats.p95_ms,
+            last_status=stats.last_status.value,
+            last_finished_at=stats.last_finished_at,
+        )
+
+
+@router.get("/runs", response_model=ApiResponse[list[TaskRunResponse]])
+async def list_task_runs(
+    task_id: str | None = Query(None, description="任务 ID，为空时返回全部任务"),
+    limit: int = Query(50, ge=1, le=500),
+    store: TaskRunStore = Depends(get_task_run_store),
+) -> ApiResponse[list[TaskRunResponse]]:
+    """最近的运行记录，按结束时间倒序。"""
+    records = await store.find_recent(task_id=task_id, limit=limit)
+    return ApiResponse.success(data=[TaskRunResponse.from_record(r) for r in records])
+
+
+@router.get("/runs/stats", response_model=ApiResponse[list[TaskRunStatsResponse]])
+async def get_task_run_stats(
+    days: int = Query(30, ge=1, le=365, description="统计最近多少天的运行"),
+    store: TaskRunStore = Depends(get_task_run_store),
+) -> ApiResponse[list[TaskRunStatsResponse]]:
+    """按任务汇总运行次数与成功运行耗时的 p50/p95，用于发现夜间同步链路的性能回退。"""
+    records = await store.find_since(datetime.now(UTC) - timedelta(days=days))
+    return ApiResponse.success(data=[TaskRunStatsResponse.from_stats(s) for s in summarize_runs(records)])
@@ -0,0 +1,43 @@
+"""后台任务执行器依赖注入入口。
+
+提供 create_job_runner()（应用启动时创建）与 get_job_runner()（路由注入）。
+"""
+
+from __future__ import annotations
+
+from typing import TYPE_CHECKING, cast
+
+from fastapi import Request
+
+from app.config import settings
+from app.modules.foundation.application.job_runner import JobRunner
+from app.modules.foundation.infrastructure.asyncio_job_runner import AsyncIOJobRunner
+from app.modules.foundation.infrastructure.sqlalchemy_background_job_store import (
+    SqlAlchemyBackgroundJobStore,
+)
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+
+
+def create_job_runner(session_factory: async_sessionmaker[AsyncSession]) -> JobRunner:
+    """创建后台任务执行器实例（不暴露具体实现）。
+
+    Args:
+        session_factory: SQLAlchemy async_sessionmaker 实例，用于持久化任务状态。
+
+    Returns:
+        JobRunner Protocol 类型的执行器实例。
+    """
+    return AsyncIOJobRunner(
+        store=SqlAlchemyBackgroundJobStore(session_factory),
+        max_workers=settings.JOB_RUNNER_MAX_WORKERS,
+        progress_flush_seconds=settings.JOB_PROGRESS_FLUSH_SECONDS,
+        shutdown_timeout_seconds=settings.JOB_SHUTDOWN_TIMEOUT_SECONDS,
+        lease_seconds=settings.JOB_LEASE_SECONDS,
+    )
+
+
+def get_job_runner(request: Request) -> JobRunner:
+    """获取应用级后台任务执行器，供路由注入。"""
+    return cast(JobRunner, request.app.state.job_runner)
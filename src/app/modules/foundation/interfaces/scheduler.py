@@ -1,21 +1,122 @@
 """调度器依赖注入入口。
 
-提供 get_scheduler() 函数，用于在 interfaces 层获取调度器实例。
+提供 get_scheduler() 函数，用于在 interfaces 层获取调度器实例；
+提供 create_leader_elector()，多进程部署时只有主节点运行调度器；
+提供 create_task_dispatcher()，将定时任务分派到独立工作进程执行；
+提供 create_task_run_store() / get_task_run_store()，记录与查询定时任务运行历史。
 """
 
 from __future__ import annotations
 
+import os
+import socket
+from typing import TYPE_CHECKING
+from uuid import uuid4
+
+from fastapi import Request
+
+from app.config import settings
+from app.modules.foundation.application.leader_election import LeaderElector
 from app.modules.foundation.application.scheduler import Scheduler
+from app.modules.foundation.application.task_dispatcher import TaskDispatcher
+from app.modules.foundation.application.task_run_store import TaskRunStore
 from app.modules.foundation.infrastructure.asyncio_scheduler_impl import AsyncIOSchedulerImpl
+from app.modules.foundation.infrastructure.process_pool_task_dispatcher import (
+    ProcessPoolTaskDispatcher,
+    WorkerTaskLoader,
+)
+from app.modules.foundation.infrastructure.sqlalchemy_leader_lock import SqlAlchemyLeaderLock
+from app.modules.foundation.infrastructure.sqlalchemy_scheduler_state_store import SqlAlchemySchedulerStateStore
+from app.modules.foundation.infrastructure.sqlalchemy_task_run_store import SqlAlchemyTaskRunStore
+
+if TYPE_CHECKING:
+    from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+# 同一数据库上的全部实例竞争同一把锁
+_LEADER_LOCK_NAME = "scheduler"
 
 
-def get_scheduler() -> Scheduler:
+def get_scheduler(session_factory: async_sessionmaker[AsyncSession] | None = None) -> Scheduler:
     """获取调度器实例。
 
     返回 Scheduler Protocol 类型（不暴露具体实现），
     用于在 FastAPI 的 interfaces 层通过依赖注入获取调度器实例。
 
+    Args:
+        session_factory: 提供时持久化任务的下次执行时间，重启后恢复错过的执行。
+
     Returns:
         Scheduler Protocol 类型的调度器实例。
     """
-    return AsyncIOSchedulerImpl()
+    state_store = SqlAlchemySchedulerStateStore(session_factory) if session_factory is not None else None
+    return AsyncIOSchedulerImpl(state_store=state_store)
+
+
+def create_leader_elector(engine: AsyncEngine, scheduler: Scheduler) -> LeaderElector:
+    """创建调度器主节点选举器：成为主节点时恢复错过的执行并启动/恢复调度器，失去主节点身份时暂停调度器。
+
+    Args:
+        engine: 数据库引擎，选举锁所在的数据库。
+        scheduler: 由主节点运行的调度器。
+
+    Returns:
+        LeaderElector 实例，调用 start() 后开始竞选。
+    """
+    instance_id = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+    lock = SqlAlchemyLeaderLock(
+        engine,
+        name=_LEADER_LOCK_NAME,
+        instance_id=instance_id,
+        lease_seconds=settings.SCHEDULER_LEADER_LEASE_SECONDS,
+    )
+
+    async def on_elected() -> None:
+        # 前任主节点可能刚刚执行过任务，以成为主节点时的持久化状态为准
+        await scheduler.restore()
+        scheduler.resume()
+
+    async def on_demoted() -> None:
+        scheduler.pause()
+
+    return LeaderElector(
+        lock,
+        on_elected=on_elected,
+        on_demoted=on_demoted,
+        renew_interval=settings.SCHEDULER_LEADER_RENEW_SECONDS,
+    )
+
+
+def create_task_dispatcher(loader: WorkerTaskLoader) -> TaskDispatcher | None:
+    """按 SCHEDULER_EXECUTION_MODE 创建任务分派器。
+
+    Args:
+        loader: 工作进程构建任务执行函数的模块级函数。
+
+    Returns:
+        process 模式返回进程池分派器；inline 模式返回 None，任务在调度器所在事件循环中执行。
+    """
+    if settings.SCHEDULER_EXECUTION_MODE != "process":
+        return None
+    return ProcessPoolTaskDispatcher(
+        loader,
+        database_url=settings.DATABASE_URL,
+        max_workers=settings.SCHEDULER_PROCESS_WORKERS,
+        log_level=settings.LOG_LEVEL,
+    )
+
+
+def create_task_run_store(session_factory: async_sessionmaker[AsyncSession]) -> TaskRunStore:
+    """创建定时任务运行历史存储。
+
+    Args:
+        session_factory: SQLAlchemy async_sessionmaker 实例。
+
+    Returns:
+        TaskRunStore 实例。
+    """
+    return SqlAlchemyTaskRunStore(session_factory)
+
+
+def get_task_run_store(request: Request) -> TaskRunStore:
+    """获取运行历史存储，供路由注入。"""
+    return create_task_run_store(request.app.state.db.session_factory)
@@ -0,0 +1,16 @@
+"""协作式取消：长任务在处理单元之间检查取消标记，在安全点停止并保留断点。"""
+
+
+class CancellationToken:
+    """取消标记。由调用方（如后台任务执行器的关闭钩子）置位，Handler 轮询。"""
+
+    def __init__(self) -> None:
+        self._cancelled = False
+
+    def cancel(self) -> None:
+        """请求取消。幂等。"""
+        self._cancelled = True
+
+    @property
+    def is_cancelled(self) -> bool:
+        return self._cancelled
@@ -1,9 +1,18 @@
-"""EventBus 抽象：领域事件发布与订阅。"""
+"""EventBus 抽象：领域事件发布与订阅。
+
+InProcessEventBus 在发布进程内按类型分发给订阅者；跨副本的效果（如缓存失效）由订阅者借助共享基础设施完成，
+例如 Redis 近端缓存的失效广播。定时任务工作进程中发布的事件随任务结果回传，由主进程重新发布。
+"""
 
 from abc import ABC, abstractmethod
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from typing import Any, TypeAlias
 
 from app.shared_kernel.domain.domain_event import DomainEvent
 
+EventHandler: TypeAlias = Callable[[Any], Awaitable[None]]
+
 
 class EventBus(ABC):
     """事件总线抽象接口。"""
@@ -12,3 +21,45 @@ class EventBus(ABC):
     async def publish(self, event: DomainEvent) -> None:
         """发布领域事件。"""
         ...
+
+    @abstractmethod
+    def subscribe(self, event_type: type[DomainEvent], handler: EventHandler) -> None:
+        """订阅事件类型；订阅基类时同时收到其全部子类事件。"""
+        ...
+
+
+class InProcessEventBus(EventBus):
+    """按事件类型（含基类）依次调用订阅者。
+
+    单个订阅者失败不影响其他订阅者；全部调用结束后重新抛出第一个异常，由发布方决定是否忽略。
+    """
+
+    def __init__(self) -> None:
+        self._handlers: defaultdict[type[DomainEvent], list[EventHandler]] = defaultdict(list)
+
+    def subscribe(self, event_type: type[DomainEvent], handler: EventHandler) -> None:
+        self._handlers[event_type].append(handler)
+
+    async def publish(self, event: DomainEvent) -> None:
+        errors: list[Exception] = []
+        for event_type in type(event).__mro__:
+            for handler in self._handlers.get(event_type, ()):
+                try:
+                    await handler(event)
+                except Exception as e:
+                    errors.append(e)
+        if errors:
+            raise errors[0]
+
+
+_event_bus: EventBus = InProcessEventBus()
+
+
+def get_event_bus() -> EventBus:
+    """当前进程的事件总线。应用启动时由 lifespan 通过 set_event_bus() 替换为已注册订阅者的实例。"""
+    return _event_bus
+
+
+def set_event_bus(event_bus: EventBus) -> None:
+    global _event_bus
+    _event_bus = event_bus
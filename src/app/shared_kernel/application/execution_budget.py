@@ -0,0 +1,111 @@
+"""执行预算：长任务 Handler 共用的截止时间、内存阈值与取消检查。
+
+Handler 在处理单元之间调用 stop_reason() 决定是否在安全点停止，调用 check_memory() 采样 RSS；
+超过内存阈值时预算进入退让状态，Handler 通过 scale() / chunks() 缩小并发数与批次大小。
+"""
+
+import gc
+import os
+from collections.abc import Callable, Iterator, Sequence
+from enum import StrEnum
+from time import monotonic
+from typing import TypeVar
+
+import psutil  # type: ignore
+
+from .cancellation import CancellationToken
+
+T = TypeVar("T")
+
+# 退让级别上限：scale() 最多缩小到原值的 1/16
+_MAX_PRESSURE_LEVEL = 4
+# RSS 回落到阈值的该比例以下时逐级解除退让，避免在阈值附近反复抖动
+_RELEASE_RATIO = 0.75
+
+
+class StopReason(StrEnum):
+    """提前停止的原因。"""
+
+    CANCELLED = "cancelled"  # 调用方请求取消（如进程关闭）
+    DEADLINE = "deadline"  # 超过截止时间
+
+
+def process_rss_mb() -> int:
+    """当前进程常驻内存（MB）。"""
+    return int(psutil.Process(os.getpid()).memory_info().rss // 1024 // 1024)
+
+
+class ExecutionBudget:
+    """一次 Handler 执行的预算。
+
+    - deadline_seconds：自创建起的最长执行秒数，None 或非正数表示不限
+    - memory_threshold_mb：RSS 阈值，None 表示不检查
+    - cancellation：外部取消标记，与截止时间一并由 stop_reason() 判断
+
+    默认构造即为无限预算，Handler 行为与未接入预算时一致。
+    """
+
+    def __init__(
+        self,
+        deadline_seconds: float | None = None,
+        memory_threshold_mb: int | None = None,
+        cancellation: CancellationToken | None = None,
+        rss_probe: Callable[[], int] = process_rss_mb,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        self._clock = clock
+        self._deadline = clock() + deadline_seconds if deadline_seconds and deadline_seconds > 0 else None
+        self._memory_threshold_mb = memory_threshold_mb
+        self._cancellation = cancellation or CancellationToken()
+        self._rss_probe = rss_probe
+        self._pressure_level = 0
+        self.last_rss_mb: int | None = None
+
+    @property
+    def cancellation(self) -> CancellationToken:
+        return self._cancellation
+
+    @property
+    def pressure_level(self) -> int:
+        """退让级别，0 表示无内存压力。"""
+        return self._pressure_level
+
+    @property
+    def under_pressure(self) -> bool:
+        return self._pressure_level > 0
+
+    def stop_reason(self) -> StopReason | None:
+        """需要停止时返回原因，否则返回 None。取消优先于截止时间。"""
+        if self._cancellation.is_cancelled:
+            return StopReason.CANCELLED
+        if self._deadline is not None and self._clock() >= self._deadline:
+            return StopReason.DEADLINE
+        return None
+
+    def check_memory(self) -> bool:
+        """采样 RSS 并调整退让级别，返回是否处于内存压力下。
+
+        超过阈值时退让级别加一并触发一次垃圾回收；回落到阈值的 3/4 以下时退让级别减一。
+        """
+        if self._memory_threshold_mb is None:
+            return False
+        rss_mb = self.last_rss_mb = self._rss_probe()
+        if rss_mb >= self._memory_threshold_mb:
+            if self._pressure_level < _MAX_PRESSURE_LEVEL:
+                self._pressure_level += 1
+            gc.collect()
+        elif self._pressure_level and rss_mb < self._memory_threshold_mb * _RELEASE_RATIO:
+            self._pressure_level -= 1
+        return self.under_pressure
+
+    def scale(self, value: int, minimum: int = 1) -> int:
+        """按当前退让级别缩小并发数或批次大小：每级减半，不低于 minimum。"""
+        return max(minimum, value >> self._pressure_level)
+
+    def chunks(self, items: Sequence[T], size: int) -> Iterator[Sequence[T]]:
+        """按 scale(size) 切分批次；每个批次切分前重新计算，处理期间的退让立即生效。"""
+        offset = 0
+        while offset < len(items):
+            step = self.scale(size)
+            yield items[offset : offset + step]
+            offset += step
@@ -0,0 +1,71 @@
+"""游标分页：Page 结果与不透明游标的编解码。
+
+按自增 id 升序做 keyset 分页：游标记录上一页最后一行的 id，下一页查询 id > 该值的行，
+翻页代价与页大小相关，与偏移量和表大小无关。
+"""
+
+import base64
+import binascii
+from collections.abc import Sequence
+from dataclasses import dataclass, field
+from typing import Any, Generic, TypeVar
+
+from app.shared_kernel.domain.exception import ValidationException
+
+T = TypeVar("T")
+
+_CURSOR_PREFIX = "id:"
+
+
+@dataclass(frozen=True)
+class Page(Generic[T]):
+    """一页结果。
+
+    Attributes:
+        items: 本页数据。
+        next_cursor: 下一页游标，已是最后一页时为 None。
+    """
+
+    items: list[T] = field(default_factory=list)
+    next_cursor: str | None = None
+
+
+def encode_cursor(last_id: int) -> str:
+    return base64.urlsafe_b64encode(f"{_CURSOR_PREFIX}{last_id}".encode()).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> int:
+    """还原游标中的 id。
+
+    Raises:
+        ValidationException: 游标不是 encode_cursor() 的输出。
+    """
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)).decode()
+    except (binascii.Error, UnicodeDecodeError) as e:
+        raise ValidationException(f"Invalid cursor: {cursor}") from e
+    value = raw.removeprefix(_CURSOR_PREFIX)
+    if value == raw or not value.isdigit():
+        raise ValidationException(f"Invalid cursor: {cursor}")
+    return int(value)
+
+
+def paginate(rows: Sequence[dict[str, Any]], limit: int) -> Page[dict[str, Any]]:
+    """由按 id 升序、多取一行（limit + 1）的查询结果生成 Page；多出的一行说明还有下一页。"""
+    items = list(rows[:limit])
+    next_cursor = encode_cursor(items[-1]["id"]) if len(rows) > limit else None
+    return Page(items=items, next_cursor=next_cursor)
+
+
+def resolve_fields(requested: Sequence[str] | None, allowed: Sequence[str]) -> tuple[str, ...]:
+    """校验字段投影：None 表示全部字段；id 始终返回（游标依赖它）。
+
+    Raises:
+        ValidationException: 含不支持的字段。
+    """
+    if not requested:
+        return tuple(allowed)
+    unknown = [f for f in requested if f not in allowed]
+    if unknown:
+        raise ValidationException(f"Unsupported fields: {', '.join(unknown)}; allowed: {', '.join(allowed)}")
+    return ("id", *(f for f in allowed if f in requested and f != "id"))
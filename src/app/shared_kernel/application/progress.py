@@ -0,0 +1,22 @@
+"""进度上报抽象：长任务 Handler 通过它对外暴露进度计数器，不关心由谁消费。"""
+
+from abc import ABC, abstractmethod
+
+
+class ProgressReporter(ABC):
+    """进度上报接口。"""
+
+    @abstractmethod
+    def report(self, **counters: int) -> None:
+        """以绝对值更新进度计数器（如 processed、total、rows_written、failures）。
+
+        须为非阻塞调用，Handler 可在每个处理单元结束后直接调用。
+        """
+        ...
+
+
+class NullProgressReporter(ProgressReporter):
+    """默认实现：丢弃所有进度，供未接入任务系统的调用方（HTTP 同步调用、定时任务）使用。"""
+
+    def report(self, **counters: int) -> None:
+        return None
@@ -0,0 +1,5 @@
+"""跨模块复用的 QueryHandler。"""
+
+from .cached_query_handler import CachedQueryHandler, QueryResultCache, query_cache_key, query_cache_prefix
+
+__all__ = ["CachedQueryHandler", "QueryResultCache", "query_cache_key", "query_cache_prefix"]
@@ -0,0 +1,54 @@
+"""查询 Handler 缓存装饰：按查询参数缓存 QueryHandler 的结果。"""
+
+import dataclasses
+from collections.abc import Awaitable, Callable
+from enum import Enum
+from typing import Any, Generic, Protocol, TypeVar, cast
+
+from ..query import Query
+from ..query_handler import QueryHandler
+
+Q = TypeVar("Q", bound=Query)
+R = TypeVar("R")
+
+
+class QueryResultCache(Protocol):
+    """CachedQueryHandler 所需的缓存能力，CacheClient 的各实现均满足。"""
+
+    async def get_or_load(
+        self, key: str, loader: Callable[[], Awaitable[Any]], ttl_seconds: int | None = None
+    ) -> Any: ...
+
+
+def query_cache_key(query: Query) -> str:
+    """由查询类型与字段值生成缓存键，如 "query:GetConceptStocks:concept_id=3"。枚举字段取其值。"""
+    fields = ",".join(f"{f.name}={_key_part(getattr(query, f.name))}" for f in dataclasses.fields(query))
+    return f"{query_cache_prefix(type(query))}{fields}"
+
+
+def query_cache_prefix(query_type: type[Query]) -> str:
+    """某一查询类型全部缓存键的公共前缀，供按类型整体失效。"""
+    return f"query:{query_type.__name__}:"
+
+
+def _key_part(value: Any) -> str:
+    return str(value.value) if isinstance(value, Enum) else repr(value)
+
+
+class CachedQueryHandler(QueryHandler[Q, R], Generic[Q, R]):
+    """为 QueryHandler 加缓存：以 query_cache_key(query) 为键，未命中时委托内层 Handler 并回填。
+
+    缓存键只由查询参数决定，内层 Handler 的结果必须只依赖查询参数与底层数据；
+    数据变化时由写入方按键（或 "query:<查询类型>:" 前缀）失效。
+    """
+
+    def __init__(self, inner: QueryHandler[Q, R], cache: QueryResultCache, ttl_seconds: int | None = None) -> None:
+        self._inner = inner
+        self._cache = cache
+        self._ttl_seconds = ttl_seconds
+
+    async def handle(self, query: Q) -> R:
+        result = await self._cache.get_or_load(
+            query_cache_key(query), lambda: self._inner.handle(query), self._ttl_seconds
+        )
+        return cast(R, result)
@@ -1,7 +1,26 @@
-"""缓存客户端抽象：定义统一的缓存接口，具体实现（Redis 等）在模块或全局基础设施层提供。"""
+"""缓存客户端：统一的缓存接口与进程内 TTL/LRU 实现。
 
+- CacheClient：缓存接口，get_or_load() 在未命中时加载并回填
+- InMemoryCacheClient：进程内实现，容量上限 + 按键 TTL + LRU 淘汰，并发未命中同一键时只加载一次
+- create_cache_client()：按配置创建进程内缓存或 Redis 两级缓存（见 redis_cache）
+
+查询 Handler 的缓存装饰见 app.shared_kernel.application.queries。
+"""
+
+import asyncio
 from abc import ABC, abstractmethod
-from typing import Any
+from collections import OrderedDict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from time import monotonic
+from typing import TYPE_CHECKING, Any
+
+from .logging import get_logger
+
+if TYPE_CHECKING:
+    from .cache_serializer import CacheSerializer
+
+logger = get_logger(__name__)
 
 
 class CacheClient(ABC):
@@ -21,3 +40,226 @@ class CacheClient(ABC):
     async def delete(self, key: str) -> None:
         """删除缓存键。"""
         ...
+
+    @abstractmethod
+    async def delete_prefix(self, prefix: str) -> int:
+        """删除全部以 prefix 开头的键，返回删除数量。"""
+        ...
+
+    async def start(self) -> None:
+        """启动后台连接（如失效消息订阅），默认无操作。"""
+
+    async def close(self) -> None:
+        """释放连接，默认无操作。"""
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[Any]], ttl_seconds: int | None = None) -> Any:
+        """命中时返回缓存值，否则调用 loader 加载并回填；loader 返回 None 时不缓存。"""
+        value = await self.get(key)
+        if value is not None:
+            return value
+        value = await loader()
+        if value is not None:
+            await self.set(key, value, ttl_seconds)
+        return value
+
+
+@dataclass(frozen=True)
+class CacheStats:
+    """缓存计数快照。
+
+    Attributes:
+        hits: 命中次数。
+        misses: 未命中次数（含已过期）。
+        loads: get_or_load 实际调用 loader 的次数，并发未命中同一键只计一次。
+        load_failures: loader 抛出异常的次数。
+        evictions: 超出容量被 LRU 淘汰的条目数。
+        expirations: 因 TTL 过期被移除的条目数。
+        size: 当前条目数。
+    """
+
+    hits: int
+    misses: int
+    loads: int
+    load_failures: int
+    evictions: int
+    expirations: int
+    size: int
+
+    @property
+    def hit_ratio(self) -> float:
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+
+class InMemoryCacheClient(CacheClient):
+    """进程内缓存：容量上限 + 按键 TTL + LRU 淘汰。
+
+    缓存的是对象本身而非副本，调用方须把取到的值视为只读。
+    get_or_load() 对同一键的并发未命中只调用一次 loader（single-flight），其余调用等待同一结果；
+    loader 失败时异常传给全部等待者，且不缓存。加载期间发生的删除使该次加载结果不回填，避免写回旧值。
+
+    Attributes:
+        _entries: 键到 (值, 过期时刻) 的映射，按最近使用先后排列，末尾为最近使用。
+        _inflight: 正在加载的键到加载任务的映射。
+        _generation: 删除计数，加载开始后有删除发生时结果不回填。
+    """
+
+    def __init__(
+        self,
+        max_entries: int = 10_000,
+        default_ttl_seconds: int | None = None,
+        clock: Callable[[], float] = monotonic,
+    ) -> None:
+        if max_entries < 1:
+            raise ValueError("max_entries must be positive")
+        self._max_entries = max_entries
+        self._default_ttl = default_ttl_seconds
+        self._clock = clock
+        self._entries: OrderedDict[str, tuple[Any, float | None]] = OrderedDict()
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
+        self._generation = 0
+        self._hits = 0
+        self._misses = 0
+        self._loads = 0
+        self._load_failures = 0
+        self._evictions = 0
+        self._expirations = 0
+
+    async def get(self, key: str) -> Any | None:
+        return self._get(key)
+
+    async def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> None:
+        self._set(key, value, ttl_seconds)
+
+    async def delete(self, key: str) -> None:
+        self._entries.pop(key, None)
+        self._inflight.pop(key, None)
+        self._generation += 1
+
+    async def delete_prefix(self, prefix: str) -> int:
+        keys = [k for k in self._entries if k.startswith(prefix)]
+        for key in keys:
+            del self._entries[key]
+        for key in [k for k in self._inflight if k.startswith(prefix)]:
+            del self._inflight[key]
+        self._generation += 1
+        return len(keys)
+
+    async def clear(self) -> None:
+        self._entries.clear()
+        self._inflight.clear()
+        self._generation += 1
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[Any]], ttl_seconds: int | None = None) -> Any:
+        value = self._get(key)
+        if value is not None:
+            return value
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, loader, ttl_seconds))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._load_done(key, t))
+        # shield：某个等待者被取消时加载继续进行，其余等待者仍能拿到结果
+        return await asyncio.shield(task)
+
+    def stats(self) -> CacheStats:
+        return CacheStats(
+            hits=self._hits,
+            misses=self._misses,
+            loads=self._loads,
+            load_failures=self._load_failures,
+            evictions=self._evictions,
+            expirations=self._expirations,
+            size=len(self._entries),
+        )
+
+    def _get(self, key: str) -> Any | None:
+        entry = self._entries.get(key)
+        if entry is None:
+            self._misses += 1
+            return None
+        value, expires_at = entry
+        if expires_at is not None and self._clock() >= expires_at:
+            del self._entries[key]
+            self._expirations += 1
+            self._misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self._hits += 1
+        return value
+
+    def _set(self, key: str, value: Any, ttl_seconds: int | None) -> None:
+        ttl = ttl_seconds if ttl_seconds is not None else self._default_ttl
+        expires_at = self._clock() + ttl if ttl is not None else None
+        self._entries[key] = (value, expires_at)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self._max_entries:
+            self._entries.popitem(last=False)
+            self._evictions += 1
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[Any]], ttl_seconds: int | None) -> Any:
+        self._loads += 1
+        generation = self._generation
+        try:
+            value = await loader()
+        except Exception as e:
+            self._load_failures += 1
+            logger.warning("Cache load failed", key=key, error=str(e))
+            raise
+        if value is not None and generation == self._generation:
+            self._set(key, value, ttl_seconds)
+        return value
+
+    def _load_done(self, key: str, task: asyncio.Task[Any]) -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # 全部等待者都已取消时异常无人读取，在此读取以免 asyncio 报告未处理的异常
+        if not task.cancelled():
+            task.exception()
+
+
+def create_cache_client(
+    backend: str = "memory",
+    *,
+    max_entries: int = 10_000,
+    redis_url: str = "",
+    redis_max_connections: int = 20,
+    key_prefix: str = "cache:",
+    near_ttl_seconds: int = 60,
+    serializer: "CacheSerializer | None" = None,
+) -> CacheClient:
+    """按配置创建缓存客户端。
+
+    Args:
+        backend: memory：进程内缓存；redis：Redis + 进程内近端缓存，多副本共享并经 pub/sub 失效。
+        max_entries: 进程内（或近端）缓存容量。
+        redis_url: Redis 连接串，backend=redis 时必填。
+        redis_max_connections: Redis 连接池上限。
+        key_prefix: Redis 键前缀，失效频道名也以此为前缀。
+        near_ttl_seconds: 近端缓存条目的最长存活时间，兜底 pub/sub 漏发的失效消息。
+        serializer: Redis 值序列化器，需注册所缓存的 dataclass 类型。
+
+    Raises:
+        ValueError: backend 不受支持，或 backend=redis 时未配置 redis_url。
+    """
+    if backend == "memory":
+        return InMemoryCacheClient(max_entries=max_entries)
+    if backend != "redis":
+        raise ValueError(f"Unsupported cache backend: {backend}")
+    if not redis_url:
+        raise ValueError("redis_url is required for the redis cache backend")
+
+    from redis.asyncio import Redis
+
+    from .cache_serializer import CacheSerializer
+    from .redis_cache import NearCacheClient, RedisCacheClient
+
+    redis = Redis.from_url(redis_url, max_connections=redis_max_connections)
+    remote = RedisCacheClient(redis, serializer or CacheSerializer(), key_prefix=key_prefix)
+    return NearCacheClient(
+        InMemoryCacheClient(max_entries=max_entries),
+        remote,
+        redis,
+        channel=f"{key_prefix}invalidate",
+        near_ttl_seconds=near_ttl_seconds,
+    )
@@ -0,0 +1,105 @@
+"""缓存值序列化：orjson 编码，已注册的 dataclass 带类型标签，解码时按字段类型注解还原。
+
+只还原显式注册的类型，Redis 中的数据不能借此实例化任意类；未注册的 dataclass 编码时报错，
+避免读回时悄悄变成 dict。
+"""
+
+import dataclasses
+import types
+import typing
+from datetime import date, datetime
+from decimal import Decimal
+from enum import Enum
+from typing import Any
+
+import orjson
+
+_TYPE_TAG = "__type__"
+
+
+class CacheSerializer:
+    """缓存值的 bytes 编解码。
+
+    支持 JSON 基本类型、list/tuple/dict、datetime/date（ISO 8601）、Decimal（字符串）、
+    Enum（值）与已注册的 dataclass；dataclass 只编码 init 字段。
+    """
+
+    def __init__(self) -> None:
+        self._types: dict[str, type] = {}
+        self._hints: dict[type, dict[str, Any]] = {}
+
+    def register(self, *classes: type) -> None:
+        """注册可缓存的 dataclass。类型以类名为标签，不同模块的同名类不能同时注册。"""
+        for cls in classes:
+            if not dataclasses.is_dataclass(cls):
+                raise TypeError(f"{cls.__name__} is not a dataclass")
+            registered = self._types.get(cls.__name__)
+            if registered is not None and registered is not cls:
+                raise ValueError(f"Cache type name '{cls.__name__}' already registered by {registered.__module__}")
+            self._types[cls.__name__] = cls
+
+    def dumps(self, value: Any) -> bytes:
+        return orjson.dumps(value, default=self._default, option=orjson.OPT_PASSTHROUGH_DATACLASS)
+
+    def loads(self, data: bytes) -> Any:
+        return self._revive(orjson.loads(data))
+
+    def _default(self, obj: Any) -> Any:
+        if dataclasses.is_dataclass(obj) and not isinstance(obj, type):
+            name = type(obj).__name__
+            if self._types.get(name) is not type(obj):
+                raise TypeError(f"Dataclass {name} is not registered for caching")
+            payload = {f.name: getattr(obj, f.name) for f in dataclasses.fields(obj) if f.init}
+            return {_TYPE_TAG: name, **payload}
+        if isinstance(obj, Decimal):
+            return str(obj)
+        if isinstance(obj, set | frozenset):
+            return list(obj)
+        raise TypeError(f"Type {type(obj).__name__} is not cache-serializable")
+
+    def _revive(self, value: Any) -> Any:
+        if isinstance(value, list):
+            return [self._revive(v) for v in value]
+        if not isinstance(value, dict):
+            return value
+        name = value.get(_TYPE_TAG)
+        if name is None:
+            return {k: self._revive(v) for k, v in value.items()}
+        cls = self._types.get(name)
+        if cls is None:
+            raise ValueError(f"Unknown cached type '{name}'")
+        hints = self._type_hints(cls)
+        kwargs = {k: self._coerce(self._revive(v), hints.get(k)) for k, v in value.items() if k != _TYPE_TAG}
+        return cls(**kwargs)
+
+    def _type_hints(self, cls: type) -> dict[str, Any]:
+        hints = self._hints.get(cls)
+        if hints is None:
+            hints = self._hints[cls] = typing.get_type_hints(cls)
+        return hints
+
+    def _coerce(self, value: Any, hint: Any) -> Any:
+        """按类型注解把 JSON 值还原为字段类型；无法识别的注解原样返回。"""
+        if value is None or hint is None:
+            return value
+        origin = typing.get_origin(hint)
+        if origin in (typing.Union, types.UnionType):
+            # 只处理 X | None；多类型联合无法从 JSON 值判断目标类型，原样返回
+            args = [a for a in typing.get_args(hint) if a is not type(None)]
+            return self._coerce(value, args[0]) if len(args) == 1 else value
+        if origin in (list, tuple) and isinstance(value, list):
+            item_args = typing.get_args(hint)
+            item_hint = item_args[0] if item_args else None
+            items = [self._coerce(v, item_hint) for v in value]
+            return tuple(items) if origin is tuple else items
+        if not isinstance(hint, type):
+            return value
+        if issubclass(hint, Enum) and not isinstance(value, hint):
+            return hint(value)
+        if hint is datetime and isinstance(value, str):
+            return datetime.fromisoformat(value)
+        if hint is date and isinstance(value, str):
+            return date.fromisoformat(value)
+        if hint is Decimal and isinstance(value, str | int | float):
+            return Decimal(str(value))
+        return value
@@ -0,0 +1,260 @@
+"""Redis 缓存后端与两级近端缓存。
+
+- RedisCacheClient：值经 CacheSerializer 编码后存入 Redis，多副本共享；批量读写各只需一次往返
+- NearCacheClient：进程内 InMemoryCacheClient 在前、RedisCacheClient 在后；写入与删除经 pub/sub
+  广播失效消息，其他副本随即丢弃本地副本。pub/sub 不保证送达，本地副本另有较短 TTL 兜底
+
+依赖 redis（redis.asyncio），仅在 CACHE_BACKEND=redis 时导入。
+"""
+
+import asyncio
+import contextlib
+import os
+import socket
+from collections.abc import Awaitable, Callable, Iterable
+from typing import Any
+from uuid import uuid4
+
+import orjson
+from redis.asyncio import Redis
+from redis.exceptions import RedisError
+
+from .cache import CacheClient, InMemoryCacheClient
+from .cache_serializer import CacheSerializer
+from .logging import get_logger
+
+logger = get_logger(__name__)
+
+# delete_prefix 中 SCAN 每批返回的键数
+_SCAN_BATCH = 500
+
+
+class RedisCacheClient(CacheClient):
+    """Redis 缓存。
+
+    键统一加 key_prefix 以便与其他数据共用实例；连接由 Redis 客户端的连接池管理。
+    get_or_load() 在进程内对同一键的并发未命中只加载一次，跨副本的并发加载不做协调。
+    读取失败（Redis 不可用）记录告警并按未命中处理，get_or_load() 由此回退到 loader。
+    """
+
+    def __init__(
+        self,
+        redis: Redis,
+        serializer: CacheSerializer,
+        key_prefix: str = "cache:",
+        default_ttl_seconds: int | None = None,
+    ) -> None:
+        self._redis = redis
+        self._serializer = serializer
+        self._prefix = key_prefix
+        self._default_ttl = default_ttl_seconds
+        self._inflight: dict[str, asyncio.Task[Any]] = {}
+
+    async def get(self, key: str) -> Any | None:
+        try:
+            raw = await self._redis.get(self._prefix + key)
+        except RedisError as e:
+            logger.warning("Cache read failed", key=key, error=str(e))
+            return None
+        return None if raw is None else self._serializer.loads(_as_bytes(raw))
+
+    async def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> None:
+        await self._redis.set(self._prefix + key, self._serializer.dumps(value), ex=self._ttl(ttl_seconds))
+
+    async def delete(self, key: str) -> None:
+        await self._redis.delete(self._prefix + key)
+
+    async def get_many(self, keys: list[str]) -> dict[str, Any]:
+        """一次 MGET 读取多个键，返回命中的键值。"""
+        if not keys:
+            return {}
+        try:
+            raws = await self._redis.mget([self._prefix + k for k in keys])
+        except RedisError as e:
+            logger.warning("Cache read failed", key_count=len(keys), error=str(e))
+            return {}
+        return {k: self._serializer.loads(_as_bytes(raw)) for k, raw in zip(keys, raws, strict=True) if raw is not None}
+
+    async def set_many(self, items: dict[str, Any], ttl_seconds: int | None = None) -> None:
+        """以一条非事务 pipeline 写入多个键。"""
+        if not items:
+            return
+        ttl = self._ttl(ttl_seconds)
+        async with self._redis.pipeline(transaction=False) as pipe:
+            for key, value in items.items():
+                pipe.set(self._prefix + key, self._serializer.dumps(value), ex=ttl)
+            await pipe.execute()
+
+    async def delete_prefix(self, prefix: str) -> int:
+        """以 SCAN 遍历并 UNLINK 全部以 prefix 开头的键，返回删除数量。"""
+        deleted = 0
+        batch: list[bytes] = []
+        async for key in self._redis.scan_iter(match=_escape_glob(self._prefix + prefix) + "*", count=_SCAN_BATCH):
+            batch.append(key)
+            if len(batch) >= _SCAN_BATCH:
+                deleted += await self._redis.unlink(*batch)
+                batch.clear()
+        if batch:
+            deleted += await self._redis.unlink(*batch)
+        return deleted
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[Any]], ttl_seconds: int | None = None) -> Any:
+        value = await self.get(key)
+        if value is not None:
+            return value
+        task = self._inflight.get(key)
+        if task is None:
+            task = asyncio.ensure_future(self._load(key, loader, ttl_seconds))
+            self._inflight[key] = task
+            task.add_done_callback(lambda t: self._inflight.pop(key, None) if self._inflight.get(key) is t else None)
+        return await asyncio.shield(task)
+
+    async def close(self) -> None:
+        await self._redis.aclose()
+
+    def _ttl(self, ttl_seconds: int | None) -> int | None:
+        return ttl_seconds if ttl_seconds is not None else self._default_ttl
+
+    async def _load(self, key: str, loader: Callable[[], Awaitable[Any]], ttl_seconds: int | None) -> Any:
+        value = await loader()
+        if value is not None:
+            try:
+                await self.set(key, value, ttl_seconds)
+            except Exception as e:
+                # 回填失败不影响本次结果
+                logger.warning("Cache write failed", key=key, error=str(e))
+        return value
+
+
+class NearCacheClient(CacheClient):
+    """两级缓存：本地 InMemoryCacheClient + 远端 RedisCacheClient。
+
+    - 读：先本地，未命中读远端并回填本地（本地 TTL 取 near_ttl_seconds 与写入 TTL 的较小值）
+    - 写 / 删：先远端后本地，再在 channel 上广播失效消息；收到其他实例的消息时删除本地对应键
+    - get_or_load：本地 single-flight 包住远端 get_or_load，同一进程内并发未命中只访问一次远端
+
+    订阅连接断开期间可能漏收失效消息，重新订阅后清空本地缓存。
+
+    Attributes:
+        _origin: 本实例标识，忽略自己发出的失效消息。
+        _listener: 订阅失效消息的后台任务。
+    """
+
+    def __init__(
+        self,
+        local: InMemoryCacheClient,
+        remote: RedisCacheClient,
+        redis: Redis,
+        channel: str = "cache:invalidate",
+        near_ttl_seconds: int = 60,
+    ) -> None:
+        self._local = local
+        self._remote = remote
+        self._redis = redis
+        self._channel = channel
+        self._near_ttl = near_ttl_seconds
+        self._origin = f"{socket.gethostname()}:{os.getpid()}:{uuid4().hex[:8]}"
+        self._listener: asyncio.Task[None] | None = None
+        self._subscribed = asyncio.Event()
+
+    @property
+    def local(self) -> InMemoryCacheClient:
+        return self._local
+
+    async def start(self) -> None:
+        """订阅失效消息，返回时已完成订阅。"""
+        if self._listener is None:
+            self._listener = asyncio.create_task(self._listen())
+            await self._subscribed.wait()
+
+    async def close(self) -> None:
+        if self._listener is not None:
+            self._listener.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._listener
+            self._listener = None
+        await self._remote.close()
+
+    async def get(self, key: str) -> Any | None:
+        value = await self._local.get(key)
+        if value is not None:
+            return value
+        value = await self._remote.get(key)
+        if value is not None:
+            await self._local.set(key, value, self._near_ttl)
+        return value
+
+    async def set(self, key: str, value: Any, ttl_seconds: int | None = None) -> None:
+        await self._remote.set(key, value, ttl_seconds)
+        await self._local.set(key, value, self._local_ttl(ttl_seconds))
+        await self._publish(keys=[key])
+
+    async def delete(self, key: str) -> None:
+        await self._remote.delete(key)
+        await self._local.delete(key)
+        await self._publish(keys=[key])
+
+    async def delete_prefix(self, prefix: str) -> int:
+        deleted = await self._remote.delete_prefix(prefix)
+        await self._local.delete_prefix(prefix)
+        await self._publish(prefixes=[prefix])
+        return deleted
+
+    async def get_or_load(self, key: str, loader: Callable[[], Awaitable[Any]], ttl_seconds: int | None = None) -> Any:
+        return await self._local.get_or_load(
+            key, lambda: self._remote.get_or_load(key, loader, ttl_seconds), self._local_ttl(ttl_seconds)
+        )
+
+    def _local_ttl(self, ttl_seconds: int | None) -> int:
+        return self._near_ttl if ttl_seconds is None else min(ttl_seconds, self._near_ttl)
+
+    async def _publish(self, keys: Iterable[str] = (), prefixes: Iterable[str] = ()) -> None:
+        message = orjson.dumps({"origin": self._origin, "keys": list(keys), "prefixes": list(prefixes)})
+        try:
+            await self._redis.publish(self._channel, message)
+        except Exception as e:
+            # 其他副本的本地副本最迟在 near_ttl_seconds 后过期
+            logger.warning("Cache invalidation publish failed", channel=self._channel, error=str(e))
+
+    async def _listen(self) -> None:
+        while True:
+            try:
+                async with self._redis.pubsub(ignore_subscribe_messages=True) as pubsub:
+                    await pubsub.subscribe(self._channel)
+                    if self._subscribed.is_set():
+                        # 重新订阅：断开期间可能漏收失效消息
+                        await self._local.clear()
+                        logger.info("Cache invalidation resubscribed", channel=self._channel)
+                    self._subscribed.set()
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            await self._apply_invalidation(message["data"])
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.warning("Cache invalidation subscription lost", channel=self._channel, error=str(e))
+                self._subscribed.set()
+                await asyncio.sleep(1.0)
+
+    async def _apply_invalidation(self, data: bytes) -> None:
+        try:
+            message = orjson.loads(data)
+        except orjson.JSONDecodeError:
+            logger.warning("Malformed cache invalidation message", channel=self._channel)
+            return
+        if message.get("origin") == self._origin:
+            return
+        for key in message.get("keys", []):
+            await self._local.delete(key)
+        for prefix in message.get("prefixes", []):
+            await self._local.delete_prefix(prefix)
+
+
+def _as_bytes(raw: bytes | str) -> bytes:
+    """客户端开启 decode_responses 时 Redis 返回 str，统一转回 bytes 交给序列化器。"""
+    return raw.encode() if isinstance(raw, str) else raw
+
+
+def _escape_glob(pattern: str) -> str:
+    """转义 Redis MATCH 的通配字符。"""
+    return "".join("\\" + c if c in "*?[]\\" else c for c in pattern)
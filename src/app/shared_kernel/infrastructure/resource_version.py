@@ -0,0 +1,35 @@
+"""资源版本号：为条件 GET 提供无需查库的 ETag。
+
+每个资源（如 "concepts"、"concept_stocks:3"）在缓存中保存一个随机版本号，首次读取时生成；
+数据变化时写入方调用 bump() 删除版本号，下次读取生成新值。版本号丢失（过期、淘汰、重启）只会让客户端多收一次完整响应，
+不会误判为未修改；读取方须先取版本号再加载数据，并发写入时最多多返回一次 200。
+"""
+
+from uuid import uuid4
+
+from .cache import CacheClient
+
+_KEY_PREFIX = "version:"
+
+
+class ResourceVersions:
+    """缓存支持的资源版本号。多副本共享 Redis 缓存时各副本看到同一版本号。"""
+
+    def __init__(self, cache: CacheClient) -> None:
+        self._cache = cache
+
+    async def current(self, resource: str, ttl_seconds: int | None = None) -> str:
+        """资源当前版本号，不存在时生成。"""
+        return str(await self._cache.get_or_load(_KEY_PREFIX + resource, self._new_version, ttl_seconds))
+
+    async def bump(self, resource: str) -> None:
+        """资源已变化，作废当前版本号。"""
+        await self._cache.delete(_KEY_PREFIX + resource)
+
+    async def bump_prefix(self, prefix: str) -> None:
+        """作废全部以 prefix 开头的资源的版本号。"""
+        await self._cache.delete_prefix(_KEY_PREFIX + prefix)
+
+    @staticmethod
+    async def _new_version() -> str:
+        return uuid4().hex
@@ -1,5 +1,6 @@
 """Fixtures for API (interface) tests. Use in-memory SQLite, no real DB."""
 
+import asyncio
 import os
 
 import pytest
@@ -20,8 +21,12 @@ async def api_client():
     import app.modules.data_engineering.infrastructure.models  # noqa: F401
     import app.modules.data_engineering.infrastructure.models.concept_model  # noqa: F401
     import app.modules.data_engineering.infrastructure.models.concept_stock_model  # noqa: F401
+    import app.modules.foundation.infrastructure.background_job_model  # noqa: F401
+    import app.modules.foundation.infrastructure.scheduled_task_run_model  # noqa: F401
     from app.interfaces import main
+    from app.shared_kernel.application.event_bus import InProcessEventBus, set_event_bus
     from app.shared_kernel.application.mediator import Mediator
+    from app.shared_kernel.infrastructure.cache import InMemoryCacheClient
     from app.shared_kernel.infrastructure.database import Base, Database
 
     app = main.app
@@ -35,10 +40,36 @@ async def api_client():
     app.state.db = db
     app.state.mediator = mediator
 
+    cache = InMemoryCacheClient()
+    app.state.cache = cache
+    set_event_bus(main._initialize_event_bus(cache))
+
+    job_runner = main._initialize_job_runner(db)
+    app.state.job_runner = job_runner
+    await job_runner.start()
+
     async with AsyncClient(
         transport=ASGITransport(app=app),
         base_url="http://test",
     ) as client:
         yield client
 
+    await job_runner.shutdown()
+    set_event_bus(InProcessEventBus())
     await db.dispose()
+
+
+@pytest.fixture
+def wait_for_job(api_client):
+    """返回一个协程函数：轮询 /jobs/{job_id} 直到任务进入终态，返回任务数据。"""
+
+    async def _wait(job_id: str, timeout: float = 5.0) -> dict:
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + timeout
+        while True:
+            data = (await api_client.get(f"/api/v1/jobs/{job_id}")).json()["data"]
+            if data["status"] in ("succeeded", "failed") or loop.time() > deadline:
+                return data
+            await asyncio.sleep(0.02)
+
+    return _wait
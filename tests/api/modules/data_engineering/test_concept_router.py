@@ -1,3 +1,4 @@
+from dataclasses import replace
 from unittest.mock import AsyncMock, patch
 
 import pytest
@@ -21,17 +22,20 @@ def _make_concept() -> Concept:
 
 class TestConceptRouter:
     @pytest.mark.asyncio
-    async def test_sync_and_list_concepts(self, api_client) -> None:
+    async def test_sync_and_list_concepts(self, api_client, wait_for_job) -> None:
         with patch("app.modules.data_engineering.interfaces.dependencies.AkShareConceptGateway") as MockGateway:
             MockGateway.return_value.fetch_concepts = AsyncMock(return_value=[_make_concept()])
             MockGateway.return_value.fetch_concept_stocks = AsyncMock(return_value=[])
 
             sync_resp = await api_client.post("/api/v1/data-engineering/concepts/sync")
+            assert sync_resp.status_code == 202
+            sync_body = sync_resp.json()
+            assert sync_body["data"]["status"] == "pending"
+            job = await wait_for_job(sync_body["data"]["id"])
 
-        assert sync_resp.status_code == 200
-        sync_body = sync_resp.json()
-        assert sync_body["code"] == 200
-        assert sync_body["data"]["new_concepts"] == 1
+        assert job["status"] == "succeeded"
+        assert job["result"]["new_concepts"] == 1
+        assert job["progress"]["processed"] == job["progress"]["total"] == 1
 
         list_resp = await api_client.get("/api/v1/data-engineering/concepts")
         assert list_resp.status_code == 200
@@ -39,8 +43,195 @@ class TestConceptRouter:
         assert list_body["code"] == 200
         assert isinstance(list_body["data"], list)
 
+    @pytest.mark.asyncio
+    async def test_sync_with_snapshot_strategy(self, api_client, wait_for_job) -> None:
+        with patch("app.modules.data_engineering.interfaces.dependencies.AkShareConceptGateway") as MockGateway:
+            MockGateway.return_value.fetch_concepts = AsyncMock(return_value=[_make_concept()])
+            MockGateway.return_value.fetch_concept_stocks = AsyncMock(return_value=[])
+
+            first_resp = await api_client.post(
+                "/api/v1/data-engineering/concepts/sync", params={"strategy": "snapshot"}
+            )
+            first = await wait_for_job(first_resp.json()["data"]["id"])
+            second_resp = await api_client.post(
+                "/api/v1/data-engineering/concepts/sync", params={"strategy": "snapshot"}
+            )
+            second = await wait_for_job(second_resp.json()["data"]["id"])
+
+        assert first_resp.status_code == 202
+        assert first["params"] == {"strategy": "snapshot"}
+        assert first["result"]["new_concepts"] == 1
+        assert second["result"]["new_concepts"] == 0
+        assert second["result"]["modified_concepts"] == 0
+
+        list_resp = await api_client.get("/api/v1/data-engineering/concepts")
+        assert [c["third_code"] for c in list_resp.json()["data"]] == ["BK0818"]
+
     @pytest.mark.asyncio
     async def test_get_concept_stocks_not_found_returns_404(self, api_client) -> None:
         response = await api_client.get("/api/v1/data-engineering/concepts/999/stocks")
 
         assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_cached_list_is_invalidated_by_sync(self, api_client, wait_for_job) -> None:
+        before = await api_client.get("/api/v1/data-engineering/concepts")
+        assert before.json()["data"] == []
+
+        with patch("app.modules.data_engineering.interfaces.dependencies.AkShareConceptGateway") as MockGateway:
+            MockGateway.return_value.fetch_concepts = AsyncMock(return_value=[_make_concept()])
+            MockGateway.return_value.fetch_concept_stocks = AsyncMock(return_value=[])
+            sync_resp = await api_client.post("/api/v1/data-engineering/concepts/sync")
+            await wait_for_job(sync_resp.json()["data"]["id"])
+
+        after = await api_client.get("/api/v1/data-engineering/concepts")
+        assert [c["third_code"] for c in after.json()["data"]] == ["BK0818"]
+
+    @pytest.mark.asyncio
+    async def test_conditional_get_returns_304_until_sync_changes_concepts(self, api_client, wait_for_job) -> None:
+        first = await api_client.get("/api/v1/data-engineering/concepts")
+        etag = first.headers["etag"]
+        assert etag.startswith('"') and "must-revalidate" in first.headers["cache-control"]
+
+        not_modified = await api_client.get("/api/v1/data-engineering/concepts", headers={"If-None-Match": etag})
+        assert not_modified.status_code == 304
+        assert not_modified.headers["etag"] == etag
+        assert not_modified.content == b""
+
+        with patch("app.modules.data_engineering.interfaces.dependencies.AkShareConceptGateway") as MockGateway:
+            MockGateway.return_value.fetch_concepts = AsyncMock(return_value=[_make_concept()])
+            MockGateway.return_value.fetch_concept_stocks = AsyncMock(return_value=[])
+            sync_resp = await api_client.post("/api/v1/data-engineering/concepts/sync")
+            await wait_for_job(sync_resp.json()["data"]["id"])
+
+        changed = await api_client.get("/api/v1/data-engineering/concepts", headers={"If-None-Match": etag})
+        assert changed.status_code == 200
+        assert changed.headers["etag"] != etag
+        assert [c["third_code"] for c in changed.json()["data"]] == ["BK0818"]
+
+    @pytest.mark.asyncio
+    async def test_list_concepts_paginates_with_link_header_and_projection(self, api_client, wait_for_job) -> None:
+        concepts = [_make_concept(), replace(_make_concept(), third_code="BK0001", name="人工智能芯片")]
+        with patch("app.modules.data_engineering.interfaces.dependencies.AkShareConceptGateway") as MockGateway:
+            MockGateway.return_value.fetch_concepts = AsyncMock(return_value=concepts)
+            MockGateway.return_value.fetch_concept_stocks = AsyncMock(return_value=[])
+            sync_resp = await api_client.post("/api/v1/data-engineering/concepts/sync")
+            await wait_for_job(sync_resp.json()["data"]["id"])
+
+        first = await api_client.get(
+            "/api/v1/data-engineering/concepts", params={"limit": 1, "fields": "name", "name_prefix": "人工"}
+        )
+        assert first.status_code == 200
+        assert list(first.json()["data"][0]) == ["id", "name"]
+        next_url = first.headers["link"].removeprefix("<").split(">;")[0]
+
+        second = await api_client.get(next_url)
+        assert [c["name"] for c in first.json()["data"] + second.json()["data"]] == ["人工智能", "人工智能芯片"]
+        assert "link" not in second.headers
+
+        bad = await api_client.get("/api/v1/data-engineering/concepts", params={"fields": "content_hash"})
+        assert bad.status_code == 400
+
+    @pytest.mark.asyncio
+    async def test_concepts_by_stock_and_batch_memberships(self, api_client) -> None:
+        from datetime import UTC, datetime
+
+        from app.interfaces.main import app
+        from app.modules.data_engineering.domain.entities.concept_stock import ConceptStock
+        from app.modules.data_engineering.infrastructure import (
+            SqlAlchemyConceptRepository,
+            SqlAlchemyConceptStockRepository,
+        )
+
+        async with app.state.db.session_factory() as session:
+            first, second = await SqlAlchemyConceptRepository(session).save_many(
+                [_make_concept(), replace(_make_concept(), third_code="BK0001", name="白酒")]
+            )
+            await SqlAlchemyConceptStockRepository(session).save_many(
+                [
+                    ConceptStock(None, concept.id or 0, DataSource.AKSHARE, code, None, "h", datetime.now(UTC))
+                    for concept, code in [(first, "000001.SZ"), (second, "600519.SH"), (first, "600519.SH")]
+                ]
+            )
+            await session.commit()
+
+        by_stock = await api_client.get("/api/v1/data-engineering/concepts/by-stock/600519.sh")
+        assert by_stock.status_code == 200
+        assert [c["name"] for c in by_stock.json()["data"]] == ["人工智能", "白酒"]
+        assert by_stock.headers["etag"]
+
+        batch = await api_client.post(
+            "/api/v1/data-engineering/concepts/memberships",
+            json={"stock_third_codes": ["600519.SH", "000001.SZ", "999999.SZ"]},
+        )
+        data = batch.json()["data"]
+        assert data["memberships"] == {"600519.SH": [first.id, second.id], "000001.SZ": [first.id], "999999.SZ": []}
+        assert [c["third_code"] for c in data["concepts"]] == ["BK0818", "BK0001"]
+
+        too_many = await api_client.post(
+            "/api/v1/data-engineering/concepts/memberships", json={"stock_third_codes": ["X"] * 5001}
+        )
+        assert too_many.status_code == 422
+
+    @pytest.mark.asyncio
+    async def test_screen_and_overlap(self, api_client) -> None:
+        from datetime import UTC, date, datetime
+
+        from app.interfaces.main import app
+        from app.modules.data_engineering.domain.entities.concept_stock import ConceptStock
+        from app.modules.data_engineering.domain.entities.stock_basic import StockBasic
+        from app.modules.data_engineering.domain.value_objects.stock_status import StockStatus
+        from app.modules.data_engineering.infrastructure import (
+            SqlAlchemyConceptRepository,
+            SqlAlchemyConceptStockRepository,
+            SqlAlchemyStockBasicRepository,
+        )
+
+        codes = ["000001.SZ", "600519.SH", "600000.SH"]
+        async with app.state.db.session_factory() as session:
+            await SqlAlchemyStockBasicRepository(session).upsert_many(
+                [
+                    StockBasic(
+                        None,
+                        DataSource.TUSHARE,
+                        code,
+                        code[:6],
+                        code,
+                        "主板",
+                        "",
+                        "",
+                        date(2020, 1, 1),
+                        StockStatus.LISTED,
+                    )
+                    for code in codes
+                ]
+            )
+            first, second = await SqlAlchemyConceptRepository(session).save_many(
+                [_make_concept(), replace(_make_concept(), third_code="BK0001", name="白酒")]
+            )
+            await SqlAlchemyConceptStockRepository(session).save_many(
+                [
+                    ConceptStock(None, concept.id or 0, DataSource.AKSHARE, code, None, "h", datetime.now(UTC))
+                    for concept, code in [(first, "000001.SZ"), (first, "600519.SH"), (second, "600519.SH")]
+                ]
+            )
+            await session.commit()
+
+        screen = await api_client.post(
+            "/api/v1/data-engineering/concepts/screen", json={"expression": "BK0818 AND NOT BK0001"}
+        )
+        assert screen.json()["data"] == {"count": 1, "stock_third_codes": ["000001.SZ"]}
+
+        overlap = await api_client.post("/api/v1/data-engineering/concepts/overlap", json={"top": 2})
+        data = overlap.json()["data"]
+        assert [c["third_code"] for c in data["concepts"]] == ["BK0818", "BK0001"]
+        assert data["sizes"] == [2, 1]
+        assert data["jaccard"] == [[1.0, 0.5], [0.5, 1.0]]
+
+        invalid = await api_client.post("/api/v1/data-engineering/concepts/screen", json={"expression": "BK0818 AND"})
+        assert invalid.status_code == 400
+
+        nested = await api_client.post(
+            "/api/v1/data-engineering/concepts/screen", json={"expression": "(" * 400 + "BK0818" + ")" * 400}
+        )
+        assert nested.status_code == 400
@@ -4,6 +4,7 @@ import os
 
 os.environ.setdefault("DATABASE_URL", "sqlite+aiosqlite:///:memory:")
 
+from datetime import UTC, datetime
 from unittest.mock import AsyncMock
 
 import pytest
@@ -14,40 +15,54 @@ from app.modules.data_engineering.application.commands.sync_finance_indicator_co
 )
 from app.modules.data_engineering.interfaces.dependencies import (
     get_sync_finance_indicator_by_stock_handler,
-    get_sync_finance_indicator_full_handler,
     get_sync_finance_indicator_increment_handler,
 )
+from app.modules.foundation.application.background_job import BackgroundJob, JobStatus
+from app.modules.foundation.interfaces.jobs import get_job_runner
 
 _R = SyncFinanceIndicatorResult(total=10, success_count=9, failure_count=1, synced_records=360)
 _RS = SyncFinanceIndicatorResult(total=1, success_count=1, failure_count=0, synced_records=40)
 
 
 @pytest.fixture
-def app_with_mocks():
+def job_runner():
+    runner = AsyncMock()
+    runner.submit.return_value = BackgroundJob(
+        id="job-1",
+        job_type="de.sync_finance_indicator_full",
+        params={"revision_aware": True},
+        status=JobStatus.PENDING,
+        created_at=datetime.now(UTC),
+    )
+    return runner
+
+
+@pytest.fixture
+def app_with_mocks(job_runner):
     from app.interfaces.main import app
 
-    full_handler = AsyncMock()
-    full_handler.handle.return_value = _R
     by_stock_handler = AsyncMock()
     by_stock_handler.handle.return_value = _RS
     increment_handler = AsyncMock()
     increment_handler.handle.return_value = _R
 
-    app.dependency_overrides[get_sync_finance_indicator_full_handler] = lambda: full_handler
+    app.dependency_overrides[get_job_runner] = lambda: job_runner
     app.dependency_overrides[get_sync_finance_indicator_by_stock_handler] = lambda: by_stock_handler
     app.dependency_overrides[get_sync_finance_indicator_increment_handler] = lambda: increment_handler
     yield app
-    app.dependency_overrides.pop(get_sync_finance_indicator_full_handler, None)
+    app.dependency_overrides.pop(get_job_runner, None)
     app.dependency_overrides.pop(get_sync_finance_indicator_by_stock_handler, None)
     app.dependency_overrides.pop(get_sync_finance_indicator_increment_handler, None)
 
 
 @pytest.mark.asyncio
-async def test_sync_full(app_with_mocks):
+async def test_sync_full(app_with_mocks, job_runner):
     async with AsyncClient(transport=ASGITransport(app=app_with_mocks), base_url="http://test") as c:
-        r = await c.post("/api/v1/data-engineering/finance-indicator/sync/full")
-    assert r.status_code == 200
-    assert r.json()["success_count"] == 9
+        r = await c.post("/api/v1/data-engineering/finance-indicator/sync/full", params={"revision_aware": True})
+    assert r.status_code == 202
+    assert r.json()["data"]["id"] == "job-1"
+    assert r.json()["data"]["status"] == "pending"
+    job_runner.submit.assert_awaited_once_with("de.sync_finance_indicator_full", {"revision_aware": True})
 
 
 @pytest.mark.asyncio
@@ -0,0 +1,45 @@
+import asyncio
+from typing import Any
+
+import pytest
+
+from app.modules.foundation.application.job_runner import JobContext
+
+
+class TestJobRouter:
+    @pytest.mark.asyncio
+    async def test_get_unknown_job_returns_404(self, api_client) -> None:
+        response = await api_client.get("/api/v1/jobs/missing")
+
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_resume_unknown_job_returns_404(self, api_client) -> None:
+        response = await api_client.post("/api/v1/jobs/missing/resume")
+
+        assert response.status_code == 404
+
+    @pytest.mark.asyncio
+    async def test_events_stream_ends_with_terminal_status(self, api_client) -> None:
+        from app.interfaces.main import app
+
+        async def _job(_params: dict[str, Any], ctx: JobContext) -> dict[str, Any]:
+            ctx.progress.report(total=2, processed=1)
+            await asyncio.sleep(0.01)
+            ctx.progress.report(processed=2)
+            return {"ok": 1}
+
+        runner = app.state.job_runner
+        runner.register("test.progress", _job)
+        job = await runner.submit("test.progress")
+
+        async with api_client.stream("GET", f"/api/v1/jobs/{job.id}/events") as response:
+            assert response.status_code == 200
+            assert response.headers["content-type"].startswith("text/event-stream")
+            events = [
+                line.removeprefix("event: ") async for line in response.aiter_lines() if line.startswith("event:")
+            ]
+        assert events[-1] == "succeeded"
+        polled = (await api_client.get(f"/api/v1/jobs/{job.id}")).json()["data"]
+        assert polled["result"] == {"ok": 1}
+        assert polled["progress"] == {"total": 2, "processed": 2}
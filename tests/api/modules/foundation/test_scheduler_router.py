@@ -0,0 +1,38 @@
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.modules.foundation.application.task_run_store import TaskRunRecord, TaskRunStatus
+
+
+class TestSchedulerRouter:
+    @pytest.mark.asyncio
+    async def test_runs_and_stats(self, api_client) -> None:
+        from app.interfaces.main import app
+        from app.modules.foundation.interfaces.scheduler import create_task_run_store
+
+        now = datetime.now(UTC)
+        store = create_task_run_store(app.state.db.session_factory)
+        await store.add_many(
+            [
+                TaskRunRecord(
+                    run_id=f"r{i}",
+                    task_id="de.sync_stock_basic",
+                    root_id="de.sync_stock_basic",
+                    status=TaskRunStatus.SUCCEEDED,
+                    started_at=now - timedelta(minutes=i, seconds=1),
+                    finished_at=now - timedelta(minutes=i),
+                    duration_ms=100 * (i + 1),
+                    rows=5000,
+                )
+                for i in range(10)
+            ]
+        )
+
+        runs = (await api_client.get("/api/v1/scheduler/runs", params={"limit": 3})).json()["data"]
+        assert [r["run_id"] for r in runs] == ["r0", "r1", "r2"]
+        assert runs[0]["rows"] == 5000
+
+        [stats] = (await api_client.get("/api/v1/scheduler/runs/stats")).json()["data"]
+        assert stats["task_id"] == "de.sync_stock_basic"
+        assert (stats["runs"], stats["p50_ms"], stats["p95_ms"]) == (10, 500, 1000)
@@ -142,3 +142,31 @@ async def test_find_all_and_delete(engine_and_session) -> None:
 
     assert len(all_concepts) == 2
     assert len(after_delete) == 1
+
+
+@pytest.mark.asyncio
+async def test_find_page_filters_by_name_prefix_and_projects_columns(engine_and_session) -> None:
+    _engine, session_factory = engine_and_session
+    async with session_factory() as session:
+        repo = SqlAlchemyConceptRepository(session)
+        await repo.save_many(
+            [
+                _make_concept("BK0001", "人工智能"),
+                _make_concept("BK0002", "新能源"),
+                _make_concept("BK0003", "人工智能应用"),
+                _make_concept("BK0004", "人工%智能"),
+            ]
+        )
+        await session.commit()
+
+    async with session_factory() as session:
+        repo = SqlAlchemyConceptRepository(session)
+        first = await repo.find_page(DataSource.AKSHARE, fields=("id", "name"), limit=1, name_prefix="人工智能")
+        rest = await repo.find_page(
+            DataSource.AKSHARE, fields=("id", "name"), limit=10, after_id=first[0]["id"], name_prefix="人工智能"
+        )
+        escaped = await repo.find_page(DataSource.AKSHARE, fields=("id", "third_code"), limit=10, name_prefix="人工%")
+
+    assert [set(row) for row in first] == [{"id", "name"}]
+    assert [row["name"] for row in first + rest] == ["人工智能", "人工智能应用"]
+    assert [row["third_code"] for row in escaped] == ["BK0004"]
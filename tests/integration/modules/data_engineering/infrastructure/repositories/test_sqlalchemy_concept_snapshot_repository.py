@@ -0,0 +1,154 @@
+from dataclasses import replace
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.modules.data_engineering.domain.entities.concept import Concept
+from app.modules.data_engineering.domain.entities.concept_stock import ConceptStock
+from app.modules.data_engineering.domain.value_objects.concept_snapshot import ConceptSnapshotMember
+from app.modules.data_engineering.domain.value_objects.data_source import DataSource
+from app.modules.data_engineering.infrastructure.models.concept_shadow_model import ConceptShadowModel
+from app.modules.data_engineering.infrastructure.models.concept_stock_shadow_model import (
+    ConceptStockShadowModel,
+)
+from app.modules.data_engineering.infrastructure.repositories.sqlalchemy_concept_repository import (
+    SqlAlchemyConceptRepository,
+)
+from app.modules.data_engineering.infrastructure.repositories.sqlalchemy_concept_snapshot_repository import (
+    SqlAlchemyConceptSnapshotRepository,
+)
+from app.modules.data_engineering.infrastructure.repositories.sqlalchemy_concept_stock_repository import (
+    SqlAlchemyConceptStockRepository,
+)
+from app.shared_kernel.infrastructure.database import Base
+
+
+@pytest.fixture
+async def engine_and_session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    yield engine, factory
+    await engine.dispose()
+
+
+def _concept(third_code: str, name: str) -> Concept:
+    return Concept(
+        id=None,
+        source=DataSource.AKSHARE,
+        third_code=third_code,
+        name=name,
+        content_hash=Concept.compute_hash(DataSource.AKSHARE, third_code, name),
+        last_synced_at=datetime(2026, 1, 1, tzinfo=UTC),
+    )
+
+
+def _member(concept_third_code: str, stock_third_code: str, symbol: str) -> ConceptSnapshotMember:
+    return ConceptSnapshotMember(
+        concept_third_code=concept_third_code,
+        stock_third_code=stock_third_code,
+        stock_symbol=symbol,
+        content_hash=ConceptStock.compute_hash(DataSource.AKSHARE, stock_third_code, symbol),
+    )
+
+
+@pytest.mark.asyncio
+async def test_stage_and_apply_merges_snapshot(engine_and_session) -> None:
+    _engine, session_factory = engine_and_session
+    async with session_factory() as session:
+        concept_repo = SqlAlchemyConceptRepository(session)
+        stock_repo = SqlAlchemyConceptStockRepository(session)
+        kept = await concept_repo.save(_concept("BK0001", "人工智能"))
+        obsolete = await concept_repo.save(_concept("BK0003", "过时概念"))
+        await stock_repo.save_many(
+            [
+                ConceptStock(
+                    id=None,
+                    concept_id=concept_id,
+                    source=DataSource.AKSHARE,
+                    stock_third_code=code,
+                    stock_symbol=symbol,
+                    content_hash=ConceptStock.compute_hash(DataSource.AKSHARE, code, symbol),
+                    added_at=datetime(2026, 1, 1, tzinfo=UTC),
+                )
+                for concept_id, code, symbol in [
+                    (kept.id, "000001.SZ", "000001"),  # 保留
+                    (kept.id, "000002.SZ", "000002"),  # 被移出
+                    (kept.id, "600000.SH", "old"),  # 内容变化
+                    (obsolete.id, "000001.SZ", "000001"),  # 随过时概念删除
+                ]
+            ]
+        )
+        await session.commit()
+
+        repo = SqlAlchemyConceptSnapshotRepository(session)
+        await repo.stage(
+            DataSource.AKSHARE,
+            [_concept("BK0001", "人工智能AI"), _concept("BK0002", "新能源")],
+            [
+                _member("BK0001", "000001.SZ", "000001"),
+                _member("BK0001", "600000.SH", "600000"),
+                _member("BK0002", "300750.SZ", "300750"),
+            ],
+        )
+        await session.commit()
+        diff = await repo.apply(DataSource.AKSHARE, datetime(2026, 2, 1, tzinfo=UTC))
+        await session.commit()
+
+        assert (diff.new_concepts, diff.modified_concepts, diff.deleted_concepts) == (1, 1, 1)
+        assert (diff.new_stocks, diff.modified_stocks, diff.deleted_stocks) == (1, 1, 2)
+
+        concepts = {c.third_code: c for c in await concept_repo.find_all(DataSource.AKSHARE)}
+        assert set(concepts) == {"BK0001", "BK0002"}
+        assert concepts["BK0001"].id == kept.id
+        assert concepts["BK0001"].name == "人工智能AI"
+
+        grouped = await stock_repo.find_all_grouped_by_concept(DataSource.AKSHARE)
+        assert {s.stock_third_code: s.stock_symbol for s in grouped[kept.id]} == {
+            "000001.SZ": "000001",
+            "600000.SH": "600000",
+        }
+        assert [s.stock_third_code for s in grouped[concepts["BK0002"].id]] == ["300750.SZ"]
+
+        for model in (ConceptShadowModel, ConceptStockShadowModel):
+            assert (await session.execute(select(func.count()).select_from(model))).scalar_one() == 0
+
+
+@pytest.mark.asyncio
+async def test_apply_unchanged_snapshot_is_noop(engine_and_session) -> None:
+    _engine, session_factory = engine_and_session
+    async with session_factory() as session:
+        repo = SqlAlchemyConceptSnapshotRepository(session)
+        snapshot = ([_concept("BK0001", "人工智能")], [_member("BK0001", "000001.SZ", "000001")])
+        await repo.stage(DataSource.AKSHARE, *snapshot)
+        await repo.apply(DataSource.AKSHARE, datetime(2026, 2, 1, tzinfo=UTC))
+        await session.commit()
+
+        await repo.stage(DataSource.AKSHARE, *snapshot)
+        diff = await repo.apply(DataSource.AKSHARE, datetime(2026, 2, 2, tzinfo=UTC))
+        await session.commit()
+
+    assert diff.new_concepts == diff.modified_concepts == diff.deleted_concepts == 0
+    assert diff.new_stocks == diff.modified_stocks == diff.deleted_stocks == 0
+
+
+@pytest.mark.asyncio
+async def test_apply_updates_concept_when_only_membership_hash_changes(engine_and_session) -> None:
+    _engine, session_factory = engine_and_session
+    async with session_factory() as session:
+        repo = SqlAlchemyConceptSnapshotRepository(session)
+        await repo.stage(DataSource.AKSHARE, [replace(_concept("BK0001", "人工智能"), membership_hash="a" * 16)], [])
+        await repo.apply(DataSource.AKSHARE, datetime(2026, 2, 1, tzinfo=UTC))
+        await session.commit()
+
+        await repo.stage(DataSource.AKSHARE, [replace(_concept("BK0001", "人工智能"), membership_hash="b" * 16)], [])
+        diff = await repo.apply(DataSource.AKSHARE, datetime(2026, 2, 2, tzinfo=UTC))
+        await session.commit()
+
+        concepts = await SqlAlchemyConceptRepository(session).find_all(DataSource.AKSHARE)
+
+    assert diff.modified_concepts == 1
+    assert concepts[0].membership_hash == "b" * 16
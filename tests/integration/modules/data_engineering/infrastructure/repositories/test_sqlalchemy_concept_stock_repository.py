@@ -103,3 +103,62 @@ async def test_delete_by_concept_id_removes_all_rows(engine_and_session) -> None
         rows_after = await repo.find_by_concept_id(concept_id)
 
     assert rows_after == []
+
+
+@pytest.mark.asyncio
+async def test_find_all_grouped_by_concept_and_delete_by_concept_ids(engine_and_session) -> None:
+    _engine, session_factory = engine_and_session
+    async with session_factory() as session:
+        concept_id = await _seed_concept(session)
+        repo = SqlAlchemyConceptStockRepository(session)
+        await repo.save_many([_make_concept_stock(concept_id, "000001"), _make_concept_stock(concept_id, "000002")])
+        await session.commit()
+
+        grouped = await repo.find_all_grouped_by_concept(DataSource.AKSHARE)
+        assert list(grouped) == [concept_id]
+        assert {s.stock_third_code for s in grouped[concept_id]} == {"000001", "000002"}
+        assert await repo.find_all_grouped_by_concept(DataSource.TUSHARE) == {}
+
+        await repo.delete_by_concept_ids([concept_id])
+        await session.commit()
+
+        assert await repo.find_all_grouped_by_concept(DataSource.AKSHARE) == {}
+
+
+@pytest.mark.asyncio
+async def test_find_page_by_concept_id_uses_keyset(engine_and_session) -> None:
+    _engine, session_factory = engine_and_session
+    async with session_factory() as session:
+        concept_id = await _seed_concept(session)
+        repo = SqlAlchemyConceptStockRepository(session)
+        await repo.save_many([_make_concept_stock(concept_id, code) for code in ("000001", "000002", "000003")])
+        await session.commit()
+
+    async with session_factory() as session:
+        repo = SqlAlchemyConceptStockRepository(session)
+        first = await repo.find_page_by_concept_id(concept_id, fields=("id", "stock_third_code"), limit=2)
+        rest = await repo.find_page_by_concept_id(
+            concept_id, fields=("id", "stock_third_code"), limit=2, after_id=first[-1]["id"]
+        )
+
+    assert [row["stock_third_code"] for row in first] == ["000001", "000002"]
+    assert [row["stock_third_code"] for row in rest] == ["000003"]
+    assert set(first[0]) == {"id", "stock_third_code"}
+
+
+@pytest.mark.asyncio
+async def test_find_memberships_returns_code_concept_pairs(engine_and_session) -> None:
+    _engine, session_factory = engine_and_session
+    async with session_factory() as session:
+        concept_id = await _seed_concept(session)
+        repo = SqlAlchemyConceptStockRepository(session)
+        await repo.save_many([_make_concept_stock(concept_id, "000001"), _make_concept_stock(concept_id, "000002")])
+        await session.commit()
+
+    async with session_factory() as session:
+        repo = SqlAlchemyConceptStockRepository(session)
+        pairs = await repo.find_memberships(DataSource.AKSHARE)
+        other = await repo.find_memberships(DataSource.TUSHARE)
+
+    assert sorted(pairs) == [("000001", concept_id), ("000002", concept_id)]
+    assert other == []
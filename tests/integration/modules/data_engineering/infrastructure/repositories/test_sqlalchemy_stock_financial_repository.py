@@ -7,6 +7,9 @@ from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_asyn
 
 from app.modules.data_engineering.domain.entities.stock_financial import StockFinancial
 from app.modules.data_engineering.domain.value_objects.data_source import DataSource
+from app.modules.data_engineering.domain.value_objects.financial_report_fingerprint import (
+    FinancialReportFingerprint,
+)
 from app.modules.data_engineering.infrastructure.repositories.sqlalchemy_stock_financial_repository import (
     SqlAlchemyStockFinancialRepository,
 )
@@ -77,3 +80,25 @@ async def test_get_latest_end_date_no_records(engine_and_session):
         repo = SqlAlchemyStockFinancialRepository(db_session)
         result = await repo.get_latest_end_date(DataSource.TUSHARE, "999999.SZ")
         assert result is None
+
+
+@pytest.mark.asyncio
+async def test_find_fingerprints_returns_versions_by_end_date(engine_and_session):
+    _engine, session_factory = engine_and_session
+    async with session_factory() as db_session:
+        repo = SqlAlchemyStockFinancialRepository(db_session)
+        await repo.upsert_many(
+            [
+                _make(end_date=date(2023, 3, 31), ann_date=date(2023, 4, 28), update_flag="0"),
+                _make(end_date=date(2023, 6, 30), ann_date=date(2023, 8, 30), update_flag="1"),
+                _make(third_code="600000.SH", end_date=date(2023, 6, 30), ann_date=date(2023, 8, 25)),
+            ]
+        )
+        await db_session.commit()
+
+        fingerprints = await repo.find_fingerprints(DataSource.TUSHARE, "000001.SZ")
+
+    assert fingerprints == {
+        date(2023, 3, 31): FinancialReportFingerprint(date(2023, 3, 31), date(2023, 4, 28), "0"),
+        date(2023, 6, 30): FinancialReportFingerprint(date(2023, 6, 30), date(2023, 8, 30), "1"),
+    }
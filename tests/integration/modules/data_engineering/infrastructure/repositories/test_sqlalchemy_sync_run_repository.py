@@ -0,0 +1,69 @@
+from datetime import UTC, datetime
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.modules.data_engineering.domain.entities.sync_run import SyncRun
+from app.modules.data_engineering.domain.value_objects.sync_run_status import SyncRunItemStatus, SyncRunStatus
+from app.modules.data_engineering.infrastructure.models.sync_run_model import SyncRunItemModel, SyncRunModel  # noqa: F401
+from app.modules.data_engineering.infrastructure.repositories.sqlalchemy_sync_run_repository import (
+    SqlAlchemySyncRunRepository,
+)
+from app.shared_kernel.infrastructure.database import Base
+
+
+@pytest.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as s:
+        yield s
+    await engine.dispose()
+
+
+def _run(run_key: str) -> SyncRun:
+    return SyncRun(
+        id=None,
+        kind="stock_daily_history",
+        run_key=run_key,
+        status=SyncRunStatus.RUNNING,
+        total_items=3,
+        started_at=datetime(2026, 2, 22, tzinfo=UTC),
+    )
+
+
+@pytest.mark.asyncio
+async def test_pending_items_follow_plan_order_and_exclude_finished(session) -> None:
+    repo = SqlAlchemySyncRunRepository(session)
+    run = await repo.create(_run("job-1"), ["000003.SZ", "000001.SZ", "000002.SZ"])
+    assert run.id is not None
+
+    await repo.mark_item(run.id, "000003.SZ", SyncRunItemStatus.DONE)
+    await repo.mark_item(run.id, "000002.SZ", SyncRunItemStatus.FAILED, "timeout")
+    await session.commit()
+
+    assert await repo.find_pending_item_keys(run.id) == ["000001.SZ"]
+
+
+@pytest.mark.asyncio
+async def test_find_unfinished_ignores_completed_runs(session) -> None:
+    repo = SqlAlchemySyncRunRepository(session)
+    run = await repo.create(_run("job-1"), ["000001.SZ"])
+    run.status = SyncRunStatus.INTERRUPTED
+    await repo.save(run)
+    await session.commit()
+
+    found = await repo.find_unfinished("stock_daily_history", "job-1")
+    assert found is not None
+    assert found.id == run.id
+    assert found.status is SyncRunStatus.INTERRUPTED
+    assert await repo.find_unfinished("finance_indicator_full", "job-1") is None
+
+    run.status = SyncRunStatus.COMPLETED
+    run.finished_at = datetime(2026, 2, 22, 1, tzinfo=UTC)
+    await repo.save(run)
+    await session.commit()
+
+    assert await repo.find_unfinished("stock_daily_history", "job-1") is None
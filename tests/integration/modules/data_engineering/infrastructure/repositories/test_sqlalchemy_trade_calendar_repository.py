@@ -0,0 +1,39 @@
+from datetime import date
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.modules.data_engineering.domain.entities.trade_calendar_day import TradeCalendarDay
+from app.modules.data_engineering.infrastructure.models.trade_calendar_model import TradeCalendarModel  # noqa: F401
+from app.modules.data_engineering.infrastructure.repositories.sqlalchemy_trade_calendar_repository import (
+    SqlAlchemyTradeCalendarRepository,
+)
+from app.shared_kernel.infrastructure.database import Base
+
+
+@pytest.fixture
+async def session():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False)
+    async with factory() as s:
+        yield s
+    await engine.dispose()
+
+
+def _day(cal_date: date, is_open: bool, exchange: str = "SSE") -> TradeCalendarDay:
+    return TradeCalendarDay(id=None, exchange=exchange, cal_date=cal_date, is_open=is_open)
+
+
+@pytest.mark.asyncio
+async def test_upsert_is_idempotent_and_updates_open_flag(session) -> None:
+    repo = SqlAlchemyTradeCalendarRepository(session)
+    await repo.upsert_many([_day(date(2026, 2, 17), True), _day(date(2026, 2, 16), False)])
+    await repo.upsert_many([_day(date(2026, 2, 17), False), _day(date(2026, 2, 16), False, exchange="SZSE")])
+    await session.commit()
+
+    days = await repo.find_all("SSE")
+
+    assert [(d.cal_date, d.is_open) for d in days] == [(date(2026, 2, 16), False), (date(2026, 2, 17), False)]
+    assert len(await repo.find_all("SZSE")) == 1
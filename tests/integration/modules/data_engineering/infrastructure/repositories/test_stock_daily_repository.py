@@ -135,3 +135,58 @@ async def test_upsert_many_and_get_latest_date(engine_and_session):
         )
         await repository.upsert_many([daily1_updated])
         await db_session.commit()
+
+
+def _daily(third_code: str, trade_date: date, source: DataSource = DataSource.TUSHARE) -> StockDaily:
+    price = Decimal("10.0")
+    return StockDaily(
+        id=None,
+        source=source,
+        third_code=third_code,
+        symbol=third_code.split(".")[0],
+        trade_date=trade_date,
+        open=price,
+        high=price,
+        low=price,
+        close=price,
+        pre_close=price,
+        change=Decimal("0"),
+        pct_chg=Decimal("0"),
+        vol=Decimal("100"),
+        amount=Decimal("1000"),
+        adj_factor=Decimal("1.0"),
+        turnover_rate=None,
+        turnover_rate_f=None,
+        volume_ratio=None,
+        pe=None,
+        pe_ttm=None,
+        pb=None,
+        ps=None,
+        ps_ttm=None,
+        dv_ratio=None,
+        dv_ttm=None,
+        total_share=None,
+        float_share=None,
+        free_share=None,
+        total_mv=None,
+        circ_mv=None,
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_global_latest_trade_date_spans_all_stocks(engine_and_session):
+    _, session_factory = engine_and_session
+    async with session_factory() as db_session:
+        repository = SqlAlchemyStockDailyRepository(db_session)
+        assert await repository.get_global_latest_trade_date(DataSource.TUSHARE) is None
+
+        await repository.upsert_many(
+            [
+                _daily("000001.SZ", date(2026, 2, 18)),
+                _daily("000002.SZ", date(2026, 2, 20)),
+                _daily("000003.SZ", date(2026, 2, 19)),
+            ]
+        )
+        await db_session.commit()
+
+        assert await repository.get_global_latest_trade_date(DataSource.TUSHARE) == date(2026, 2, 20)
@@ -1,28 +1,34 @@
 """API Router and Dependencies 注册集成测试。"""
 
+from datetime import UTC, datetime
+
 import pytest
 from httpx import ASGITransport, AsyncClient
 
 from app.interfaces.main import app
-from app.modules.data_engineering.application.commands.sync_stock_daily_history import (
-    SyncHistoryResult,
-)
 from app.modules.data_engineering.application.commands.sync_stock_daily_increment import (
     RetryResult,
     SyncIncrementResult,
 )
 from app.modules.data_engineering.interfaces.dependencies import (
     get_retry_stock_daily_sync_failures_handler,
-    get_sync_stock_daily_history_handler,
     get_sync_stock_daily_increment_handler,
 )
+from app.modules.foundation.application.background_job import BackgroundJob, JobStatus
+from app.modules.foundation.interfaces.jobs import get_job_runner
 
 
 @pytest.fixture
-def mock_history_handler(mocker):
-    handler = mocker.AsyncMock()
-    handler.handle.return_value = SyncHistoryResult(total=10, success_count=9, failure_count=1, synced_days=100)
-    return handler
+def mock_job_runner(mocker):
+    runner = mocker.AsyncMock()
+    runner.submit.return_value = BackgroundJob(
+        id="job-1",
+        job_type="de.sync_stock_daily_history",
+        params={"ts_codes": ["000001.SZ"]},
+        status=JobStatus.PENDING,
+        created_at=datetime.now(UTC),
+    )
+    return runner
 
 
 @pytest.fixture
@@ -42,21 +48,19 @@ def mock_retry_handler(mocker):
 
 
 @pytest.mark.asyncio
-async def test_sync_history_api(mock_history_handler):
-    app.dependency_overrides[get_sync_stock_daily_history_handler] = lambda: mock_history_handler
+async def test_sync_history_api(mock_job_runner):
+    app.dependency_overrides[get_job_runner] = lambda: mock_job_runner
     try:
         async with AsyncClient(transport=ASGITransport(app=app), base_url="http://test") as client:
             response = await client.post(
                 "/api/v1/data-engineering/stock-daily/sync/history",
                 json={"ts_codes": ["000001.SZ"]},
             )
-        assert response.status_code == 200
+        assert response.status_code == 202
         data = response.json()["data"]
-        assert data["total"] == 10
-        assert data["success_count"] == 9
-        assert data["failure_count"] == 1
-        assert data["synced_days"] == 100
-        assert "duration_ms" in data
+        assert data["id"] == "job-1"
+        assert data["status"] == "pending"
+        mock_job_runner.submit.assert_awaited_once_with("de.sync_stock_daily_history", {"ts_codes": ["000001.SZ"]})
     finally:
         app.dependency_overrides.clear()
 
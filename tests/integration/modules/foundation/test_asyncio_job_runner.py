@@ -0,0 +1,316 @@
+"""AsyncIOJobRunner 集成测试：SQLite 持久化任务状态。"""
+
+import asyncio
+from datetime import UTC, datetime, timedelta
+from typing import Any
+
+import pytest
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+
+from app.modules.foundation.application.background_job import JobStatus
+from app.modules.foundation.application.job_runner import JobContext, JobInterrupted
+from app.modules.foundation.infrastructure.asyncio_job_runner import AsyncIOJobRunner
+from app.modules.foundation.infrastructure.background_job_model import BackgroundJobModel  # noqa: F401
+from app.modules.foundation.infrastructure.sqlalchemy_background_job_store import (
+    SqlAlchemyBackgroundJobStore,
+)
+from app.shared_kernel.domain.exception import NotFoundException, ValidationException
+from app.shared_kernel.infrastructure.database import Base
+
+
+@pytest.fixture
+async def store(tmp_path):
+    # 文件库：每个 Session 独立连接，内存库共用一条连接时并发 Session 的事务会相互提交 / 回滚
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'jobs.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield SqlAlchemyBackgroundJobStore(async_sessionmaker(engine, class_=AsyncSession, expire_on_commit=False))
+    await engine.dispose()
+
+
+async def _wait_terminal(runner: AsyncIOJobRunner, job_id: str) -> None:
+    async for job in runner.subscribe(job_id):
+        if job.status.is_terminal:
+            return
+
+
+@pytest.mark.asyncio
+async def test_submit_runs_job_and_persists_progress_and_result(store) -> None:
+    async def _job(params: dict[str, Any], ctx: JobContext) -> dict[str, Any]:
+        for i in range(1, 4):
+            ctx.progress.report(total=3, processed=i)
+            await asyncio.sleep(0)
+        return {"echo": params["value"]}
+
+    runner = AsyncIOJobRunner(store, max_workers=1, progress_flush_seconds=0.01)
+    runner.register("test.echo", _job)
+    await runner.start()
+    try:
+        job = await runner.submit("test.echo", {"value": 7})
+        assert job.status is JobStatus.PENDING
+        await asyncio.wait_for(_wait_terminal(runner, job.id), timeout=5)
+    finally:
+        await runner.shutdown()
+
+    stored = await store.get(job.id)
+    assert stored is not None
+    assert stored.status is JobStatus.SUCCEEDED
+    assert stored.result == {"echo": 7}
+    assert stored.progress == {"total": 3, "processed": 3}
+    assert stored.started_at is not None and stored.finished_at is not None
+
+
+@pytest.mark.asyncio
+async def test_failed_job_records_error(store) -> None:
+    async def _job(_params: dict[str, Any], _ctx: JobContext) -> dict[str, Any]:
+        raise RuntimeError("boom")
+
+    runner = AsyncIOJobRunner(store, max_workers=1)
+    runner.register("test.fail", _job)
+    await runner.start()
+    try:
+        job = await runner.submit("test.fail")
+        await asyncio.wait_for(_wait_terminal(runner, job.id), timeout=5)
+    finally:
+        await runner.shutdown()
+
+    stored = await store.get(job.id)
+    assert stored is not None
+    assert stored.status is JobStatus.FAILED
+    assert stored.error == "RuntimeError: boom"
+
+
+@pytest.mark.asyncio
+async def test_submit_unknown_job_type_raises(store) -> None:
+    runner = AsyncIOJobRunner(store)
+    with pytest.raises(ValueError):
+        await runner.submit("test.missing")
+
+
+@pytest.mark.asyncio
+async def test_worker_pool_bounds_concurrency(store) -> None:
+    running = 0
+    peak = 0
+
+    async def _job(_params: dict[str, Any], _ctx: JobContext) -> dict[str, Any]:
+        nonlocal running, peak
+        running += 1
+        peak = max(peak, running)
+        await asyncio.sleep(0.02)
+        running -= 1
+        return {}
+
+    runner = AsyncIOJobRunner(store, max_workers=2)
+    runner.register("test.sleep", _job)
+    await runner.start()
+    try:
+        jobs = [await runner.submit("test.sleep") for _ in range(5)]
+        await asyncio.wait_for(asyncio.gather(*(_wait_terminal(runner, j.id) for j in jobs)), timeout=5)
+    finally:
+        await runner.shutdown()
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_start_requeues_jobs_left_over_from_previous_process(store) -> None:
+    started = asyncio.Event()
+
+    async def _blocking(_params: dict[str, Any], _ctx: JobContext) -> dict[str, Any]:
+        started.set()
+        await asyncio.sleep(3600)
+        return {}
+
+    first = AsyncIOJobRunner(store, max_workers=1)
+    first.register("test.sync", _blocking)
+    await first.start()
+    interrupted = await first.submit("test.sync", {"n": 1})
+    queued = await first.submit("test.sync", {"n": 2})
+    await asyncio.wait_for(started.wait(), timeout=5)
+    # 任务不响应取消标记：超过关闭期限后被强制取消
+    await first.shutdown(timeout=0.05)
+
+    assert (await store.get(interrupted.id)).status is JobStatus.RUNNING  # type: ignore[union-attr]
+    assert (await store.get(queued.id)).status is JobStatus.PENDING  # type: ignore[union-attr]
+
+    seen: list[dict[str, Any]] = []
+
+    async def _record(params: dict[str, Any], _ctx: JobContext) -> dict[str, Any]:
+        seen.append(params)
+        return {}
+
+    second = AsyncIOJobRunner(store, max_workers=1)
+    second.register("test.sync", _record)
+    await second.start()
+    try:
+        await asyncio.wait_for(_wait_terminal(second, queued.id), timeout=5)
+    finally:
+        await second.shutdown()
+
+    assert seen == [{"n": 1}, {"n": 2}]
+    assert (await store.get(interrupted.id)).status is JobStatus.SUCCEEDED  # type: ignore[union-attr]
+
+
+@pytest.mark.asyncio
+async def test_shutdown_lets_cooperative_job_checkpoint(store) -> None:
+    started = asyncio.Event()
+    runs: list[str] = []
+
+    async def _cooperative(_params: dict[str, Any], ctx: JobContext) -> dict[str, Any]:
+        runs.append(ctx.job_id)
+        if len(runs) > 1:
+            return {"resumed": True}
+        started.set()
+        while not ctx.cancellation.is_cancelled:
+            await asyncio.sleep(0.01)
+        ctx.progress.report(processed=1)
+        raise JobInterrupted("checkpointed")
+
+    first = AsyncIOJobRunner(store, max_workers=1)
+    first.register("test.checkpoint", _cooperative)
+    await first.start()
+    job = await first.submit("test.checkpoint")
+    await asyncio.wait_for(started.wait(), timeout=5)
+    await first.shutdown(timeout=5)
+
+    stored = await store.get(job.id)
+    assert stored is not None
+    assert stored.status is JobStatus.PENDING
+    assert stored.progress == {"processed": 1}
+
+    second = AsyncIOJobRunner(store, max_workers=1)
+    second.register("test.checkpoint", _cooperative)
+    await second.start()
+    try:
+        await asyncio.wait_for(_wait_terminal(second, job.id), timeout=5)
+    finally:
+        await second.shutdown()
+
+    assert runs == [job.id, job.id]
+    assert (await store.get(job.id)).result == {"resumed": True}  # type: ignore[union-attr]
+
+
+@pytest.mark.asyncio
+async def test_resume_requeues_failed_job_only(store) -> None:
+    attempts: list[int] = []
+
+    async def _flaky(_params: dict[str, Any], _ctx: JobContext) -> dict[str, Any]:
+        attempts.append(1)
+        if len(attempts) == 1:
+            raise RuntimeError("upstream timeout")
+        return {"ok": True}
+
+    runner = AsyncIOJobRunner(store, max_workers=1)
+    runner.register("test.flaky", _flaky)
+    await runner.start()
+    try:
+        job = await runner.submit("test.flaky")
+        await asyncio.wait_for(_wait_terminal(runner, job.id), timeout=5)
+        assert (await runner.get(job.id)).status is JobStatus.FAILED  # type: ignore[union-attr]
+
+        resumed = await runner.resume(job.id)
+        assert resumed.id == job.id
+        assert resumed.error is None
+        await asyncio.wait_for(_wait_terminal(runner, job.id), timeout=5)
+
+        with pytest.raises(ValidationException):
+            await runner.resume(job.id)
+        with pytest.raises(NotFoundException):
+            await runner.resume("missing")
+    finally:
+        await runner.shutdown()
+
+    assert (await store.get(job.id)).status is JobStatus.SUCCEEDED  # type: ignore[union-attr]
+
+
+@pytest.mark.asyncio
+async def test_start_skips_jobs_claimed_by_live_instance(store) -> None:
+    started = asyncio.Event()
+    release = asyncio.Event()
+    runs: list[str] = []
+
+    async def _sync(_params: dict[str, Any], ctx: JobContext) -> dict[str, Any]:
+        runs.append(ctx.job_id)
+        started.set()
+        await release.wait()
+        return {}
+
+    first = AsyncIOJobRunner(store, max_workers=1, instance_id="first")
+    first.register("test.sync", _sync)
+    second = AsyncIOJobRunner(store, max_workers=1, instance_id="second")
+    second.register("test.sync", _sync)
+    await first.start()
+    try:
+        job = await first.submit("test.sync")
+        await asyncio.wait_for(started.wait(), timeout=5)
+        # 另一个 worker / 副本启动：任务仍由存活的 first 持有，不重复执行
+        await second.start()
+        assert await second.get(job.id) is not None
+        assert (await store.get(job.id)).owner == "first"  # type: ignore[union-attr]
+        release.set()
+        await asyncio.wait_for(_wait_terminal(first, job.id), timeout=5)
+    finally:
+        await second.shutdown()
+        await first.shutdown()
+
+    assert runs == [job.id]
+
+
+@pytest.mark.asyncio
+async def test_claim_is_exclusive_until_lease_expires(store) -> None:
+    runner = AsyncIOJobRunner(store, instance_id="a")
+    runner.register("test.noop", lambda _p, _c: asyncio.sleep(0))
+    job = await runner.submit("test.noop")
+    now = datetime.now(UTC)
+
+    assert not await store.claim(job.id, "b", now + timedelta(seconds=60))
+    assert await store.claim(job.id, "a", now + timedelta(seconds=60))
+
+    # 持有者失联：租约过期后其他实例可认领
+    stored = await store.get(job.id)
+    stored.lease_expires_at = now - timedelta(seconds=1)  # type: ignore[union-attr]
+    await store.save(stored)  # type: ignore[arg-type]
+    assert await store.claim(job.id, "b", now + timedelta(seconds=60))
+    assert not await store.claim(job.id, "a", now + timedelta(seconds=60))
+
+    await store.release(job.id, "b")
+    assert await store.claim(job.id, "a", now + timedelta(seconds=60))
+
+
+@pytest.mark.asyncio
+async def test_runner_stops_writing_after_lease_is_taken_over(store) -> None:
+    started = asyncio.Event()
+    stopped = asyncio.Event()
+
+    async def _sync(_params: dict[str, Any], ctx: JobContext) -> dict[str, Any]:
+        started.set()
+        processed = 0
+        while not ctx.cancellation.is_cancelled:
+            processed += 1
+            ctx.progress.report(processed=processed)
+            await asyncio.sleep(0.01)
+        stopped.set()
+        raise JobInterrupted("lease lost")
+
+    runner = AsyncIOJobRunner(store, max_workers=1, progress_flush_seconds=0.01, instance_id="a")
+    runner.register("test.sync", _sync)
+    await runner.start()
+    try:
+        job = await runner.submit("test.sync")
+        await asyncio.wait_for(started.wait(), timeout=5)
+        # 持有者落库失败超过租约期，期间租约过期并由 b 接管（一次写入完成，避免与 a 的续约交错）
+        stored = await store.get(job.id)
+        stored.owner = "b"  # type: ignore[union-attr]
+        stored.lease_expires_at = datetime.now(UTC) + timedelta(seconds=60)  # type: ignore[union-attr]
+        await store.save(stored)  # type: ignore[arg-type]
+        taken_over = await store.get(job.id)
+
+        await asyncio.wait_for(stopped.wait(), timeout=5)
+        await asyncio.sleep(0.05)
+        assert await runner.get(job.id) == await store.get(job.id)
+    finally:
+        await runner.shutdown()
+
+    final = await store.get(job.id)
+    assert final == taken_over
+    assert final.owner == "b" and final.status is JobStatus.RUNNING  # type: ignore[union-attr]
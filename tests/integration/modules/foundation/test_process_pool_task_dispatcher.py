@@ -0,0 +1,92 @@
+"""ProcessPoolTaskDispatcher 集成测试：任务在 spawn 工作进程中执行，日志、失败与领域事件回传主进程。"""
+
+import os
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+
+import pytest
+from structlog.testing import capture_logs
+
+from app.modules.foundation.application.task_dispatcher import RemoteTaskError
+from app.modules.foundation.infrastructure.process_pool_task_dispatcher import ProcessPoolTaskDispatcher
+from app.shared_kernel.application.event_bus import InProcessEventBus, get_event_bus, set_event_bus
+from app.shared_kernel.domain.domain_event import DomainEvent
+from app.shared_kernel.infrastructure.logging import get_logger
+
+
+@dataclass(frozen=True)
+class WorkerEvent(DomainEvent):
+    pid: int = 0
+
+
+def _load_test_tasks(session_factory) -> dict[str, Callable[[], Awaitable[None]]]:
+    """工作进程内调用：模块级函数，按引用传给 spawn 进程。"""
+    logger = get_logger("tests.worker")
+
+    async def ok() -> None:
+        logger.info("worker task ran", pid=os.getpid(), has_session_factory=session_factory is not None)
+
+    async def fail() -> None:
+        raise ValueError("boom")
+
+    async def publish() -> None:
+        await get_event_bus().publish(WorkerEvent(pid=os.getpid()))
+
+    return {"test.ok": ok, "test.fail": fail, "test.publish": publish}
+
+
+@pytest.fixture
+async def dispatcher():
+    dispatcher = ProcessPoolTaskDispatcher(_load_test_tasks, database_url="sqlite+aiosqlite:///:memory:", max_workers=1)
+    yield dispatcher
+    await dispatcher.shutdown(wait=True)
+
+
+@pytest.mark.asyncio
+async def test_task_runs_in_worker_process_and_logs_flow_back(dispatcher) -> None:
+    with capture_logs() as logs:
+        await dispatcher.remote("test.ok")()
+
+    ran = next(e for e in logs if e["event"] == "worker task ran")
+    assert ran["pid"] != os.getpid()
+    assert ran["worker_pid"] == ran["pid"]
+    assert ran["has_session_factory"] is True
+    finished = next(e for e in logs if e["event"] == "Task finished in worker process")
+    assert finished["task_id"] == "test.ok"
+    assert finished["succeeded"] is True
+
+
+@pytest.mark.asyncio
+async def test_worker_failure_raises_remote_task_error(dispatcher) -> None:
+    with pytest.raises(RemoteTaskError, match="ValueError: boom"):
+        await dispatcher.remote("test.fail")()
+
+    # 失败不影响工作进程继续执行后续任务
+    await dispatcher.remote("test.ok")()
+
+
+@pytest.mark.asyncio
+async def test_unknown_task_id_raises_remote_task_error(dispatcher) -> None:
+    with pytest.raises(RemoteTaskError, match="test.missing"):
+        await dispatcher.remote("test.missing")()
+
+
+@pytest.mark.asyncio
+async def test_worker_events_are_republished_in_main_process(dispatcher) -> None:
+    received: list[DomainEvent] = []
+
+    async def on_event(event: DomainEvent) -> None:
+        received.append(event)
+
+    bus = InProcessEventBus()
+    bus.subscribe(WorkerEvent, on_event)
+    set_event_bus(bus)
+    try:
+        await dispatcher.remote("test.publish")()
+        await dispatcher.remote("test.ok")()
+    finally:
+        set_event_bus(InProcessEventBus())
+
+    assert len(received) == 1
+    assert isinstance(received[0], WorkerEvent)
+    assert received[0].pid != os.getpid()
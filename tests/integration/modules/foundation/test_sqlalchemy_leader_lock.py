@@ -0,0 +1,89 @@
+"""SqlAlchemyLeaderLock 集成测试：SQLite 下以租约表作为选举锁。"""
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock
+
+import pytest
+from sqlalchemy import update
+from sqlalchemy.ext.asyncio import create_async_engine
+
+from app.modules.foundation.infrastructure.scheduler_leader_model import SchedulerLeaderModel
+from app.modules.foundation.infrastructure.sqlalchemy_leader_lock import SqlAlchemyLeaderLock
+from app.shared_kernel.infrastructure.database import Base
+
+
+@pytest.fixture
+async def engine(tmp_path):
+    # 文件库：多个连接共享同一数据库，模拟多个进程
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'leader.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield engine
+    await engine.dispose()
+
+
+async def _expire_lease(engine) -> None:
+    async with engine.begin() as conn:
+        await conn.execute(
+            update(SchedulerLeaderModel.__table__).values(expires_at=datetime.now(UTC) - timedelta(seconds=1))
+        )
+
+
+@pytest.mark.asyncio
+async def test_only_one_instance_acquires(engine) -> None:
+    a = SqlAlchemyLeaderLock(engine, "scheduler", "a")
+    b = SqlAlchemyLeaderLock(engine, "scheduler", "b")
+
+    assert await a.try_acquire() is True
+    assert await b.try_acquire() is False
+    assert await a.renew() is True
+
+    leader = await b.current_leader()
+    assert leader is not None
+    assert leader.instance_id == "a"
+
+
+@pytest.mark.asyncio
+async def test_expired_lease_fails_over(engine) -> None:
+    a = SqlAlchemyLeaderLock(engine, "scheduler", "a")
+    b = SqlAlchemyLeaderLock(engine, "scheduler", "b")
+    await a.try_acquire()
+
+    await _expire_lease(engine)
+    assert await a.current_leader() is None
+
+    assert await b.try_acquire() is True
+    assert await a.renew() is False
+    leader = await a.current_leader()
+    assert leader is not None
+    assert leader.instance_id == "b"
+
+
+@pytest.mark.asyncio
+async def test_release_allows_immediate_takeover(engine) -> None:
+    a = SqlAlchemyLeaderLock(engine, "scheduler", "a")
+    b = SqlAlchemyLeaderLock(engine, "scheduler", "b")
+    await a.try_acquire()
+
+    await a.release()
+
+    assert await b.current_leader() is None
+    assert await b.try_acquire() is True
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("op", ["try_acquire", "renew"])
+async def test_advisory_lock_is_dropped_when_lease_write_fails(engine, op) -> None:
+    """advisory 模式下租约行写入失败时废弃专用连接，锁不会在下一次竞选时重入泄漏"""
+    lock = SqlAlchemyLeaderLock(engine, "scheduler", "a")
+    lock._use_advisory = True
+    conn = AsyncMock()
+    lock._lock_conn = conn
+    lock._acquire_advisory = AsyncMock(return_value=True)
+    lock._write_lease = AsyncMock(side_effect=RuntimeError("db down"))
+
+    with pytest.raises(RuntimeError, match="db down"):
+        await getattr(lock, op)()
+
+    conn.invalidate.assert_awaited_once()
+    assert lock._lock_conn is None
@@ -0,0 +1,63 @@
+"""SqlAlchemyTaskRunStore / SqlAlchemySchedulerStateStore 集成测试（SQLite）。"""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+import app.modules.foundation.infrastructure.scheduled_job_state_model  # noqa: F401
+import app.modules.foundation.infrastructure.scheduled_task_run_model  # noqa: F401
+from app.modules.foundation.application.task_run_store import TaskRunRecord, TaskRunStatus
+from app.modules.foundation.infrastructure.sqlalchemy_scheduler_state_store import SqlAlchemySchedulerStateStore
+from app.modules.foundation.infrastructure.sqlalchemy_task_run_store import SqlAlchemyTaskRunStore
+from app.shared_kernel.infrastructure.database import Base
+
+
+@pytest.fixture
+async def session_factory():
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    yield async_sessionmaker(engine, expire_on_commit=False)
+    await engine.dispose()
+
+
+def _record(task_id: str, finished_at: datetime, rows: int | None = None) -> TaskRunRecord:
+    return TaskRunRecord(
+        run_id="run",
+        task_id=task_id,
+        root_id="a",
+        status=TaskRunStatus.SUCCEEDED,
+        started_at=finished_at - timedelta(seconds=1),
+        finished_at=finished_at,
+        duration_ms=1000,
+        rows=rows,
+    )
+
+
+@pytest.mark.asyncio
+async def test_task_run_store_round_trip(session_factory) -> None:
+    store = SqlAlchemyTaskRunStore(session_factory)
+    now = datetime.now(UTC)
+    old = _record("a", now - timedelta(days=40))
+    recent = [_record("a", now - timedelta(minutes=2), rows=10), _record("b", now - timedelta(minutes=1))]
+    await store.add_many([old, *recent])
+
+    latest = await store.find_recent(limit=2)
+    assert [r.task_id for r in latest] == ["b", "a"]
+    assert latest[1] == recent[0]
+
+    assert [r.finished_at for r in await store.find_recent(task_id="a")] == [recent[0].finished_at, old.finished_at]
+    assert await store.find_since(now - timedelta(days=30)) == recent
+
+
+@pytest.mark.asyncio
+async def test_scheduler_state_store_upserts(session_factory) -> None:
+    store = SqlAlchemySchedulerStateStore(session_factory)
+    first = datetime(2026, 2, 23, 8, 30, tzinfo=UTC)
+
+    await store.save_next_run_time("a", first)
+    await store.save_next_run_time("a", first + timedelta(days=1))
+    await store.save_next_run_time("b", None)
+
+    assert await store.load_next_run_times() == {"a": first + timedelta(days=1)}
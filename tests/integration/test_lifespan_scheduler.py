@@ -1,10 +1,17 @@
 """应用启动集成测试 - 调度器生命周期。"""
 
 import pytest
-from fastapi import FastAPI
 from fastapi.testclient import TestClient
 
 
+@pytest.fixture(autouse=True)
+def _single_process_scheduler(monkeypatch):
+    """默认按单进程部署运行（不做主节点选举），选举相关测试在 sqlite_url 中重新开启。"""
+    from app.config import settings
+
+    monkeypatch.setattr(settings, "SCHEDULER_LEADER_ELECTION_ENABLED", False)
+
+
 class TestLifespanScheduler:
     """测试 lifespan 中调度器的初始化和关闭。"""
 
@@ -48,3 +55,60 @@ class TestLifespanScheduler:
         # 注意：由于 TestClient 的实现，running 状态可能仍为 True
         # 但 shutdown 方法应该已被调用
         # 这里我们主要验证没有异常抛出
+
+
+class TestLifespanLeaderElection:
+    """测试开启主节点选举时 lifespan 的调度器启动与 /health 报告。"""
+
+    @pytest.fixture
+    def sqlite_url(self, tmp_path, monkeypatch) -> str:
+        from sqlalchemy import create_engine
+
+        import app.modules.foundation.infrastructure.scheduled_job_state_model  # noqa: F401
+        import app.modules.foundation.infrastructure.scheduled_task_run_model  # noqa: F401
+        import app.modules.foundation.infrastructure.scheduler_leader_model  # noqa: F401
+        from app.config import settings
+        from app.shared_kernel.infrastructure.database import Base
+
+        path = tmp_path / "app.db"
+        engine = create_engine(f"sqlite:///{path}")
+        Base.metadata.create_all(engine)
+        engine.dispose()
+        url = f"sqlite+aiosqlite:///{path}"
+        monkeypatch.setattr(settings, "DATABASE_URL", url)
+        monkeypatch.setattr(settings, "SCHEDULER_LEADER_ELECTION_ENABLED", True)
+        return url
+
+    def test_leader_starts_scheduler_and_reports_on_health(self, sqlite_url: str) -> None:
+        """验证获得主节点身份的进程启动调度器，并在 /health 报告当前主节点。"""
+        from app.interfaces.main import app
+
+        with TestClient(app) as client:
+            elector = app.state.leader_elector
+            assert elector.is_leader
+            assert app.state.scheduler._scheduler.running
+
+            scheduler_status = client.get("/health").json()["data"]["scheduler"]
+            assert scheduler_status["is_leader"] is True
+            assert scheduler_status["leader"] == scheduler_status["instance_id"]
+
+    def test_standby_does_not_start_scheduler(self, sqlite_url: str) -> None:
+        """验证锁已被其他实例持有时，本进程不启动调度器。"""
+        import asyncio
+
+        from sqlalchemy.ext.asyncio import create_async_engine
+
+        from app.interfaces.main import app
+        from app.modules.foundation.infrastructure.sqlalchemy_leader_lock import SqlAlchemyLeaderLock
+
+        async def hold_lock() -> None:
+            engine = create_async_engine(sqlite_url)
+            await SqlAlchemyLeaderLock(engine, "scheduler", "other-worker").try_acquire()
+            await engine.dispose()
+
+        asyncio.run(hold_lock())
+
+        with TestClient(app) as client:
+            assert not app.state.leader_elector.is_leader
+            assert not app.state.scheduler._scheduler.running
+            assert client.get("/health").json()["data"]["scheduler"]["leader"] == "other-worker"
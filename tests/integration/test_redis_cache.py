@@ -0,0 +1,130 @@
+"""RedisCacheClient / NearCacheClient 集成测试：以 fakeredis 代替 Redis 服务。"""
+
+import asyncio
+
+import pytest
+
+fakeredis = pytest.importorskip("fakeredis")
+
+from app.shared_kernel.infrastructure.cache import InMemoryCacheClient  # noqa: E402
+from app.shared_kernel.infrastructure.cache_serializer import CacheSerializer  # noqa: E402
+from app.shared_kernel.infrastructure.redis_cache import NearCacheClient, RedisCacheClient  # noqa: E402
+
+
+@pytest.fixture
+def server():
+    return fakeredis.FakeServer()
+
+
+def _remote(server) -> RedisCacheClient:
+    return RedisCacheClient(fakeredis.FakeAsyncRedis(server=server), CacheSerializer(), key_prefix="t:")
+
+
+async def _near(server) -> NearCacheClient:
+    redis = fakeredis.FakeAsyncRedis(server=server)
+    client = NearCacheClient(
+        InMemoryCacheClient(),
+        RedisCacheClient(redis, CacheSerializer(), key_prefix="t:"),
+        redis,
+        channel="t:invalidate",
+    )
+    await client.start()
+    return client
+
+
+async def _eventually(predicate, timeout: float = 2.0) -> None:
+    deadline = asyncio.get_running_loop().time() + timeout
+    while not await predicate():
+        assert asyncio.get_running_loop().time() < deadline, "condition not met in time"
+        await asyncio.sleep(0.01)
+
+
+@pytest.mark.asyncio
+async def test_redis_get_set_ttl_and_batch(server) -> None:
+    cache = _remote(server)
+    await cache.set("a", {"v": 1}, ttl_seconds=30)
+    await cache.set_many({"b": [1, 2], "c": "x"})
+
+    assert await cache.get("a") == {"v": 1}
+    assert await cache.get_many(["a", "b", "c", "missing"]) == {"a": {"v": 1}, "b": [1, 2], "c": "x"}
+    assert 0 < await cache._redis.ttl("t:a") <= 30
+
+    await cache.delete("a")
+    assert await cache.get("a") is None
+    await cache.close()
+
+
+@pytest.mark.asyncio
+async def test_redis_read_failure_is_a_miss_and_falls_back_to_loader(server) -> None:
+    cache = _remote(server)
+    await cache.set("a", {"v": 1})
+    server.connected = False
+
+    assert await cache.get("a") is None
+    assert await cache.get_many(["a"]) == {}
+    assert await cache.get_or_load("a", _loader({"v": 2})) == {"v": 2}
+    await cache.close()
+
+
+def _loader(value):
+    async def load():
+        return value
+
+    return load
+
+
+@pytest.mark.asyncio
+async def test_redis_delete_prefix_only_touches_own_keys(server) -> None:
+    cache = _remote(server)
+    other = RedisCacheClient(fakeredis.FakeAsyncRedis(server=server), CacheSerializer(), key_prefix="other:")
+    await cache.set_many({"query:A:1": 1, "query:A:2": 2, "query:B:1": 3})
+    await other.set("query:A:1", 4)
+
+    assert await cache.delete_prefix("query:A:") == 2
+    assert await cache.get("query:B:1") == 3
+    assert await other.get("query:A:1") == 4
+
+
+@pytest.mark.asyncio
+async def test_near_cache_invalidated_across_replicas(server) -> None:
+    a = await _near(server)
+    b = await _near(server)
+    try:
+        await a.set("k", "v1", ttl_seconds=300)
+        assert await b.get("k") == "v1"
+        assert await b.local.get("k") == "v1"
+
+        await a.set("k", "v2", ttl_seconds=300)
+        await _eventually(lambda: _local_is(b, "k", None))
+        assert await b.get("k") == "v2"
+
+        await a.delete_prefix("k")
+        await _eventually(lambda: _local_is(b, "k", None))
+        assert await b.get("k") is None
+    finally:
+        await a.close()
+        await b.close()
+
+
+@pytest.mark.asyncio
+async def test_near_cache_get_or_load_loads_once_per_process(server) -> None:
+    cache = await _near(server)
+    calls = 0
+
+    async def loader() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "value"
+
+    try:
+        results = await asyncio.gather(*(cache.get_or_load("k", loader, ttl_seconds=60) for _ in range(5)))
+        assert results == ["value"] * 5
+        assert calls == 1
+        assert await _remote(server).get("k") == "value"
+    finally:
+        await cache.close()
+
+
+async def _local_is(client: NearCacheClient, key: str, expected) -> bool:
+    return await client.local.get(key) == expected
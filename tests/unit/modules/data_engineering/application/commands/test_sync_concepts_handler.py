@@ -1,18 +1,30 @@
+import asyncio
+from dataclasses import replace
 from datetime import UTC, date, datetime
 from unittest.mock import AsyncMock
 
 import pytest
 
-from app.modules.data_engineering.application.commands.sync_concepts import SyncConcepts
+from app.modules.data_engineering.application.commands.sync_concepts import (
+    ConceptSyncStrategy,
+    SyncConcepts,
+)
 from app.modules.data_engineering.application.commands.sync_concepts_handler import (
     SyncConceptsHandler,
 )
 from app.modules.data_engineering.domain.entities.concept import Concept
 from app.modules.data_engineering.domain.entities.concept_stock import ConceptStock
 from app.modules.data_engineering.domain.entities.stock_basic import StockBasic
+from app.modules.data_engineering.domain.events import ConceptsChanged
 from app.modules.data_engineering.domain.exceptions import ExternalConceptServiceError
+from app.modules.data_engineering.domain.services.security_master import SecurityMaster
+from app.modules.data_engineering.domain.value_objects.concept_snapshot import (
+    ConceptSnapshotDiff,
+    ConceptSnapshotMember,
+)
 from app.modules.data_engineering.domain.value_objects.data_source import DataSource
 from app.modules.data_engineering.domain.value_objects.stock_status import StockStatus
+from app.shared_kernel.application.execution_budget import ExecutionBudget
 
 
 def _make_concept(
@@ -56,7 +68,7 @@ async def test_handle_full_sync_new_concept_syncs_stocks() -> None:
     concept_repo.find_all = AsyncMock(return_value=[])
     concept_repo.save = AsyncMock(return_value=_make_concept("BK0818", "人工智能", concept_id=101))
     stock_repo = AsyncMock()
-    stock_repo.find_by_concept_id = AsyncMock(return_value=[])
+    stock_repo.find_all_grouped_by_concept = AsyncMock(return_value={})
     stock_basic_repo = AsyncMock()
     stock_basic_repo.find_all_listed = AsyncMock(return_value=[_make_stock_basic("000001.SZ", "000001")])
     uow = AsyncMock()
@@ -71,6 +83,30 @@ async def test_handle_full_sync_new_concept_syncs_stocks() -> None:
     uow.commit.assert_called()  # 验证事务被调用
 
 
+@pytest.mark.asyncio
+async def test_handle_full_sync_resolves_members_with_security_master() -> None:
+    """测试注入证券主数据时按任意代码写法解析成分股，跳过已退市股票且不再查询股票列表。"""
+    delisted = replace(_make_stock_basic("000002", "000002.SZ"), status=StockStatus.DELISTED)
+    securities = SecurityMaster([_make_stock_basic("000001", "000001.SZ"), delisted])
+    gateway = AsyncMock()
+    gateway.fetch_concepts = AsyncMock(return_value=[_make_concept("BK0818", "人工智能")])
+    gateway.fetch_concept_stocks = AsyncMock(return_value=[("sz000001", "平安银行"), ("000002", "万科A")])
+    concept_repo = AsyncMock()
+    concept_repo.find_all = AsyncMock(return_value=[])
+    concept_repo.save = AsyncMock(return_value=_make_concept("BK0818", "人工智能", concept_id=101))
+    stock_repo = AsyncMock()
+    stock_repo.find_all_grouped_by_concept = AsyncMock(return_value={})
+    stock_basic_repo = AsyncMock()
+
+    handler = SyncConceptsHandler(
+        gateway, concept_repo, stock_repo, stock_basic_repo, AsyncMock(), securities=securities
+    )
+    result = await handler.handle(SyncConcepts())
+
+    assert result.new_stocks == 1
+    stock_basic_repo.find_all_listed.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_handle_full_sync_unchanged_concept_updates_timestamp() -> None:
     """测试全量同步未变更概念只更新时间戳。"""
@@ -82,6 +118,7 @@ async def test_handle_full_sync_unchanged_concept_updates_timestamp() -> None:
     concept_repo.find_all = AsyncMock(return_value=[concept])
     concept_repo.save = AsyncMock(return_value=concept)
     stock_repo = AsyncMock()
+    stock_repo.find_all_grouped_by_concept = AsyncMock(return_value={})
     stock_basic_repo = AsyncMock()
     stock_basic_repo.find_all_listed = AsyncMock(return_value=[])
     uow = AsyncMock()
@@ -96,16 +133,57 @@ async def test_handle_full_sync_unchanged_concept_updates_timestamp() -> None:
     gateway.fetch_concept_stocks.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_handle_full_sync_skips_concept_when_content_and_membership_unchanged() -> None:
+    """测试概念内容哈希与成分股聚合哈希均未变化时跳过写入与事务。"""
+    member_hash = ConceptStock.compute_hash(DataSource.AKSHARE, "000001.SZ", "000001")
+    local = replace(
+        _make_concept("BK0818", "人工智能", concept_id=101),
+        membership_hash=Concept.compute_membership_hash({"000001.SZ": member_hash}),
+    )
+    gateway = AsyncMock()
+    gateway.fetch_concepts = AsyncMock(return_value=[_make_concept("BK0818", "人工智能")])
+    gateway.fetch_concept_stocks = AsyncMock(return_value=[("000001", "平安银行")])
+    concept_repo = AsyncMock()
+    concept_repo.find_all = AsyncMock(return_value=[local])
+    stock_repo = AsyncMock()
+    stock_repo.find_all_grouped_by_concept = AsyncMock(return_value={})
+    stock_basic_repo = AsyncMock()
+    stock_basic_repo.find_all_listed = AsyncMock(return_value=[_make_stock_basic("000001.SZ", "000001.SZ")])
+    uow = AsyncMock()
+
+    handler = SyncConceptsHandler(gateway, concept_repo, stock_repo, stock_basic_repo, uow)
+    result = await handler.handle(SyncConcepts())
+
+    assert result.unchanged_concepts == 1
+    assert result.modified_concepts == 0
+    concept_repo.save.assert_not_called()
+    stock_repo.save_many.assert_not_called()
+    uow.commit.assert_not_called()
+
+
 @pytest.mark.asyncio
 async def test_handle_full_sync_deleted_concept_removes_rows() -> None:
     """测试全量同步删除过时概念。"""
     local = _make_concept("BK0818", "人工智能", concept_id=101)
+    local_stocks = [
+        ConceptStock(
+            id=stock_id,
+            concept_id=101,
+            source=DataSource.AKSHARE,
+            stock_third_code=code,
+            stock_symbol=code,
+            content_hash=ConceptStock.compute_hash(DataSource.AKSHARE, code, code),
+            added_at=datetime.now(UTC),
+        )
+        for stock_id, code in [(11, "000001.SZ"), (12, "000002.SZ")]
+    ]
     gateway = AsyncMock()
     gateway.fetch_concepts = AsyncMock(return_value=[])
     concept_repo = AsyncMock()
     concept_repo.find_all = AsyncMock(return_value=[local])
     stock_repo = AsyncMock()
-    stock_repo.find_by_concept_id = AsyncMock(return_value=[])
+    stock_repo.find_all_grouped_by_concept = AsyncMock(return_value={101: local_stocks})
     stock_basic_repo = AsyncMock()
     stock_basic_repo.find_all_listed = AsyncMock(return_value=[])
     uow = AsyncMock()
@@ -114,10 +192,12 @@ async def test_handle_full_sync_deleted_concept_removes_rows() -> None:
     result = await handler.handle(SyncConcepts())
 
     assert result.deleted_concepts == 1
+    assert result.deleted_stocks == 2  # 按删除前的预加载索引统计
     assert result.new_concepts == 0
     assert result.modified_concepts == 0
-    stock_repo.delete_by_concept_id.assert_awaited_once_with(101)
-    concept_repo.delete.assert_awaited_once_with(101)
+    stock_repo.delete_by_concept_ids.assert_awaited_once_with([101])
+    concept_repo.delete_many.assert_awaited_once_with([101])
+    stock_repo.find_by_concept_id.assert_not_called()
 
 
 @pytest.mark.asyncio
@@ -157,11 +237,11 @@ async def test_handle_full_sync_complete_workflow() -> None:
     concept_repo = AsyncMock()
     concept_repo.find_all = AsyncMock(return_value=local_concepts)
     concept_repo.save = AsyncMock(side_effect=lambda c: c)
-    concept_repo.delete = AsyncMock()
+    concept_repo.delete_many = AsyncMock()
 
     stock_repo = AsyncMock()
-    stock_repo.find_by_concept_id = AsyncMock(return_value=[])
-    stock_repo.delete_by_concept_id = AsyncMock()
+    stock_repo.find_all_grouped_by_concept = AsyncMock(return_value={})
+    stock_repo.delete_by_concept_ids = AsyncMock()
 
     stock_basic_repo = AsyncMock()
     stock_basic_repo.find_all_listed = AsyncMock(return_value=[_make_stock_basic("000001.SZ", "000001")])
@@ -180,7 +260,8 @@ async def test_handle_full_sync_complete_workflow() -> None:
 
     # 验证调用次数
     assert concept_repo.save.call_count == 2  # BK0001 更新, BK0002 新增
-    assert concept_repo.delete.call_count == 1  # BK0003 删除
+    concept_repo.delete_many.assert_awaited_once_with([103])  # BK0003 删除
+    stock_repo.find_all_grouped_by_concept.assert_awaited_once()  # 成分股只加载一次
     assert gateway.fetch_concept_stocks.call_count == 2  # 每个概念调用一次
 
 
@@ -199,7 +280,7 @@ async def test_handle_full_sync_batch_processing() -> None:
     concept_repo.save = AsyncMock(side_effect=lambda c: c)
 
     stock_repo = AsyncMock()
-    stock_repo.find_by_concept_id = AsyncMock(return_value=[])
+    stock_repo.find_all_grouped_by_concept = AsyncMock(return_value={})
 
     stock_basic_repo = AsyncMock()
     stock_basic_repo.find_all_listed = AsyncMock(return_value=[])
@@ -234,7 +315,7 @@ async def test_handle_full_sync_performance_large_dataset() -> None:
     concept_repo.save = AsyncMock(side_effect=lambda c: c)
 
     stock_repo = AsyncMock()
-    stock_repo.find_by_concept_id = AsyncMock(return_value=[])
+    stock_repo.find_all_grouped_by_concept = AsyncMock(return_value={})
 
     stock_basic_repo = AsyncMock()
     stock_basic_repo.find_all_listed = AsyncMock(
@@ -280,7 +361,7 @@ async def test_handle_full_sync_memory_usage() -> None:
     concept_repo.save = AsyncMock(side_effect=lambda c: c)
 
     stock_repo = AsyncMock()
-    stock_repo.find_by_concept_id = AsyncMock(return_value=[])
+    stock_repo.find_all_grouped_by_concept = AsyncMock(return_value={})
 
     stock_basic_repo = AsyncMock()
     stock_basic_repo.find_all_listed = AsyncMock(return_value=[])
@@ -330,7 +411,7 @@ async def test_handle_full_sync_modified_concept_syncs_stocks() -> None:
     concept_repo.find_all = AsyncMock(return_value=[local])
     concept_repo.save = AsyncMock(return_value=remote)
     stock_repo = AsyncMock()
-    stock_repo.find_by_concept_id = AsyncMock(return_value=[local_stock])
+    stock_repo.find_all_grouped_by_concept = AsyncMock(return_value={101: [local_stock]})
     stock_basic_repo = AsyncMock()
     stock_basic_repo.find_all_listed = AsyncMock(return_value=[_make_stock_basic("000002.SZ", "000002.SZ")])
     uow = AsyncMock()
@@ -342,3 +423,281 @@ async def test_handle_full_sync_modified_concept_syncs_stocks() -> None:
     assert result.new_stocks == 1  # 新股票
     assert result.deleted_stocks == 1  # 删除旧股票
     gateway.fetch_concept_stocks.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_handle_full_sync_prefetches_with_bounded_concurrency() -> None:
+    """测试成分股预取并发受限，且单个概念拉取失败计入 failed_concepts。"""
+    remote_concepts = [_make_concept(f"BK{i:04d}", f"概念{i}") for i in range(1, 21)]
+    in_flight = 0
+    peak = 0
+
+    async def _fetch(third_code: str, _name: str) -> list[tuple[str, str]]:
+        nonlocal in_flight, peak
+        in_flight += 1
+        peak = max(peak, in_flight)
+        await asyncio.sleep(0.01)
+        in_flight -= 1
+        if third_code == "BK0007":
+            raise ExternalConceptServiceError("boom")
+        return [("000001", "平安银行")]
+
+    gateway = AsyncMock()
+    gateway.fetch_concepts = AsyncMock(return_value=remote_concepts)
+    gateway.fetch_concept_stocks = AsyncMock(side_effect=_fetch)
+    concept_repo = AsyncMock()
+    concept_repo.find_all = AsyncMock(return_value=[])
+    concept_repo.save = AsyncMock(side_effect=lambda c: c)
+    stock_repo = AsyncMock()
+    stock_repo.find_all_grouped_by_concept = AsyncMock(return_value={})
+    stock_basic_repo = AsyncMock()
+    stock_basic_repo.find_all_listed = AsyncMock(return_value=[_make_stock_basic("000001.SZ", "000001")])
+    uow = AsyncMock()
+
+    handler = SyncConceptsHandler(
+        gateway, concept_repo, stock_repo, stock_basic_repo, uow, batch_size=8, fetch_concurrency=3
+    )
+    result = await handler.handle(SyncConcepts())
+
+    assert peak <= 3
+    assert gateway.fetch_concept_stocks.await_count == 20
+    assert result.failed_concepts == 1
+    assert result.new_concepts == 19
+    assert concept_repo.save.call_count == 19
+
+
+@pytest.mark.asyncio
+async def test_handle_snapshot_strategy_stages_and_applies_once() -> None:
+    """测试快照策略：整体写入影子表后单次合并，失败概念沿用本地关系。"""
+    local = _make_concept("BK0002", "新能源", concept_id=102)
+    local_stock = ConceptStock(
+        id=21,
+        concept_id=102,
+        source=DataSource.AKSHARE,
+        stock_third_code="300750.SZ",
+        stock_symbol="300750",
+        content_hash="h300750",
+        added_at=datetime.now(UTC),
+    )
+
+    async def _fetch(third_code: str, _name: str) -> list[tuple[str, str]]:
+        if third_code == "BK0002":
+            raise ExternalConceptServiceError("boom")
+        return [("000001", "平安银行"), ("000001", "平安银行"), ("999999", "未上市")]
+
+    gateway = AsyncMock()
+    gateway.fetch_concepts = AsyncMock(return_value=[_make_concept("BK0001", "人工智能"), local])
+    gateway.fetch_concept_stocks = AsyncMock(side_effect=_fetch)
+    concept_repo = AsyncMock()
+    concept_repo.find_all = AsyncMock(return_value=[local])
+    stock_repo = AsyncMock()
+    stock_repo.find_all_grouped_by_concept = AsyncMock(return_value={102: [local_stock]})
+    stock_basic_repo = AsyncMock()
+    stock_basic_repo.find_all_listed = AsyncMock(return_value=[_make_stock_basic("000001.SZ", "000001.SZ")])
+    snapshot_repo = AsyncMock()
+    snapshot_repo.apply = AsyncMock(return_value=ConceptSnapshotDiff(1, 0, 0, 1, 0, 0))
+    uow = AsyncMock()
+
+    handler = SyncConceptsHandler(gateway, concept_repo, stock_repo, stock_basic_repo, uow, snapshot_repo=snapshot_repo)
+    result = await handler.handle(SyncConcepts(strategy=ConceptSyncStrategy.SNAPSHOT))
+
+    _source, staged_concepts, staged_members = snapshot_repo.stage.await_args.args
+    assert [c.third_code for c in staged_concepts] == ["BK0001", "BK0002"]
+    assert staged_members == [
+        ConceptSnapshotMember(
+            "BK0001", "000001.SZ", "000001", ConceptStock.compute_hash(DataSource.AKSHARE, "000001.SZ", "000001")
+        ),
+        ConceptSnapshotMember("BK0002", "300750.SZ", "300750", "h300750"),
+    ]
+    snapshot_repo.apply.assert_awaited_once()
+    concept_repo.save.assert_not_called()
+    assert uow.commit.await_count == 2
+    assert result.new_concepts == 1 and result.new_stocks == 1 and result.total_stocks == 1
+    assert result.failed_concepts == 1
+
+
+@pytest.mark.asyncio
+async def test_handle_full_sync_stops_between_batches_on_deadline() -> None:
+    """超过截止时间后在批次之间停止，返回已处理部分并跳过过时概念清理。"""
+    remote_concepts = [_make_concept(f"BK{i:04d}", f"概念{i}") for i in range(1, 31)]
+    obsolete = _make_concept("BK9999", "过时概念", concept_id=99)
+
+    gateway = AsyncMock()
+    gateway.fetch_concepts = AsyncMock(return_value=remote_concepts)
+    gateway.fetch_concept_stocks = AsyncMock(return_value=[])
+    concept_repo = AsyncMock()
+    concept_repo.find_all = AsyncMock(return_value=[obsolete])
+    stock_repo = AsyncMock()
+    stock_repo.find_all_grouped_by_concept = AsyncMock(return_value={})
+    stock_basic_repo = AsyncMock()
+    stock_basic_repo.find_all_listed = AsyncMock(return_value=[])
+
+    now = [0.0]
+    budget = ExecutionBudget(deadline_seconds=10, clock=lambda: now[0])
+
+    async def _save(concept: Concept) -> Concept:
+        now[0] = 11.0  # 第一个批次处理期间超时
+        return concept
+
+    concept_repo.save = AsyncMock(side_effect=_save)
+    handler = SyncConceptsHandler(
+        gateway, concept_repo, stock_repo, stock_basic_repo, AsyncMock(), batch_size=10, budget=budget
+    )
+    result = await handler.handle(SyncConcepts())
+
+    assert result.interrupted is True
+    assert result.stop_reason == "deadline"
+    assert result.new_concepts == 10
+    assert result.deleted_concepts == 0
+    concept_repo.delete_many.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_handle_full_sync_shrinks_batches_under_memory_pressure() -> None:
+    """内存超过阈值后批次大小与预取并发减半，且不再重叠预取。"""
+    remote_concepts = [_make_concept(f"BK{i:04d}", f"概念{i}") for i in range(1, 21)]
+    batch_sizes: list[int] = []
+
+    gateway = AsyncMock()
+    gateway.fetch_concepts = AsyncMock(return_value=remote_concepts)
+    gateway.fetch_concept_stocks = AsyncMock(return_value=[])
+    concept_repo = AsyncMock()
+    concept_repo.find_all = AsyncMock(return_value=[])
+    concept_repo.save = AsyncMock(side_effect=lambda c: c)
+    stock_repo = AsyncMock()
+    stock_repo.find_all_grouped_by_concept = AsyncMock(return_value={})
+    stock_basic_repo = AsyncMock()
+    stock_basic_repo.find_all_listed = AsyncMock(return_value=[])
+
+    budget = ExecutionBudget(memory_threshold_mb=1000, rss_probe=lambda: 1500)
+    handler = SyncConceptsHandler(
+        gateway, concept_repo, stock_repo, stock_basic_repo, AsyncMock(), batch_size=8, budget=budget
+    )
+    original_prefetch = handler._prefetch_concept_stocks
+
+    async def _recording_prefetch(batch_items):
+        batch_sizes.append(len(batch_items))
+        return await original_prefetch(batch_items)
+
+    handler._prefetch_concept_stocks = _recording_prefetch  # type: ignore[method-assign]
+    result = await handler.handle(SyncConcepts())
+
+    assert result.new_concepts == 20
+    assert result.interrupted is False
+    # 第二批在检测到压力前已重叠预取；第三批按退让后的批次大小切分，且在当前批次写完后才拉取
+    assert batch_sizes == [8, 8, 4]
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("cancel", [False, True])
+async def test_handle_snapshot_strategy_merges_after_deadline_but_not_after_cancel(cancel: bool) -> None:
+    """预取期间超过截止时间仍合并完整快照；请求取消时不合并。"""
+    now = [0.0]
+    budget = ExecutionBudget(deadline_seconds=10, clock=lambda: now[0])
+
+    async def _fetch(_third_code: str, _name: str) -> list[tuple[str, str]]:
+        now[0] = 11.0
+        if cancel:
+            budget.cancellation.cancel()
+        return [("000001", "平安银行")]
+
+    gateway = AsyncMock()
+    gateway.fetch_concepts = AsyncMock(return_value=[_make_concept("BK0001", "人工智能")])
+    gateway.fetch_concept_stocks = AsyncMock(side_effect=_fetch)
+    concept_repo = AsyncMock()
+    concept_repo.find_all = AsyncMock(return_value=[])
+    stock_repo = AsyncMock()
+    stock_repo.find_all_grouped_by_concept = AsyncMock(return_value={})
+    stock_basic_repo = AsyncMock()
+    stock_basic_repo.find_all_listed = AsyncMock(return_value=[_make_stock_basic("000001.SZ", "000001.SZ")])
+    snapshot_repo = AsyncMock()
+    snapshot_repo.apply = AsyncMock(return_value=ConceptSnapshotDiff(1, 0, 0, 1, 0, 0))
+
+    handler = SyncConceptsHandler(
+        gateway, concept_repo, stock_repo, stock_basic_repo, AsyncMock(), snapshot_repo=snapshot_repo, budget=budget
+    )
+    result = await handler.handle(SyncConcepts(strategy=ConceptSyncStrategy.SNAPSHOT))
+
+    if cancel:
+        assert result.interrupted is True and result.stop_reason == "cancelled"
+        snapshot_repo.apply.assert_not_called()
+    else:
+        assert result.interrupted is False and result.new_concepts == 1
+        snapshot_repo.apply.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_handle_full_sync_publishes_changed_concept_ids() -> None:
+    """测试全量同步提交后发布 ConceptsChanged，包含新增与删除的概念 ID。"""
+    obsolete = _make_concept("BK0001", "旧概念", concept_id=100)
+    gateway = AsyncMock()
+    gateway.fetch_concepts = AsyncMock(return_value=[_make_concept("BK0818", "人工智能")])
+    gateway.fetch_concept_stocks = AsyncMock(return_value=[("000001", "平安银行")])
+    concept_repo = AsyncMock()
+    concept_repo.find_all = AsyncMock(return_value=[obsolete])
+    concept_repo.save = AsyncMock(return_value=_make_concept("BK0818", "人工智能", concept_id=101))
+    stock_repo = AsyncMock()
+    stock_repo.find_all_grouped_by_concept = AsyncMock(return_value={})
+    stock_basic_repo = AsyncMock()
+    stock_basic_repo.find_all_listed = AsyncMock(return_value=[_make_stock_basic("000001.SZ", "000001")])
+    event_bus = AsyncMock()
+
+    handler = SyncConceptsHandler(gateway, concept_repo, stock_repo, stock_basic_repo, AsyncMock(), event_bus=event_bus)
+    await handler.handle(SyncConcepts())
+
+    event_bus.publish.assert_awaited_once()
+    event = event_bus.publish.await_args.args[0]
+    assert isinstance(event, ConceptsChanged)
+    assert sorted(event.concept_ids) == [100, 101]
+    assert event.all_concepts is False
+
+
+@pytest.mark.asyncio
+async def test_handle_full_sync_without_changes_publishes_nothing() -> None:
+    """测试没有概念变化时不发布事件。"""
+    gateway = AsyncMock()
+    gateway.fetch_concepts = AsyncMock(return_value=[])
+    concept_repo = AsyncMock()
+    concept_repo.find_all = AsyncMock(return_value=[])
+    stock_repo = AsyncMock()
+    stock_repo.find_all_grouped_by_concept = AsyncMock(return_value={})
+    stock_basic_repo = AsyncMock()
+    stock_basic_repo.find_all_listed = AsyncMock(return_value=[])
+    event_bus = AsyncMock()
+
+    handler = SyncConceptsHandler(gateway, concept_repo, stock_repo, stock_basic_repo, AsyncMock(), event_bus=event_bus)
+    await handler.handle(SyncConcepts())
+
+    event_bus.publish.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_handle_snapshot_strategy_publishes_all_concepts_changed() -> None:
+    """测试快照策略合并产生变化时发布整体失效事件。"""
+    gateway = AsyncMock()
+    gateway.fetch_concepts = AsyncMock(return_value=[_make_concept("BK0001", "人工智能")])
+    gateway.fetch_concept_stocks = AsyncMock(return_value=[("000001", "平安银行")])
+    concept_repo = AsyncMock()
+    concept_repo.find_all = AsyncMock(return_value=[])
+    stock_repo = AsyncMock()
+    stock_repo.find_all_grouped_by_concept = AsyncMock(return_value={})
+    stock_basic_repo = AsyncMock()
+    stock_basic_repo.find_all_listed = AsyncMock(return_value=[_make_stock_basic("000001.SZ", "000001.SZ")])
+    snapshot_repo = AsyncMock()
+    snapshot_repo.apply = AsyncMock(return_value=ConceptSnapshotDiff(1, 0, 0, 1, 0, 0))
+    event_bus = AsyncMock()
+
+    handler = SyncConceptsHandler(
+        gateway,
+        concept_repo,
+        stock_repo,
+        stock_basic_repo,
+        AsyncMock(),
+        snapshot_repo=snapshot_repo,
+        event_bus=event_bus,
+    )
+    await handler.handle(SyncConcepts(strategy=ConceptSyncStrategy.SNAPSHOT))
+
+    event = event_bus.publish.await_args.args[0]
+    assert isinstance(event, ConceptsChanged)
+    assert event.all_concepts is True
@@ -11,7 +11,15 @@ from app.modules.data_engineering.application.commands import (
     SyncFinanceIndicatorIncrement,
     SyncFinanceIndicatorIncrementHandler,
 )
+from app.modules.data_engineering.domain.entities.stock_basic import StockBasic
+from app.modules.data_engineering.domain.services.security_master import SecurityMaster
 from app.modules.data_engineering.domain.value_objects.data_source import DataSource
+from app.modules.data_engineering.domain.value_objects.financial_report_fingerprint import (
+    FinancialReportFingerprint,
+)
+from app.modules.data_engineering.domain.value_objects.stock_status import StockStatus
+from app.shared_kernel.application.cancellation import CancellationToken
+from app.shared_kernel.application.execution_budget import ExecutionBudget
 
 
 def _uow():
@@ -41,6 +49,57 @@ async def test_full_syncs_all_stocks():
     assert result.total == 1 and result.success_count == 1 and result.failure_count == 0
 
 
+def _record(end_date, ann_date, update_flag="0"):
+    r = MagicMock()
+    r.end_date = end_date
+    r.fingerprint.return_value = FinancialReportFingerprint(
+        end_date=end_date, ann_date=ann_date, update_flag=update_flag
+    )
+    return r
+
+
+@pytest.mark.asyncio
+async def test_full_revision_aware_fetches_window_and_skips_unchanged():
+    basic_repo = AsyncMock()
+    basic_repo.find_all.return_value = [_stock()]
+    fi_repo = AsyncMock()
+    fi_repo.find_fingerprints.return_value = {
+        date(2023, 9, 30): FinancialReportFingerprint(date(2023, 9, 30), date(2023, 10, 28), "0"),
+        date(2023, 6, 30): FinancialReportFingerprint(date(2023, 6, 30), date(2023, 8, 20), "0"),
+    }
+    unchanged = _record(date(2023, 9, 30), date(2023, 10, 28))
+    restated = _record(date(2023, 6, 30), date(2023, 11, 5), "1")
+    new_period = _record(date(2023, 12, 31), date(2024, 3, 30))
+    gateway = AsyncMock()
+    gateway.fetch_by_stock.return_value = [new_period, restated, unchanged]
+
+    result = await SyncFinanceIndicatorFullHandler(basic_repo, fi_repo, gateway, _uow()).handle(
+        SyncFinanceIndicatorFull(revision_aware=True)
+    )
+
+    gateway.fetch_by_stock.assert_called_once_with("000001.SZ", start_date=date(2023, 7, 30))
+    fi_repo.upsert_many.assert_awaited_once_with([new_period, restated])
+    assert result.synced_records == 2
+    assert result.skipped_records == 1
+
+
+@pytest.mark.asyncio
+async def test_full_revision_aware_without_history_fetches_everything():
+    basic_repo = AsyncMock()
+    basic_repo.find_all.return_value = [_stock()]
+    fi_repo = AsyncMock()
+    fi_repo.find_fingerprints.return_value = {}
+    gateway = AsyncMock()
+    gateway.fetch_by_stock.return_value = [_record(date(2023, 12, 31), date(2024, 3, 30))]
+
+    result = await SyncFinanceIndicatorFullHandler(basic_repo, fi_repo, gateway, _uow()).handle(
+        SyncFinanceIndicatorFull(revision_aware=True)
+    )
+
+    gateway.fetch_by_stock.assert_called_once_with("000001.SZ", start_date=None)
+    assert result.synced_records == 1 and result.skipped_records == 0
+
+
 @pytest.mark.asyncio
 async def test_by_stock_returns_count():
     fi_repo = AsyncMock()
@@ -64,3 +123,65 @@ async def test_increment_uses_latest_end_date():
         SyncFinanceIndicatorIncrement()
     )
     gateway.fetch_by_stock.assert_called_once_with("000001.SZ", start_date=date(2023, 10, 1))
+
+
+@pytest.mark.asyncio
+async def test_increment_stops_between_stocks_when_cancelled():
+    basic_repo = AsyncMock()
+    basic_repo.find_all_listed.return_value = [_stock("000001.SZ"), _stock("000002.SZ")]
+    fi_repo = AsyncMock()
+    fi_repo.get_latest_end_date.return_value = None
+    token = CancellationToken()
+
+    async def _fetch(*_args, **_kwargs):
+        token.cancel()
+        return [MagicMock()]
+
+    gateway = AsyncMock()
+    gateway.fetch_by_stock.side_effect = _fetch
+    result = await SyncFinanceIndicatorIncrementHandler(
+        basic_repo, fi_repo, gateway, _uow(), budget=ExecutionBudget(cancellation=token)
+    ).handle(SyncFinanceIndicatorIncrement())
+    assert result.interrupted is True and result.stop_reason == "cancelled"
+    assert result.success_count == 1 and result.synced_records == 1
+    gateway.fetch_by_stock.assert_called_once()
+
+
+def _stock_basic(code, status=StockStatus.LISTED):
+    return StockBasic(
+        id=None,
+        source=DataSource.TUSHARE,
+        third_code=code,
+        symbol=code[:6],
+        name=code,
+        market="主板",
+        area="",
+        industry="",
+        list_date=date(2020, 1, 1),
+        status=status,
+    )
+
+
+@pytest.mark.asyncio
+async def test_increment_and_full_take_stocks_from_security_master():
+    securities = SecurityMaster(
+        [_stock_basic("600000.SH"), _stock_basic("000005.SZ", StockStatus.DELISTED), _stock_basic("000001.SZ")]
+    )
+    basic_repo = AsyncMock()
+    fi_repo = AsyncMock()
+    fi_repo.get_latest_end_date.return_value = None
+    gateway = AsyncMock()
+    gateway.fetch_by_stock.return_value = []
+
+    await SyncFinanceIndicatorIncrementHandler(basic_repo, fi_repo, gateway, _uow(), securities).handle(
+        SyncFinanceIndicatorIncrement()
+    )
+    assert [c.args[0] for c in gateway.fetch_by_stock.call_args_list] == ["600000.SH", "000001.SZ"]
+
+    gateway.fetch_by_stock.reset_mock()
+    result = await SyncFinanceIndicatorFullHandler(basic_repo, fi_repo, gateway, _uow(), securities=securities).handle(
+        SyncFinanceIndicatorFull(ts_codes=["000001.SZ", "999999.SZ"])
+    )
+    assert result.total == 1
+    basic_repo.find_all_listed.assert_not_called()
+    basic_repo.find_by_third_codes.assert_not_called()
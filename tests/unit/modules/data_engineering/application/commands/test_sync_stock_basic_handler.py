@@ -1,17 +1,20 @@
 """SyncStockBasicHandler 单测：fake 网关与仓储，验证编排与异常上抛。"""
 
 from datetime import date
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, patch
 
 import pytest
 
-from app.modules.data_engineering.application.commands.sync_stock_basic import SyncStockBasic
+from app.modules.data_engineering.application.commands.sync_stock_basic import SyncStockBasic, SyncStockBasicResult
 from app.modules.data_engineering.application.commands.sync_stock_basic_handler import (
     SyncStockBasicHandler,
 )
 from app.modules.data_engineering.domain.entities.stock_basic import StockBasic
+from app.modules.data_engineering.domain.events import StockBasicChanged
 from app.modules.data_engineering.domain.value_objects.data_source import DataSource
 from app.modules.data_engineering.domain.value_objects.stock_status import StockStatus
+from app.shared_kernel.application.cancellation import CancellationToken
+from app.shared_kernel.application.execution_budget import ExecutionBudget
 
 
 def _make_stock(third_code: str = "000001.SZ", name: str = "平安银行") -> StockBasic:
@@ -40,7 +43,7 @@ class TestSyncStockBasicHandler:
         uow = AsyncMock()
         handler = SyncStockBasicHandler(gateway=gateway, repository=repo, uow=uow)
         result = await handler.handle(SyncStockBasic())
-        assert result == 2
+        assert result == SyncStockBasicResult(synced_count=2, total=2)
         gateway.fetch_stock_basic.assert_awaited_once()
         repo.upsert_many.assert_awaited_once_with(stocks)
         uow.commit.assert_awaited_once()
@@ -57,3 +60,65 @@ class TestSyncStockBasicHandler:
             await handler.handle(SyncStockBasic())
         repo.upsert_many.assert_not_called()
         uow.commit.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_handle_publishes_stock_basic_changed_after_commit(self) -> None:
+        gateway = AsyncMock()
+        gateway.fetch_stock_basic = AsyncMock(return_value=[_make_stock()])
+        uow = AsyncMock()
+        event_bus = AsyncMock()
+        event_bus.publish.side_effect = lambda _: uow.commit.assert_awaited_once()
+        handler = SyncStockBasicHandler(gateway=gateway, repository=AsyncMock(), uow=uow, event_bus=event_bus)
+        assert (await handler.handle(SyncStockBasic())).synced_count == 1
+        event = event_bus.publish.await_args.args[0]
+        assert isinstance(event, StockBasicChanged)
+        assert event.source is DataSource.TUSHARE and event.synced_count == 1
+
+    @pytest.mark.asyncio
+    async def test_handle_publish_failure_does_not_fail_sync(self) -> None:
+        gateway = AsyncMock()
+        gateway.fetch_stock_basic = AsyncMock(return_value=[_make_stock()])
+        event_bus = AsyncMock()
+        event_bus.publish.side_effect = RuntimeError("bus down")
+        handler = SyncStockBasicHandler(gateway=gateway, repository=AsyncMock(), uow=AsyncMock(), event_bus=event_bus)
+        assert (await handler.handle(SyncStockBasic())).synced_count == 1
+
+    @pytest.mark.asyncio
+    async def test_handle_commits_in_chunks_and_stops_when_cancelled(self) -> None:
+        stocks = [_make_stock(f"{i:06d}.SZ", f"股票{i}") for i in range(3)]
+        gateway = AsyncMock()
+        gateway.fetch_stock_basic = AsyncMock(return_value=stocks)
+        repo = AsyncMock()
+        uow = AsyncMock()
+        token = CancellationToken()
+        uow.commit.side_effect = token.cancel
+        event_bus = AsyncMock()
+        budget = ExecutionBudget(memory_threshold_mb=1000, cancellation=token, rss_probe=lambda: 1200)
+        budget.check_memory()
+        budget.check_memory()
+        handler = SyncStockBasicHandler(gateway=gateway, repository=repo, uow=uow, event_bus=event_bus, budget=budget)
+        with patch("app.modules.data_engineering.application.commands.sync_stock_basic_handler.WRITE_CHUNK_SIZE", 8):
+            result = await handler.handle(SyncStockBasic())
+        assert result == SyncStockBasicResult(synced_count=2, total=3, interrupted=True, stop_reason="cancelled")
+        repo.upsert_many.assert_awaited_once_with(stocks[:2])
+        uow.commit.assert_awaited_once()
+        assert event_bus.publish.await_args.args[0].synced_count == 2
+
+    @pytest.mark.asyncio
+    async def test_handle_reports_interrupted_when_deadline_passes(self) -> None:
+        stocks = [_make_stock(f"{i:06d}.SZ", f"股票{i}") for i in range(3)]
+        gateway = AsyncMock()
+        gateway.fetch_stock_basic = AsyncMock(return_value=stocks)
+        repo = AsyncMock()
+        now = [0.0]
+        budget = ExecutionBudget(deadline_seconds=10, clock=lambda: now[0])
+
+        async def _slow_upsert(_chunk) -> None:
+            now[0] += 10
+
+        repo.upsert_many.side_effect = _slow_upsert
+        handler = SyncStockBasicHandler(gateway=gateway, repository=repo, uow=AsyncMock(), budget=budget)
+        with patch("app.modules.data_engineering.application.commands.sync_stock_basic_handler.WRITE_CHUNK_SIZE", 2):
+            result = await handler.handle(SyncStockBasic())
+        assert result == SyncStockBasicResult(synced_count=2, total=3, interrupted=True, stop_reason="deadline")
+        repo.upsert_many.assert_awaited_once_with(stocks[:2])
@@ -1,4 +1,5 @@
-from datetime import date
+from dataclasses import replace
+from datetime import UTC, date, datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
@@ -10,8 +11,12 @@ from app.modules.data_engineering.application.commands.sync_stock_daily_history_
     SyncStockDailyHistoryHandler,
 )
 from app.modules.data_engineering.domain.entities.stock_basic import StockBasic
+from app.modules.data_engineering.domain.entities.sync_run import SyncRun
 from app.modules.data_engineering.domain.value_objects.data_source import DataSource
 from app.modules.data_engineering.domain.value_objects.stock_status import StockStatus
+from app.modules.data_engineering.domain.value_objects.sync_run_status import SyncRunItemStatus, SyncRunStatus
+from app.shared_kernel.application.cancellation import CancellationToken
+from app.shared_kernel.application.execution_budget import ExecutionBudget
 
 
 @pytest.fixture
@@ -88,3 +93,112 @@ async def test_history_sync_first_time(mock_date, handler, mock_basic_repo, mock
 
     mock_gateway.fetch_stock_daily.assert_called_once_with("000001.SZ", date(2026, 2, 18), date(2026, 2, 20))
     handler.uow.commit.assert_called_once()
+
+
+@pytest.mark.asyncio
+@patch("app.modules.data_engineering.application.commands.sync_stock_daily_history_handler.date")
+async def test_history_sync_resumes_from_pending_items(
+    mock_date, mock_gateway, mock_daily_repo, mock_basic_repo, mock_failure_repo, mock_uow
+):
+    """run_key 对应未完成运行时，只同步未完成的股票，忽略 ts_codes"""
+    mock_date.today.return_value = date(2026, 2, 20)
+    run_repo = AsyncMock()
+    run_repo.find_unfinished.return_value = SyncRun(
+        id=7,
+        kind="stock_daily_history",
+        run_key="job-1",
+        status=SyncRunStatus.INTERRUPTED,
+        total_items=3,
+        started_at=datetime(2026, 2, 20, tzinfo=UTC),
+    )
+    run_repo.find_pending_item_keys.return_value = ["000002.SZ"]
+    mock_basic_repo.find_by_third_codes.return_value = [_make_stock("000002.SZ", date(2026, 2, 18))]
+    mock_gateway.fetch_stock_daily.return_value = [MagicMock()]
+    handler = SyncStockDailyHistoryHandler(
+        gateway=mock_gateway,
+        daily_repo=mock_daily_repo,
+        basic_repo=mock_basic_repo,
+        failure_repo=mock_failure_repo,
+        uow=mock_uow,
+        run_repo=run_repo,
+    )
+
+    res = await handler.handle(SyncStockDailyHistory(ts_codes=["000001.SZ"], run_key="job-1"))
+
+    assert res.total == 1
+    assert res.run_id == 7
+    assert res.interrupted is False
+    mock_basic_repo.find_by_third_codes.assert_called_once_with(DataSource.TUSHARE, ["000002.SZ"])
+    run_repo.create.assert_not_called()
+    run_repo.mark_item.assert_called_once_with(7, "000002.SZ", SyncRunItemStatus.DONE)
+    assert run_repo.save.call_args_list[-1].args[0].status is SyncRunStatus.COMPLETED
+
+
+@pytest.mark.asyncio
+@patch("app.modules.data_engineering.application.commands.sync_stock_daily_history_handler.date")
+async def test_history_sync_stops_between_stocks_when_cancelled(
+    mock_date, mock_gateway, mock_daily_repo, mock_basic_repo, mock_failure_repo, mock_uow
+):
+    """取消后在股票之间停止，运行保留为中断状态"""
+    mock_date.today.return_value = date(2026, 2, 20)
+    run_repo = AsyncMock()
+    run_repo.find_unfinished.return_value = None
+    run_repo.create.side_effect = lambda run, _keys: replace(run, id=9)
+    mock_basic_repo.find_by_third_codes.return_value = [
+        _make_stock("000001.SZ", date(2026, 2, 18)),
+        _make_stock("000002.SZ", date(2026, 2, 18)),
+    ]
+    token = CancellationToken()
+
+    async def _fetch(*_args):
+        token.cancel()
+        return [MagicMock()]
+
+    mock_gateway.fetch_stock_daily.side_effect = _fetch
+    handler = SyncStockDailyHistoryHandler(
+        gateway=mock_gateway,
+        daily_repo=mock_daily_repo,
+        basic_repo=mock_basic_repo,
+        failure_repo=mock_failure_repo,
+        uow=mock_uow,
+        run_repo=run_repo,
+        budget=ExecutionBudget(cancellation=token),
+    )
+
+    res = await handler.handle(SyncStockDailyHistory(ts_codes=["000001.SZ", "000002.SZ"], run_key="job-2"))
+
+    assert res.interrupted is True
+    assert res.stop_reason == "cancelled"
+    assert res.success_count == 1
+    assert res.run_id == 9
+    mock_gateway.fetch_stock_daily.assert_called_once()
+    run_repo.mark_item.assert_called_once_with(9, "000001.SZ", SyncRunItemStatus.DONE)
+    assert run_repo.save.call_args_list[-1].args[0].status is SyncRunStatus.INTERRUPTED
+
+
+@pytest.mark.asyncio
+@patch("app.modules.data_engineering.application.commands.sync_stock_daily_history_handler.date")
+async def test_history_sync_fetches_in_windows_under_memory_pressure(
+    mock_date, mock_gateway, mock_daily_repo, mock_basic_repo, mock_failure_repo, mock_uow
+):
+    """内存超过阈值时区间分段拉取，每段单独提交"""
+    mock_date.today.return_value = date(2026, 2, 20)
+    mock_basic_repo.find_by_third_codes.return_value = [_make_stock("000001.SZ", date(2020, 1, 1))]
+    mock_gateway.fetch_stock_daily.return_value = [MagicMock()]
+    handler = SyncStockDailyHistoryHandler(
+        gateway=mock_gateway,
+        daily_repo=mock_daily_repo,
+        basic_repo=mock_basic_repo,
+        failure_repo=mock_failure_repo,
+        uow=mock_uow,
+        budget=ExecutionBudget(memory_threshold_mb=1000, rss_probe=lambda: 1200),
+    )
+
+    res = await handler.handle(SyncStockDailyHistory(ts_codes=["000001.SZ"]))
+
+    windows = [c.args[1:] for c in mock_gateway.fetch_stock_daily.call_args_list]
+    assert len(windows) > 1
+    assert windows[0][0] == date(2020, 1, 1) and windows[-1][1] == date(2026, 2, 20)
+    assert all((end - start).days < 1825 for start, end in windows)
+    assert mock_uow.commit.call_count == len(windows)
+    assert res.success_count == 1 and res.synced_days == len(windows)
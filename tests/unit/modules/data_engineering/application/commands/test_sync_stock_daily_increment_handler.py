@@ -1,5 +1,6 @@
+import asyncio
 from datetime import date
-from unittest.mock import AsyncMock
+from unittest.mock import AsyncMock, MagicMock
 
 import pytest
 
@@ -11,10 +12,31 @@ from app.modules.data_engineering.application.commands.sync_stock_daily_incremen
 from app.modules.data_engineering.application.commands.sync_stock_daily_increment_handler import (
     SyncStockDailyIncrementHandler,
 )
+from app.modules.data_engineering.domain.entities.stock_basic import StockBasic
 from app.modules.data_engineering.domain.entities.stock_daily_sync_failure import (
     StockDailySyncFailure,
 )
+from app.modules.data_engineering.domain.services.security_master import SecurityMaster
+from app.modules.data_engineering.domain.services.trade_calendar import TradeCalendar
 from app.modules.data_engineering.domain.value_objects.data_source import DataSource
+from app.modules.data_engineering.domain.value_objects.stock_status import StockStatus
+from app.shared_kernel.application.cancellation import CancellationToken
+from app.shared_kernel.application.execution_budget import ExecutionBudget
+
+
+def _stock_basic(third_code: str, symbol: str) -> StockBasic:
+    return StockBasic(
+        id=None,
+        source=DataSource.TUSHARE,
+        third_code=third_code,
+        symbol=symbol,
+        name="平安银行",
+        market="主板",
+        area="深圳",
+        industry="银行",
+        list_date=date(1991, 4, 3),
+        status=StockStatus.LISTED,
+    )
 
 
 @pytest.fixture
@@ -38,10 +60,20 @@ def mock_uow():
     return uow
 
 
+@pytest.fixture
+def mock_basic_repo():
+    repo = AsyncMock()
+    repo.find_all.return_value = []
+    return repo
+
+
 @pytest.mark.asyncio
-async def test_increment_sync_success(mock_gateway, mock_daily_repo, mock_uow):
-    mock_gateway.fetch_daily_all_by_date.return_value = ["mock_record"]
-    handler = SyncStockDailyIncrementHandler(gateway=mock_gateway, daily_repo=mock_daily_repo, uow=mock_uow)
+async def test_increment_sync_success(mock_gateway, mock_daily_repo, mock_basic_repo, mock_uow):
+    record = MagicMock(third_code="000001.SZ")
+    mock_gateway.fetch_daily_all_by_date.return_value = [record]
+    handler = SyncStockDailyIncrementHandler(
+        gateway=mock_gateway, daily_repo=mock_daily_repo, basic_repo=mock_basic_repo, uow=mock_uow
+    )
 
     cmd = SyncStockDailyIncrement(trade_date=date(2026, 2, 20))
     res = await handler.handle(cmd)
@@ -50,10 +82,132 @@ async def test_increment_sync_success(mock_gateway, mock_daily_repo, mock_uow):
     assert res.synced_count == 1
 
     mock_gateway.fetch_daily_all_by_date.assert_called_once_with(date(2026, 2, 20))
-    mock_daily_repo.upsert_many.assert_called_once_with(["mock_record"])
+    mock_daily_repo.upsert_many.assert_called_once_with([record])
     mock_uow.commit.assert_called_once()
 
 
+@pytest.mark.asyncio
+async def test_increment_sync_commits_in_chunks_and_retries_failed_chunk(
+    mock_gateway, mock_daily_repo, mock_basic_repo, mock_uow
+):
+    """拉取在事务之外，写入按分块独立提交；失败分块重试后成功"""
+    records = [MagicMock(third_code=f"{i:06d}.SZ") for i in range(5)]
+    mock_gateway.fetch_daily_all_by_date.return_value = records
+    mock_daily_repo.upsert_many.side_effect = [None, Exception("deadlock"), None, None]
+    handler = SyncStockDailyIncrementHandler(
+        gateway=mock_gateway,
+        daily_repo=mock_daily_repo,
+        basic_repo=mock_basic_repo,
+        uow=mock_uow,
+        write_chunk_size=2,
+        retry_backoff_seconds=0,
+    )
+
+    res = await handler.handle(SyncStockDailyIncrement(trade_date=date(2026, 2, 20)))
+
+    assert res.synced_count == 5
+    assert res.chunks == 3
+    assert [c.args[0] for c in mock_daily_repo.upsert_many.call_args_list] == [
+        records[0:2],
+        records[2:4],
+        records[2:4],
+        records[4:5],
+    ]
+    assert mock_uow.commit.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_increment_sync_overlaps_next_day_fetch_with_current_write(
+    mock_gateway, mock_daily_repo, mock_basic_repo, mock_uow
+):
+    """多日同步时，第 N+1 日的拉取在第 N 日写入之前已经开始"""
+    events: list[str] = []
+
+    async def _fetch(trade_date: date):
+        events.append(f"fetch {trade_date.day}")
+        return [MagicMock(third_code="000001.SZ")]
+
+    async def _upsert(chunk):
+        await asyncio.sleep(0)
+        events.append("write")
+
+    mock_gateway.fetch_daily_all_by_date.side_effect = _fetch
+    mock_daily_repo.upsert_many.side_effect = _upsert
+    handler = SyncStockDailyIncrementHandler(
+        gateway=mock_gateway, daily_repo=mock_daily_repo, basic_repo=mock_basic_repo, uow=mock_uow
+    )
+
+    res = await handler.handle(SyncStockDailyIncrement(trade_date=date(2026, 2, 18), end_date=date(2026, 2, 20)))
+
+    assert res.days == 3
+    assert res.synced_count == 3
+    assert events == ["fetch 18", "fetch 19", "write", "fetch 20", "write", "write"]
+
+
+@pytest.mark.asyncio
+async def test_increment_catch_up_backfills_weekdays_after_global_watermark(
+    mock_gateway, mock_daily_repo, mock_basic_repo, mock_uow
+):
+    """补齐模式：从全局水位次日到终点，逐个工作日按日期拉取（跳过周末）"""
+    mock_daily_repo.get_global_latest_trade_date.return_value = date(2026, 2, 12)  # 周四
+    mock_gateway.fetch_daily_all_by_date.return_value = [MagicMock(third_code="000001.SZ")]
+    handler = SyncStockDailyIncrementHandler(
+        gateway=mock_gateway,
+        daily_repo=mock_daily_repo,
+        basic_repo=mock_basic_repo,
+        uow=mock_uow,
+        fetch_concurrency=3,
+    )
+
+    res = await handler.handle(SyncStockDailyIncrement(trade_date=date(2026, 2, 17), catch_up=True))
+
+    expected = [date(2026, 2, 13), date(2026, 2, 16), date(2026, 2, 17)]
+    assert res.trade_dates == expected
+    assert res.trade_date == date(2026, 2, 13)
+    assert res.end_date == date(2026, 2, 17)
+    assert res.synced_count == 3
+    assert [c.args[0] for c in mock_gateway.fetch_daily_all_by_date.call_args_list] == expected
+
+
+@pytest.mark.asyncio
+async def test_increment_catch_up_is_noop_when_up_to_date(mock_gateway, mock_daily_repo, mock_basic_repo, mock_uow):
+    mock_daily_repo.get_global_latest_trade_date.return_value = date(2026, 2, 20)
+    handler = SyncStockDailyIncrementHandler(
+        gateway=mock_gateway, daily_repo=mock_daily_repo, basic_repo=mock_basic_repo, uow=mock_uow
+    )
+
+    res = await handler.handle(SyncStockDailyIncrement(trade_date=date(2026, 2, 20), catch_up=True))
+
+    assert res.days == 0
+    assert res.synced_count == 0
+    mock_gateway.fetch_daily_all_by_date.assert_not_called()
+    mock_uow.commit.assert_not_called()
+
+
+@pytest.mark.asyncio
+async def test_increment_catch_up_caps_lookback_window(mock_gateway, mock_daily_repo, mock_basic_repo, mock_uow):
+    """缺口超过补齐窗口时只补最近 max_catch_up_days 个自然日"""
+    mock_daily_repo.get_global_latest_trade_date.return_value = date(2025, 12, 1)
+    mock_gateway.fetch_daily_all_by_date.return_value = []
+    handler = SyncStockDailyIncrementHandler(
+        gateway=mock_gateway,
+        daily_repo=mock_daily_repo,
+        basic_repo=mock_basic_repo,
+        uow=mock_uow,
+        max_catch_up_days=7,
+    )
+
+    res = await handler.handle(SyncStockDailyIncrement(trade_date=date(2026, 2, 20), catch_up=True))
+
+    assert res.trade_dates == [
+        date(2026, 2, 16),
+        date(2026, 2, 17),
+        date(2026, 2, 18),
+        date(2026, 2, 19),
+        date(2026, 2, 20),
+    ]
+
+
 @pytest.mark.asyncio
 async def test_retry_failures_success_and_failure(mock_gateway, mock_daily_repo, mock_failure_repo, mock_uow):
     failure1 = StockDailySyncFailure(
@@ -101,3 +255,143 @@ async def test_retry_failures_success_and_failure(mock_gateway, mock_daily_repo,
     mock_failure_repo.save.assert_called_once()
     assert failure2.retry_count == 1
     assert "still failing" in failure2.error_message
+
+
+@pytest.mark.asyncio
+async def test_increment_skips_non_trading_days_from_calendar(mock_gateway, mock_daily_repo, mock_basic_repo, mock_uow):
+    """注入交易日历时，区间同步跳过节假日，不发起全市场拉取"""
+    holiday = date(2026, 2, 17)
+    calendar = TradeCalendar(
+        [date(2026, 2, 13), date(2026, 2, 24)],
+        coverage=(date(2026, 2, 13), date(2026, 2, 24)),
+    )
+    mock_gateway.fetch_daily_all_by_date.return_value = [MagicMock(third_code="000001.SZ")]
+    handler = SyncStockDailyIncrementHandler(
+        gateway=mock_gateway,
+        daily_repo=mock_daily_repo,
+        basic_repo=mock_basic_repo,
+        uow=mock_uow,
+        calendar=calendar,
+    )
+
+    single = await handler.handle(SyncStockDailyIncrement(trade_date=holiday))
+    ranged = await handler.handle(SyncStockDailyIncrement(trade_date=date(2026, 2, 13), end_date=date(2026, 2, 24)))
+
+    assert single.days == 0
+    assert ranged.trade_dates == [date(2026, 2, 13), date(2026, 2, 24)]
+    assert [c.args[0] for c in mock_gateway.fetch_daily_all_by_date.call_args_list] == ranged.trade_dates
+
+
+@pytest.mark.asyncio
+async def test_increment_and_retry_fill_symbol_from_security_master(
+    mock_gateway, mock_daily_repo, mock_basic_repo, mock_failure_repo, mock_uow
+):
+    """注入证券主数据时，增量同步不再查询股票列表，重试同步也按 third_code 填充 symbol"""
+    securities = SecurityMaster([_stock_basic("000001.SZ", "000001")])
+    record = MagicMock(third_code="000001.SZ", symbol=None)
+    mock_gateway.fetch_daily_all_by_date.return_value = [record]
+    handler = SyncStockDailyIncrementHandler(
+        gateway=mock_gateway,
+        daily_repo=mock_daily_repo,
+        basic_repo=mock_basic_repo,
+        uow=mock_uow,
+        securities=securities,
+    )
+
+    await handler.handle(SyncStockDailyIncrement(trade_date=date(2026, 2, 20)))
+
+    assert record.symbol == "000001"
+    mock_basic_repo.find_all.assert_not_called()
+
+    failure = StockDailySyncFailure(
+        id=1,
+        source=DataSource.TUSHARE,
+        third_code="000001.SZ",
+        start_date=date(2026, 1, 1),
+        end_date=date(2026, 1, 10),
+        error_message="err",
+        failed_at=None,
+        retry_count=0,
+        resolved=False,
+    )
+    mock_failure_repo.find_unresolved.return_value = [failure]
+    retried = MagicMock(third_code="000001.SZ", symbol=None)
+    mock_gateway.fetch_stock_daily.return_value = [retried]
+    retry_handler = RetryStockDailySyncFailuresHandler(
+        gateway=mock_gateway,
+        daily_repo=mock_daily_repo,
+        failure_repo=mock_failure_repo,
+        uow=mock_uow,
+        securities=securities,
+    )
+
+    res = await retry_handler.handle(RetryStockDailySyncFailures())
+
+    assert res.resolved_count == 1
+    assert retried.symbol == "000001"
+
+
+@pytest.mark.asyncio
+async def test_increment_catch_up_stops_between_days_with_partial_result(
+    mock_gateway, mock_daily_repo, mock_basic_repo, mock_uow
+):
+    """预算要求停止后不再写入后续日期，结果只含已写入的日期"""
+    mock_daily_repo.get_global_latest_trade_date.return_value = date(2026, 2, 12)
+    token = CancellationToken()
+
+    async def _write(_records):
+        token.cancel()
+
+    mock_gateway.fetch_daily_all_by_date.return_value = [MagicMock(third_code="000001.SZ")]
+    mock_daily_repo.upsert_many.side_effect = _write
+    handler = SyncStockDailyIncrementHandler(
+        gateway=mock_gateway,
+        daily_repo=mock_daily_repo,
+        basic_repo=mock_basic_repo,
+        uow=mock_uow,
+        budget=ExecutionBudget(cancellation=token),
+    )
+
+    res = await handler.handle(SyncStockDailyIncrement(trade_date=date(2026, 2, 17), catch_up=True))
+
+    assert res.interrupted is True
+    assert res.stop_reason == "cancelled"
+    assert res.trade_dates == [date(2026, 2, 13)]
+    assert res.days == 1 and res.synced_count == 1
+    mock_daily_repo.upsert_many.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_increment_scales_fetch_concurrency_and_write_chunks_under_memory_pressure(
+    mock_gateway, mock_daily_repo, mock_basic_repo, mock_uow
+):
+    """内存超过阈值时拉取并发与写入分块按退让级别减半"""
+    mock_daily_repo.get_global_latest_trade_date.return_value = date(2026, 2, 12)
+    records = [MagicMock(third_code=f"{i:06d}.SZ") for i in range(4)]
+    in_flight = 0
+    max_in_flight = 0
+
+    async def _fetch(_day):
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0)
+        in_flight -= 1
+        return records
+
+    mock_gateway.fetch_daily_all_by_date.side_effect = _fetch
+    handler = SyncStockDailyIncrementHandler(
+        gateway=mock_gateway,
+        daily_repo=mock_daily_repo,
+        basic_repo=mock_basic_repo,
+        uow=mock_uow,
+        fetch_concurrency=2,
+        write_chunk_size=4,
+        budget=ExecutionBudget(memory_threshold_mb=1000, rss_probe=lambda: 1200),
+    )
+
+    res = await handler.handle(SyncStockDailyIncrement(trade_date=date(2026, 2, 17), catch_up=True))
+
+    assert res.days == 3 and res.interrupted is False
+    assert max_in_flight == 1
+    assert all(len(c.args[0]) <= 2 for c in mock_daily_repo.upsert_many.call_args_list)
@@ -0,0 +1,32 @@
+from datetime import date
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.modules.data_engineering.application.commands.sync_trade_calendar import SyncTradeCalendar
+from app.modules.data_engineering.application.commands.sync_trade_calendar_handler import (
+    SyncTradeCalendarHandler,
+)
+from app.modules.data_engineering.domain.entities.trade_calendar_day import TradeCalendarDay
+
+
+@pytest.mark.asyncio
+async def test_sync_trade_calendar_upserts_fetched_days() -> None:
+    days = [
+        TradeCalendarDay(id=None, exchange="SSE", cal_date=date(2026, 2, 13), is_open=True),
+        TradeCalendarDay(id=None, exchange="SSE", cal_date=date(2026, 2, 16), is_open=False),
+    ]
+    gateway = AsyncMock()
+    gateway.fetch_trade_calendar.return_value = days
+    repository = AsyncMock()
+    repository.upsert_many.return_value = 2
+    uow = AsyncMock()
+    handler = SyncTradeCalendarHandler(gateway=gateway, repository=repository, uow=uow)
+
+    result = await handler.handle(SyncTradeCalendar(start_date=date(2026, 1, 1)))
+
+    gateway.fetch_trade_calendar.assert_awaited_once_with("SSE", date(2026, 1, 1), date(date.today().year + 1, 12, 31))
+    repository.upsert_many.assert_awaited_once_with(days)
+    uow.commit.assert_awaited_once()
+    assert result.synced_count == 2
+    assert result.open_count == 1
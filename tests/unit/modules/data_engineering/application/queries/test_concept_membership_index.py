@@ -0,0 +1,134 @@
+from datetime import UTC, datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.modules.data_engineering.application.queries import (
+    ConceptMembershipIndexCache,
+    ConceptMembershipIndexProvider,
+    ConceptQueryCacheInvalidator,
+    ConceptSummary,
+    GetConceptMemberships,
+    GetConceptMembershipsHandler,
+    GetConceptOverlap,
+    GetConceptOverlapHandler,
+    ScreenConceptStocks,
+    ScreenConceptStocksHandler,
+)
+from app.modules.data_engineering.domain.entities.concept import Concept
+from app.modules.data_engineering.domain.entities.stock_basic import StockBasic
+from app.modules.data_engineering.domain.events import ConceptsChanged
+from app.modules.data_engineering.domain.exceptions import ConceptNotFoundError, InvalidConceptExpressionError
+from app.modules.data_engineering.domain.value_objects.data_source import DataSource
+from app.modules.data_engineering.domain.value_objects.stock_status import StockStatus
+from app.shared_kernel.infrastructure.cache import InMemoryCacheClient
+from app.shared_kernel.infrastructure.resource_version import ResourceVersions
+
+
+def _make_concept(concept_id: int, third_code: str, name: str) -> Concept:
+    return Concept(
+        id=concept_id,
+        source=DataSource.AKSHARE,
+        third_code=third_code,
+        name=name,
+        content_hash=Concept.compute_hash(DataSource.AKSHARE, third_code, name),
+        last_synced_at=datetime.now(UTC),
+    )
+
+
+def _make_stock_basic(third_code: str) -> StockBasic:
+    return StockBasic(
+        id=None,
+        source=DataSource.TUSHARE,
+        third_code=third_code,
+        symbol=third_code[:6],
+        name=third_code,
+        market="主板",
+        area=None,
+        industry=None,
+        list_date=None,
+        status=StockStatus.LISTED,
+    )
+
+
+def _make_provider(cache: InMemoryCacheClient) -> tuple[ConceptMembershipIndexProvider, AsyncMock]:
+    concept_repo = AsyncMock()
+    concepts = [
+        _make_concept(2, "BK0002", "白酒"),
+        _make_concept(1, "BK0001", "消费"),
+        _make_concept(3, "BK0003", "空"),
+    ]
+    concept_repo.find_all = AsyncMock(return_value=concepts)
+    concept_stock_repo = AsyncMock()
+    concept_stock_repo.find_memberships = AsyncMock(
+        return_value=[("600519.SH", 2), ("600519.SH", 1), ("000858.SZ", 2), ("000001.SZ", 99), ("600000.SH", 1)]
+    )
+    stock_basic_repo = AsyncMock()
+    stock_basic_repo.find_all_listed = AsyncMock(
+        return_value=[_make_stock_basic(c) for c in ("600519.SH", "000858.SZ", "600000.SH", "000001.SZ")]
+    )
+    provider = ConceptMembershipIndexProvider(
+        ConceptMembershipIndexCache(), ResourceVersions(cache), concept_repo, concept_stock_repo, stock_basic_repo
+    )
+    return provider, concept_stock_repo
+
+
+def _make_handler(cache: InMemoryCacheClient) -> tuple[GetConceptMembershipsHandler, AsyncMock]:
+    provider, concept_stock_repo = _make_provider(cache)
+    return GetConceptMembershipsHandler(provider), concept_stock_repo
+
+
+@pytest.mark.asyncio
+async def test_lookup_returns_sorted_memberships_and_referenced_concepts() -> None:
+    handler, _ = _make_handler(InMemoryCacheClient())
+
+    result = await handler.handle(GetConceptMemberships(stock_third_codes=("600519.sh", "000858.SZ", "000001.SZ")))
+
+    assert result.memberships == {"600519.SH": [1, 2], "000858.SZ": [2], "000001.SZ": []}
+    assert result.concepts == [ConceptSummary(1, "BK0001", "消费"), ConceptSummary(2, "BK0002", "白酒")]
+
+
+@pytest.mark.asyncio
+async def test_index_is_reused_until_concepts_change() -> None:
+    cache = InMemoryCacheClient()
+    handler, concept_stock_repo = _make_handler(cache)
+
+    await handler.handle(GetConceptMemberships(stock_third_codes=("600519.SH",)))
+    await handler.handle(GetConceptMemberships(stock_third_codes=("000858.SZ",)))
+    assert concept_stock_repo.find_memberships.await_count == 1
+
+    await ConceptQueryCacheInvalidator(cache).handle(ConceptsChanged(concept_ids=(2,)))
+    await handler.handle(GetConceptMemberships(stock_third_codes=("600519.SH",)))
+    assert concept_stock_repo.find_memberships.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_screen_evaluates_set_expression() -> None:
+    provider, _ = _make_provider(InMemoryCacheClient())
+    handler = ScreenConceptStocksHandler(provider)
+
+    both = await handler.handle(ScreenConceptStocks(expression="bk0001 and BK0002"))
+    either_not = await handler.handle(ScreenConceptStocks(expression="(BK0001 OR BK0002) AND NOT BK0002"))
+    outside = await handler.handle(ScreenConceptStocks(expression="NOT (BK0001 OR BK0002)"))
+
+    assert (both.count, both.stock_third_codes) == (1, ["600519.SH"])
+    assert either_not.stock_third_codes == ["600000.SH"]
+    assert outside.stock_third_codes == ["000001.SZ"]
+    with pytest.raises(InvalidConceptExpressionError, match="BK9999"):
+        await handler.handle(ScreenConceptStocks(expression="BK0001 AND BK9999"))
+
+
+@pytest.mark.asyncio
+async def test_overlap_matrix_for_top_and_named_concepts() -> None:
+    provider, _ = _make_provider(InMemoryCacheClient())
+    handler = GetConceptOverlapHandler(provider)
+
+    top = await handler.handle(GetConceptOverlap(top=2))
+    named = await handler.handle(GetConceptOverlap(concept_codes=("BK0002", "BK0003")))
+
+    assert [c.id for c in top.concepts] == [1, 2]
+    assert top.sizes == [2, 2]
+    assert top.jaccard == [[1.0, 1 / 3], [1 / 3, 1.0]]
+    assert named.jaccard == [[1.0, 0.0], [0.0, 0.0]]
+    with pytest.raises(ConceptNotFoundError):
+        await handler.handle(GetConceptOverlap(concept_codes=("BK9999",)))
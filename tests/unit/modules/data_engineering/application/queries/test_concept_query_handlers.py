@@ -3,6 +3,9 @@ from unittest.mock import AsyncMock
 
 import pytest
 
+from app.modules.data_engineering.application.queries.concept_query_cache import (
+    ConceptQueryCacheInvalidator,
+)
 from app.modules.data_engineering.application.queries.get_concept_stocks import GetConceptStocks
 from app.modules.data_engineering.application.queries.get_concept_stocks_handler import (
     GetConceptStocksHandler,
@@ -13,8 +16,12 @@ from app.modules.data_engineering.application.queries.get_concepts_handler impor
 )
 from app.modules.data_engineering.domain.entities.concept import Concept
 from app.modules.data_engineering.domain.entities.concept_stock import ConceptStock
+from app.modules.data_engineering.domain.events import ConceptsChanged
 from app.modules.data_engineering.domain.exceptions import ConceptNotFoundError
 from app.modules.data_engineering.domain.value_objects.data_source import DataSource
+from app.shared_kernel.application.queries import query_cache_key
+from app.shared_kernel.domain.exception import ValidationException
+from app.shared_kernel.infrastructure.cache import InMemoryCacheClient
 
 
 def _make_concept(concept_id: int = 1) -> Concept:
@@ -43,23 +50,54 @@ def _make_concept_stock(concept_id: int = 1) -> ConceptStock:
 @pytest.mark.asyncio
 async def test_get_concepts_returns_list() -> None:
     concept_repo = AsyncMock()
-    concept_repo.find_all = AsyncMock(return_value=[_make_concept()])
+    concept_repo.find_page = AsyncMock(return_value=[{"id": 1, "name": "人工智能"}])
     handler = GetConceptsHandler(concept_repo)
 
     result = await handler.handle(GetConcepts())
 
-    assert len(result) == 1
+    assert len(result.items) == 1
+    assert result.next_cursor is None
 
 
 @pytest.mark.asyncio
 async def test_get_concepts_returns_empty_list() -> None:
     concept_repo = AsyncMock()
-    concept_repo.find_all = AsyncMock(return_value=[])
+    concept_repo.find_page = AsyncMock(return_value=[])
     handler = GetConceptsHandler(concept_repo)
 
     result = await handler.handle(GetConcepts())
 
-    assert result == []
+    assert result.items == []
+
+
+@pytest.mark.asyncio
+async def test_get_concepts_pages_by_cursor_with_projection() -> None:
+    concept_repo = AsyncMock()
+    concept_repo.find_page = AsyncMock(return_value=[{"id": 3, "name": "a"}, {"id": 5, "name": "b"}])
+    handler = GetConceptsHandler(concept_repo)
+
+    first = await handler.handle(GetConcepts(limit=1, fields=("name",), name_prefix="人工"))
+
+    assert first.items == [{"id": 3, "name": "a"}]
+    assert first.next_cursor is not None
+    kwargs = concept_repo.find_page.await_args.kwargs
+    assert kwargs["fields"] == ("id", "name")
+    assert kwargs["limit"] == 2
+    assert kwargs["after_id"] is None
+    assert kwargs["name_prefix"] == "人工"
+
+    await handler.handle(GetConcepts(limit=1, cursor=first.next_cursor))
+    assert concept_repo.find_page.await_args.kwargs["after_id"] == 3
+
+
+@pytest.mark.asyncio
+async def test_get_concepts_rejects_unknown_field_and_bad_cursor() -> None:
+    handler = GetConceptsHandler(AsyncMock())
+
+    with pytest.raises(ValidationException, match="content_hash"):
+        await handler.handle(GetConcepts(fields=("name", "content_hash")))
+    with pytest.raises(ValidationException, match="cursor"):
+        await handler.handle(GetConcepts(cursor="not-a-cursor"))
 
 
 @pytest.mark.asyncio
@@ -67,12 +105,12 @@ async def test_get_concept_stocks_returns_list() -> None:
     concept_repo = AsyncMock()
     concept_repo.find_by_id = AsyncMock(return_value=_make_concept())
     concept_stock_repo = AsyncMock()
-    concept_stock_repo.find_by_concept_id = AsyncMock(return_value=[_make_concept_stock()])
+    concept_stock_repo.find_page_by_concept_id = AsyncMock(return_value=[{"id": 1, "stock_third_code": "000001"}])
     handler = GetConceptStocksHandler(concept_repo, concept_stock_repo)
 
     result = await handler.handle(GetConceptStocks(concept_id=1))
 
-    assert len(result) == 1
+    assert len(result.items) == 1
 
 
 @pytest.mark.asyncio
@@ -84,3 +122,34 @@ async def test_get_concept_stocks_raises_not_found() -> None:
 
     with pytest.raises(ConceptNotFoundError):
         await handler.handle(GetConceptStocks(concept_id=999))
+
+
+async def _seed_cache() -> InMemoryCacheClient:
+    cache = InMemoryCacheClient()
+    await cache.set(query_cache_key(GetConcepts()), [_make_concept()])
+    for concept_id in (1, 2, 10):
+        await cache.set(query_cache_key(GetConceptStocks(concept_id=concept_id)), [_make_concept_stock()])
+    await cache.set(query_cache_key(GetConceptStocks(concept_id=1, cursor="next")), [_make_concept_stock()])
+    return cache
+
+
+@pytest.mark.asyncio
+async def test_invalidator_drops_list_and_changed_concept_stocks_only() -> None:
+    cache = await _seed_cache()
+
+    await ConceptQueryCacheInvalidator(cache).handle(ConceptsChanged(concept_ids=(1,)))
+
+    assert await cache.get(query_cache_key(GetConcepts())) is None
+    assert await cache.get(query_cache_key(GetConceptStocks(concept_id=1))) is None
+    assert await cache.get(query_cache_key(GetConceptStocks(concept_id=1, cursor="next"))) is None
+    assert await cache.get(query_cache_key(GetConceptStocks(concept_id=2))) is not None
+    assert await cache.get(query_cache_key(GetConceptStocks(concept_id=10))) is not None
+
+
+@pytest.mark.asyncio
+async def test_invalidator_drops_all_concept_stocks_on_snapshot() -> None:
+    cache = await _seed_cache()
+
+    await ConceptQueryCacheInvalidator(cache).handle(ConceptsChanged(all_concepts=True))
+
+    assert cache.stats().size == 0
@@ -0,0 +1,73 @@
+import pytest
+
+from app.modules.data_engineering.domain.exceptions import InvalidConceptExpressionError
+from app.modules.data_engineering.domain.services.concept_bitmap import ConceptBitmaps
+
+_RESOLVE = {"A": 1, "B": 2, "C": 3}
+
+
+def _bitmaps() -> ConceptBitmaps:
+    bitmaps = ConceptBitmaps(["s1", "s2", "s3", "s4", "s5"])
+    bitmaps.add_concept(1, ["s1", "s2", "s3"])
+    bitmaps.add_concept(2, ["s2", "s3", "s4"])
+    bitmaps.add_concept(3, ["s3"])
+    return bitmaps
+
+
+@pytest.mark.parametrize(
+    ("expression", "expected"),
+    [
+        ("A", ["s1", "s2", "s3"]),
+        ("A AND B", ["s2", "s3"]),
+        ("A and b and not c", ["s2"]),
+        ("A OR B AND C", ["s1", "s2", "s3"]),  # AND 优先于 OR
+        ("(A OR B) AND NOT C", ["s1", "s2", "s4"]),
+        ("NOT A", ["s4", "s5"]),
+        ("NOT NOT C", ["s3"]),
+    ],
+)
+def test_evaluate_expression(expression: str, expected: list[str]) -> None:
+    bitmaps = _bitmaps()
+
+    assert bitmaps.decode(bitmaps.evaluate(expression, _RESOLVE)) == expected
+
+
+@pytest.mark.parametrize("expression", ["", "A AND", "(A OR B", "A B", "A AND )", "A # B", "AND A", "D"])
+def test_invalid_expression_raises(expression: str) -> None:
+    with pytest.raises(InvalidConceptExpressionError):
+        _bitmaps().evaluate(expression, _RESOLVE)
+
+
+@pytest.mark.parametrize("expression", ["(" * 400 + "A" + ")" * 400, "NOT " * 1000 + "A"])
+def test_deeply_nested_expression_raises_invalid_expression(expression: str) -> None:
+    with pytest.raises(InvalidConceptExpressionError, match="nested deeper"):
+        _bitmaps().evaluate(expression, _RESOLVE)
+
+
+def test_nesting_up_to_limit_is_accepted() -> None:
+    expression = "(" * 16 + "NOT " * 16 + "C" + ")" * 16
+
+    assert _bitmaps().decode(_bitmaps().evaluate(expression, _RESOLVE)) == ["s3"]
+
+
+def test_decode_limit_and_sizes() -> None:
+    bitmaps = _bitmaps()
+
+    assert bitmaps.decode(bitmaps.bitmap(1), limit=2) == ["s1", "s2"]
+    assert [bitmaps.size(cid) for cid in (1, 2, 3, 99)] == [3, 3, 1, 0]
+    assert bitmaps.largest(2) == [1, 2]
+
+
+def test_jaccard_and_overlap_matrix() -> None:
+    bitmaps = _bitmaps()
+
+    assert bitmaps.jaccard(1, 2) == 0.5
+    assert bitmaps.overlap_matrix([1, 3, 99]) == [[1.0, 1 / 3, 0.0], [1 / 3, 1.0, 0.0], [0.0, 0.0, 0.0]]
+
+
+def test_members_outside_universe_are_excluded_by_not() -> None:
+    bitmaps = ConceptBitmaps(["s1"])
+    bitmaps.add_concept(1, ["s1", "delisted"])
+
+    assert bitmaps.decode(bitmaps.evaluate("A", {"A": 1})) == ["s1", "delisted"]
+    assert bitmaps.decode(bitmaps.evaluate("NOT NOT A", {"A": 1})) == ["s1"]
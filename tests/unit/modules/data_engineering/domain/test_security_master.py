@@ -0,0 +1,159 @@
+"""单元测试：SecurityMaster 证券标识索引与 SecurityMasterCache。"""
+
+from datetime import date
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.modules.data_engineering.domain.entities.stock_basic import StockBasic
+from app.modules.data_engineering.domain.services.security_master import SecurityMaster
+from app.modules.data_engineering.domain.value_objects.data_source import DataSource
+from app.modules.data_engineering.domain.value_objects.stock_status import StockStatus
+from app.modules.data_engineering.infrastructure.cache.security_master_cache import SecurityMasterCache
+
+
+def _stock(
+    third_code: str,
+    symbol: str,
+    status: StockStatus = StockStatus.LISTED,
+    market: str = "主板",
+    industry: str = "",
+) -> StockBasic:
+    return StockBasic(
+        id=None,
+        source=DataSource.TUSHARE,
+        third_code=third_code,
+        symbol=symbol,
+        name=third_code,
+        market=market,
+        area="",
+        industry=industry,
+        list_date=date(2020, 1, 1),
+        status=status,
+    )
+
+
+@pytest.fixture
+def master() -> SecurityMaster:
+    return SecurityMaster([_stock("000001.SZ", "000001"), _stock("600000.SH", "600000"), _stock("830799.BJ", "830799")])
+
+
+class TestSecurityMaster:
+    @pytest.mark.parametrize("identifier", ["000001.SZ", "000001", "SZ000001", "sz000001", "000001.sz", " 000001 "])
+    def test_resolves_every_spelling(self, master: SecurityMaster, identifier: str) -> None:
+        stock = master.resolve(identifier)
+        assert stock is not None and stock.third_code == "000001.SZ"
+
+    def test_unknown_identifier(self, master: SecurityMaster) -> None:
+        assert master.resolve("999999") is None
+        assert master.resolve("") is None
+        assert master.get("000001") is None
+
+    def test_symbol_of(self, master: SecurityMaster) -> None:
+        assert master.symbol_of("600000.SH") == "600000"
+        assert master.symbol_of("600001.SH") is None
+        assert len(master) == 3
+
+    def test_symbol_with_exchange_suffix(self) -> None:
+        master = SecurityMaster([_stock("000001", "000001.SZ")])
+        stock = master.resolve("SZ000001")
+        assert stock is not None and stock.third_code == "000001"
+
+    def test_bare_code_prefers_listed_then_exchange_order(self) -> None:
+        master = SecurityMaster(
+            [
+                _stock("000002.SH", "000002"),
+                _stock("000002.SZ", "000002", StockStatus.DELISTED),
+                _stock("000003.SH", "000003"),
+                _stock("000003.SZ", "000003"),
+            ]
+        )
+        assert master.resolve("000002").third_code == "000002.SH"  # type: ignore[union-attr]
+        assert master.resolve("000003").third_code == "000003.SZ"  # type: ignore[union-attr]
+        # 交易所限定写法不受裸代码取舍影响
+        assert master.resolve("SH000003").third_code == "000003.SH"  # type: ignore[union-attr]
+
+
+class TestSecurityMasterViews:
+    @pytest.fixture
+    def universe(self) -> SecurityMaster:
+        return SecurityMaster(
+            [
+                _stock("600000.SH", "600000", industry="银行"),
+                _stock("300750.SZ", "300750", market="创业板", industry="电池"),
+                _stock("000001.SZ", "000001", industry="银行"),
+                _stock("000005.SZ", "000005", StockStatus.DELISTED, industry="银行"),
+            ]
+        )
+
+    def test_listed_keeps_load_order(self, universe: SecurityMaster) -> None:
+        assert [s.third_code for s in universe.listed()] == ["600000.SH", "300750.SZ", "000001.SZ"]
+        assert [s.third_code for s in universe.stocks()] == [s.third_code for s in universe]
+
+    def test_stocks_combines_filters(self, universe: SecurityMaster) -> None:
+        banks = universe.stocks(status=StockStatus.LISTED, industry="银行")
+        assert [s.third_code for s in banks] == ["600000.SH", "000001.SZ"]
+        assert [s.third_code for s in universe.stocks(market="创业板")] == ["300750.SZ"]
+        assert universe.stocks(market="科创板") == []
+
+    def test_find_keeps_given_order_and_skips_unknown(self, universe: SecurityMaster) -> None:
+        found = universe.find(["000001.SZ", "999999.SZ", "600000.SH"])
+        assert [s.third_code for s in found] == ["000001.SZ", "600000.SH"]
+
+
+class TestSecurityMasterCache:
+    @pytest.mark.asyncio
+    async def test_loads_once_and_reloads_after_invalidate(self) -> None:
+        repo = AsyncMock()
+        repo.find_all.return_value = [_stock("000001.SZ", "000001")]
+        cache = SecurityMasterCache()
+
+        first = await cache.get(repo)
+        assert await cache.get(repo) is first
+        repo.find_all.assert_awaited_once_with(DataSource.TUSHARE)
+
+        repo.find_all.return_value = [_stock("000001.SZ", "000001"), _stock("600000.SH", "600000")]
+        cache.invalidate()
+        assert len(await cache.get(repo)) == 2
+
+    @pytest.mark.asyncio
+    async def test_reload_failure_keeps_previous_index(self) -> None:
+        repo = AsyncMock()
+        repo.find_all.return_value = [_stock("000001.SZ", "000001")]
+        cache = SecurityMasterCache()
+        first = await cache.get(repo)
+
+        repo.find_all.side_effect = RuntimeError("db down")
+        cache.invalidate()
+        assert await cache.get(repo) is first
+
+    @pytest.mark.asyncio
+    async def test_first_load_failure_raises(self) -> None:
+        repo = AsyncMock()
+        repo.find_all.side_effect = RuntimeError("db down")
+        with pytest.raises(RuntimeError):
+            await SecurityMasterCache().get(repo)
+
+    @pytest.mark.asyncio
+    async def test_snapshots_are_versioned_per_source(self) -> None:
+        repo = AsyncMock()
+        repo.find_all.side_effect = lambda source: [_stock("000001.SZ", "000001")]
+        cache = SecurityMasterCache()
+        tushare = await cache.get(repo)
+        akshare = await cache.get(repo, DataSource.AKSHARE)
+        assert repo.find_all.await_count == 2
+
+        cache.invalidate(DataSource.AKSHARE)
+        assert cache.version(DataSource.AKSHARE) == 1 and cache.version() == 0
+        assert await cache.get(repo) is tushare
+        assert await cache.get(repo, DataSource.AKSHARE) is not akshare
+        assert repo.find_all.await_count == 3
+
+    @pytest.mark.asyncio
+    async def test_reloads_after_refresh_interval(self) -> None:
+        repo = AsyncMock()
+        repo.find_all.return_value = [_stock("000001.SZ", "000001")]
+        cache = SecurityMasterCache(refresh_seconds=0)
+        await cache.get(repo)
+        await cache.get(repo)
+        assert repo.find_all.await_count == 2
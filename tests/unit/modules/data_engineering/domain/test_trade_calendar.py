@@ -0,0 +1,66 @@
+"""单元测试：TradeCalendar 交易日索引。"""
+
+from datetime import date, timedelta
+
+import pytest
+
+from app.modules.data_engineering.domain.entities.trade_calendar_day import TradeCalendarDay
+from app.modules.data_engineering.domain.services.trade_calendar import TradeCalendar
+
+# 2026-02-09 ~ 2026-02-27，春节休市 02-16 ~ 02-23
+_HOLIDAYS = {date(2026, 2, 16), date(2026, 2, 17), date(2026, 2, 18), date(2026, 2, 19), date(2026, 2, 20)}
+_HOLIDAYS.add(date(2026, 2, 23))
+
+
+@pytest.fixture
+def calendar() -> TradeCalendar:
+    days = []
+    d = date(2026, 2, 9)
+    while d <= date(2026, 2, 27):
+        days.append(
+            TradeCalendarDay(id=None, exchange="SSE", cal_date=d, is_open=d.weekday() < 5 and d not in _HOLIDAYS)
+        )
+        d += timedelta(days=1)
+    return TradeCalendar.from_days(days)
+
+
+class TestTradeCalendar:
+    def test_holidays_are_not_trading_days(self, calendar: TradeCalendar) -> None:
+        assert calendar.is_trading_day(date(2026, 2, 13))
+        assert not calendar.is_trading_day(date(2026, 2, 18))
+        assert not calendar.is_trading_day(date(2026, 2, 21))
+
+    def test_next_and_prev_skip_holiday(self, calendar: TradeCalendar) -> None:
+        assert calendar.next_trading_day(date(2026, 2, 13)) == date(2026, 2, 24)
+        assert calendar.prev_trading_day(date(2026, 2, 24)) == date(2026, 2, 13)
+        assert calendar.latest_trading_day(date(2026, 2, 22)) == date(2026, 2, 13)
+        assert calendar.latest_trading_day(date(2026, 2, 24)) == date(2026, 2, 24)
+
+    def test_range_queries_inside_coverage(self, calendar: TradeCalendar) -> None:
+        assert calendar.trading_days(date(2026, 2, 12), date(2026, 2, 25)) == [
+            date(2026, 2, 12),
+            date(2026, 2, 13),
+            date(2026, 2, 24),
+            date(2026, 2, 25),
+        ]
+        assert calendar.count_trading_days(date(2026, 2, 14), date(2026, 2, 23)) == 0
+        assert calendar.count_trading_days(date(2026, 2, 9), date(2026, 2, 27)) == 9
+
+    def test_falls_back_to_weekdays_outside_coverage(self, calendar: TradeCalendar) -> None:
+        # 2026-02-02 ~ 02-08 在覆盖范围之前，按工作日计；03-02 ~ 03-03 在之后
+        assert calendar.count_trading_days(date(2026, 2, 2), date(2026, 3, 3)) == 5 + 9 + 2
+        assert calendar.next_trading_day(date(2026, 2, 27)) == date(2026, 3, 2)
+        assert calendar.prev_trading_day(date(2026, 2, 9)) == date(2026, 2, 6)
+
+    def test_empty_calendar_uses_weekdays(self) -> None:
+        calendar = TradeCalendar()
+        assert calendar.is_empty
+        assert calendar.count_trading_days(date(2026, 2, 16), date(2026, 2, 22)) == 5
+        assert not calendar.is_trading_day(date(2026, 2, 21))
+
+    def test_split_by_trading_days(self, calendar: TradeCalendar) -> None:
+        assert calendar.split_by_trading_days(date(2026, 2, 11), date(2026, 2, 26), max_days=3) == [
+            (date(2026, 2, 11), date(2026, 2, 13)),
+            (date(2026, 2, 24), date(2026, 2, 26)),
+        ]
+        assert calendar.split_by_trading_days(date(2026, 2, 16), date(2026, 2, 23), max_days=3) == []
@@ -1,4 +1,4 @@
-from unittest.mock import patch
+from unittest.mock import AsyncMock, patch
 
 import pandas as pd
 import pytest
@@ -7,6 +7,7 @@ from app.modules.data_engineering.domain.exceptions import ExternalConceptServic
 from app.modules.data_engineering.infrastructure.gateways.akshare_concept_gateway import (
     AkShareConceptGateway,
 )
+from app.modules.data_engineering.infrastructure.gateways.tushare_stock_daily_gateway import TokenBucket
 
 
 @pytest.mark.asyncio
@@ -50,3 +51,23 @@ async def test_fetch_concept_stocks_wraps_external_errors(mock_to_thread) -> Non
 
     with pytest.raises(ExternalConceptServiceError, match="fetch concept stocks"):
         await gateway.fetch_concept_stocks("BK0818", "人工智能")
+
+
+@pytest.mark.asyncio
+@patch("app.modules.data_engineering.infrastructure.gateways.akshare_concept_gateway.asyncio.to_thread")
+async def test_fetch_concept_stocks_acquires_rate_limit_token(mock_to_thread) -> None:
+    mock_to_thread.return_value = pd.DataFrame([{"代码": "000001", "名称": "平安银行"}])
+    gateway = AkShareConceptGateway()
+
+    with patch.object(gateway._rate_limiter, "acquire", new_callable=AsyncMock) as mock_acquire:
+        await gateway.fetch_concept_stocks("BK0818", "人工智能")
+
+    mock_acquire.assert_awaited_once()
+
+
+def test_gateways_share_injected_rate_limiter() -> None:
+    limiter = TokenBucket(capacity=5, tokens_per_minute=120)
+
+    assert AkShareConceptGateway(rate_limiter=limiter)._rate_limiter is limiter
+    assert AkShareConceptGateway(rate_limiter=limiter)._rate_limiter is limiter
+    assert AkShareConceptGateway()._rate_limiter is not AkShareConceptGateway()._rate_limiter
@@ -25,14 +25,34 @@ class TestGetScheduledTasks:
         assert "de.sync_stock_daily_increment" in task_ids
 
     def test_trigger_is_cron_16_30(self) -> None:
-        """验证 CronTrigger 配置为 hour=16, minute=30。"""
+        """验证收盘后同步链由 de.sync_stock_basic 在 16:30 触发。"""
         from app.modules.data_engineering.interfaces.schedulers.tasks import get_scheduled_tasks
 
         configs = get_scheduled_tasks()
-        sync_task = next((c for c in configs if c.id == "de.sync_stock_daily_increment"), None)
-        assert sync_task is not None
-        assert sync_task.trigger.hour == 16
-        assert sync_task.trigger.minute == 30
+        root_task = next((c for c in configs if c.id == "de.sync_stock_basic"), None)
+        assert root_task is not None
+        assert root_task.trigger is not None
+        assert root_task.trigger.hour == 16
+        assert root_task.trigger.minute == 30
+
+    def test_post_close_chain_dependencies(self) -> None:
+        """验证日线增量 → 财务指标增量 → 概念同步依次依赖上游，且自身无触发器。"""
+        from app.modules.data_engineering.interfaces.schedulers.tasks import get_scheduled_tasks
+
+        configs = {c.id: c for c in get_scheduled_tasks()}
+        assert configs["de.sync_stock_daily_increment"].depends_on == ("de.sync_stock_basic",)
+        assert configs["de.sync_finance_indicator_increment"].depends_on == ("de.sync_stock_daily_increment",)
+        assert configs["de.sync_concepts"].depends_on == ("de.sync_finance_indicator_increment",)
+        assert all(configs[i].trigger is None for i in configs if configs[i].depends_on)
+
+    def test_every_task_has_callable(self) -> None:
+        """验证每个任务配置都有对应的执行函数。"""
+        from unittest.mock import MagicMock
+
+        from app.modules.data_engineering.interfaces.schedulers.tasks import create_task_callables, get_scheduled_tasks
+
+        callables = create_task_callables(MagicMock())
+        assert {c.id for c in get_scheduled_tasks()} == set(callables)
 
     def test_max_instances_is_1(self) -> None:
         """验证 max_instances=1。"""
@@ -90,6 +110,33 @@ class TestCreateTaskCallables:
         task_callable = callables["de.sync_stock_daily_increment"]
         assert asyncio.iscoroutinefunction(task_callable)
 
+    @pytest.mark.asyncio
+    async def test_interrupted_stock_basic_sync_fails_task(self) -> None:
+        """股票基础信息同步提前停止时任务失败，依赖链下游随之跳过。"""
+        from unittest.mock import AsyncMock, MagicMock, patch
+
+        from app.modules.data_engineering.application.commands.sync_stock_basic import SyncStockBasicResult
+        from app.modules.data_engineering.domain.exceptions import SyncInterruptedError
+        from app.modules.data_engineering.interfaces.schedulers.tasks import create_task_callables
+
+        session_factory = MagicMock()
+        session_factory.return_value.__aenter__ = AsyncMock()
+        session_factory.return_value.__aexit__ = AsyncMock(return_value=False)
+        handler = AsyncMock()
+        handler.handle.return_value = SyncStockBasicResult(
+            synced_count=2, total=3, interrupted=True, stop_reason="deadline"
+        )
+        callables = create_task_callables(session_factory)
+
+        with (
+            patch(
+                "app.modules.data_engineering.interfaces.schedulers.tasks.get_sync_stock_basic_handler",
+                return_value=handler,
+            ),
+            pytest.raises(SyncInterruptedError, match="deadline"),
+        ):
+            await callables["de.sync_stock_basic"]()
+
 
 class TestCreateScheduledTasks:
     """测试 create_scheduled_tasks 入口函数。"""
@@ -0,0 +1,116 @@
+"""LeaderElector 单元测试。"""
+
+from datetime import UTC, datetime, timedelta
+
+import pytest
+
+from app.modules.foundation.application.leader_election import LeaderElector, LeaderInfo, LeaderLock
+
+
+class FakeLeaderLock(LeaderLock):
+    """内存中的选举锁，holder 为当前持有者。"""
+
+    def __init__(self, state: dict, instance_id: str) -> None:
+        self._state = state
+        self._instance_id = instance_id
+        self.fail = False
+
+    @property
+    def instance_id(self) -> str:
+        return self._instance_id
+
+    async def try_acquire(self) -> bool:
+        if self.fail:
+            raise ConnectionError("database unavailable")
+        if self._state.get("holder") in (None, self._instance_id):
+            self._state["holder"] = self._instance_id
+            return True
+        return False
+
+    async def renew(self) -> bool:
+        if self.fail:
+            raise ConnectionError("database unavailable")
+        return self._state.get("holder") == self._instance_id
+
+    async def release(self) -> None:
+        if self._state.get("holder") == self._instance_id:
+            self._state["holder"] = None
+
+    async def current_leader(self) -> LeaderInfo | None:
+        holder = self._state.get("holder")
+        now = datetime.now(UTC)
+        return LeaderInfo(holder, now, now + timedelta(seconds=30)) if holder else None
+
+
+def _elector(lock: LeaderLock, events: list[str]) -> LeaderElector:
+    async def on_elected() -> None:
+        events.append(f"elected:{lock.instance_id}")
+
+    async def on_demoted() -> None:
+        events.append(f"demoted:{lock.instance_id}")
+
+    return LeaderElector(lock, on_elected=on_elected, on_demoted=on_demoted, renew_interval=60)
+
+
+class TestLeaderElector:
+    """测试竞选、续约与接管。"""
+
+    @pytest.mark.asyncio
+    async def test_only_one_instance_is_elected(self) -> None:
+        """验证同一把锁只有一个实例成为主节点，待命实例报告当前主节点。"""
+        state: dict = {}
+        events: list[str] = []
+        a, b = _elector(FakeLeaderLock(state, "a"), events), _elector(FakeLeaderLock(state, "b"), events)
+
+        await a.tick()
+        await b.tick()
+
+        assert a.is_leader and not b.is_leader
+        assert events == ["elected:a"]
+        status = b.status()
+        assert status["instance_id"] == "b"
+        assert status["is_leader"] is False
+        assert status["leader"] == "a"
+
+    @pytest.mark.asyncio
+    async def test_standby_takes_over_after_leader_loses_lock(self) -> None:
+        """验证主节点失去锁后降级，待命实例在下一周期接管。"""
+        state: dict = {}
+        events: list[str] = []
+        a, b = _elector(FakeLeaderLock(state, "a"), events), _elector(FakeLeaderLock(state, "b"), events)
+        await a.tick()
+
+        state["holder"] = None  # 模拟主节点连接断开、锁被数据库释放
+        await b.tick()
+        await a.tick()
+
+        assert b.is_leader and not a.is_leader
+        assert events == ["elected:a", "elected:b", "demoted:a"]
+
+    @pytest.mark.asyncio
+    async def test_lock_error_demotes_leader(self) -> None:
+        """验证续约异常时主节点降级，不抛出异常。"""
+        events: list[str] = []
+        lock = FakeLeaderLock({}, "a")
+        elector = _elector(lock, events)
+        await elector.tick()
+
+        lock.fail = True
+        await elector.tick()
+
+        assert not elector.is_leader
+        assert events == ["elected:a", "demoted:a"]
+
+    @pytest.mark.asyncio
+    async def test_stop_releases_lock_for_standby(self) -> None:
+        """验证 stop() 释放锁，待命实例立即可接管。"""
+        state: dict = {}
+        events: list[str] = []
+        a, b = _elector(FakeLeaderLock(state, "a"), events), _elector(FakeLeaderLock(state, "b"), events)
+        await a.start()
+
+        await a.stop()
+        await b.tick()
+
+        assert b.is_leader
+        assert not a.is_leader
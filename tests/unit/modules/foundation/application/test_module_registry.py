@@ -95,6 +95,76 @@ class TestModuleRegistry:
         call_args = mock_scheduler.add_job.call_args
         assert call_args[0][0] == config  # config 参数
 
+    def test_only_root_tasks_are_added_to_scheduler(self) -> None:
+        """验证声明 depends_on 的任务不注册到调度器，由根任务的依赖图执行器启动。"""
+        from app.modules.foundation.application.module_registry import ModuleRegistry
+
+        registry = ModuleRegistry(max_concurrent_tasks=2)
+        root = ScheduledTaskConfig(
+            id="test.root", trigger=CronTrigger(hour=16, minute=30), name="根任务", module="test"
+        )
+        child = ScheduledTaskConfig(
+            id="test.child", trigger=None, name="下游任务", module="test", depends_on=("test.root",)
+        )
+
+        async def noop() -> None:
+            pass
+
+        registry.register_scheduled_tasks(lambda: ([root, child], {"test.root": noop, "test.child": noop}))
+
+        mock_scheduler = MagicMock()
+        registry.register_all_to_scheduler(mock_scheduler)
+
+        mock_scheduler.add_job.assert_called_once()
+        assert mock_scheduler.add_job.call_args[0][0] == root
+        assert registry.executor is not None
+
+    def test_dispatcher_wraps_task_callables(self) -> None:
+        """验证配置分派器时，调度器执行的是分派器返回的远程 callable。"""
+        import asyncio
+
+        from app.modules.foundation.application.module_registry import ModuleRegistry
+
+        dispatched: list[str] = []
+
+        class RecordingDispatcher:
+            def remote(self, task_id: str) -> Callable[[], Awaitable[None]]:
+                async def run() -> None:
+                    dispatched.append(task_id)
+
+                return run
+
+            async def shutdown(self, wait: bool = True) -> None:
+                pass
+
+        registry = ModuleRegistry(dispatcher=RecordingDispatcher())
+        config = ScheduledTaskConfig(
+            id="test.task1", trigger=CronTrigger(hour=16, minute=30), name="测试任务1", module="test"
+        )
+        local_callable = AsyncMock()
+        registry.register_scheduled_tasks(lambda: ([config], {"test.task1": local_callable}))
+
+        mock_scheduler = MagicMock()
+        registry.register_all_to_scheduler(mock_scheduler)
+        asyncio.run(mock_scheduler.add_job.call_args[0][1]())
+
+        assert dispatched == ["test.task1"]
+        local_callable.assert_not_called()
+
+    def test_registered_trading_calendar_is_passed_to_scheduler(self) -> None:
+        """验证 register_trading_calendar 注册的提供者在注册任务前设置到调度器。"""
+        from app.modules.foundation.application.module_registry import ModuleRegistry
+        from app.modules.foundation.application.scheduled_task_config import WeekdayTradingCalendar
+
+        registry = ModuleRegistry()
+        provider = WeekdayTradingCalendar()
+        registry.register_trading_calendar(provider)
+
+        mock_scheduler = MagicMock()
+        registry.register_all_to_scheduler(mock_scheduler)
+
+        mock_scheduler.set_trading_calendar.assert_called_once_with(provider)
+
 
 class TestModuleRegistryValidation:
     """测试 ModuleRegistry 任务验证。"""
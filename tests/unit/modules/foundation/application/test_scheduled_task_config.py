@@ -97,3 +97,31 @@ class TestScheduledTaskConfig:
         )
 
         assert config.max_instances == 3
+
+    def test_dependent_task_without_trigger(self) -> None:
+        """验证声明 depends_on 的任务可以不设触发器。"""
+        config = ScheduledTaskConfig(
+            id="test.downstream",
+            trigger=None,
+            name="下游任务",
+            module="test",
+            depends_on=("test.task",),
+        )
+
+        assert config.depends_on == ("test.task",)
+
+    def test_dependent_task_with_trigger_raises(self) -> None:
+        """验证同时声明 depends_on 与触发器时抛出 ValueError。"""
+        with pytest.raises(ValueError, match="test.downstream"):
+            ScheduledTaskConfig(
+                id="test.downstream",
+                trigger=CronTrigger(hour=16, minute=30),
+                name="下游任务",
+                module="test",
+                depends_on=("test.task",),
+            )
+
+    def test_task_without_trigger_or_dependency_raises(self) -> None:
+        """验证既无触发器也无依赖时抛出 ValueError。"""
+        with pytest.raises(ValueError, match="test.task"):
+            ScheduledTaskConfig(id="test.task", trigger=None, name="测试任务", module="test")
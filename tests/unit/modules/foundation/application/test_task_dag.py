@@ -0,0 +1,158 @@
+"""TaskDag / TaskDagExecutor 单元测试。"""
+
+import asyncio
+from collections.abc import Awaitable, Callable
+from unittest.mock import AsyncMock
+
+import pytest
+
+from app.modules.foundation.application.scheduled_task_config import CronTrigger, ScheduledTaskConfig
+from app.modules.foundation.application.task_dag import TaskDag, TaskDagExecutor, TaskRunStatus
+from app.modules.foundation.application.task_run_store import TaskRunStore
+
+
+def _root(task_id: str) -> ScheduledTaskConfig:
+    return ScheduledTaskConfig(id=task_id, trigger=CronTrigger(hour=16, minute=30), name=task_id, module="test")
+
+
+def _child(task_id: str, *depends_on: str) -> ScheduledTaskConfig:
+    return ScheduledTaskConfig(id=task_id, trigger=None, name=task_id, module="test", depends_on=depends_on)
+
+
+class TestTaskDag:
+    """测试依赖图构建与校验。"""
+
+    def test_roots_and_reachable_order(self) -> None:
+        """验证根任务识别，且下游按拓扑序排列。"""
+        dag = TaskDag([_child("c", "b"), _child("b", "a"), _root("a"), _root("other")])
+
+        assert [c.id for c in dag.roots] == ["a", "other"]
+        assert dag.reachable_from("a") == ["a", "b", "c"]
+        assert dag.reachable_from("other") == ["other"]
+
+    def test_unknown_dependency_raises(self) -> None:
+        """验证依赖不存在的任务时抛出 ValueError。"""
+        with pytest.raises(ValueError, match="missing"):
+            TaskDag([_root("a"), _child("b", "missing")])
+
+    def test_cycle_raises(self) -> None:
+        """验证依赖成环时抛出 ValueError。"""
+        with pytest.raises(ValueError, match="cycle"):
+            TaskDag([_root("a"), _child("b", "a", "c"), _child("c", "b")])
+
+
+def _recorder(log: list[str], task_id: str, delay: float = 0.0, fail: bool = False) -> Callable[[], Awaitable[None]]:
+    async def run() -> None:
+        log.append(f"start:{task_id}")
+        await asyncio.sleep(delay)
+        log.append(f"end:{task_id}")
+        if fail:
+            raise RuntimeError(f"{task_id} failed")
+
+    return run
+
+
+class TestTaskDagExecutor:
+    """测试依赖图执行。"""
+
+    @pytest.mark.asyncio
+    async def test_downstream_runs_after_upstream_and_branches_run_in_parallel(self) -> None:
+        """验证下游在上游完成后启动，无依赖关系的分支并行执行。"""
+        log: list[str] = []
+        dag = TaskDag([_root("a"), _child("b", "a"), _child("c", "a"), _child("d", "b", "c")])
+        executor = TaskDagExecutor(
+            dag,
+            {
+                "a": _recorder(log, "a"),
+                "b": _recorder(log, "b", delay=0.02),
+                "c": _recorder(log, "c", delay=0.02),
+                "d": _recorder(log, "d"),
+            },
+        )
+
+        records = await executor.run("a")
+
+        assert log.index("end:a") < log.index("start:b")
+        # b 与 c 并行：两者都在任一结束之前启动
+        assert max(log.index("start:b"), log.index("start:c")) < min(log.index("end:b"), log.index("end:c"))
+        assert log.index("start:d") > max(log.index("end:b"), log.index("end:c"))
+        assert [r.task_id for r in records] == ["a", "b", "c", "d"]
+        assert all(r.status is TaskRunStatus.SUCCEEDED for r in records)
+        assert len({r.run_id for r in records}) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrency_cap_limits_parallel_tasks(self) -> None:
+        """验证同时执行的任务数不超过 max_concurrency，排队时间计入 wait_ms。"""
+        running = 0
+        peak = 0
+
+        async def task() -> None:
+            nonlocal running, peak
+            running += 1
+            peak = max(peak, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+
+        children = [_child(f"c{i}", "root") for i in range(4)]
+        dag = TaskDag([_root("root"), *children])
+        executor = TaskDagExecutor(dag, {c.id: task for c in [_root("root"), *children]}, max_concurrency=2)
+
+        records = await executor.run("root")
+
+        assert peak == 2
+        assert max(r.wait_ms for r in records) > 0
+
+    @pytest.mark.asyncio
+    async def test_upstream_failure_skips_downstream(self) -> None:
+        """验证上游失败时下游标记为 SKIPPED、不执行，且运行结束后抛出上游异常。"""
+        log: list[str] = []
+        dag = TaskDag([_root("a"), _child("b", "a"), _child("c", "b")])
+        executor = TaskDagExecutor(
+            dag, {"a": _recorder(log, "a", fail=True), "b": _recorder(log, "b"), "c": _recorder(log, "c")}
+        )
+
+        with pytest.raises(RuntimeError, match="a failed"):
+            await executor.run("a")
+
+        assert "start:b" not in log
+        statuses = {r.task_id: r.status for r in executor.recent_runs()}
+        assert statuses == {"a": TaskRunStatus.FAILED, "b": TaskRunStatus.SKIPPED, "c": TaskRunStatus.SKIPPED}
+        assert executor.recent_runs("a")[0].error == "RuntimeError: a failed"
+
+    @pytest.mark.asyncio
+    async def test_runner_for_returns_scheduler_callable(self) -> None:
+        """验证 runner_for 返回的无参 callable 执行整条依赖链。"""
+        log: list[str] = []
+        dag = TaskDag([_root("a"), _child("b", "a")])
+        executor = TaskDagExecutor(dag, {"a": _recorder(log, "a"), "b": _recorder(log, "b")})
+
+        await executor.runner_for("a")()
+
+        assert log == ["start:a", "end:a", "start:b", "end:b"]
+
+    @pytest.mark.asyncio
+    async def test_rows_are_recorded_and_written_to_run_store(self) -> None:
+        """验证任务返回的行数记录在执行记录中，且每次运行结束后写入运行历史。"""
+        store = AsyncMock(spec=TaskRunStore)
+        dag = TaskDag([_root("a"), _child("b", "a")])
+
+        async def returns_rows() -> int:
+            return 42
+
+        executor = TaskDagExecutor(dag, {"a": returns_rows, "b": _recorder([], "b")}, run_store=store)
+
+        records = await executor.run("a")
+
+        assert [r.rows for r in records] == [42, None]
+        store.add_many.assert_awaited_once_with(records)
+
+    @pytest.mark.asyncio
+    async def test_run_store_failure_does_not_fail_run(self) -> None:
+        """验证运行历史写入失败不影响任务结果。"""
+        store = AsyncMock(spec=TaskRunStore)
+        store.add_many.side_effect = RuntimeError("db down")
+        executor = TaskDagExecutor(TaskDag([_root("a")]), {"a": _recorder([], "a")}, run_store=store)
+
+        records = await executor.run("a")
+
+        assert records[0].status is TaskRunStatus.SUCCEEDED
@@ -0,0 +1,44 @@
+"""summarize_runs 单元测试。"""
+
+from datetime import UTC, datetime, timedelta
+
+from app.modules.foundation.application.task_run_store import TaskRunRecord, TaskRunStatus, summarize_runs
+
+_BASE = datetime(2026, 2, 23, 16, 30, tzinfo=UTC)
+
+
+def _record(task_id: str, duration_ms: int, status: TaskRunStatus = TaskRunStatus.SUCCEEDED, offset: int = 0):
+    return TaskRunRecord(
+        run_id=f"r{offset}",
+        task_id=task_id,
+        root_id=task_id,
+        status=status,
+        started_at=_BASE,
+        finished_at=_BASE + timedelta(minutes=offset),
+        duration_ms=duration_ms,
+    )
+
+
+class TestSummarizeRuns:
+    """测试运行历史汇总。"""
+
+    def test_percentiles_use_successful_runs_only(self) -> None:
+        """验证 p50/p95 为成功运行耗时的最近秩分位数，失败与跳过只计入次数。"""
+        records = [_record("a", ms, offset=i) for i, ms in enumerate(range(100, 2100, 100))]
+        records.append(_record("a", 99_999, TaskRunStatus.FAILED, offset=30))
+        records.append(_record("a", 0, TaskRunStatus.SKIPPED, offset=31))
+
+        [stats] = summarize_runs(records)
+
+        assert (stats.runs, stats.succeeded, stats.failed, stats.skipped) == (22, 20, 1, 1)
+        assert stats.p50_ms == 1000
+        assert stats.p95_ms == 1900
+        assert stats.last_status is TaskRunStatus.SKIPPED
+
+    def test_groups_by_task_sorted(self) -> None:
+        """验证按任务分组、按任务 ID 排序，无成功运行时分位数为 None。"""
+        stats = summarize_runs([_record("b", 10), _record("a", 0, TaskRunStatus.FAILED)])
+
+        assert [s.task_id for s in stats] == ["a", "b"]
+        assert stats[0].p50_ms is None
+        assert stats[1].p95_ms == 10
@@ -0,0 +1,66 @@
+"""TradingDayTrigger 值对象单元测试。"""
+
+from datetime import date
+
+import pytest
+
+from app.modules.foundation.application.scheduled_task_config import (
+    TradingDayRule,
+    TradingDayTrigger,
+    WeekdayTradingCalendar,
+)
+
+
+class _HolidayCalendar(WeekdayTradingCalendar):
+    """工作日中排除指定休市日。"""
+
+    def __init__(self, *holidays: date) -> None:
+        self._holidays = set(holidays)
+
+    def is_trading_day(self, day: date) -> bool:
+        return super().is_trading_day(day) and day not in self._holidays
+
+
+class TestTradingDayTriggerMatches:
+    """测试 TradingDayTrigger.matches。"""
+
+    def test_every_day_skips_weekend_and_holiday(self) -> None:
+        """验证每日规则只在交易日触发。"""
+        trigger = TradingDayTrigger(hour=16, minute=30)
+        calendar = _HolidayCalendar(date(2026, 10, 1))
+
+        assert trigger.matches(date(2026, 9, 30), calendar)
+        assert not trigger.matches(date(2026, 10, 1), calendar)
+        assert not trigger.matches(date(2026, 10, 3), calendar)
+
+    def test_month_first_skips_leading_holidays(self) -> None:
+        """验证国庆长假后第一个交易日为十月首个交易日。"""
+        holidays = [date(2026, 10, d) for d in (1, 2, 5, 6, 7)]
+        calendar = _HolidayCalendar(*holidays)
+        first = TradingDayTrigger(hour=9, minute=0, rule=TradingDayRule.MONTH_FIRST)
+        second = TradingDayTrigger(hour=9, minute=0, rule=TradingDayRule.MONTH_FIRST, offset=1)
+
+        assert first.matches(date(2026, 10, 8), calendar)
+        assert not first.matches(date(2026, 10, 9), calendar)
+        assert second.matches(date(2026, 10, 9), calendar)
+
+    def test_month_last(self) -> None:
+        """验证 2026-10-31 为周六时，月末规则落在 10-30。"""
+        calendar = WeekdayTradingCalendar()
+        last = TradingDayTrigger(hour=15, minute=30, rule=TradingDayRule.MONTH_LAST)
+        second_last = TradingDayTrigger(hour=15, minute=30, rule=TradingDayRule.MONTH_LAST, offset=1)
+
+        assert last.matches(date(2026, 10, 30), calendar)
+        assert second_last.matches(date(2026, 10, 29), calendar)
+
+
+class TestTradingDayTriggerValidation:
+    """测试 TradingDayTrigger 参数校验。"""
+
+    def test_offset_not_allowed_for_every_day(self) -> None:
+        with pytest.raises(ValueError, match="offset"):
+            TradingDayTrigger(hour=16, minute=30, offset=1)
+
+    def test_invalid_hour_raises_value_error(self) -> None:
+        with pytest.raises(ValueError, match="hour.*0.*23"):
+            TradingDayTrigger(hour=24, minute=0)
@@ -2,11 +2,13 @@
 
 import asyncio
 from collections.abc import Awaitable, Callable
+from datetime import UTC, datetime, timedelta
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
 from app.modules.foundation.application.scheduled_task_config import CronTrigger, ScheduledTaskConfig
+from app.modules.foundation.application.scheduler_state_store import SchedulerStateStore
 from app.modules.foundation.infrastructure.asyncio_scheduler_impl import AsyncIOSchedulerImpl
 
 
@@ -41,6 +43,24 @@ class TestAsyncIOSchedulerImpl:
         assert job is not None
         assert job.id == "test.task"
 
+    def test_add_job_rejects_dependent_task_without_trigger(self) -> None:
+        """声明 depends_on 的任务没有触发器，不能注册到调度器。"""
+        scheduler = AsyncIOSchedulerImpl()
+        config = ScheduledTaskConfig(
+            id="test.downstream",
+            trigger=None,
+            name="下游任务",
+            module="test",
+            depends_on=("test.task",),
+        )
+
+        async def task_callable() -> None:
+            pass
+
+        with pytest.raises(ValueError, match="no trigger"):
+            scheduler.add_job(config, task_callable)
+        assert scheduler._scheduler.get_job("test.downstream") is None
+
     def test_start_starts_scheduler(self) -> None:
         """验证 scheduler.start() 启动调度器。"""
         scheduler = AsyncIOSchedulerImpl()
@@ -168,3 +188,51 @@ class TestWrappedTaskLogging:
             info_calls = [call for call in mock_logger.info.call_args_list]
             # 找到第一个 info 调用（Task started）
             assert len(info_calls) >= 1, f"Expected at least 1 info call: {info_calls}"
+
+
+class _MemoryStateStore(SchedulerStateStore):
+    def __init__(self, stored: dict[str, datetime] | None = None) -> None:
+        self.stored: dict[str, datetime | None] = dict(stored or {})
+
+    async def load_next_run_times(self) -> dict[str, datetime]:
+        return {k: v for k, v in self.stored.items() if v is not None}
+
+    async def save_next_run_time(self, task_id: str, next_run_time: datetime | None) -> None:
+        self.stored[task_id] = next_run_time
+
+
+class TestRestore:
+    """测试调度器状态恢复。"""
+
+    @staticmethod
+    def _scheduler(store: SchedulerStateStore) -> AsyncIOSchedulerImpl:
+        scheduler = AsyncIOSchedulerImpl(state_store=store)
+        config = ScheduledTaskConfig(id="test.task", trigger=CronTrigger(hour=16, minute=30), name="t", module="test")
+
+        async def task_callable() -> None:
+            pass
+
+        scheduler.add_job(config, task_callable)
+        return scheduler
+
+    @pytest.mark.asyncio
+    async def test_missed_run_is_restored(self) -> None:
+        """验证停机期间错过的执行时间写回任务，由 APScheduler 按 misfire 规则处理。"""
+        missed = datetime.now(UTC) - timedelta(minutes=5)
+        scheduler = self._scheduler(_MemoryStateStore({"test.task": missed}))
+
+        await scheduler.restore()
+
+        assert scheduler._scheduler.get_job("test.task").next_run_time == missed
+
+    @pytest.mark.asyncio
+    async def test_unknown_job_saves_next_fire_time(self) -> None:
+        """验证尚无保存记录的任务写入按触发器计算的下次执行时间。"""
+        store = _MemoryStateStore()
+        scheduler = self._scheduler(store)
+
+        await scheduler.restore()
+
+        saved = store.stored["test.task"]
+        assert saved is not None
+        assert saved > datetime.now(UTC)
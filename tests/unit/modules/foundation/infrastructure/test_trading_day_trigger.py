@@ -0,0 +1,70 @@
+"""APSchedulerTradingDayTrigger 与交易日任务包装单元测试。"""
+
+from datetime import date, datetime
+from unittest.mock import AsyncMock
+from zoneinfo import ZoneInfo
+
+import pytest
+
+from app.modules.foundation.application.scheduled_task_config import (
+    ScheduledTaskConfig,
+    TradingDayRule,
+    TradingDayTrigger,
+    WeekdayTradingCalendar,
+)
+from app.modules.foundation.infrastructure.asyncio_scheduler_impl import AsyncIOSchedulerImpl
+from app.modules.foundation.infrastructure.trading_day_trigger import APSchedulerTradingDayTrigger
+
+_TZ = ZoneInfo("Asia/Shanghai")
+
+
+class _HolidayCalendar(WeekdayTradingCalendar):
+    def __init__(self, *holidays: date) -> None:
+        self._holidays = set(holidays)
+        self.refresh = AsyncMock()  # type: ignore[method-assign]
+
+    def is_trading_day(self, day: date) -> bool:
+        return super().is_trading_day(day) and day not in self._holidays
+
+
+class TestAPSchedulerTradingDayTrigger:
+    """测试下次触发时间计算。"""
+
+    def test_next_fire_time_skips_holidays(self) -> None:
+        """验证 9-30 收盘后计算的下次触发时间跳过国庆长假。"""
+        holidays = [date(2026, 10, d) for d in (1, 2, 5, 6, 7)]
+        calendar = _HolidayCalendar(*holidays)
+        trigger = APSchedulerTradingDayTrigger(TradingDayTrigger(hour=16, minute=30), lambda: calendar)
+
+        now = datetime(2026, 9, 30, 16, 30, tzinfo=_TZ)
+        assert trigger.get_next_fire_time(None, now) == now
+        assert trigger.get_next_fire_time(now, now) == datetime(2026, 10, 8, 16, 30, tzinfo=_TZ)
+
+    def test_next_fire_time_for_month_first(self) -> None:
+        trigger = APSchedulerTradingDayTrigger(
+            TradingDayTrigger(hour=9, minute=0, rule=TradingDayRule.MONTH_FIRST), WeekdayTradingCalendar
+        )
+
+        now = datetime(2026, 10, 19, 12, 0, tzinfo=_TZ)
+        assert trigger.get_next_fire_time(None, now) == datetime(2026, 11, 2, 9, 0, tzinfo=_TZ)
+
+
+class TestTradingDayTaskCheck:
+    """测试交易日任务执行前的二次确认。"""
+
+    @pytest.mark.asyncio
+    async def test_task_skipped_when_today_is_not_trading_day(self) -> None:
+        scheduler = AsyncIOSchedulerImpl()
+        calendar = _HolidayCalendar(date.today())
+        scheduler.set_trading_calendar(calendar)
+        task = AsyncMock()
+        scheduler.add_job(
+            ScheduledTaskConfig(id="test.trading", trigger=TradingDayTrigger(hour=16, minute=30), name="t", module="t"),
+            task,
+        )
+
+        job = scheduler._scheduler.get_job("test.trading")
+        await job.func()  # type: ignore[misc]
+
+        calendar.refresh.assert_awaited_once()
+        task.assert_not_awaited()
@@ -0,0 +1,154 @@
+import asyncio
+from dataclasses import dataclass
+
+import pytest
+
+from app.shared_kernel.application.queries import CachedQueryHandler, query_cache_key
+from app.shared_kernel.application.query import Query
+from app.shared_kernel.application.query_handler import QueryHandler
+from app.shared_kernel.infrastructure.cache import InMemoryCacheClient, create_cache_client
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+@pytest.mark.asyncio
+async def test_ttl_expiry_and_default_ttl() -> None:
+    clock = _Clock()
+    cache = InMemoryCacheClient(default_ttl_seconds=60, clock=clock)
+    await cache.set("default", 1)
+    await cache.set("short", 2, ttl_seconds=5)
+
+    clock.now = 5.0
+    assert await cache.get("short") is None
+    assert await cache.get("default") == 1
+    clock.now = 60.0
+    assert await cache.get("default") is None
+
+    stats = cache.stats()
+    assert (stats.hits, stats.misses, stats.expirations, stats.size) == (1, 2, 2, 0)
+
+
+@pytest.mark.asyncio
+async def test_lru_eviction_keeps_recently_used() -> None:
+    cache = InMemoryCacheClient(max_entries=2)
+    await cache.set("a", 1)
+    await cache.set("b", 2)
+    assert await cache.get("a") == 1
+
+    await cache.set("c", 3)
+
+    assert await cache.get("b") is None
+    assert await cache.get("a") == 1
+    assert await cache.get("c") == 3
+    assert cache.stats().evictions == 1
+
+
+@pytest.mark.asyncio
+async def test_delete_prefix() -> None:
+    cache = InMemoryCacheClient()
+    await cache.set("query:A:x=1", 1)
+    await cache.set("query:A:x=2", 2)
+    await cache.set("query:B:", 3)
+
+    assert await cache.delete_prefix("query:A:") == 2
+    assert await cache.get("query:B:") == 3
+
+
+@pytest.mark.asyncio
+async def test_concurrent_misses_load_once() -> None:
+    cache = InMemoryCacheClient()
+    calls = 0
+
+    async def loader() -> str:
+        nonlocal calls
+        calls += 1
+        await asyncio.sleep(0.01)
+        return "value"
+
+    results = await asyncio.gather(*(cache.get_or_load("k", loader) for _ in range(10)))
+
+    assert results == ["value"] * 10
+    assert calls == 1
+    assert await cache.get_or_load("k", loader) == "value"
+    assert cache.stats().loads == 1
+
+
+@pytest.mark.asyncio
+async def test_load_failure_propagates_to_all_waiters_and_is_not_cached() -> None:
+    cache = InMemoryCacheClient()
+
+    async def failing() -> str:
+        await asyncio.sleep(0.01)
+        raise RuntimeError("db down")
+
+    results = await asyncio.gather(*(cache.get_or_load("k", failing) for _ in range(3)), return_exceptions=True)
+
+    assert all(isinstance(r, RuntimeError) for r in results)
+    assert cache.stats().load_failures == 1
+
+    async def ok() -> str:
+        return "value"
+
+    assert await cache.get_or_load("k", ok) == "value"
+
+
+@pytest.mark.asyncio
+async def test_delete_during_load_discards_stale_result() -> None:
+    cache = InMemoryCacheClient()
+    started = asyncio.Event()
+
+    async def slow() -> str:
+        started.set()
+        await asyncio.sleep(0.01)
+        return "stale"
+
+    pending = asyncio.create_task(cache.get_or_load("k", slow))
+    await started.wait()
+    await cache.delete("k")
+
+    assert await pending == "stale"
+    assert await cache.get("k") is None
+
+
+def test_create_cache_client_backends() -> None:
+    assert isinstance(create_cache_client("memory"), InMemoryCacheClient)
+    with pytest.raises(ValueError, match="Unsupported"):
+        create_cache_client("memcached")
+    with pytest.raises(ValueError, match="redis_url"):
+        create_cache_client("redis")
+
+
+@dataclass(frozen=True)
+class _GetThing(Query):
+    thing_id: int
+
+
+class _CountingHandler(QueryHandler[_GetThing, str]):
+    def __init__(self) -> None:
+        self.calls = 0
+
+    async def handle(self, query: _GetThing) -> str:
+        self.calls += 1
+        return f"thing-{query.thing_id}"
+
+
+def test_query_cache_key_includes_type_and_fields() -> None:
+    assert query_cache_key(_GetThing(thing_id=3)) == "query:_GetThing:thing_id=3"
+
+
+@pytest.mark.asyncio
+async def test_cached_query_handler_caches_per_query() -> None:
+    inner = _CountingHandler()
+    handler = CachedQueryHandler(inner, InMemoryCacheClient(), ttl_seconds=60)
+
+    assert await handler.handle(_GetThing(1)) == "thing-1"
+    assert await handler.handle(_GetThing(1)) == "thing-1"
+    assert await handler.handle(_GetThing(2)) == "thing-2"
+
+    assert inner.calls == 2
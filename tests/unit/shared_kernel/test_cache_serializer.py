@@ -0,0 +1,56 @@
+from dataclasses import dataclass, field
+from datetime import UTC, date, datetime
+from decimal import Decimal
+from enum import StrEnum
+
+import pytest
+
+from app.shared_kernel.infrastructure.cache_serializer import CacheSerializer
+
+
+class _Source(StrEnum):
+    A = "a"
+
+
+@dataclass
+class _Item:
+    id: int | None
+    source: _Source
+    at: datetime
+    day: date | None
+    price: Decimal
+    tags: tuple[str, ...] = ()
+    _internal: list[str] = field(default_factory=list, init=False)
+
+
+@dataclass
+class _Unregistered:
+    x: int
+
+
+def test_round_trips_registered_dataclasses() -> None:
+    serializer = CacheSerializer()
+    serializer.register(_Item)
+    item = _Item(
+        id=1,
+        source=_Source.A,
+        at=datetime(2026, 2, 23, 8, 30, tzinfo=UTC),
+        day=date(2026, 2, 23),
+        price=Decimal("12.34"),
+        tags=("x", "y"),
+    )
+
+    [restored] = serializer.loads(serializer.dumps([item]))
+
+    assert restored == item
+    assert restored.source is _Source.A
+    assert restored.tags == ("x", "y")
+
+
+def test_rejects_unregistered_types() -> None:
+    serializer = CacheSerializer()
+
+    with pytest.raises(TypeError):
+        serializer.dumps(_Unregistered(1))
+    with pytest.raises(ValueError, match="Unknown cached type"):
+        serializer.loads(b'{"__type__": "_Unregistered", "x": 1}')
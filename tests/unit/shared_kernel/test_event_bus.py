@@ -0,0 +1,51 @@
+from dataclasses import dataclass
+
+import pytest
+
+from app.shared_kernel.application.event_bus import InProcessEventBus
+from app.shared_kernel.domain.domain_event import DomainEvent
+
+
+@dataclass(frozen=True)
+class ThingHappened(DomainEvent):
+    name: str = ""
+
+
+@pytest.mark.asyncio
+async def test_publish_dispatches_to_exact_and_base_type_subscribers() -> None:
+    bus = InProcessEventBus()
+    received: list[tuple[str, DomainEvent]] = []
+
+    async def on_thing(event: DomainEvent) -> None:
+        received.append(("thing", event))
+
+    async def on_any(event: DomainEvent) -> None:
+        received.append(("any", event))
+
+    bus.subscribe(ThingHappened, on_thing)
+    bus.subscribe(DomainEvent, on_any)
+    event = ThingHappened(name="x")
+    await bus.publish(event)
+    await bus.publish(DomainEvent())
+
+    assert [tag for tag, _ in received] == ["thing", "any", "any"]
+    assert received[0][1] is event
+
+
+@pytest.mark.asyncio
+async def test_failing_subscriber_does_not_block_others() -> None:
+    bus = InProcessEventBus()
+    called: list[str] = []
+
+    async def failing(_event: DomainEvent) -> None:
+        raise RuntimeError("boom")
+
+    async def ok(_event: DomainEvent) -> None:
+        called.append("ok")
+
+    bus.subscribe(ThingHappened, failing)
+    bus.subscribe(ThingHappened, ok)
+
+    with pytest.raises(RuntimeError, match="boom"):
+        await bus.publish(ThingHappened())
+    assert called == ["ok"]
@@ -0,0 +1,74 @@
+from app.shared_kernel.application.cancellation import CancellationToken
+from app.shared_kernel.application.execution_budget import ExecutionBudget, StopReason
+
+
+class _Clock:
+    def __init__(self) -> None:
+        self.now = 0.0
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def test_default_budget_is_unlimited() -> None:
+    budget = ExecutionBudget()
+
+    assert budget.stop_reason() is None
+    assert budget.check_memory() is False
+    assert budget.scale(8) == 8
+
+
+def test_deadline_and_cancellation_stop_reasons() -> None:
+    clock = _Clock()
+    token = CancellationToken()
+    budget = ExecutionBudget(deadline_seconds=10, cancellation=token, clock=clock)
+
+    assert budget.stop_reason() is None
+    clock.now = 10.0
+    assert budget.stop_reason() is StopReason.DEADLINE
+    token.cancel()
+    assert budget.stop_reason() is StopReason.CANCELLED
+
+
+def test_non_positive_deadline_means_unlimited() -> None:
+    clock = _Clock()
+    budget = ExecutionBudget(deadline_seconds=0, clock=clock)
+    clock.now = 1e9
+
+    assert budget.stop_reason() is None
+
+
+def test_memory_pressure_halves_scale_and_releases_with_hysteresis() -> None:
+    rss = [1200]
+    budget = ExecutionBudget(memory_threshold_mb=1000, rss_probe=lambda: rss[0])
+
+    assert budget.check_memory() is True
+    assert budget.scale(8) == 4
+    assert budget.check_memory() is True
+    assert budget.scale(8) == 2
+    assert budget.scale(2) == 1
+
+    rss[0] = 900  # 低于阈值但高于 3/4：保持退让级别
+    assert budget.check_memory() is True
+    assert budget.scale(8) == 2
+
+    rss[0] = 500
+    budget.check_memory()
+    assert budget.scale(8) == 4
+    assert budget.check_memory() is False
+    assert budget.scale(8) == 8
+
+
+def test_chunks_shrink_as_pressure_rises() -> None:
+    rss = [500]
+    budget = ExecutionBudget(memory_threshold_mb=1000, rss_probe=lambda: rss[0])
+    items = list(range(10))
+
+    assert [list(c) for c in budget.chunks(items, 4)] == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+    sizes = []
+    for chunk in budget.chunks(items, 4):
+        sizes.append(len(chunk))
+        rss[0] = 1200
+        budget.check_memory()
+    assert sizes == [4, 2, 1, 1, 1, 1]
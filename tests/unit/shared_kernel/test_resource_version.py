@@ -0,0 +1,27 @@
+import pytest
+
+from app.shared_kernel.infrastructure.cache import InMemoryCacheClient
+from app.shared_kernel.infrastructure.resource_version import ResourceVersions
+
+
+@pytest.mark.asyncio
+async def test_version_is_stable_until_bumped() -> None:
+    versions = ResourceVersions(InMemoryCacheClient())
+
+    first = await versions.current("concepts")
+    assert await versions.current("concepts") == first
+
+    await versions.bump("concepts")
+    assert await versions.current("concepts") != first
+
+
+@pytest.mark.asyncio
+async def test_bump_prefix_only_touches_matching_resources() -> None:
+    versions = ResourceVersions(InMemoryCacheClient())
+    stocks_1 = await versions.current("concept_stocks:1")
+    concepts = await versions.current("concepts")
+
+    await versions.bump_prefix("concept_stocks:")
+
+    assert await versions.current("concept_stocks:1") != stocks_1
+    assert await versions.current("concepts") == concepts